@@ -0,0 +1,73 @@
+# cogs/admin/command_sync.py
+"""
+슬래시 명령어 강제 동기화 (관리자 전용)
+
+평소에는 봇 시작 시 트리 해시가 바뀐 경우에만 동기화한다 (services/command_sync.py).
+디스코드 쪽 명령어가 꼬였거나 다른 곳에서 덮어쓴 경우 이 명령어로 해시와 무관하게 다시 올린다.
+"""
+import logging
+
+from discord import app_commands, Interaction
+from discord.ext import commands
+
+from db.database_manager import DatabaseManager
+from services.command_sync import CommandSyncer
+from utils.helpers import trace_interaction
+
+logger = logging.getLogger(__name__)
+
+
+class CommandSync(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.db_manager = DatabaseManager()
+        self.syncer = CommandSyncer(bot, self.db_manager)
+
+    async def cog_load(self):
+        """코그 로드 시 DB 연결 + 동기화 기록 테이블 준비"""
+        await self.db_manager.create_pool()
+        await self.syncer.ensure_schema()
+        logger.info("CommandSync: 데이터베이스 연결 완료")
+
+    async def cog_unload(self):
+        """코그 언로드 시 DB 연결 해제"""
+        await self.db_manager.close_pool()
+        logger.info("CommandSync: 데이터베이스 연결 해제")
+
+    @app_commands.command(name="관리자_명령어동기화", description="슬래시 명령어를 디스코드에 강제로 다시 동기화합니다 (관리자 전용)")
+    @app_commands.describe(scope="동기화 범위")
+    @app_commands.choices(scope=[
+        app_commands.Choice(name="전역", value="global"),
+        app_commands.Choice(name="이 서버", value="guild"),
+    ])
+    @app_commands.default_permissions(administrator=True)
+    @trace_interaction
+    async def force_sync(self, interaction: Interaction, scope: str = "global"):
+        if not interaction.permissions.administrator:
+            await interaction.response.send_message("이 명령어는 관리자만 사용할 수 있어요!", ephemeral=True)
+            return
+
+        guild = interaction.guild if scope == "guild" else None
+        if scope == "guild" and guild is None:
+            await interaction.response.send_message(">>> 서버 안에서만 사용할 수 있는 범위입니다.", ephemeral=True)
+            return
+
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        logger.info(f"명령어 강제 동기화 요청: {interaction.user.name} ({scope})")
+
+        try:
+            result = await self.syncer.sync(guild=guild, force=True)
+        except Exception as e:
+            logger.error(f"명령어 강제 동기화 오류: {e}")
+            await interaction.followup.send(f">>> 동기화 중 오류가 발생했습니다: {e}", ephemeral=True)
+            return
+
+        await interaction.followup.send(
+            f">>> **{result.command_count}개** 명령어를 동기화했습니다.\n"
+            f"범위: `{result.scope}`\n해시: `{result.tree_hash[:12]}`",
+            ephemeral=True
+        )
+
+
+async def setup(bot):
+    await bot.add_cog(CommandSync(bot))
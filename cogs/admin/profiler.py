@@ -0,0 +1,79 @@
+# cogs/admin/profiler.py
+"""
+운영 중 프로파일링 명령어 (관리자 전용)
+
+/관리자_프로파일 초 상위개수 메모리
+- 지정한 시간 동안 cProfile로 봇 전체(이벤트 루프 스레드)를 기록
+- 누적 시간 상위 함수 요약 + profile.txt 보고서 + profile.pstats 파일 첨부
+- 메모리 옵션을 켜면 tracemalloc 할당 상위 위치(memory.txt)도 첨부
+프로파일링 중에는 봇이 눈에 띄게 느려질 수 있으니 짧게 사용할 것.
+"""
+import io
+import logging
+from datetime import datetime
+
+import discord
+from discord import app_commands, Interaction
+from discord.ext import commands
+
+from utils.helpers import trace_interaction
+from utils.profiler import is_profiling, profile_for
+
+logger = logging.getLogger(__name__)
+
+# 요약 메시지에 넣을 상위 함수 개수 (디스코드 메시지 2000자 제한)
+SUMMARY_LINES = 10
+
+
+class Profiler(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    @app_commands.command(name="관리자_프로파일", description="봇을 지정한 시간 동안 프로파일링합니다 (관리자 전용)")
+    @app_commands.describe(
+        seconds="프로파일링 시간 (초)",
+        top="보고서에 넣을 상위 함수 개수",
+        memory="메모리 할당 상위 위치도 수집 (tracemalloc)"
+    )
+    @app_commands.default_permissions(administrator=True)
+    @trace_interaction
+    async def profile(self, interaction: Interaction,
+                      seconds: app_commands.Range[int, 1, 120] = 15,
+                      top: app_commands.Range[int, 5, 200] = 40,
+                      memory: bool = False):
+        if not interaction.permissions.administrator:
+            await interaction.response.send_message("이 명령어는 관리자만 사용할 수 있어요!", ephemeral=True)
+            return
+        if is_profiling():
+            await interaction.response.send_message(">>> 이미 프로파일링 중입니다. 끝난 뒤에 다시 시도해주세요.", ephemeral=True)
+            return
+
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        logger.info(f"프로파일링 시작: {interaction.user.name} ({seconds}초, 상위 {top}개, 메모리 {memory})")
+
+        try:
+            result = await profile_for(seconds, top=top, trace_memory=memory)
+        except RuntimeError as e:
+            await interaction.followup.send(f">>> {e}", ephemeral=True)
+            return
+
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        files = [
+            discord.File(io.BytesIO(result.report.encode("utf-8")), filename=f"profile-{stamp}.txt"),
+            discord.File(io.BytesIO(result.pstats_data), filename=f"profile-{stamp}.pstats"),
+        ]
+        if result.memory_report:
+            files.append(discord.File(io.BytesIO(result.memory_report.encode("utf-8")), filename=f"memory-{stamp}.txt"))
+
+        summary = "\n".join(result.hotspots[:SUMMARY_LINES])
+        await interaction.followup.send(
+            f">>> **프로파일링 완료** ({result.seconds:.1f}초, 함수 호출 {result.total_calls:,}회)\n"
+            f"누적 시간 상위 {min(SUMMARY_LINES, len(result.hotspots))}개:\n```\n{summary[:1500]}\n```",
+            files=files,
+            ephemeral=True
+        )
+        logger.info(f"프로파일링 완료: {result.total_calls}회 호출, {result.total_time:.2f}초")
+
+
+async def setup(bot):
+    await bot.add_cog(Profiler(bot))
@@ -1,18 +1,23 @@
 # cogs/admin/raid_management.py
+import logging
 import discord
 from discord import app_commands, Interaction, ui
 from discord.ext import commands
 from db.database_manager import DatabaseManager
-from services.character_service import CharacterService
+from services.character_service import CharacterService, resolve_realm_for_input
 from services.participation_service import ParticipationService
-from utils.wow_translation import translate_realm_en_to_kr, translate_class_en_to_kr, REALM_KR_TO_EN
+from utils.wow_translation import translate_realm_en_to_kr, translate_class_en_to_kr
 from utils.wow_role_mapping import get_role_korean
-from utils.helpers import Logger, ParticipationStatus
+from utils.wow_registry import get_wow_registry
+from utils.helpers import ParticipationStatus, trace_interaction
+from utils.tracing import span
+from utils.autocomplete import character_autocomplete, realm_autocomplete
 from typing import List, Dict, Any
 from datetime import datetime, timedelta
-import json
 import os
 
+logger = logging.getLogger(__name__)
+
 
 class AdminRaidManagement(commands.Cog):
     def __init__(self, bot):
@@ -24,12 +29,12 @@ class AdminRaidManagement(commands.Cog):
     async def cog_load(self):
         """Cog 로드 시 DB 연결"""
         await self.db_manager.create_pool()
-        print(">>> AdminRaidManagement: 데이터베이스 연결 완료")
+        logger.info("AdminRaidManagement: 데이터베이스 연결 완료")
 
     async def cog_unload(self):
         """Cog 언로드 시 DB 연결 해제"""
         await self.db_manager.close_pool()
-        print(">>> AdminRaidManagement: 데이터베이스 연결 해제")
+        logger.info("AdminRaidManagement: 데이터베이스 연결 해제")
 
     async def get_upcoming_events(self) -> List[Dict]:
         """활성 상태인 일정 목록 조회"""
@@ -77,6 +82,7 @@ class AdminRaidManagement(commands.Cog):
 
     @app_commands.command(name="관리자_참가관리", description="관리자가 일정 참가자를 관리합니다")
     @commands.has_permissions(administrator=True)
+    @trace_interaction
     async def admin_participant_management(self, interaction: Interaction):
         """관리자용 참가자 관리"""
         await interaction.response.defer()
@@ -90,16 +96,18 @@ class AdminRaidManagement(commands.Cog):
             
             # 일정 선택 View 생성
             view = EventSelectionView(self, events)
-            embed = self.create_event_list_embed(events)
+            with span("render"):
+                embed = self.create_event_list_embed(events)
             
             await interaction.followup.send(embed=embed, view=view)
             
         except Exception as e:
-            Logger.error(f"관리자_참가관리 오류: {e}")
+            logger.error(f"관리자_참가관리 오류: {e}")
             await interaction.followup.send(">>> 오류가 발생했습니다.")
 
     @app_commands.command(name="관리자_진행도새로고침", description="참가자들의 레이드 진행도를 새로고침합니다")
     @commands.has_permissions(administrator=True)
+    @trace_interaction
     async def admin_refresh_progression(self, interaction: Interaction, 인스턴스id: int):
         """참가자들의 진행도 새로고침"""
         await interaction.response.defer()
@@ -120,9 +128,37 @@ class AdminRaidManagement(commands.Cog):
             )
             
         except Exception as e:
-            Logger.error(f"진행도 새로고침 오류: {e}")
+            logger.error(f"진행도 새로고침 오류: {e}")
             await interaction.followup.send(">>> 진행도 새로고침 중 오류가 발생했습니다.")
 
+    @app_commands.command(name="관리자_참가자추가", description="캐릭터명/서버명 자동완성으로 참가자를 추가합니다")
+    @app_commands.describe(인스턴스id="일정 인스턴스 ID", 캐릭터명="추가할 캐릭터명", 서버명="캐릭터 서버", 메모="수동 추가 사유")
+    @app_commands.autocomplete(캐릭터명=character_autocomplete, 서버명=realm_autocomplete)
+    @app_commands.default_permissions(administrator=True)
+    @trace_interaction
+    async def admin_add_participant(self, interaction: Interaction, 인스턴스id: int, 캐릭터명: str, 서버명: str, 메모: str = ""):
+        """관리자용 참가자 추가 (모달 대신 자동완성 사용)"""
+        if not interaction.permissions.administrator:
+            await interaction.response.send_message("이 명령어는 관리자만 사용할 수 있어요!", ephemeral=True)
+            return
+        
+        await interaction.response.defer(ephemeral=True)
+        
+        try:
+            events = await self.get_upcoming_events()
+            event_data = next((e for e in events if e['id'] == 인스턴스id), None)
+            
+            if not event_data:
+                await interaction.followup.send(f">>> 활성 일정에서 인스턴스 ID {인스턴스id}를 찾을 수 없습니다.")
+                return
+            
+            modal = AddParticipantModal(self, 인스턴스id, event_data)
+            await modal.add_participant(interaction, 캐릭터명.strip(), 서버명.strip(), 메모.strip())
+            
+        except Exception as e:
+            logger.error(f"관리자_참가자추가 오류: {e}")
+            await interaction.followup.send(">>> 참가자 추가 중 오류가 발생했습니다.")
+
     def create_event_list_embed(self, events: List[Dict]) -> discord.Embed:
         """일정 목록 임베드 생성"""
         embed = discord.Embed(
@@ -159,9 +195,6 @@ class AdminRaidManagement(commands.Cog):
             color=0x0099ff
         )
         
-        # WoW 이모티콘 로드
-        wow_emojis = self.load_wow_class_emojis()
-        
         # 참가자 상태별 그룹화
         status_groups = {
             'confirmed': [],
@@ -192,7 +225,7 @@ class AdminRaidManagement(commands.Cog):
         
         # 확정 참가자만 역할별로 상세 표시
         if status_groups['confirmed']:
-            confirmed_text = self.format_participants_by_role(status_groups['confirmed'], wow_emojis)
+            confirmed_text = self.format_participants_by_role(status_groups['confirmed'])
             embed.add_field(name="✅ 확정 참가자", value=confirmed_text, inline=False)
         
         # 미정/불참은 간단히
@@ -206,15 +239,6 @@ class AdminRaidManagement(commands.Cog):
         
         return embed
 
-    def load_wow_class_emojis(self) -> Dict[str, str]:
-        """WoW 직업 이모티콘 로드"""
-        try:
-            with open('data/server_emojis.json', 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return {k: v['format'] for k, v in data.get('wow_classes', {}).items()}
-        except:
-            return {}
-
     def count_roles(self, participants: List[Dict]) -> Dict[str, int]:
         """역할별 인원 카운팅"""
         counts = {'TANK': 0, 'HEALER': 0, 'MELEE_DPS': 0, 'RANGED_DPS': 0}
@@ -224,7 +248,7 @@ class AdminRaidManagement(commands.Cog):
                 counts[role] = counts.get(role, 0) + 1
         return counts
 
-    def format_participants_by_role(self, participants: List[Dict], wow_emojis: Dict[str, str]) -> str:
+    def format_participants_by_role(self, participants: List[Dict]) -> str:
         """역할별 참가자 포맷팅"""
         roles = {
             'TANK': ('🛡️', '탱커'),
@@ -240,12 +264,13 @@ class AdminRaidManagement(commands.Cog):
                 role_groups[role] = []
             role_groups[role].append(p)
         
+        registry = get_wow_registry()
         result_lines = []
         for role_key, (emoji, name) in roles.items():
             if role_key in role_groups:
                 result_lines.append(f"\n{emoji} **{name} ({len(role_groups[role_key])}명)**")
                 for p in role_groups[role_key]:
-                    class_emoji = wow_emojis.get(p['character_class'], '⚪')
+                    class_emoji = registry.class_emoji(p['character_class'])
                     result_lines.append(f"{class_emoji} {p['character_name']}")
         
         return '\n'.join(result_lines) if result_lines else "참가자가 없습니다."
@@ -282,6 +307,7 @@ class EventSelectionDropdown(ui.Select):
         
         super().__init__(placeholder="관리할 일정을 선택하세요...", options=options)
 
+    @trace_interaction
     async def callback(self, interaction: Interaction):
         await interaction.response.defer()
         
@@ -294,7 +320,8 @@ class EventSelectionDropdown(ui.Select):
         participants = await self.cog.get_event_participants(event_instance_id)
         
         # 참가자 관리 View와 Embed 생성
-        embed = self.cog.create_participants_embed(selected_event, participants)
+        with span("render"):
+            embed = self.cog.create_participants_embed(selected_event, participants)
         view = ParticipantManagementView(self.cog, event_instance_id, participants, selected_event)
         
         await interaction.followup.send(embed=embed, view=view)
@@ -309,12 +336,14 @@ class ParticipantManagementView(ui.View):
         self.event_data = event_data
 
     @ui.button(label="➕ 참가자 추가", style=discord.ButtonStyle.success)
+    @trace_interaction
     async def add_participant(self, interaction: Interaction, button: ui.Button):
         """참가자 추가 버튼"""
         modal = AddParticipantModal(self.cog, self.event_instance_id, self.event_data)
         await interaction.response.send_modal(modal)
 
     @ui.button(label="📝 상태 변경", style=discord.ButtonStyle.primary)
+    @trace_interaction
     async def change_status(self, interaction: Interaction, button: ui.Button):
         """참가자 상태 변경 버튼"""
         if not self.participants:
@@ -325,6 +354,7 @@ class ParticipantManagementView(ui.View):
         await interaction.response.send_message(">>> 상태를 변경할 참가자를 선택하세요:", view=view, ephemeral=True)
 
     @ui.button(label="🗑️ 참가자 제거", style=discord.ButtonStyle.danger)
+    @trace_interaction
     async def remove_participant(self, interaction: Interaction, button: ui.Button):
         """참가자 제거 버튼"""
         if not self.participants:
@@ -364,16 +394,26 @@ class AddParticipantModal(ui.Modal):
         max_length=200
     )
 
+    @trace_interaction
     async def on_submit(self, interaction: Interaction):
         await interaction.response.defer(ephemeral=True)
         
-        character_name = self.character_name.value.strip()
-        server_input = self.server_name.value.strip()
-        memo = self.admin_memo.value.strip()
-        
+        await self.add_participant(
+            interaction,
+            self.character_name.value.strip(),
+            self.server_name.value.strip(),
+            self.admin_memo.value.strip()
+        )
+
+    async def add_participant(self, interaction: Interaction, character_name: str, server_input: str, memo: str):
+        """참가자 추가 처리 (모달/슬래시 명령어 공용, 응답은 defer된 상태여야 함)"""
         try:
-            # 서버명 정규화
-            server_en = REALM_KR_TO_EN.get(server_input, server_input)
+            # 서버명 정규화 (인덱스에서 바로 확인, 오타는 API 호출 없이 안내)
+            realm_result = resolve_realm_for_input(server_input)
+            if realm_result.get("error"):
+                await interaction.followup.send(f">>> {realm_result['error']}")
+                return
+            server_en = realm_result["realm_name_en"]
             
             # 캐릭터 유효성 검사
             from utils.character_validator import validate_character, get_character_info
@@ -415,7 +455,7 @@ class AddParticipantModal(ui.Modal):
                 
                 if existing_dummy:
                     # 이미 더미로 추가된 캐릭터인 경우
-                    Logger.info(f"관리자 추가 시 기존 더미 발견: {character_data['character_name']}")
+                    logger.info(f"관리자 추가 시 기존 더미 발견: {character_data['character_name']}")
                     
                     # 기존 더미 기록의 메모만 업데이트
                     await conn.execute("""
@@ -451,7 +491,7 @@ class AddParticipantModal(ui.Modal):
                         f"메모: {formatted_memo}"
                     )
                     
-                    Logger.info(f"관리자가 기존 더미 메모 업데이트: {character_name}-{server_input} by {interaction.user.display_name}")
+                    logger.info(f"관리자가 기존 더미 메모 업데이트: {character_name}-{server_input} by {interaction.user.display_name}")
                     
                     # 메시지 업데이트
                     await self.update_messages_after_change(interaction)
@@ -499,25 +539,26 @@ class AddParticipantModal(ui.Modal):
                 f"메모: {formatted_memo}"
             )
             
-            Logger.info(f"관리자 수동 참가자 추가: {character_name}-{server_input} by {interaction.user.display_name}")
+            logger.info(f"관리자 수동 참가자 추가: {character_name}-{server_input} by {interaction.user.display_name}")
             
             # 메시지 업데이트
             await self.update_messages_after_change(interaction)
 
         except Exception as e:
-            Logger.error(f"참가자 추가 오류: {e}")
+            logger.error(f"참가자 추가 오류: {e}")
             await interaction.followup.send(">>> 참가자 추가 중 오류가 발생했습니다.")
 
     async def update_messages_after_change(self, interaction):
         """참가자 변경 후 관련 메시지들 업데이트"""
         try:
-            print(">>> 메시지 업데이트 시작")
+            logger.info("메시지 업데이트 시작")
             
             # 1. 현재 참가자 목록 다시 조회
             updated_participants = await self.cog.get_event_participants(self.event_instance_id)
             
             # 2. 관리자용 참가자 목록 메시지 업데이트
-            updated_embed = self.cog.create_participants_embed(self.event_data, updated_participants)
+            with span("render"):
+                updated_embed = self.cog.create_participants_embed(self.event_data, updated_participants)
             
             # 현재 interaction이 속한 메시지 업데이트 (관리자용 메시지)
             try:
@@ -526,16 +567,16 @@ class AddParticipantModal(ui.Modal):
                     # 새로운 View 생성 (기존 참가자 목록으로)
                     updated_view = ParticipantManagementView(self.cog, self.event_instance_id, updated_participants, self.event_data)
                     await original_message.edit(embed=updated_embed, view=updated_view)
-                    print(">>> 관리자용 참가자 목록 메시지 업데이트 완료")
+                    logger.info("관리자용 참가자 목록 메시지 업데이트 완료")
             except Exception as e:
-                print(f">>> 관리자용 메시지 업데이트 오류: {e}")
+                logger.error(f"관리자용 메시지 업데이트 오류: {e}")
             
             # 3. 일정 공지 메시지 업데이트 (discord_message_id 있는 경우)
             if self.event_data.get('discord_message_id') and self.event_data.get('discord_channel_id'):
                 await self.update_event_announcement_message()
                 
         except Exception as e:
-            print(f">>> 메시지 업데이트 전체 오류: {e}")
+            logger.error(f"메시지 업데이트 전체 오류: {e}")
     
     async def update_event_announcement_message(self):
         """일정 공지 메시지 업데이트"""
@@ -600,14 +641,15 @@ class AddParticipantModal(ui.Modal):
                         """, self.event_instance_id)
                     
                     # 새로운 embed 생성
-                    updated_embed = signup_view.create_detailed_event_embed(event_data, participants_data, recent_logs)
+                    with span("render"):
+                        updated_embed = signup_view.create_detailed_event_embed(event_data, participants_data, recent_logs)
                     
                     # 메시지 업데이트
                     await message.edit(embed=updated_embed, view=signup_view)
-                    print(">>> 일정 공지 메시지 업데이트 완료")
+                    logger.info("일정 공지 메시지 업데이트 완료")
                     
         except Exception as e:
-            print(f">>> 일정 공지 메시지 업데이트 오류: {e}")
+            logger.error(f"일정 공지 메시지 업데이트 오류: {e}")
 
 
 class StatusChangeView(ui.View):
@@ -686,6 +728,7 @@ class ParticipantSelectionDropdown(ui.Select):
         placeholder = "상태를 변경할 참가자를 선택하세요..." if action_type == "status_change" else "제거할 참가자를 선택하세요..."
         super().__init__(placeholder=placeholder, options=options)
 
+    @trace_interaction
     async def callback(self, interaction: Interaction):
         await interaction.response.defer(ephemeral=True)
         
@@ -715,14 +758,17 @@ class StatusChangeButtonView(ui.View):
         self.event_data = event_data
 
     @ui.button(label="✅ 확정", style=discord.ButtonStyle.success)
+    @trace_interaction
     async def set_confirmed(self, interaction: Interaction, button: ui.Button):
         await self.change_status(interaction, "confirmed")
 
     @ui.button(label="⏳ 미정", style=discord.ButtonStyle.secondary)
+    @trace_interaction
     async def set_tentative(self, interaction: Interaction, button: ui.Button):
         await self.change_status(interaction, "tentative")
 
     @ui.button(label="❌ 불참", style=discord.ButtonStyle.danger)
+    @trace_interaction
     async def set_declined(self, interaction: Interaction, button: ui.Button):
         await self.change_status(interaction, "declined")
 
@@ -769,10 +815,10 @@ class StatusChangeButtonView(ui.View):
                 f"{status_names[old_status]} → {status_names[new_status]}"
             )
             
-            print(f">>> 관리자 상태 변경: {self.participant['character_name']} {old_status} → {new_status}")
+            logger.info(f"관리자 상태 변경: {self.participant['character_name']} {old_status} → {new_status}")
             
         except Exception as e:
-            Logger.error(f"상태 변경 오류: {e}")
+            logger.error(f"상태 변경 오류: {e}")
             await interaction.followup.send(">>> 상태 변경 중 오류가 발생했습니다.")
 
 
@@ -785,6 +831,7 @@ class RemoveConfirmView(ui.View):
         self.event_data = event_data
 
     @ui.button(label="✅ 제거 확정", style=discord.ButtonStyle.danger)
+    @trace_interaction
     async def confirm_remove(self, interaction: Interaction, button: ui.Button):
         await interaction.response.defer(ephemeral=True)
         
@@ -818,13 +865,14 @@ class RemoveConfirmView(ui.View):
                 f"캐릭터: {self.participant['character_name']}-{realm_kr}"
             )
             
-            print(f">>> 관리자 참가자 제거: {self.participant['character_name']}-{self.participant['character_realm']}")
+            logger.info(f"관리자 참가자 제거: {self.participant['character_name']}-{self.participant['character_realm']}")
             
         except Exception as e:
-            Logger.error(f"참가자 제거 오류: {e}")
+            logger.error(f"참가자 제거 오류: {e}")
             await interaction.followup.send(">>> 참가자 제거 중 오류가 발생했습니다.")
 
     @ui.button(label="❌ 취소", style=discord.ButtonStyle.secondary)
+    @trace_interaction
     async def cancel_remove(self, interaction: Interaction, button: ui.Button):
         await interaction.response.send_message(">>> 참가자 제거를 취소했습니다.", ephemeral=True)
 
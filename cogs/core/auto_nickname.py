@@ -1,10 +1,16 @@
+import logging
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
 from db.database_manager import DatabaseManager
-from utils.character_validator import validate_character, get_character_info
+from services.character_index import character_index
+from services.character_ownership import CharacterOwnershipService
+from services.character_repository import CharacterRepository
+from utils.character_validator import get_character_info, prefetch_character_profiles, validate_character
 import asyncio
 from typing import Optional, Dict, List, Tuple
 
+logger = logging.getLogger(__name__)
+
 class AutoNicknameHandler(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
@@ -14,12 +20,22 @@ class AutoNicknameHandler(commands.Cog):
     async def cog_load(self):
         """코그 로드 시 DB 연결"""
         await self.db_manager.create_pool()
-        print(">>> AutoNicknameHandler: 데이터베이스 연결 완료")
+        logger.info("AutoNicknameHandler: 데이터베이스 연결 완료")
+        self.refresh_character_index.start()
 
     async def cog_unload(self):
         """코그 언로드 시 DB 연결 해제"""
+        self.refresh_character_index.cancel()
         await self.db_manager.close_pool()
-        print(">>> AutoNicknameHandler: 데이터베이스 연결 해제")
+        logger.info("AutoNicknameHandler: 데이터베이스 연결 해제")
+
+    @tasks.loop(minutes=10)
+    async def refresh_character_index(self):
+        """자동완성용 캐릭터 인덱스 주기적 전체 갱신"""
+        try:
+            await character_index.refresh(self.db_manager)
+        except Exception as e:
+            logger.error(f"캐릭터 인덱스 갱신 오류: {e}")
 
     async def get_characters_from_db(self, character_name: str) -> List[Tuple[str, int, bool]]:
         """DB에서 캐릭터 정보 조회 (길드원 여부 포함)"""
@@ -31,138 +47,54 @@ class AutoNicknameHandler(commands.Cog):
                     WHERE character_name = $1
                 """, character_name)
             
-            print(f">>> DB 조회 결과: {character_name} - {len(rows)}개 서버에서 발견")
+            logger.debug(f"DB 조회 결과: {character_name} - {len(rows)}개 서버에서 발견")
             for i, row in enumerate(rows):
                 guild_status = "길드원" if row['is_guild_member'] else "비길드원"
-                print(f">>>   [{i+1}] 서버: {row['realm_slug']}, ID: {row['id']} ({guild_status})")
+                logger.debug(f"  [{i+1}] 서버: {row['realm_slug']}, ID: {row['id']} ({guild_status})")
             
             return [(row['realm_slug'], row['id'], row['is_guild_member']) for row in rows]
             
         except Exception as e:
-            print(f">>> DB 캐릭터 조회 오류: {e}")
+            logger.error(f"DB 캐릭터 조회 오류: {e}")
             return []
 
-    async def save_character_to_db(self, char_info: dict, is_guild_member: bool = False) -> bool:
-        """캐릭터 정보를 characters 테이블에 저장"""
+    async def save_character_to_db(self, char_info: dict) -> bool:
+        """캐릭터 정보를 characters 테이블에 저장 (길드원 여부는 로스터 수집기가 관리)"""
         try:
-            name = char_info.get("name")
-            realm = char_info.get("realm")
-            
-            if not name or not realm:
-                print(f">>> 필수 데이터 누락: name={name}, realm={realm}")
+            saved = await CharacterRepository(self.db_manager).save(char_info)
+            if saved is None:
                 return False
             
-            # raider.io API 응답값 그대로 사용
-            race = char_info.get("race", "")
-            class_name = char_info.get("class", "")
-            active_spec = char_info.get("active_spec_name", "")
-            active_spec_role = char_info.get("active_spec_role", "")
-            gender = char_info.get("gender", "")
-            faction = char_info.get("faction", "")
-
-            print(f">>> characters 테이블 저장 시도: {name}-{realm}")
-            
-            async with self.db_manager.get_connection() as conn:
-                await conn.execute("""
-                    INSERT INTO guild_bot.characters (
-                        character_name, realm_slug, is_guild_member,
-                        race, class, active_spec, active_spec_role,
-                        gender, faction, achievement_points,
-                        profile_url, profile_banner, thumbnail_url, region, last_crawled_at
-                    )
-                    VALUES ($1, $2, $3, $4, $5, $6, $7,
-                            $8, $9, $10, $11, $12, $13, $14, NOW())
-                    ON CONFLICT (character_name, realm_slug)
-                    DO UPDATE SET
-                        race = EXCLUDED.race,
-                        class = EXCLUDED.class,
-                        active_spec = EXCLUDED.active_spec,
-                        active_spec_role = EXCLUDED.active_spec_role,
-                        gender = EXCLUDED.gender,
-                        faction = EXCLUDED.faction,
-                        achievement_points = EXCLUDED.achievement_points,
-                        profile_url = EXCLUDED.profile_url,
-                        profile_banner = EXCLUDED.profile_banner,
-                        thumbnail_url = EXCLUDED.thumbnail_url,
-                        last_crawled_at = NOW(),
-                        updated_at = NOW()
-                """,
-                name, realm, is_guild_member, race, class_name, active_spec, active_spec_role,
-                gender, faction, char_info.get("achievement_points", 0),
-                char_info.get("profile_url", ""), char_info.get("profile_banner", ""),
-                char_info.get("thumbnail_url", ""), "kr"
-                )
-            
-            print(f">>> characters 테이블 저장 성공: {name}-{realm}")
+            logger.debug(f"characters 테이블 저장 성공: {saved.character_name}-{saved.realm_slug}")
             return True
             
         except Exception as e:
-            print(f">>> characters 테이블 저장 오류: {e}")
+            logger.error(f"characters 테이블 저장 오류: {e}")
             return False
 
     async def link_character_to_discord(self, character_name: str, realm_slug: str, user: discord.Member) -> bool:
-        """캐릭터를 디스코드 유저에게 연결"""
+        """캐릭터를 디스코드 유저에게 연결 (기존 인증 캐릭터는 해제, 한 번의 쿼리)"""
         try:
-            async with self.db_manager.get_connection() as conn:
-                discord_id = str(user.id)
-                discord_username = user.name
-                
-                print(f">>> 디스코드 연결 시작: {character_name}-{realm_slug} -> {discord_username}#{discord_id}")
-                
-                # 1. discord_users 테이블에 유저 정보 추가/업데이트
-                await conn.execute("""
-                    INSERT INTO guild_bot.discord_users (discord_id, discord_username)
-                    VALUES ($1, $2)
-                    ON CONFLICT (discord_id)
-                    DO UPDATE SET
-                        discord_username = EXCLUDED.discord_username,
-                        updated_at = NOW()
-                """, discord_id, discord_username)
-                
-                # 2. discord_user_id 조회
-                discord_user_db_id = await conn.fetchval(
-                    "SELECT id FROM guild_bot.discord_users WHERE discord_id = $1",
-                    discord_id
-                )
-                
-                # 3. character_id 조회
-                character_db_id = await conn.fetchval(
-                    "SELECT id FROM guild_bot.characters WHERE character_name = $1 AND realm_slug = $2",
-                    character_name, realm_slug
-                )
-                
-                if not character_db_id:
-                    print(f">>> 캐릭터를 찾을 수 없음: {character_name}-{realm_slug}")
-                    return False
-                
-                # 4. 기존 verified 연결 해제 (한 유저당 하나의 활성 캐릭터만)
-                await conn.execute("""
-                    UPDATE guild_bot.character_ownership 
-                    SET is_verified = FALSE, updated_at = NOW()
-                    WHERE discord_user_id = $1 AND is_verified = TRUE
-                """, discord_user_db_id)
-                
-                # 5. 새로운 연결 추가/업데이트
-                await conn.execute("""
-                    INSERT INTO guild_bot.character_ownership (discord_user_id, character_id, is_verified)
-                    VALUES ($1, $2, TRUE)
-                    ON CONFLICT (discord_user_id, character_id)
-                    DO UPDATE SET
-                        is_verified = TRUE,
-                        updated_at = NOW()
-                """, discord_user_db_id, character_db_id)
-                
-                print(f">>> 디스코드 연결 성공: {character_name}-{realm_slug} -> {discord_username}#{discord_id}")
-                return True
+            logger.debug(f"디스코드 연결 시작: {character_name}-{realm_slug} -> {user.name}#{user.id}")
+            
+            link = await CharacterOwnershipService(self.db_manager).link(
+                str(user.id), user.name, character_name=character_name, realm_slug=realm_slug)
+            
+            if link is None:
+                logger.info(f"캐릭터를 찾을 수 없음: {character_name}-{realm_slug}")
+                return False
+            
+            logger.info(f"디스코드 연결 성공: {character_name}-{realm_slug} -> {user.name}#{user.id}")
+            return True
                 
         except Exception as e:
-            print(f">>> 디스코드 연결 오류: {e}")
+            logger.error(f"디스코드 연결 오류: {e}")
             return False
 
     async def check_character_validity(self, character_name: str) -> Optional[Dict]:
         """캐릭터 유효성 검사 (DB 우선, 없으면 API)"""
         
-        print(f">>> 캐릭터 유효성 검사 시작: {character_name}")
+        logger.debug(f"캐릭터 유효성 검사 시작: {character_name}")
         
         # 1. DB에서 캐릭터 확인 (길드원/비길드원 무관)
         db_characters = await self.get_characters_from_db(character_name)
@@ -171,7 +103,7 @@ class AutoNicknameHandler(commands.Cog):
                 # 유일한 캐릭터 발견
                 realm_slug, character_id, is_guild_member = db_characters[0]
                 guild_status = "길드원" if is_guild_member else "비길드원"
-                print(f">>> DB에서 유일한 캐릭터 발견: {character_name}-{realm_slug} ({guild_status})")
+                logger.debug(f"DB에서 유일한 캐릭터 발견: {character_name}-{realm_slug} ({guild_status})")
                 return {
                     "source": "db",
                     "character_name": character_name,
@@ -181,11 +113,11 @@ class AutoNicknameHandler(commands.Cog):
                 }
             else:
                 # 여러 서버에 같은 이름 존재
-                print(f">>> DB에서 여러 서버에 같은 캐릭터명 발견: {character_name} ({len(db_characters)}개 서버)")
+                logger.debug(f"DB에서 여러 서버에 같은 캐릭터명 발견: {character_name} ({len(db_characters)}개 서버)")
                 for i, (realm, char_id, is_guild) in enumerate(db_characters):
                     guild_status = "길드원" if is_guild else "비길드원"
-                    print(f">>>   [{i+1}] {character_name}-{realm} ({guild_status})")
-                print(">>> 모호한 캐릭터로 물음표 처리")
+                    logger.debug(f"  [{i+1}] {character_name}-{realm} ({guild_status})")
+                logger.debug("모호한 캐릭터로 물음표 처리")
                 return {
                     "source": "db_ambiguous",
                     "character_name": character_name,
@@ -194,7 +126,7 @@ class AutoNicknameHandler(commands.Cog):
                 }
         
         # 2. DB에 없으면 API로 유효성 검사 (여러 서버 시도)
-        print(f">>> DB에 없음, API로 캐릭터 유효성 검사: {character_name}")
+        logger.debug(f"DB에 없음, API로 캐릭터 유효성 검사: {character_name}")
         
         # 주요 서버들 (우선순위 순 - 길드 서버 우선)
         servers_to_check = [
@@ -202,36 +134,38 @@ class AutoNicknameHandler(commands.Cog):
             "Stormrage", "Windrunner", "Zul'jin", "Dalaran", "Durotan"
         ]
         
+        # 캐시된 서버별 응답을 한 번에 불러오기 (아래 검사는 캐시에 없는 서버만 API 호출)
+        await prefetch_character_profiles(servers_to_check, character_name)
         found_servers = []
         
         for server in servers_to_check:
             try:
-                print(f">>> API 서버 검사 중: {character_name}-{server}")
+                logger.debug(f"API 서버 검사 중: {character_name}-{server}")
                 if await validate_character(server, character_name):
-                    print(f">>> API에서 캐릭터 발견: {character_name}-{server}")
+                    logger.debug(f"API에서 캐릭터 발견: {character_name}-{server}")
                     char_info = await get_character_info(server, character_name)
                     if char_info:
                         found_servers.append((server, char_info))
                         
                         # 2개 이상 발견되면 바로 중단 (어차피 모호함 처리)
                         if len(found_servers) >= 2:
-                            print(f">>> 2개 이상 서버에서 발견, 검사 중단: {character_name}")
+                            logger.debug(f"2개 이상 서버에서 발견, 검사 중단: {character_name}")
                             break
                             
                 # API 호출 제한을 위한 짧은 대기
                 await asyncio.sleep(0.1)
             except Exception as e:
-                print(f">>> API 검사 오류 ({server}): {e}")
+                logger.error(f"API 검사 오류 ({server}): {e}")
                 continue
         
         # API 검사 결과 분석
         if len(found_servers) == 0:
-            print(f">>> 어떤 서버에서도 캐릭터를 찾을 수 없음: {character_name}")
+            logger.debug(f"어떤 서버에서도 캐릭터를 찾을 수 없음: {character_name}")
             return None
         elif len(found_servers) == 1:
             # 유일한 서버에서 발견
             server, char_info = found_servers[0]
-            print(f">>> API에서 유일한 서버에 캐릭터 발견: {character_name}-{server}")
+            logger.debug(f"API에서 유일한 서버에 캐릭터 발견: {character_name}-{server}")
             return {
                 "source": "api",
                 "character_info": char_info,
@@ -240,10 +174,10 @@ class AutoNicknameHandler(commands.Cog):
             }
         else:
             # 여러 서버에서 발견
-            print(f">>> API에서 여러 서버에 같은 캐릭터명 발견: {character_name} ({len(found_servers)}개 서버)")
+            logger.debug(f"API에서 여러 서버에 같은 캐릭터명 발견: {character_name} ({len(found_servers)}개 서버)")
             for i, (server, _) in enumerate(found_servers):
-                print(f">>>   [{i+1}] {character_name}-{server}")
-            print(">>> 모호한 API 캐릭터로 물음표 처리")
+                logger.debug(f"  [{i+1}] {character_name}-{server}")
+            logger.debug("모호한 API 캐릭터로 물음표 처리")
             return {
                 "source": "api_ambiguous",
                 "character_name": character_name,
@@ -269,7 +203,7 @@ class AutoNicknameHandler(commands.Cog):
         
         # 중복 처리 방지
         if after.id in self.processing_users:
-            print(f">>> 중복 처리 방지: {after.display_name} (사용자 ID: {after.id})")
+            logger.debug(f"중복 처리 방지: {after.display_name} (사용자 ID: {after.id})")
             return
         
         self.processing_users.add(after.id)
@@ -277,22 +211,22 @@ class AutoNicknameHandler(commands.Cog):
         try:
             new_nickname = after.display_name
             old_nickname = before.display_name
-            print(f">>> 닉네임 변경 감지: {old_nickname} -> {new_nickname} (사용자: {after.name})")
+            logger.info(f"닉네임 변경 감지: {old_nickname} -> {new_nickname} (사용자: {after.name})")
             
             # 로켓/물음표 이모티콘 제거해서 캐릭터명 추출
             character_name = new_nickname.replace("🚀", "").replace("⭐", "").strip()
-            print(f">>> 추출된 캐릭터명: '{character_name}'")
+            logger.debug(f"추출된 캐릭터명: '{character_name}'")
             
             # 빈 문자열이거나 너무 짧으면 무시
             if len(character_name) < 2:
-                print(f">>> 캐릭터명이 너무 짧음: '{character_name}' (길이: {len(character_name)})")
+                logger.debug(f"캐릭터명이 너무 짧음: '{character_name}' (길이: {len(character_name)})")
                 return
             
             # 캐릭터 유효성 검사
             char_result = await self.check_character_validity(character_name)
             
             if char_result:
-                print(f">>> 유효한 캐릭터 확인 완료: {character_name} (소스: {char_result['source']})")
+                logger.debug(f"유효한 캐릭터 확인 완료: {character_name} (소스: {char_result['source']})")
                 
                 # 모호한 경우와 확실한 경우 구분
                 if char_result.get("needs_clarification"):
@@ -301,28 +235,28 @@ class AutoNicknameHandler(commands.Cog):
                         try:
                             new_emoji_nickname = f"⭐{character_name}"
                             await after.edit(nick=new_emoji_nickname)
-                            print(f">>> 물음표 추가 성공 (모호한 캐릭터): {new_nickname} -> {new_emoji_nickname}")
+                            logger.info(f"물음표 추가 성공 (모호한 캐릭터): {new_nickname} -> {new_emoji_nickname}")
                             servers_list = ", ".join(char_result["servers"])
-                            print(f">>> 존재하는 서버들: {servers_list}")
+                            logger.debug(f"존재하는 서버들: {servers_list}")
                         except discord.Forbidden:
-                            print(f">>> 물음표 추가 실패 (권한 부족): {after.name}")
+                            logger.warning(f"물음표 추가 실패 (권한 부족): {after.name}")
                         except Exception as e:
-                            print(f">>> 물음표 추가 오류: {e}")
+                            logger.error(f"물음표 추가 오류: {e}")
                     else:
-                        print(f">>> 이미 물음표 이모티콘 존재: {new_nickname}")
+                        logger.debug(f"이미 물음표 이모티콘 존재: {new_nickname}")
                 else:
                     # 유일한 서버에서 확인된 캐릭터 - 로켓 추가
                     if not new_nickname.startswith("🚀"):
                         try:
                             new_emoji_nickname = f"🚀{character_name}"
                             await after.edit(nick=new_emoji_nickname)
-                            print(f">>> 로켓 추가 성공 (확실한 캐릭터): {new_nickname} -> {new_emoji_nickname}")
+                            logger.info(f"로켓 추가 성공 (확실한 캐릭터): {new_nickname} -> {new_emoji_nickname}")
                         except discord.Forbidden:
-                            print(f">>> 로켓 추가 실패 (권한 부족): {after.name}")
+                            logger.warning(f"로켓 추가 실패 (권한 부족): {after.name}")
                         except Exception as e:
-                            print(f">>> 로켓 추가 오류: {e}")
+                            logger.error(f"로켓 추가 오류: {e}")
                     else:
-                        print(f">>> 이미 로켓 이모티콘 존재: {new_nickname}")
+                        logger.debug(f"이미 로켓 이모티콘 존재: {new_nickname}")
                 
                 # 데이터베이스 업데이트 (확실한 캐릭터만)
                 if not char_result.get("needs_clarification"):
@@ -334,16 +268,16 @@ class AutoNicknameHandler(commands.Cog):
                             after
                         )
                         if success:
-                            print(f">>> DB 길드 캐릭터 연결 성공: {character_name}-{char_result['realm_slug']}")
+                            logger.info(f"DB 길드 캐릭터 연결 성공: {character_name}-{char_result['realm_slug']}")
                         else:
-                            print(f">>> DB 길드 캐릭터 연결 실패: {character_name}")
+                            logger.warning(f"DB 길드 캐릭터 연결 실패: {character_name}")
                         
                     elif char_result["source"] == "api":
                         # API에서 찾은 외부 캐릭터
                         char_info = char_result["character_info"]
                         
                         # 캐릭터 정보를 DB에 저장
-                        save_success = await self.save_character_to_db(char_info, is_guild_member=False)
+                        save_success = await self.save_character_to_db(char_info)
                         
                         # 디스코드 연결
                         link_success = await self.link_character_to_discord(
@@ -353,35 +287,35 @@ class AutoNicknameHandler(commands.Cog):
                         )
                         
                         if save_success and link_success:
-                            print(f">>> API 캐릭터 저장 및 연결 성공: {character_name}-{char_result['realm_slug']}")
+                            logger.info(f"API 캐릭터 저장 및 연결 성공: {character_name}-{char_result['realm_slug']}")
                         else:
-                            print(f">>> API 캐릭터 처리 일부 실패: save={save_success}, link={link_success}")
+                            logger.warning(f"API 캐릭터 처리 일부 실패: save={save_success}, link={link_success}")
                 else:
-                    print(f">>> 모호한 캐릭터로 인해 DB 연결 생략: {character_name}")
+                    logger.debug(f"모호한 캐릭터로 인해 DB 연결 생략: {character_name}")
             
             else:
-                print(f">>> 유효하지 않은 캐릭터: {character_name}")
+                logger.debug(f"유효하지 않은 캐릭터: {character_name}")
                 # 로켓/물음표 이모티콘이 있으면 제거
                 if new_nickname.startswith("🚀") or new_nickname.startswith("⭐"):
                     try:
                         clean_nickname = character_name
                         await after.edit(nick=clean_nickname)
-                        print(f">>> 무효한 캐릭터, 이모티콘 제거: {new_nickname} -> {clean_nickname}")
+                        logger.info(f"무효한 캐릭터, 이모티콘 제거: {new_nickname} -> {clean_nickname}")
                     except discord.Forbidden:
-                        print(f">>> 이모티콘 제거 실패 (권한 부족): {after.name}")
+                        logger.warning(f"이모티콘 제거 실패 (권한 부족): {after.name}")
                     except Exception as e:
-                        print(f">>> 이모티콘 제거 오류: {e}")
+                        logger.error(f"이모티콘 제거 오류: {e}")
                 else:
-                    print(f">>> 이모티콘 제거 불필요: {new_nickname}")
+                    logger.debug(f"이모티콘 제거 불필요: {new_nickname}")
         
         except Exception as e:
-            print(f">>> on_member_update 처리 오류: {e}")
+            logger.error(f"on_member_update 처리 오류: {e}")
         
         finally:
             # 처리 완료 후 사용자 ID 제거
             await asyncio.sleep(1)  # 짧은 대기 후 제거
             self.processing_users.discard(after.id)
-            print(f">>> 처리 완료, 사용자 ID 제거: {after.id}")
+            logger.debug(f"처리 완료, 사용자 ID 제거: {after.id}")
 
 async def setup(bot):
     await bot.add_cog(AutoNicknameHandler(bot))
\ No newline at end of file
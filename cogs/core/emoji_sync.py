@@ -0,0 +1,57 @@
+# cogs/core/emoji_sync.py
+"""
+서버 이모티콘 동기화
+
+봇 시작 시 guild.emojis로 이모티콘 레지스트리를 채우고,
+on_guild_emojis_update로 변경 사항을 바로 반영한다.
+data/server_emojis.json은 다음 시작 때의 콜드 스타트용 스냅샷으로만 사용한다.
+"""
+import asyncio
+import logging
+
+import discord
+from discord.ext import commands
+
+from utils.emoji_helper import load_emojis, update_emojis_from_discord, save_emoji_snapshot
+
+logger = logging.getLogger(__name__)
+
+
+class EmojiSync(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        # 시작 동기화는 프로세스당 한 번 (재연결 때는 on_guild_emojis_update로 충분)
+        self._synced_once = False
+
+    async def cog_load(self):
+        """콜드 스타트용 스냅샷을 미리 읽어 둠 (이후 조회가 루프에서 파일을 읽지 않도록)"""
+        await asyncio.to_thread(load_emojis)
+
+    async def sync_emojis(self, reason: str):
+        """봇이 볼 수 있는 모든 서버 이모티콘으로 레지스트리 갱신"""
+        data = update_emojis_from_discord(self.bot.emojis)
+        if data is None:
+            return
+
+        logger.info(f"서버 이모티콘 동기화 ({reason}): WoW 이모티콘 {len(data['wow_emojis'])}개, "
+                    f"직업 {len(data['wow_classes'])}개")
+
+        try:
+            await asyncio.to_thread(save_emoji_snapshot, data)
+        except Exception as e:
+            logger.warning(f"이모티콘 스냅샷 저장 실패: {e}")
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        if self._synced_once:
+            return
+        self._synced_once = True
+        await self.sync_emojis("시작")
+
+    @commands.Cog.listener()
+    async def on_guild_emojis_update(self, guild: discord.Guild, before, after):
+        await self.sync_emojis(f"{guild.name} 이모티콘 변경")
+
+
+async def setup(bot):
+    await bot.add_cog(EmojiSync(bot))
@@ -1,11 +1,17 @@
+import logging
 import os
 import re
 import csv
 import discord
 from discord import Interaction, app_commands
 from discord.ext import commands
-import asyncio
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+from db.database_manager import DatabaseManager
+from services.cleanup_job_service import CleanupJobRunner
+from services.role_index import RoleIndex, get_role_index
+from utils.helpers import trace_interaction
+
+logger = logging.getLogger(__name__)
 
 CHANNEL_ID = 1275111651493806150
 ALLOWED_ID = [
@@ -22,9 +28,53 @@ TARGET_ROLE_ID = 1329456061048164454  # 정리할 역할 ID = 기웃대는 주
 # DM 메시지 상수
 FAREWELL_MESSAGE = "안녕하세요! **{guild_name}** 길드에서 인사드려요!😊\n\n길드 정리 작업으로 인해 서버에서 나가시게 되었어요.\n언제든지 다시 돌아오시면 환영이에요!\n함께했던 시간 고마웠고, 나중에 또 만나요!\n\n*우당탕탕 스톰윈드 지구대 드림*"
 
+async def run_cleanup_job(runner: CleanupJobRunner, interaction: discord.Interaction, mode_name: str,
+                          kick_members: List[discord.Member],
+                          role_members: Optional[List[discord.Member]] = None) -> str:
+    """정리 작업을 DB에 저장하고 실행 (진행 상황은 관리자의 ephemeral 메시지로 전송)"""
+    guild = interaction.guild
+    job_id = await runner.create_job(
+        guild, mode_name, interaction.user.id,
+        FAREWELL_MESSAGE.format(guild_name=guild.name),
+        kick_members, role_members, TARGET_ROLE_ID
+    )
+
+    async def progress(content: str):
+        await interaction.edit_original_response(content=content, view=None)
+
+    await runner.start(job_id, progress)
+    counts = await runner.get_counts(job_id)
+    return runner.format_result(mode_name, counts)
+
+
 class MemberManager(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self.db_manager = DatabaseManager()
+        self.cleanup_runner = CleanupJobRunner(bot, self.db_manager)
+
+    async def cog_load(self):
+        """코그 로드 시 DB 연결 + 정리 작업 테이블 준비"""
+        await self.db_manager.create_pool()
+        await self.cleanup_runner.ensure_schema()
+        logger.info("MemberManager: 데이터베이스 연결 완료")
+
+    async def cog_unload(self):
+        """코그 언로드 시 DB 연결 해제"""
+        await self.db_manager.close_pool()
+        logger.info("MemberManager: 데이터베이스 연결 해제")
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        """역할 인덱스 구축 + 재시작 전에 끝나지 않은 기웃정리 작업 재개"""
+        for guild in self.bot.guilds:
+            get_role_index(guild.id).build(guild.members)
+            logger.info(f"역할 인덱스 구축: {guild.name} ({len(guild.members)}명)")
+        
+        try:
+            await self.cleanup_runner.resume_unfinished()
+        except Exception as e:
+            logger.warning(f"기웃정리 작업 재개 실패: {e}")
 
     # 레벨스캔 주석처리
     # @app_commands.command(
@@ -35,49 +85,64 @@ class MemberManager(commands.Cog):
     #     # 레벨스캔 로직 주석처리
     #     pass
 
-    def analyze_target_members(self, guild: discord.Guild, target_role: discord.Role) -> Dict[str, List[discord.Member]]:
-        """대상 멤버들을 분석하여 분류"""
+    def get_built_role_index(self, guild: discord.Guild) -> RoleIndex:
+        """역할 인덱스 (아직 구축 전이면 지금 구축)"""
+        index = get_role_index(guild.id)
+        if not index.is_built:
+            index.build(guild.members)
+            logger.info(f"역할 인덱스 구축: {guild.name} ({len(guild.members)}명)")
+        return index
+
+    def analyze_target_members(self, guild: discord.Guild, target_role: discord.Role) -> Dict[str, Any]:
+        """대상 멤버들을 분석하여 분류 (역할 인덱스 집합 조회)"""
         LOG_PREFIX = "[MemberManager.analyze_target_members]"
-        print(f"{LOG_PREFIX} 대상 멤버 분석 시작")
+        logger.info(f"{LOG_PREFIX} 대상 멤버 분석 시작")
         
-        # 해당 역할을 가진 모든 멤버 찾기
-        all_target_members = [member for member in guild.members if target_role in member.roles]
-        print(f"{LOG_PREFIX} 기웃거리는 주민 역할 보유자: {len(all_target_members)}명")
-        
-        # 역할 개수에 따라 분류
-        single_role_members = []  # 기웃거리는 주민 역할만 가진 멤버
-        multi_role_members = []   # 기웃거리는 주민 + 다른 역할도 가진 멤버
-        
-        for member in all_target_members:
-            # @everyone 역할 제외하고 실제 역할 개수 계산
-            actual_roles = [role for role in member.roles if role.name != "@everyone"]
-            
-            if len(actual_roles) == 1:  # 기웃거리는 주민 역할만
-                single_role_members.append(member)
-                print(f"{LOG_PREFIX} 단일역할: {member.display_name}")
-            else:  # 다른 역할도 있음
-                multi_role_members.append(member)
-                other_roles = [role.name for role in actual_roles if role != target_role]
-                print(f"{LOG_PREFIX} 다중역할: {member.display_name} (추가역할: {', '.join(other_roles)})")
+        # 역할 개수에 따라 분류 (@everyone 제외)
+        # 단일: 기웃거리는 주민 역할만 가진 멤버 / 다중: 기웃거리는 주민 + 다른 역할도 가진 멤버
+        index = self.get_built_role_index(guild)
+        single_ids, multi_ids = index.split_by_role_count(target_role.id)
         
-        print(f"{LOG_PREFIX} 분석 완료 - 단일역할: {len(single_role_members)}명, 다중역할: {len(multi_role_members)}명")
+        single_role_members = [m for m in map(guild.get_member, single_ids) if m is not None]
+        multi_role_members = [m for m in map(guild.get_member, multi_ids) if m is not None]
+        logger.info(f"{LOG_PREFIX} 기웃거리는 주민 역할 보유자: {len(single_ids) + len(multi_ids)}명")
+        logger.info(f"{LOG_PREFIX} 분석 완료 - 단일역할: {len(single_role_members)}명, 다중역할: {len(multi_role_members)}명")
         
         return {
             "single_role": single_role_members,
             "multi_role": multi_role_members,
-            "all_target": all_target_members
+            "multi_role_ids": multi_ids,
+            "all_target": single_role_members + multi_role_members
         }
 
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        get_role_index(member.guild.id).update_member(member)
+
+    @commands.Cog.listener()
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        if before.roles != after.roles:
+            get_role_index(after.guild.id).update_member(after)
+
+    @commands.Cog.listener()
+    async def on_raw_member_remove(self, payload: discord.RawMemberRemoveEvent):
+        get_role_index(payload.guild_id).remove_member(payload.user.id)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role):
+        get_role_index(role.guild.id).remove_role(role.id)
+
     @app_commands.command(
         name="기웃정리", 
         description="특정 역할을 가진 멤버들을 서버에서 정리합니다 (관리자 전용)"
     )
+    @trace_interaction
     async def kick_cleanup(self, interaction: Interaction):
         LOG_PREFIX = "[MemberManager.kick_cleanup]"
-        print(f"{LOG_PREFIX} 기웃정리 명령어 실행 시작 - 사용자: {interaction.user.name}")
+        logger.info(f"{LOG_PREFIX} 기웃정리 명령어 실행 시작 - 사용자: {interaction.user.name}")
         
         if interaction.user.id not in ALLOWED_ID:
-            print(f"{LOG_PREFIX} 권한 없는 사용자 접근 차단: {interaction.user.id}")
+            logger.info(f"{LOG_PREFIX} 권한 없는 사용자 접근 차단: {interaction.user.id}")
             return await interaction.response.send_message(
                 "이 명령어는 관리자만 사용할 수 있어요!", ephemeral=True
             )
@@ -87,15 +152,28 @@ class MemberManager(commands.Cog):
         # 길드와 역할 확인
         guild = interaction.guild
         if not guild:
-            print(f"{LOG_PREFIX} 길드 정보 없음")
+            logger.info(f"{LOG_PREFIX} 길드 정보 없음")
             return await interaction.followup.send("길드 정보를 찾을 수 없어요!")
         
         target_role = guild.get_role(TARGET_ROLE_ID)
         if not target_role:
-            print(f"{LOG_PREFIX} 대상 역할을 찾을 수 없음: {TARGET_ROLE_ID}")
+            logger.info(f"{LOG_PREFIX} 대상 역할을 찾을 수 없음: {TARGET_ROLE_ID}")
             return await interaction.followup.send("대상 역할을 찾을 수 없어요!")
         
-        print(f"{LOG_PREFIX} 대상 역할 확인: {target_role.name}")
+        logger.info(f"{LOG_PREFIX} 대상 역할 확인: {target_role.name}")
+        
+        # 진행 중인 작업이 있으면 새로 시작하지 않고 진행 상황만 이어서 표시
+        running_job_id = await self.cleanup_runner.get_running_job_id(guild.id)
+        if running_job_id:
+            logger.info(f"{LOG_PREFIX} 진행 중인 작업 #{running_job_id}에 연결")
+            
+            async def progress(content: str):
+                await interaction.edit_original_response(content=content)
+            
+            await interaction.followup.send(f"진행 중인 기웃정리 작업(#{running_job_id})이 있어요. 진행 상황을 이어서 보여드릴게요.")
+            self.cleanup_runner.attach(running_job_id, progress)
+            self.cleanup_runner.start(running_job_id)
+            return
         
         # 멤버 분석
         member_analysis = self.analyze_target_members(guild, target_role)
@@ -104,7 +182,7 @@ class MemberManager(commands.Cog):
         multi_role_members = member_analysis["multi_role"]
         
         if not single_role_members and not multi_role_members:
-            print(f"{LOG_PREFIX} 정리할 멤버 없음")
+            logger.info(f"{LOG_PREFIX} 정리할 멤버 없음")
             return await interaction.followup.send("정리할 멤버가 없어요!")
         
         # 확인 메시지 구성
@@ -115,9 +193,10 @@ class MemberManager(commands.Cog):
 
         # 전체 대상 목록 표시
         all_members = single_role_members + multi_role_members
+        multi_role_ids = member_analysis["multi_role_ids"]
         if len(all_members) <= 15:
             for member in all_members:
-                if member in multi_role_members:
+                if member.id in multi_role_ids:
                     other_roles = [role.name for role in member.roles 
                                  if role.name != "@everyone" and role != target_role]
                     confirm_msg += f"- {member.display_name} (+{', '.join(other_roles)})\n"
@@ -125,7 +204,7 @@ class MemberManager(commands.Cog):
                     confirm_msg += f"- {member.display_name}\n"
         else:
             for member in all_members[:12]:
-                if member in multi_role_members:
+                if member.id in multi_role_ids:
                     other_roles = [role.name for role in member.roles 
                                  if role.name != "@everyone" and role != target_role]
                     confirm_msg += f"- {member.display_name} (+{', '.join(other_roles)})\n"
@@ -136,18 +215,20 @@ class MemberManager(commands.Cog):
         confirm_msg += "\n**어떻게 처리할까요?** (60초 후 자동 취소)"
         
         # 옵션 버튼 뷰
-        view = CleanupOptionsView(member_analysis, guild.name, target_role.name)
+        view = CleanupOptionsView(member_analysis, guild.name, target_role.name, self.cleanup_runner)
         
-        print(f"{LOG_PREFIX} 사용자에게 옵션 선택 화면 표시")
+        logger.info(f"{LOG_PREFIX} 사용자에게 옵션 선택 화면 표시")
         await interaction.followup.send(confirm_msg, view=view, ephemeral=True)
 
 
 class CleanupOptionsView(discord.ui.View):
-    def __init__(self, member_analysis: Dict[str, List[discord.Member]], guild_name: str, target_role_name: str):
+    def __init__(self, member_analysis: Dict[str, List[discord.Member]], guild_name: str, target_role_name: str,
+                 runner: CleanupJobRunner):
         super().__init__(timeout=60)
         self.member_analysis = member_analysis
         self.guild_name = guild_name
         self.target_role_name = target_role_name
+        self.runner = runner
         self.LOG_PREFIX = "[CleanupOptionsView]"
         
         # 동적으로 버튼 생성
@@ -189,11 +270,12 @@ class CleanupOptionsView(discord.ui.View):
         cancel_button.callback = self.cancel_cleanup
         self.add_item(cancel_button)
         
-        print(f"{self.LOG_PREFIX} 옵션 뷰 생성 완료")
+        logger.info(f"{self.LOG_PREFIX} 옵션 뷰 생성 완료")
         
+    @trace_interaction
     async def basic_cleanup(self, interaction: discord.Interaction):
         """기웃거리는 주민만 있는 멤버만 추방 + 다중역할 멤버 리스트 표시"""
-        print(f"{self.LOG_PREFIX} 기본 정리 옵션 선택됨")
+        logger.info(f"{self.LOG_PREFIX} 기본 정리 옵션 선택됨")
         
         await interaction.response.defer(ephemeral=True)
         
@@ -224,9 +306,10 @@ class CleanupOptionsView(discord.ui.View):
         
         await interaction.edit_original_response(content=result_msg, view=None)
 
+    @trace_interaction
     async def full_cleanup(self, interaction: discord.Interaction):
         """모든 대상 멤버 추방 (다중 역할 포함)"""
-        print(f"{self.LOG_PREFIX} 전체 추방 옵션 선택됨")
+        logger.info(f"{self.LOG_PREFIX} 전체 추방 옵션 선택됨")
         
         await interaction.response.defer(ephemeral=True)
         
@@ -243,12 +326,13 @@ class CleanupOptionsView(discord.ui.View):
         warning_msg += "정말로 진행하시겠습니까?"
         
         # 최종 확인 뷰
-        confirm_view = FinalConfirmView(all_members, self.guild_name, "전체 추방")
+        confirm_view = FinalConfirmView(all_members, self.guild_name, "전체 추방", self.runner)
         await interaction.followup.send(warning_msg, view=confirm_view, ephemeral=True)
 
+    @trace_interaction
     async def role_only_cleanup(self, interaction: discord.Interaction):
         """다중 역할 멤버는 역할만 제거, 단일 역할은 추방"""
-        print(f"{self.LOG_PREFIX} 역할만 제거 옵션 선택됨")
+        logger.info(f"{self.LOG_PREFIX} 역할만 제거 옵션 선택됨")
         
         await interaction.response.defer(ephemeral=True)
         
@@ -258,180 +342,29 @@ class CleanupOptionsView(discord.ui.View):
         processing_msg = "역할 제거 및 추방 처리 중...\n\n"
         await interaction.edit_original_response(content=processing_msg, view=None)
         
-        # 결과 카운터
-        kick_success = 0
-        kick_failed = 0
-        role_remove_success = 0
-        role_remove_failed = 0
-        dm_success = 0
-        dm_failed = 0
-        
-        # 1. 단일 역할 멤버들 추방
-        if single_role_members:
-            print(f"{self.LOG_PREFIX} 단일 역할 멤버 {len(single_role_members)}명 추방 시작")
-            
-            for i, member in enumerate(single_role_members, 1):
-                try:
-                    # DM 발송
-                    try:
-                        farewell_message = FAREWELL_MESSAGE.format(guild_name=self.guild_name)
-                        await member.send(farewell_message)
-                        dm_success += 1
-                        print(f"{self.LOG_PREFIX} DM 성공: {member.display_name}")
-                    except:
-                        dm_failed += 1
-                        print(f"{self.LOG_PREFIX} DM 실패: {member.display_name}")
-                    
-                    await asyncio.sleep(1)
-                    
-                    # 추방
-                    await member.kick(reason="길드 정리 작업 - 역할만 제거 모드")
-                    kick_success += 1
-                    print(f"{self.LOG_PREFIX} 추방 성공: {member.display_name}")
-                    
-                except Exception as e:
-                    kick_failed += 1
-                    print(f"{self.LOG_PREFIX} 추방 실패: {member.display_name} - {e}")
-                
-                # 진행상황 업데이트
-                if i % 3 == 0:
-                    progress = f"역할 제거 및 추방 처리 중... ({i}/{len(single_role_members) + len(multi_role_members)})"
-                    try:
-                        await interaction.edit_original_response(content=progress)
-                    except:
-                        pass
-                
-                await asyncio.sleep(0.5)
-        
-        # 2. 다중 역할 멤버들 역할만 제거
-        if multi_role_members:
-            print(f"{self.LOG_PREFIX} 다중 역할 멤버 {len(multi_role_members)}명 역할 제거 시작")
-            
-            target_role_id = TARGET_ROLE_ID
-            
-            for i, member in enumerate(multi_role_members, len(single_role_members) + 1):
-                try:
-                    # 해당 역할 찾기
-                    target_role = None
-                    for role in member.roles:
-                        if role.id == target_role_id:
-                            target_role = role
-                            break
-                    
-                    if target_role:
-                        await member.remove_roles(target_role, reason="길드 정리 작업 - 역할만 제거")
-                        role_remove_success += 1
-                        print(f"{self.LOG_PREFIX} 역할 제거 성공: {member.display_name}")
-                    else:
-                        role_remove_failed += 1
-                        print(f"{self.LOG_PREFIX} 대상 역할 없음: {member.display_name}")
-                    
-                except Exception as e:
-                    role_remove_failed += 1
-                    print(f"{self.LOG_PREFIX} 역할 제거 실패: {member.display_name} - {e}")
-                
-                # 진행상황 업데이트
-                if i % 3 == 0:
-                    progress = f"역할 제거 및 추방 처리 중... ({i}/{len(single_role_members) + len(multi_role_members)})"
-                    try:
-                        await interaction.edit_original_response(content=progress)
-                    except:
-                        pass
-                
-                await asyncio.sleep(0.3)
-        
-        # 최종 결과
-        result_msg = f"**역할만 제거 모드 완료!** 🎉\n\n"
-        result_msg += f"🔥 **추방 결과**\n"
-        result_msg += f"- 성공: {kick_success}명\n"
-        result_msg += f"- 실패: {kick_failed}명\n\n"
-        result_msg += f"⚙️ **역할 제거 결과**\n"
-        result_msg += f"- 성공: {role_remove_success}명\n"
-        result_msg += f"- 실패: {role_remove_failed}명\n\n"
-        result_msg += f"📧 **DM 발송**\n"
-        result_msg += f"- 성공: {dm_success}명\n"
-        result_msg += f"- 실패: {dm_failed}명\n\n"
-        result_msg += "모든 작업이 완료되었어요!"
-        
-        print(f"{self.LOG_PREFIX} 역할만 제거 모드 완료 - 추방:{kick_success}, 역할제거:{role_remove_success}")
+        # 단일 역할 멤버는 추방, 다중 역할 멤버는 역할만 제거
+        logger.info(f"{self.LOG_PREFIX} 추방 {len(single_role_members)}명, 역할 제거 {len(multi_role_members)}명 작업 시작")
+        result_msg = await run_cleanup_job(self.runner, interaction, "역할만 제거 모드",
+                                           single_role_members, multi_role_members)
+        
+        logger.info(f"{self.LOG_PREFIX} 역할만 제거 모드 완료")
         await interaction.edit_original_response(content=result_msg, view=None)
 
+    @trace_interaction
     async def cancel_cleanup(self, interaction: discord.Interaction):
-        print(f"{self.LOG_PREFIX} 기웃정리 취소됨")
+        logger.info(f"{self.LOG_PREFIX} 기웃정리 취소됨")
         await interaction.response.edit_message(
             content="기웃정리가 취소되었어요.", 
             view=None
         )
 
     async def execute_kicks(self, members_to_kick: List[discord.Member], interaction: discord.Interaction, mode_name: str) -> str:
-        """멤버 추방 실행"""
-        print(f"{self.LOG_PREFIX} {mode_name} 추방 시작: {len(members_to_kick)}명")
-        
-        success_count = 0
-        dm_success_count = 0
-        dm_failed_count = 0
-        kick_failed_count = 0
-        
-        farewell_message = FAREWELL_MESSAGE.format(guild_name=self.guild_name)
-        
-        for i, member in enumerate(members_to_kick, 1):
-            try:
-                # DM 발송 시도
-                try:
-                    await member.send(farewell_message)
-                    dm_success_count += 1
-                    print(f"{self.LOG_PREFIX} DM 성공: {member.display_name}")
-                except discord.Forbidden:
-                    dm_failed_count += 1
-                    print(f"{self.LOG_PREFIX} DM 실패 (차단됨): {member.display_name}")
-                except Exception as e:
-                    dm_failed_count += 1
-                    print(f"{self.LOG_PREFIX} DM 실패: {member.display_name} - {e}")
-                
-                await asyncio.sleep(1)
-                
-                # 추방 시도
-                try:
-                    await member.kick(reason=f"길드 정리 작업 - {mode_name}")
-                    success_count += 1
-                    print(f"{self.LOG_PREFIX} 추방 성공: {member.display_name}")
-                except discord.Forbidden:
-                    kick_failed_count += 1
-                    print(f"{self.LOG_PREFIX} 추방 실패 (권한부족): {member.display_name}")
-                except Exception as e:
-                    kick_failed_count += 1
-                    print(f"{self.LOG_PREFIX} 추방 실패: {member.display_name} - {e}")
-                
-                # 진행상황 업데이트
-                if i % 5 == 0 or i == len(members_to_kick):
-                    progress_msg = f"{mode_name} 처리 중... ({i}/{len(members_to_kick)})"
-                    try:
-                        await interaction.edit_original_response(content=progress_msg)
-                    except:
-                        pass
-                
-                await asyncio.sleep(0.5)
-                
-            except Exception as e:
-                print(f"{self.LOG_PREFIX} 처리 중 오류: {member.display_name} - {e}")
-                continue
-        
-        # 결과 메시지 생성
-        result_msg = f"**{mode_name} 완료!** 🎉\n\n"
-        result_msg += f"📊 **처리 결과**\n"
-        result_msg += f"- 대상 인원: {len(members_to_kick)}명\n"
-        result_msg += f"- 추방 성공: {success_count}명\n"
-        result_msg += f"- 추방 실패: {kick_failed_count}명\n\n"
-        result_msg += f"💌 **DM 발송 결과**\n"
-        result_msg += f"- DM 성공: {dm_success_count}명\n"
-        result_msg += f"- DM 실패: {dm_failed_count}명"
-        
-        print(f"{self.LOG_PREFIX} {mode_name} 완료 - 성공:{success_count}, 실패:{kick_failed_count}")
-        
-        return result_msg
+        """멤버 추방 실행 (DB 작업으로 저장 후 동시 처리, 재시작 시 재개)"""
+        logger.info(f"{self.LOG_PREFIX} {mode_name} 추방 시작: {len(members_to_kick)}명")
+        return await run_cleanup_job(self.runner, interaction, mode_name, members_to_kick)
 
     async def on_timeout(self):
-        print(f"{self.LOG_PREFIX} 선택 시간 초과")
+        logger.info(f"{self.LOG_PREFIX} 선택 시간 초과")
         # 타임아웃 시 버튼 비활성화
         for item in self.children:
             item.disabled = True
@@ -439,28 +372,30 @@ class CleanupOptionsView(discord.ui.View):
 
 class FinalConfirmView(discord.ui.View):
     """전체 추방 최종 확인 뷰"""
-    def __init__(self, members_to_kick: List[discord.Member], guild_name: str, mode_name: str):
+    def __init__(self, members_to_kick: List[discord.Member], guild_name: str, mode_name: str,
+                 runner: CleanupJobRunner):
         super().__init__(timeout=30)
         self.members_to_kick = members_to_kick
         self.guild_name = guild_name
         self.mode_name = mode_name
+        self.runner = runner
         self.LOG_PREFIX = "[FinalConfirmView]"
         
     @discord.ui.button(label="확실히 진행", style=discord.ButtonStyle.danger)
+    @trace_interaction
     async def final_confirm(self, interaction: discord.Interaction, button: discord.ui.Button):
-        print(f"{self.LOG_PREFIX} 전체 추방 최종 확인됨")
+        logger.info(f"{self.LOG_PREFIX} 전체 추방 최종 확인됨")
         
         await interaction.response.defer(ephemeral=True)
         
-        # CleanupOptionsView의 execute_kicks 메서드 재사용
-        cleanup_view = CleanupOptionsView({}, self.guild_name, "")
-        result = await cleanup_view.execute_kicks(self.members_to_kick, interaction, self.mode_name)
+        result = await run_cleanup_job(self.runner, interaction, self.mode_name, self.members_to_kick)
         
         await interaction.edit_original_response(content=result, view=None)
     
     @discord.ui.button(label="취소", style=discord.ButtonStyle.secondary)
+    @trace_interaction
     async def final_cancel(self, interaction: discord.Interaction, button: discord.ui.Button):
-        print(f"{self.LOG_PREFIX} 전체 추방 취소됨")
+        logger.info(f"{self.LOG_PREFIX} 전체 추방 취소됨")
         await interaction.response.edit_message(
             content="전체 추방이 취소되었어요.", 
             view=None
@@ -0,0 +1,96 @@
+# cogs/core/member_sync.py
+"""
+길드 멤버 스냅샷 동기화
+
+봇 시작 시 guild.members 전체를 guild_bot.guild_members에 반영하고,
+이후에는 멤버 입장/변경/퇴장 이벤트를 모아서 주기적으로 반영한다.
+tools/의 오프라인 스크립트는 게이트웨이 대신 이 테이블을 읽는다.
+"""
+import logging
+import discord
+from discord.ext import commands, tasks
+
+from db.database_manager import DatabaseManager
+from services.guild_member_snapshot import GuildMemberMirror
+
+logger = logging.getLogger(__name__)
+
+
+class MemberSync(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.db_manager = DatabaseManager()
+        self.mirror = GuildMemberMirror(self.db_manager)
+
+    async def cog_load(self):
+        """코그 로드 시 DB 연결 + 스냅샷 테이블 준비"""
+        await self.db_manager.create_pool()
+        await self.mirror.ensure_schema()
+        logger.info("MemberSync: 데이터베이스 연결 완료")
+        self.flush_changes.start()
+
+    async def cog_unload(self):
+        """코그 언로드 시 남은 변경 반영 후 DB 연결 해제"""
+        self.flush_changes.cancel()
+        try:
+            await self.mirror.flush()
+        except Exception as e:
+            logger.warning(f"멤버 스냅샷 반영 실패: {e}")
+        await self.db_manager.close_pool()
+        logger.info("MemberSync: 데이터베이스 연결 해제")
+
+    @tasks.loop(seconds=5)
+    async def flush_changes(self):
+        """모아 둔 멤버 변경 사항 반영"""
+        try:
+            await self.mirror.flush()
+        except Exception as e:
+            logger.warning(f"멤버 스냅샷 반영 실패 (대기 {self.mirror.pending}건): {e}")
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        """새 세션마다 전체 동기화
+
+        RESUME에 실패해서 다시 IDENTIFY하면 끊긴 동안의 입장/퇴장/닉네임/역할 변경은
+        이벤트로 오지 않으므로 전체를 다시 맞춘다 (RESUME 성공은 on_resumed라 여기 오지 않음).
+        """
+        for guild in self.bot.guilds:
+            try:
+                count = await self.mirror.sync_guild(guild)
+                logger.info(f"멤버 스냅샷 동기화: {guild.name} ({count}명)")
+            except Exception as e:
+                logger.warning(f"멤버 스냅샷 동기화 실패 ({guild.name}): {e}")
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        self.mirror.mark_updated(member)
+
+    @commands.Cog.listener()
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        if (before.nick, before.roles) != (after.nick, after.roles):
+            self.mirror.mark_updated(after)
+
+    @commands.Cog.listener()
+    async def on_user_update(self, before: discord.User, after: discord.User):
+        # 사용자명/전역 표시 이름이 바뀌면 닉네임 없는 멤버의 display_name도 바뀐다
+        if (before.name, before.display_name) == (after.name, after.display_name):
+            return
+        for guild in self.bot.guilds:
+            member = guild.get_member(after.id)
+            if member:
+                self.mirror.mark_updated(member)
+
+    @commands.Cog.listener()
+    async def on_raw_member_remove(self, payload: discord.RawMemberRemoveEvent):
+        self.mirror.mark_removed(payload.guild_id, payload.user.id)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role):
+        try:
+            await self.mirror.remove_role(role.guild.id, role.id)
+        except Exception as e:
+            logger.warning(f"멤버 스냅샷 역할 삭제 반영 실패: {e}")
+
+
+async def setup(bot):
+    await bot.add_cog(MemberSync(bot))
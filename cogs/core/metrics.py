@@ -0,0 +1,108 @@
+# cogs/core/metrics.py
+"""
+지표 엔드포인트
+
+봇 프로세스 안에서 작은 HTTP 서버를 띄워 GET /metrics로 Prometheus 텍스트 형식을 내보낸다.
+기본은 127.0.0.1:9108 (METRICS_HOST / METRICS_PORT 환경변수, METRICS_PORT=0이면 끔).
+
+- 슬래시 명령어 처리 시간: 명령어 트리의 interaction_check(콜백 실행 직전)에서 시작 시각을 기록하고
+  on_app_command_completion / 명령어 트리 오류 처리에서 관측
+  (on_interaction은 명령어 태스크가 첫 await까지 실행된 뒤에 와서 그 앞의 동기 작업이 빠진다)
+- 이벤트 루프 지연/막힘: utils.loop_watchdog.LoopWatchdog
+"""
+import logging
+import os
+import time
+from typing import Dict, Optional
+
+import discord
+from aiohttp import web
+from discord import app_commands
+from discord.ext import commands
+
+from utils.loop_watchdog import LoopWatchdog
+from utils.metrics import observe_interaction, render_latest
+
+logger = logging.getLogger(__name__)
+
+# 완료 이벤트가 오지 않은 인터랙션 시작 기록을 정리하는 기준 (초)
+PENDING_TTL = 15 * 60
+
+
+class Metrics(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.host = os.getenv("METRICS_HOST", "127.0.0.1")
+        self.port = int(os.getenv("METRICS_PORT", "9108"))
+        self._runner: Optional[web.AppRunner] = None
+        self.watchdog = LoopWatchdog()
+        self._started: Dict[int, float] = {}
+        self._original_tree_error = None
+        self._original_tree_check = None
+
+    async def cog_load(self):
+        """코그 로드 시 지표 서버 + 루프 감시 시작"""
+        self.watchdog.start()
+
+        tree = self.bot.tree
+        self._original_tree_error = tree.on_error
+        tree.on_error = self._on_tree_error
+        self._original_tree_check = tree.interaction_check
+        tree.interaction_check = self._tree_interaction_check
+
+        if self.port:
+            app = web.Application()
+            app.router.add_get("/metrics", self._handle_metrics)
+            self._runner = web.AppRunner(app, access_log=None)
+            await self._runner.setup()
+            await web.TCPSite(self._runner, self.host, self.port).start()
+            logger.info(f"Metrics: http://{self.host}:{self.port}/metrics")
+
+    async def cog_unload(self):
+        """코그 언로드 시 지표 서버 종료"""
+        await self.watchdog.stop()
+        if self._original_tree_error is not None:
+            self.bot.tree.on_error = self._original_tree_error
+        if self._original_tree_check is not None:
+            self.bot.tree.interaction_check = self._original_tree_check
+        if self._runner:
+            await self._runner.cleanup()
+            logger.info("Metrics: 지표 서버 종료")
+
+    async def _handle_metrics(self, request: web.Request) -> web.Response:
+        return web.Response(text=render_latest(), content_type="text/plain", charset="utf-8",
+                            headers={"X-Content-Type-Options": "nosniff"})
+
+    def _prune_started(self):
+        if len(self._started) < 256:
+            return
+        cutoff = time.perf_counter() - PENDING_TTL
+        for interaction_id in [i for i, t in self._started.items() if t < cutoff]:
+            del self._started[interaction_id]
+
+    def _finish(self, interaction: discord.Interaction, ok: bool):
+        started = self._started.pop(interaction.id, None)
+        if started is None:
+            return
+        command = interaction.command
+        name = command.qualified_name if command else "unknown"
+        observe_interaction("command", name, time.perf_counter() - started, ok=ok)
+
+    async def _on_tree_error(self, interaction: discord.Interaction, error: app_commands.AppCommandError):
+        self._finish(interaction, ok=False)
+        await self._original_tree_error(interaction, error)
+
+    async def _tree_interaction_check(self, interaction: discord.Interaction) -> bool:
+        """명령어 콜백 직전에 시작 시각 기록 (콜백의 첫 await 전 동기 작업까지 포함)"""
+        if interaction.type == discord.InteractionType.application_command:
+            self._prune_started()
+            self._started[interaction.id] = time.perf_counter()
+        return await self._original_tree_check(interaction)
+
+    @commands.Cog.listener()
+    async def on_app_command_completion(self, interaction: discord.Interaction, command):
+        self._finish(interaction, ok=True)
+
+
+async def setup(bot):
+    await bot.add_cog(Metrics(bot))
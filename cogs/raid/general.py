@@ -1,9 +1,25 @@
+import logging
 from discord.ext import commands
 from discord import app_commands, Interaction
 import discord
-import os
+from typing import List
 from decorators.guild_only import guild_only
 from db.database_manager import DatabaseManager
+from services.character_index import character_index
+from services.member_roster import member_roster
+from utils.autocomplete import character_autocomplete, realm_autocomplete
+from utils.helpers import trace_interaction
+from utils.realm_index import make_realm_slug
+from utils.wow_translation import REALM_INDEX
+
+logger = logging.getLogger(__name__)
+
+
+def to_realm_slug(realm: str) -> str:
+    """서버명(한국어/영어/슬러그)을 sim용 슬러그로 변환"""
+    record = REALM_INDEX.lookup(realm)
+    return record.slug if record else make_realm_slug(realm)
+
 
 class Raid(commands.Cog):
     def __init__(self, bot):
@@ -13,17 +29,19 @@ class Raid(commands.Cog):
     async def cog_load(self):
         """코그 로드 시 DB 연결"""
         await self.db_manager.create_pool()
-        print(">>> Raid: 데이터베이스 연결 완료")
+        logger.info("Raid: 데이터베이스 연결 완료")
+        await member_roster.ensure_fresh()
 
     async def cog_unload(self):
         """코그 언로드 시 DB 연결 해제"""
         await self.db_manager.close_pool()
-        print(">>> Raid: 데이터베이스 연결 해제")
+        logger.info("Raid: 데이터베이스 연결 해제")
 
     # /닉 - 단순한 닉네임 변경
     @app_commands.command(name="닉", description="닉네임을 변경해요!")
     @app_commands.describe(new_nickname="바꾸고 싶은 닉네임")
     # @guild_only() 
+    @trace_interaction
     async def change_nickname(self, interaction: Interaction, new_nickname: str):
         try:
             await interaction.user.edit(nick=new_nickname)
@@ -31,7 +49,7 @@ class Raid(commands.Cog):
                 f"✅ 닉네임이 **{new_nickname}**로 변경되었어요!",
                 ephemeral=True
             )
-            print(f">>> 닉네임 변경: {interaction.user.name} -> {new_nickname}")
+            logger.info(f"닉네임 변경: {interaction.user.name} -> {new_nickname}")
         except discord.Forbidden:
             await interaction.response.send_message(
                 "❌ 권한이 부족해서 닉네임을 변경할 수 없어요!",
@@ -42,36 +60,64 @@ class Raid(commands.Cog):
                 "❌ 닉네임 변경 중 오류가 발생했어요!",
                 ephemeral=True
             )
-            print(f">>> 닉네임 변경 오류: {e}")
+            logger.error(f"닉네임 변경 오류: {e}")
+
+    async def get_verified_character(self, discord_id: int):
+        """본인 인증된 캐릭터 (character_ownership.is_verified) 조회"""
+        try:
+            async with self.db_manager.get_connection() as conn:
+                return await conn.fetchrow("""
+                    SELECT c.character_name, c.realm_slug
+                    FROM guild_bot.character_ownership co
+                    JOIN guild_bot.discord_users du ON co.discord_user_id = du.id
+                    JOIN guild_bot.characters c ON co.character_id = c.id
+                    WHERE du.discord_id = $1 AND co.is_verified = TRUE
+                    LIMIT 1
+                """, str(discord_id))
+        except Exception as e:
+            logger.error(f"인증 캐릭터 조회 오류: {e}")
+            return None
+
+    def find_sim_realms(self, character_name: str, verified=None) -> List[str]:
+        """캐릭터의 sim용 서버 슬러그 목록 (인증 캐릭터 -> 캐릭터 인덱스 -> member.txt 순)"""
+        realms = []
+        if verified and verified['character_name'] == character_name:
+            realms.append(to_realm_slug(verified['realm_slug']))
+        for entry in character_index.get(character_name):
+            realms.append(to_realm_slug(entry.realm_slug))
+        for slug in member_roster.get(character_name):
+            realms.append(to_realm_slug(slug))
+        return list(dict.fromkeys(realms))
 
     @app_commands.command(name="심크", description="sim 명령어를 자동 생성해줘요!")
-    @app_commands.describe(character_name="캐릭터 이름 (없으면 본인 서버닉네임 사용)")
+    @app_commands.describe(
+        character_name="캐릭터 이름 (없으면 본인 인증 캐릭터 또는 서버닉네임 사용)",
+        realm="서버 (같은 이름의 캐릭터가 여러 서버에 있을 때)"
+    )
+    @app_commands.autocomplete(character_name=character_autocomplete, realm=realm_autocomplete)
     @guild_only() 
-    async def sim_helper(self, interaction: Interaction, character_name: str = None):
+    @trace_interaction
+    async def sim_helper(self, interaction: Interaction, character_name: str = None, realm: str = None):
         await interaction.response.defer(ephemeral=True)
         
-        # 캐릭터명이 없으면 서버 닉네임 사용 (🚀 제거)
+        verified = await self.get_verified_character(interaction.user.id)
+        
+        # 캐릭터명이 없으면 인증 캐릭터, 그것도 없으면 서버 닉네임 사용 (🚀 제거)
         if not character_name:
-            character_name = interaction.user.display_name.replace("🚀", "")
-
-        file_path = "member.txt"
-        if not os.path.exists(file_path):
-            await interaction.followup.send("💾 member.txt 파일이 없어요!")
-            return
-
-        with open(file_path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
+            if verified:
+                character_name = verified['character_name']
+            else:
+                character_name = interaction.user.display_name.replace("🚀", "")
 
-        found_server = None
-        for line in lines:
-            if "-" not in line:
-                continue
-            name, slug = line.strip().split("-", 1)
-            if name == character_name:
-                found_server = slug
-                break
+        await member_roster.ensure_fresh()
+        realms = self.find_sim_realms(character_name, verified)
+        
+        if realm:
+            wanted = to_realm_slug(realm)
+            realms = [slug for slug in realms if slug == wanted]
 
-        if found_server:
+        if len(realms) == 1:
+            found_server = realms[0]
             sim_params = f"kr {found_server} {character_name}"
             
             await interaction.followup.send(
@@ -80,10 +126,19 @@ class Raid(commands.Cog):
                 f"```{sim_params}```\n"
                 f"🔍 서버: `{found_server}`"
             )
+        elif realms:
+            options = "\n".join(f"```kr {slug} {character_name}```" for slug in realms)
+            await interaction.followup.send(
+                f"**🎮 {character_name}** 캐릭터가 {len(realms)}개 서버에 있어요!\n"
+                f"**📋 본인 서버의 파라미터를 복사해서 /sim 뒤에 붙여넣으세요:**\n"
+                f"{options}\n"
+                f"💡 `realm` 옵션으로 서버를 지정할 수도 있어요."
+            )
         else:
+            realm_text = f" ({realm})" if realm else ""
             await interaction.followup.send(
-                f"❌ **{character_name}** 캐릭터를 찾을 수 없어요 😢\n"
-                f"member.txt에 `{character_name}-서버명` 형태로 등록되어 있는지 확인해주세요!"
+                f"❌ **{character_name}**{realm_text} 캐릭터를 찾을 수 없어요 😢\n"
+                f"캐릭터를 등록했거나 member.txt에 `{character_name}-서버명` 형태로 등록되어 있는지 확인해주세요!"
             )
 
 # Cog 등록
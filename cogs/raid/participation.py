@@ -1,11 +1,15 @@
 # cogs/raid_system.py
+import logging
 import discord
 from discord.ext import commands
 from discord import app_commands, Interaction
 from db.database_manager import DatabaseManager  # 수정
+from utils.helpers import trace_interaction
 from datetime import datetime, timedelta
 import pytz
 
+logger = logging.getLogger(__name__)
+
 class RaidSystem(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
@@ -14,14 +18,15 @@ class RaidSystem(commands.Cog):
     async def cog_load(self):
         """Cog 로드 시 DB 연결"""
         await self.db_manager.create_pool()
-        print(">>> RaidSystem: 데이터베이스 연결 완료")
+        logger.info("RaidSystem: 데이터베이스 연결 완료")
 
     async def cog_unload(self):
         """Cog 언로드 시 DB 연결 해제"""  
         await self.db_manager.close_pool()
-        print(">>> RaidSystem: 데이터베이스 연결 해제")
+        logger.info("RaidSystem: 데이터베이스 연결 해제")
 
     @app_commands.command(name="일정조회", description="예정된 레이드 일정을 조회합니다")
+    @trace_interaction
     async def show_schedule(self, interaction: Interaction):
         await interaction.response.defer()
         
@@ -72,13 +77,14 @@ class RaidSystem(commands.Cog):
             await interaction.followup.send(embed=embed)
             
         except Exception as e:
-            print(f">>> 일정조회 오류: {e}")
+            logger.error(f"일정조회 오류: {e}")
             await interaction.followup.send("일정 조회 중 오류가 발생했습니다.")
 
 
 
     @app_commands.command(name="일정생성", description="테스트용 일정 인스턴스를 수동으로 생성합니다")
     @commands.has_permissions(administrator=True)
+    @trace_interaction
     async def create_event_instance(self, interaction: Interaction, 일정이름: str, 날짜: str):
         """
         사용법: /일정생성 "1st Raid" "2025-09-15"
@@ -126,10 +132,10 @@ class RaidSystem(commands.Cog):
                     f"🆔 인스턴스 ID: {instance_id}"
                 )
                 
-                print(f">>> 일정 인스턴스 생성: ID {instance_id}, {일정이름}, {날짜}")
+                logger.info(f"일정 인스턴스 생성: ID {instance_id}, {일정이름}, {날짜}")
                 
         except Exception as e:
-            print(f">>> 일정생성 오류: {e}")
+            logger.error(f"일정생성 오류: {e}")
             await interaction.followup.send("❌ 일정 생성 중 오류가 발생했습니다.")
 
 async def setup(bot):
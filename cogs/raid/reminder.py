@@ -0,0 +1,50 @@
+# cogs/raid/reminder.py
+"""
+레이드 시작 전 알림
+
+1분마다 알림 시간이 된 일정 인스턴스를 찾아 참가자에게 DM/채널 멘션을 보낸다.
+알림 시간 규칙은 RAID_REMINDER_RULES 환경변수로 설정 (예: "1440:dm,60:dm,10:channel").
+"""
+import logging
+from discord.ext import commands, tasks
+
+from db.database_manager import DatabaseManager
+from services.raid_reminder_service import DiscordReminderSender, RaidReminderService, format_offset
+
+logger = logging.getLogger(__name__)
+
+
+class RaidReminder(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.db_manager = DatabaseManager()
+        self.service = RaidReminderService(self.db_manager, DiscordReminderSender(bot))
+
+    async def cog_load(self):
+        """코그 로드 시 DB 연결 + 발송 기록 테이블 준비"""
+        await self.db_manager.create_pool()
+        await self.service.store.ensure_schema()
+        rules = ", ".join(f"{format_offset(r.offset_minutes)} 전 {r.mode}" for r in self.service.rules)
+        logger.info(f"RaidReminder: 데이터베이스 연결 완료 (알림 규칙: {rules or '없음'})")
+        self.send_reminders.start()
+
+    async def cog_unload(self):
+        """코그 언로드 시 DB 연결 해제"""
+        self.send_reminders.cancel()
+        await self.db_manager.close_pool()
+        logger.info("RaidReminder: 데이터베이스 연결 해제")
+
+    @tasks.loop(minutes=1)
+    async def send_reminders(self):
+        try:
+            await self.service.run_due()
+        except Exception as e:
+            logger.error(f"레이드 알림 처리 오류: {e}")
+
+    @send_reminders.before_loop
+    async def before_send_reminders(self):
+        await self.bot.wait_until_ready()
+
+
+async def setup(bot):
+    await bot.add_cog(RaidReminder(bot))
@@ -1,9 +1,14 @@
+import logging
 import discord
 from discord.ext import commands
 from discord import app_commands, Interaction, ui
 from decorators.guild_only import guild_only
 from .schedule_ui import EventSignupView
 from db.database_manager import DatabaseManager
+from utils.helpers import trace_interaction
+from utils.tracing import span
+
+logger = logging.getLogger(__name__)
 
 class Schedule(commands.Cog):
     def __init__(self, bot):
@@ -13,19 +18,19 @@ class Schedule(commands.Cog):
     async def cog_load(self):
         """Cog 로드 시 DB 연결"""
         await self.db_manager.create_pool()
-        print(">>> Schedule: 데이터베이스 연결 완료")
+        logger.info("Schedule: 데이터베이스 연결 완료")
 
     async def cog_unload(self):
         """Cog 언로드 시 DB 연결 해제"""  
         await self.db_manager.close_pool()
-        print(">>> Schedule: 데이터베이스 연결 해제")
+        logger.info("Schedule: 데이터베이스 연결 해제")
 
 
     async def cog_load(self):
         """Cog 로드 시 기존 메시지들의 View 복원"""
         await self.db_manager.create_pool()
         await self._restore_persistent_views()
-        print(">>> Schedule: 데이터베이스 연결 및 View 복원 완료")
+        logger.info("Schedule: 데이터베이스 연결 및 View 복원 완료")
 
     async def _restore_persistent_views(self):
         """기존 메시지들의 View 복원"""
@@ -50,15 +55,16 @@ class Schedule(commands.Cog):
                     )
                     self.bot.add_view(view)
                 
-                print(f">>> {len(active_messages)}개 기존 메시지의 View 복원 완료")
+                logger.info(f"{len(active_messages)}개 기존 메시지의 View 복원 완료")
                 
         except Exception as e:
-            print(f">>> View 복원 오류: {e}")
+            logger.error(f"View 복원 오류: {e}")
     
 
 
     @app_commands.command(name="일정", description="예정된 길드 이벤트를 보여줘요!")
     @guild_only() 
+    @trace_interaction
     async def show_events(self, interaction: Interaction):
         await interaction.response.defer()
 
@@ -142,6 +148,7 @@ class Schedule(commands.Cog):
 
     @app_commands.command(name="일정공지", description="일정 인스턴스에 대한 참가 신청 메시지를 발송합니다")
     @commands.has_permissions(administrator=True)
+    @trace_interaction
     async def post_event_message(self, interaction: Interaction, 인스턴스id: int):
         """
         사용법: /일정공지 1
@@ -164,7 +171,8 @@ class Schedule(commands.Cog):
                     return
                 
                 # 임베드 메시지 생성
-                embed = await self.create_event_embed(event_data)
+                with span("render"):
+                    embed = await self.create_event_embed(event_data)
                 
                 # 먼저 View 없이 메시지 발송
                 message = await interaction.followup.send(embed=embed)
@@ -182,12 +190,10 @@ class Schedule(commands.Cog):
                     WHERE id = $3
                 """, str(message.id), str(interaction.channel.id), 인스턴스id)
                 
-                print(f">>> 일정 공지 메시지 발송: 인스턴스 {인스턴스id}, 메시지 {message.id}, 채널 {interaction.channel.id}")
+                logger.info(f"일정 공지 메시지 발송: 인스턴스 {인스턴스id}, 메시지 {message.id}, 채널 {interaction.channel.id}")
                 
         except Exception as e:
-            print(f">>> 일정공지 오류: {e}")
-            import traceback
-            print(f">>> 스택 추적: {traceback.format_exc()}")
+            logger.exception(f"일정공지 오류: {e}")
             await interaction.followup.send("❌ 일정 공지 발송 중 오류가 발생했습니다.")
 
     async def create_event_embed(self, event_data) -> discord.Embed:
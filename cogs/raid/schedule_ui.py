@@ -1,15 +1,19 @@
 # cogs/raid/schedule_ui.py (리팩토링됨)
+import logging
 import discord
 from discord import ui
 from db.database_manager import DatabaseManager
-from utils.emoji_helper import get_class_emoji
-from utils.wow_translation import translate_spec_en_to_kr, translate_class_en_to_kr, translate_realm_en_to_kr
+from utils.wow_registry import get_wow_registry
+from utils.wow_translation import translate_class_spec_en_to_kr, translate_class_en_to_kr, translate_realm_en_to_kr
 from utils.wow_role_mapping import get_role_korean
-from utils.helpers import Logger, handle_interaction_errors, ParticipationStatus, Emojis, clean_nickname
+from utils.helpers import handle_interaction_errors, trace_interaction, ParticipationStatus, Emojis, clean_nickname
+from utils.tracing import span
 from services.character_service import CharacterService
 from services.participation_service import ParticipationService
 from collections import defaultdict
 
+logger = logging.getLogger(__name__)
+
 
 class EventSignupView(discord.ui.View):
     def __init__(self, event_instance_id: int, db_manager: DatabaseManager, discord_message_id: int = None, discord_channel_id: int = None):
@@ -24,18 +28,22 @@ class EventSignupView(discord.ui.View):
         self.participation_service = ParticipationService(db_manager)
 
     @discord.ui.button(label="참여", style=discord.ButtonStyle.success, custom_id="signup_confirmed")
+    @trace_interaction
     async def signup_confirmed(self, interaction: discord.Interaction, button: discord.ui.Button):
         await self._handle_signup(interaction, ParticipationStatus.CONFIRMED)
 
     @discord.ui.button(label="미정", style=discord.ButtonStyle.secondary, custom_id="signup_tentative") 
+    @trace_interaction
     async def signup_tentative(self, interaction: discord.Interaction, button: discord.ui.Button):
         await self._handle_signup(interaction, ParticipationStatus.TENTATIVE)
 
     @discord.ui.button(label="불참", style=discord.ButtonStyle.danger, custom_id="signup_declined")
+    @trace_interaction
     async def signup_declined(self, interaction: discord.Interaction, button: discord.ui.Button):
         await self._handle_signup(interaction, ParticipationStatus.DECLINED)
 
     @discord.ui.button(label="캐릭터변경", style=discord.ButtonStyle.secondary, row=1, custom_id="character_change")
+    @trace_interaction
     async def character_change(self, interaction: discord.Interaction, button: discord.ui.Button):
         modal = CharacterChangeModal(self.event_instance_id, self.db_manager, 
                                    self.discord_message_id, self.discord_channel_id)
@@ -56,7 +64,7 @@ class EventSignupView(discord.ui.View):
     async def _process_participation(self, interaction: discord.Interaction, status: str, memo: str = None):
         """참가 처리 핵심 로직"""
         clean_name = clean_nickname(interaction.user.display_name)
-        Logger.info(f"참가 신청 시작: {clean_name} -> {status}")
+        logger.info(f"참가 신청 시작: {clean_name} -> {status}")
         
         async with self.db_manager.get_connection() as conn:
             # ===== 새로 추가: 기존 참가 캐릭터 우선 확인 =====
@@ -74,7 +82,7 @@ class EventSignupView(discord.ui.View):
             
             if existing_participation:
                 # 이미 참가한 캐릭터가 있음 → 상태만 변경
-                Logger.info(f"기존 참가 캐릭터 발견: {existing_participation['character_name']}, 상태 변경만 수행")
+                logger.info(f"기존 참가 캐릭터 발견: {existing_participation['character_name']}, 상태 변경만 수행")
                 
                 # 상태 업데이트
                 await conn.execute("""
@@ -100,7 +108,7 @@ class EventSignupView(discord.ui.View):
                 
                 # 성공 메시지
                 status_text = {"confirmed": "확정 참여", "tentative": "미정", "declined": "불참"}
-                spec_kr = translate_spec_en_to_kr(existing_participation['character_spec'] or '')
+                spec_kr = translate_class_spec_en_to_kr(existing_participation['character_class'] or '', existing_participation['character_spec'] or '')
                 role_kr = get_role_korean(existing_participation['detailed_role'])
                 memo_text = f"\n사유: {memo}" if memo else ""
                 
@@ -112,7 +120,7 @@ class EventSignupView(discord.ui.View):
                 )
                 
                 await self.update_event_message(interaction)
-                Logger.info(f"기존 캐릭터 상태 변경 완료: {existing_participation['character_name']} -> {status}")
+                logger.info(f"기존 캐릭터 상태 변경 완료: {existing_participation['character_name']} -> {status}")
                 return  # 여기서 함수 종료
         
         # ===== 기존 로직 (참가한 캐릭터가 없는 경우) =====
@@ -153,7 +161,7 @@ class EventSignupView(discord.ui.View):
             
             if existing_dummy:
                 # 더미 기록을 실제 유저로 업데이트
-                Logger.info(f"더미 기록 발견: {character_data['character_name']}, 실제 유저로 업데이트")
+                logger.info(f"더미 기록 발견: {character_data['character_name']}, 실제 유저로 업데이트")
                 
                 # 실제 사용자 정보 확보 (이미 위에서 생성됨)
                 # discord_user_id는 이미 생성되어 있음
@@ -167,7 +175,7 @@ class EventSignupView(discord.ui.View):
                 
                 if existing_user_participation:
                     # 이미 다른 캐릭터로 참가중인 경우 - 기존 기록을 삭제하고 더미를 대체
-                    Logger.info(f"기존 참가 기록 발견: {existing_user_participation['character_name']}, 삭제 후 더미 기록으로 대체")
+                    logger.info(f"기존 참가 기록 발견: {existing_user_participation['character_name']}, 삭제 후 더미 기록으로 대체")
                     
                     # 기존 참가 기록 삭제 로그
                     await conn.execute("""
@@ -221,7 +229,7 @@ class EventSignupView(discord.ui.View):
                 if existing_user_participation:
                     message_parts.append(f"(기존 참가: {existing_user_participation['character_name']} → 제거됨)")
                 
-                spec_kr = translate_spec_en_to_kr(character_data.get('character_spec', ''))
+                spec_kr = translate_class_spec_en_to_kr(character_data.get('character_class', ''), character_data.get('character_spec', ''))
                 role_kr = get_role_korean(existing_dummy['detailed_role'])
                 
                 message_parts.extend([
@@ -232,7 +240,7 @@ class EventSignupView(discord.ui.View):
                 await interaction.followup.send("\n".join(message_parts), ephemeral=True)
                 
                 await self.update_event_message(interaction)
-                Logger.info(f"더미 기록을 실제 유저로 업데이트 완료 (기존 기록 처리 포함): {clean_name} -> {status}")
+                logger.info(f"더미 기록을 실제 유저로 업데이트 완료 (기존 기록 처리 포함): {clean_name} -> {status}")
                 return  # 여기서 함수 종료 (기존 로직 실행 안함)
             
             # ===== 기존 로직 (더미 기록이 없는 경우) =====
@@ -255,7 +263,7 @@ class EventSignupView(discord.ui.View):
         # 3. 성공 응답 - 기존 방식으로 변경
         status_text = {"confirmed": "확정 참여", "tentative": "미정", "declined": "불참"}
         
-        spec_kr = translate_spec_en_to_kr(character_data.get('character_spec', ''))
+        spec_kr = translate_class_spec_en_to_kr(character_data.get('character_class', ''), character_data.get('character_spec', ''))
         role_kr = get_role_korean(detailed_role)
         memo_text = f"\n사유: {memo}" if memo else ""
         
@@ -267,7 +275,7 @@ class EventSignupView(discord.ui.View):
         )
         
         await self.update_event_message(interaction)
-        Logger.info(f"참가 신청 완료: {clean_name} -> {status}")
+        logger.info(f"참가 신청 완료: {clean_name} -> {status}")
 
         
     async def update_event_message(self, interaction):
@@ -314,14 +322,15 @@ class EventSignupView(discord.ui.View):
                     LIMIT 3
                 """, self.event_instance_id)
             
-            embed = self.create_detailed_event_embed(event_data, participants_data, recent_logs)
+            with span("render"):
+                embed = self.create_detailed_event_embed(event_data, participants_data, recent_logs)
             original_message = await interaction.original_response()
             await original_message.edit(embed=embed, view=self)
             
-            Logger.info(f"메시지 업데이트 완료: {len(participants_data)}명 참여자")
+            logger.info(f"메시지 업데이트 완료: {len(participants_data)}명 참여자")
             
         except Exception as e:
-            Logger.error(f"메시지 업데이트 오류: {e}", e)
+            logger.exception(f"메시지 업데이트 오류: {e}")
             
     def create_detailed_event_embed(self, event_data, participants_data, recent_logs=None) -> discord.Embed:
         """간소화된 참여자 목록과 최근 이력이 포함된 임베드 생성"""
@@ -390,6 +399,7 @@ class EventSignupView(discord.ui.View):
             role = p['detailed_role'] or 'MELEE_DPS'
             roles[role].append(p)
         
+        registry = get_wow_registry()
         result_lines = []
         role_data = [
             ('TANK', '🛡️', '탱커'),
@@ -402,22 +412,21 @@ class EventSignupView(discord.ui.View):
             if roles[role_key]:
                 result_lines.append(f"\n{emoji} **{role_name} ({len(roles[role_key])}명)**")
                 for p in roles[role_key]:
-                    class_emoji = get_class_emoji(p['character_class'] or 'unknown')
-                    spec_kr = translate_spec_en_to_kr(p['character_spec'] or '')
-                    spec_text = f"({spec_kr})" if spec_kr else ""
-                    result_lines.append(f"{class_emoji} {p['character_name']}{spec_text}")
+                    info = registry.describe(p['character_class'], p['character_spec'])
+                    spec_text = f"({info.name_kr or p['character_spec']})" if p['character_spec'] else ""
+                    result_lines.append(f"{info.emoji} {p['character_name']}{spec_text}")
         
         return '\n'.join(result_lines) if result_lines else "참여자가 없습니다."
 
     def _format_participants_simple(self, participants) -> str:
         """단순한 참여자 목록"""
+        registry = get_wow_registry()
         result_lines = []
         for p in participants:
-            class_emoji = get_class_emoji(p['character_class'] or 'unknown')
-            spec_kr = translate_spec_en_to_kr(p['character_spec'] or '')
-            spec_text = f"({spec_kr})" if spec_kr else ""
+            info = registry.describe(p['character_class'], p['character_spec'])
+            spec_text = f"({info.name_kr or p['character_spec']})" if p['character_spec'] else ""
             
-            line = f"   • {class_emoji} {p['character_name']}{spec_text}"
+            line = f"   • {info.emoji} {p['character_name']}{spec_text}"
             if p['participant_notes']:
                 line += f" - \"{p['participant_notes']}\""
             
@@ -491,7 +500,7 @@ class CharacterChangeModal(discord.ui.Modal):
         character_name = self.character_input.value.strip()
         realm_input = self.realm_input.value.strip()
         
-        Logger.info(f"캐릭터 변경 시도: {character_name}-{realm_input}")
+        logger.info(f"캐릭터 변경 시도: {character_name}-{realm_input}")
         
         # 서비스 초기화
         character_service = CharacterService(self.db_manager)
@@ -510,11 +519,11 @@ class CharacterChangeModal(discord.ui.Modal):
         new_nickname = f"{Emojis.ROCKET}{character_name}"
         try:
             await interaction.user.edit(nick=new_nickname)
-            Logger.info(f"닉네임 변경 성공: {interaction.user.display_name} -> {new_nickname}")
+            logger.info(f"닉네임 변경 성공: {interaction.user.display_name} -> {new_nickname}")
         except discord.Forbidden:
-            Logger.info(f"닉네임 변경 실패 (권한 부족): {interaction.user.name}")
+            logger.info(f"닉네임 변경 실패 (권한 부족): {interaction.user.name}")
         except Exception as e:
-            Logger.error(f"닉네임 변경 오류: {e}")
+            logger.error(f"닉네임 변경 오류: {e}")
         
         # DB 트랜잭션으로 모든 작업 처리
         async with self.db_manager.get_connection() as conn:
@@ -543,7 +552,7 @@ class CharacterChangeModal(discord.ui.Modal):
 
             if existing_dummy:
                 # 더미 기록을 실제 유저로 업데이트
-                Logger.info(f"더미 기록 발견: {character_data['character_name']}, 실제 유저로 업데이트")
+                logger.info(f"더미 기록 발견: {character_data['character_name']}, 실제 유저로 업데이트")
                 
                 # 실제 사용자 정보 확보
                 discord_user_id = await participation_service.ensure_discord_user(
@@ -558,7 +567,7 @@ class CharacterChangeModal(discord.ui.Modal):
                 
                 if existing_user_participation:
                     # 이미 다른 캐릭터로 참가중인 경우 - 기존 기록을 삭제하고 더미를 대체
-                    Logger.info(f"기존 참가 기록 발견: {existing_user_participation['character_name']}, 삭제 후 더미 기록으로 대체")
+                    logger.info(f"기존 참가 기록 발견: {existing_user_participation['character_name']}, 삭제 후 더미 기록으로 대체")
                     
                     # 기존 참가 기록 삭제 로그
                     await conn.execute("""
@@ -608,7 +617,7 @@ class CharacterChangeModal(discord.ui.Modal):
                 
                 # 특별한 성공 메시지
                 class_kr = translate_class_en_to_kr(char_info.get("class", ""))
-                spec_kr = translate_spec_en_to_kr(char_info.get("active_spec_name", ""))
+                spec_kr = translate_class_spec_en_to_kr(char_info.get("class", ""), char_info.get("active_spec_name", ""))
                 role_kr = get_role_korean(existing_dummy['detailed_role'])
                 
                 message_parts = [f">>> **관리자가 미리 추가한 캐릭터를 본인 계정으로 연결했습니다!**"]
@@ -633,7 +642,7 @@ class CharacterChangeModal(discord.ui.Modal):
                                             self.discord_message_id, self.discord_channel_id)
                 await signup_view.update_event_message(interaction)
                 
-                Logger.info(f"더미 기록을 실제 유저로 업데이트 완료: {character_name}-{realm_input}")
+                logger.info(f"더미 기록을 실제 유저로 업데이트 완료: {character_name}-{realm_input}")
                 return  # 여기서 함수 종료 (기존 로직 실행 안함)
             
             # ===== 기존 로직 (더미 기록이 없는 경우) =====
@@ -668,7 +677,7 @@ class CharacterChangeModal(discord.ui.Modal):
         
         # 기존 성공 메시지...
         class_kr = translate_class_en_to_kr(char_info.get("class", ""))
-        spec_kr = translate_spec_en_to_kr(char_info.get("active_spec_name", ""))
+        spec_kr = translate_class_spec_en_to_kr(char_info.get("class", ""), char_info.get("active_spec_name", ""))
         role_kr = get_role_korean(detailed_role)
         
         await interaction.followup.send(
@@ -687,7 +696,7 @@ class CharacterChangeModal(discord.ui.Modal):
                                     self.discord_message_id, self.discord_channel_id)
         await signup_view.update_event_message(interaction)
         
-        Logger.info(f"캐릭터 변경 및 참가 완료: {char_info.get('name')}-{char_info.get('realm')}")
+        logger.info(f"캐릭터 변경 및 참가 완료: {char_info.get('name')}-{char_info.get('realm')}")
 
 
 class ParticipationMemoModal(discord.ui.Modal):
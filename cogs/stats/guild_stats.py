@@ -1,3 +1,4 @@
+import logging
 import asyncio
 import asyncpg
 from typing import Dict, List, Tuple, Any, Optional
@@ -8,6 +9,12 @@ from discord.ui import View, Select, Button
 import os
 from dotenv import load_dotenv
 
+from utils.helpers import trace_interaction
+from db.database_manager import init_connection
+from utils.metrics import TimedAcquire
+
+logger = logging.getLogger(__name__)
+
 load_dotenv()
 
 class StatsSelect(Select):
@@ -41,6 +48,7 @@ class StatsSelect(Select):
         ]
         super().__init__(placeholder="원하는 통계를 선택해주세요!", options=options)
 
+    @trace_interaction
     async def callback(self, interaction: Interaction):
         await interaction.response.defer()
         
@@ -56,7 +64,7 @@ class StatsSelect(Select):
             elif stat_type == "rare_combos":
                 await self._show_rare_combos(interaction)
         except Exception as e:
-            print(f">>> 통계 조회 중 오류 발생: {e}")
+            logger.error(f"통계 조회 중 오류 발생: {e}")
             await interaction.followup.send("통계 조회 중 오류가 발생했어요 😢")
 
     async def _show_popular_top3(self, interaction: Interaction):
@@ -209,49 +217,51 @@ class GuildStats(commands.Cog):
             self.pool = await asyncpg.create_pool(
                 database_url,
                 min_size=1,
-                max_size=5
+                max_size=5,
+                init=init_connection
             )
-            print(">>> 길드 통계 DB 연결 풀 생성 완료")
+            logger.info("길드 통계 DB 연결 풀 생성 완료")
         except Exception as e:
-            print(f">>> 길드 통계 DB 연결 실패: {e}")
+            logger.warning(f"길드 통계 DB 연결 실패: {e}")
 
     async def cog_unload(self):
         """Cog 언로드 시 DB 연결 풀 해제"""
         if self.pool:
             await self.pool.close()
-            print(">>> 길드 통계 DB 연결 풀 해제 완료")
+            logger.info("길드 통계 DB 연결 풀 해제 완료")
 
     async def execute_query(self, query: str, *params) -> List[tuple]:
         """데이터베이스 쿼리 실행"""
         if not self.pool:
-            print(">>> DB 연결 풀이 없습니다")
+            logger.error("DB 연결 풀이 없습니다")
             return []
         
         try:
-            async with self.pool.acquire() as conn:
+            async with TimedAcquire(self.pool) as conn:
                 result = await conn.fetch(query, *params)
-                print(f">>> 쿼리 실행 완료: {len(result)}행 반환")
+                logger.debug(f"쿼리 실행 완료: {len(result)}행 반환")
                 return result
         except Exception as e:
-            print(f">>> 데이터베이스 쿼리 오류: {e}")
+            logger.error(f"데이터베이스 쿼리 오류: {e}")
             return []
 
     async def execute_single_query(self, query: str, *params) -> Optional[tuple]:
         """단일 결과 쿼리 실행"""
         if not self.pool:
-            print(">>> DB 연결 풀이 없습니다")
+            logger.error("DB 연결 풀이 없습니다")
             return None
         
         try:
-            async with self.pool.acquire() as conn:
+            async with TimedAcquire(self.pool) as conn:
                 result = await conn.fetchrow(query, *params)
-                print(f">>> 단일 쿼리 실행 완료")
+                logger.debug("단일 쿼리 실행 완료")
                 return result
         except Exception as e:
-            print(f">>> 데이터베이스 쿼리 오류: {e}")
+            logger.error(f"데이터베이스 쿼리 오류: {e}")
             return None
 
     @app_commands.command(name="길드통계", description="(실험실) 길드원들의 다양한 통계를 확인할 수 있어요!")
+    @trace_interaction
     async def guild_stats(self, interaction: Interaction):
         await interaction.response.defer()
         
@@ -270,7 +280,7 @@ class GuildStats(commands.Cog):
 
     async def get_popular_top3(self) -> Dict[str, Any]:
         """인기 TOP3 통계 조회"""
-        print(">>> 인기 TOP3 통계 조회 시작")
+        logger.debug("인기 TOP3 통계 조회 시작")
         
         # 인기 직업 TOP3
         top_classes_query = """
@@ -308,7 +318,7 @@ class GuildStats(commands.Cog):
         top_realms_result = await self.execute_query(top_realms_query)
         top_realms = [(realm, cnt) for realm, cnt in top_realms_result] if top_realms_result else []
         
-        print(">>> 인기 TOP3 통계 조회 완료")
+        logger.debug("인기 TOP3 통계 조회 완료")
         return {
             'top_classes': top_classes,
             'top_specs': top_specs,
@@ -317,7 +327,7 @@ class GuildStats(commands.Cog):
 
     async def get_rankings(self) -> Dict[str, Any]:
         """랭킹 통계 조회"""
-        print(">>> 랭킹 통계 조회 시작")
+        logger.debug("랭킹 통계 조회 시작")
         
         # 업적점수 TOP5
         achievement_query = """
@@ -330,14 +340,14 @@ class GuildStats(commands.Cog):
         achievement_result = await self.execute_query(achievement_query)
         achievement_ranking = [(name, points) for name, points in achievement_result] if achievement_result else []
         
-        print(">>> 랭킹 통계 조회 완료")
+        logger.debug("랭킹 통계 조회 완료")
         return {
             'achievement_ranking': achievement_ranking
         }
 
     async def get_ratios(self) -> Dict[str, Any]:
         """비율 분석 조회"""
-        print(">>> 비율 분석 조회 시작")
+        logger.debug("비율 분석 조회 시작")
         
         # 성별 비율
         gender_query = """
@@ -406,7 +416,7 @@ class GuildStats(commands.Cog):
         for role, count in role_stats.items():
             role_ratio[role] = int((count / total_role * 100)) if total_role > 0 else 0
         
-        print(">>> 비율 분석 조회 완료")
+        logger.debug("비율 분석 조회 완료")
         return {
             'gender_ratio': gender_ratio,
             'faction_ratio': faction_ratio,
@@ -415,7 +425,7 @@ class GuildStats(commands.Cog):
 
     async def get_rare_combos(self) -> Dict[str, Any]:
         """희귀한 조합 통계 조회"""
-        print(">>> 희귀한 조합 통계 조회 시작")
+        logger.debug("희귀한 조합 통계 조회 시작")
         
         # 종족+직업 희귀한 TOP3
         race_class_query = """
@@ -465,7 +475,7 @@ class GuildStats(commands.Cog):
         full_combo_result = await self.execute_query(full_combo_query)
         rare_full_combo = [(combo, count) for combo, count in full_combo_result] if full_combo_result else []
         
-        print(">>> 희귀한 조합 통계 조회 완료")
+        logger.debug("희귀한 조합 통계 조회 완료")
         return {
             'rare_race_class': rare_race_class,
             'rare_class_spec': rare_class_spec,
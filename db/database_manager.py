@@ -1,10 +1,23 @@
+import logging
 import asyncpg
 import os
 from typing import Optional
 from dotenv import load_dotenv
 
+from utils.json_codec import set_pg_codecs
+from utils.metrics import TimedAcquire, instrument_connection
+
+logger = logging.getLogger(__name__)
+
 load_dotenv()
 
+
+async def init_connection(conn):
+    """풀 연결 초기화: 쿼리 시간 기록 + json/jsonb 코덱 (파이썬 객체 그대로 주고받기)"""
+    await instrument_connection(conn)
+    await set_pg_codecs(conn)
+
+
 class DatabaseManager:
     def __init__(self):
         self.pool: Optional[asyncpg.Pool] = None
@@ -16,21 +29,38 @@ class DatabaseManager:
             self.pool = await asyncpg.create_pool(
                 self.database_url,
                 min_size=1,
-                max_size=10
+                max_size=10,
+                init=init_connection
             )
-            print(">>> 데이터베이스 연결 풀 생성 완료")
+            logger.info("데이터베이스 연결 풀 생성 완료")
         except Exception as e:
-            print(f">>> 데이터베이스 연결 실패: {e}")
+            logger.error(f"데이터베이스 연결 실패: {e}")
             raise
     
     async def close_pool(self):
         """데이터베이스 연결 풀 종료"""
         if self.pool:
             await self.pool.close()
-            print(">>> 데이터베이스 연결 풀 종료")
+            self.pool = None
+            logger.info("데이터베이스 연결 풀 종료")
+
+    async def ping(self) -> bool:
+        """풀 상태 확인 (SELECT 1)"""
+        if not self.pool or self.pool.is_closing():
+            return False
+        async with self.get_connection() as conn:
+            return await conn.fetchval("SELECT 1") == 1
+
+    async def revalidate(self):
+        """점검 실패 시 복구: 풀이 없거나 닫혔으면 새로 만들고, 살아 있으면 기존 연결만 교체"""
+        if not self.pool or self.pool.is_closing():
+            await self.create_pool()
+        else:
+            await self.pool.expire_connections()
+            logger.info("데이터베이스 연결 교체 예약 (expire_connections)")
     
     def get_connection(self):
-        """연결 풀에서 연결 가져오기"""
+        """연결 풀에서 연결 가져오기 (대기 시간은 지표로 기록)"""
         if not self.pool:
             raise Exception("데이터베이스 풀이 생성되지 않음")
-        return self.pool.acquire()
\ No newline at end of file
+        return TimedAcquire(self.pool)
\ No newline at end of file
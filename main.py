@@ -1,77 +1,133 @@
+import asyncio
+import logging
 import discord
 from discord.ext import commands
 import os
 from dotenv import load_dotenv
 from db.database_manager import DatabaseManager  # 수정된 import
+from services.api_cache import api_cache
+from services.character_profiles import CharacterProfileStore
+from services.command_sync import CommandSyncer
+from services.member_roster import member_roster
+from services.profile_recrawler import ProfileRecrawler
+from utils.http_session import close_session, open_session, session_healthy
+from utils.lifecycle import Lifecycle
+from utils.logging_config import setup_logging
+from utils.metrics import http_trace_config
+from utils.startup import load_extensions
+
+logger = logging.getLogger("main")
 
 # .env에서 토큰 불러오기
 load_dotenv()
 TOKEN = os.getenv("DISCORD_TOKEN")
 
+# 로깅 설정 (LOG_LEVEL / LOG_FORMAT / LOG_DEBUG_SAMPLE 환경변수)
+setup_logging()
+
 # 인텐트 설정
 intents = discord.Intents.default()
 intents.message_content = True
 intents.members = True  # /권한정리 등에서 필요!
 
-# 봇 인스턴스
-bot = commands.Bot(command_prefix="!", intents=intents)
-
 # 데이터베이스 매니저 인스턴스 생성
 db_manager = DatabaseManager()
 
+# 재연결과 무관한 주기 점검 간격 (초)
+HEALTH_CHECK_INTERVAL = 300
+# 만료된 API 캐시 정리 간격 (초)
+API_CACHE_CLEANUP_INTERVAL = 3600
+
+
+class GuildBot(commands.Bot):
+    """수명주기: setup_hook에서 순서대로 시작, close()에서만 역순 종료
+
+    게이트웨이 재연결(on_disconnect/on_resumed)에서는 자원을 닫지 않고 점검만 한다.
+    """
+
+    def __init__(self):
+        # (http_trace: Discord API 호출도 지표/인터랙션 추적에 기록)
+        super().__init__(command_prefix="!", intents=intents, http_trace=http_trace_config())
+        self.lifecycle = Lifecycle()
+        self._ready_once = False
+
+        self.lifecycle.add("database", start=db_manager.create_pool, stop=db_manager.close_pool,
+                           probe=db_manager.ping, recover=db_manager.revalidate)
+        self.lifecycle.add("http session", start=open_session, stop=close_session,
+                           probe=self._http_session_ok, recover=open_session)
+        self.lifecycle.add("api cache", start=self._start_api_cache)
+        self.lifecycle.add("character profiles", start=CharacterProfileStore(db_manager).ensure_schema)
+        self.lifecycle.add("member roster", start=member_roster.ensure_fresh)
+        self.lifecycle.add_task("health check", self._health_check_loop)
+        self.lifecycle.add_task("api cache cleanup", self._api_cache_cleanup_loop)
+        self.lifecycle.add_task("profile recrawler", ProfileRecrawler(db_manager).run_forever)
+
+    @staticmethod
+    async def _http_session_ok() -> bool:
+        return session_healthy()
+
+    @staticmethod
+    async def _start_api_cache():
+        api_cache.attach(db_manager)
+        await api_cache.ensure_schema()
+
+    @staticmethod
+    async def _api_cache_cleanup_loop():
+        while True:
+            try:
+                await api_cache.cleanup()
+            except Exception as e:
+                logger.warning(f"API 캐시 정리 실패: {e}")
+            await asyncio.sleep(API_CACHE_CLEANUP_INTERVAL)
+
+    async def _health_check_loop(self):
+        while True:
+            await asyncio.sleep(HEALTH_CHECK_INTERVAL)
+            await self.lifecycle.revalidate("주기 점검")
+
+    async def setup_hook(self):
+        # 공용 자원 (DB 풀, HTTP 세션, 캐시, 백그라운드 태스크)
+        await self.lifecycle.startup()
+
+        # 코그 로드 (단계별 동시 로드, 타임라인은 로그로)
+        await load_extensions(self)
+
+        # 슬래시 명령어 동기화 (트리 해시가 바뀐 경우에만, on_ready는 재연결마다 다시 불리므로 여기서 한 번)
+        try:
+            await CommandSyncer(self, db_manager).sync()
+        except Exception as e:
+            logger.warning(f"명령어 동기화 실패: {e}")
+
+    async def close(self):
+        # 코그 언로드(각 코그 풀 정리) + 게이트웨이 종료 후 공용 자원 정리
+        await super().close()
+        await self.lifecycle.shutdown()
+
+
+# 봇 인스턴스
+bot = GuildBot()
+
+
 @bot.event
 async def on_ready():
-    try:
-        synced = await bot.tree.sync()
-        print(f"{len(synced)}개의 슬래시 커맨드를 동기화했습니다.")
-        print(f"동기화된 명령어: {[cmd.name for cmd in synced]}")
-    except Exception as e:
-        print(f"명령어 동기화 실패: {e}")
-    
+    if bot._ready_once:
+        # 세션 재시작(RESUME 실패) 후 다시 READY: 자원은 그대로 두고 점검만
+        await bot.lifecycle.revalidate("재연결")
+        return
+    bot._ready_once = True
     await bot.change_presence(activity=discord.Game("우당탕탕 명령어 실행"))
-    print(f"{bot.user} 봇이 로그인했어요!")
+    logger.info(f"{bot.user} 봇이 로그인했어요!")
+
+
+@bot.event
+async def on_resumed():
+    await bot.lifecycle.revalidate("세션 재개")
+
 
-# 코그 로드
+# 게이트웨이 연결 끊김은 재연결로 복구되므로 자원을 닫지 않는다 (종료는 GuildBot.close)
 @bot.event
-async def setup_hook():
-    # 데이터베이스 연결 풀 생성
-    try:
-        await db_manager.create_pool()
-        print(">>> 데이터베이스 연결 풀 초기화 완료!")
-    except Exception as e:
-        print(f">>> 데이터베이스 연결 실패: {e}")
-    
-    # 코그 로드
-    await bot.load_extension("cogs.admin.raid_management")   
-    await bot.load_extension("cogs.core.auto_nickname")
-    await bot.load_extension("cogs.core.member_manager")
-    await bot.load_extension("cogs.stats.guild_stats") 
-    await bot.load_extension("cogs.raid.general")
-    await bot.load_extension("cogs.raid.participation")
-    await bot.load_extension("cogs.raid.schedule")
-      
-
-    # await bot.load_extension("cogs.guild_stats")
-    await bot.load_extension("services.blizzard.token_price")  
-    await bot.load_extension("services.raiderio.affixes") 
-    await bot.load_extension("services.raiderio.raid_progression") 
-    await bot.load_extension("services.wowhead.bis") 
-    await bot.load_extension("services.community.secondary_stats") 
-    # await bot.load_extension("cogs.craft")  
-    # await bot.load_extension("cogs.general")  
-    # await bot.load_extension("cogs.raid_schedule")
-    # await bot.load_extension("cogs.character_manager")
-    # await bot.load_extension("cogs.raid_management")
-
-
-# 봇 종료 시 데이터베이스 연결 해제
-@bot.event  
 async def on_disconnect():
-    try:
-        await db_manager.close_pool()
-        print(">>> 데이터베이스 연결 풀 종료")
-    except Exception as e:
-        print(f">>> 데이터베이스 연결 해제 실패: {e}")
-
-# 봇 실행
-bot.run(TOKEN)
\ No newline at end of file
+    logger.info("게이트웨이 연결 끊김 (재연결 대기)")
+
+# 봇 실행 (discord.py 기본 로그 핸들러 대신 setup_logging 설정 사용)
+bot.run(TOKEN, log_handler=None)
\ No newline at end of file
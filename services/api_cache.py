@@ -0,0 +1,357 @@
+# services/api_cache.py
+"""
+외부 API 응답 캐시 (L1 메모리 + L2 Postgres)
+
+- L1: 프로세스 안의 LRU (같은 요청을 짧은 시간 안에 여러 번 할 때)
+- L2: guild_bot.api_cache (UNLOGGED 테이블). 봇 재시작 후에도 남고,
+  봇과 오프라인 도구(tools/)가 같은 raider.io 응답을 함께 쓴다.
+  UNLOGGED라 WAL을 쓰지 않아 쓰기가 싸고, DB 비정상 종료 시 비워지지만 캐시라 상관없다.
+
+키는 (endpoint, params_key). params_key는 정렬된 쿼리 문자열이라 인자 순서와 무관하다.
+만료(expires_at)가 지나도 STALE_GRACE 동안은 지우지 않는다 (ETag/Last-Modified로 재검증할 수 있도록).
+404 같은 실패 응답도 짧은 TTL로 저장해서 없는 캐릭터를 계속 다시 묻지 않는다.
+
+DB를 붙이지 않았거나(attach 전) DB 오류가 나면 L1만으로 동작한다.
+
+fetch_json(): 캐시를 거치는 GET. 만료된 항목에 ETag/Last-Modified가 있으면
+If-None-Match/If-Modified-Since를 보내고, 304면 본문 없이 만료 시각만 연장한다.
+결과(hit/304/200/오류 시 이전 응답)는 bot_http_cache_results_total 지표로 기록한다.
+"""
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+from urllib.parse import urlencode, urlsplit
+
+import aiohttp
+
+from utils.http_session import shared_session
+from utils.json_codec import loads
+from utils.metrics import record_cache, record_http_cache
+
+logger = logging.getLogger(__name__)
+
+API_CACHE_SCHEMA_SQL = """
+CREATE UNLOGGED TABLE IF NOT EXISTS guild_bot.api_cache (
+    endpoint TEXT NOT NULL,
+    params_key TEXT NOT NULL,
+    status SMALLINT NOT NULL,
+    payload JSONB,
+    etag TEXT,
+    last_modified TEXT,
+    fetched_at TIMESTAMPTZ NOT NULL,
+    expires_at TIMESTAMPTZ NOT NULL,
+    PRIMARY KEY (endpoint, params_key)
+);
+CREATE INDEX IF NOT EXISTS api_cache_expires_at_idx ON guild_bot.api_cache (expires_at);
+"""
+
+UPSERT_ENTRIES_SQL = """
+INSERT INTO guild_bot.api_cache
+    (endpoint, params_key, status, payload, etag, last_modified, fetched_at, expires_at)
+SELECT * FROM unnest($1::text[], $2::text[], $3::smallint[], $4::jsonb[], $5::text[], $6::text[],
+                     $7::timestamptz[], $8::timestamptz[])
+ON CONFLICT (endpoint, params_key)
+DO UPDATE SET
+    status = EXCLUDED.status,
+    payload = EXCLUDED.payload,
+    etag = EXCLUDED.etag,
+    last_modified = EXCLUDED.last_modified,
+    fetched_at = EXCLUDED.fetched_at,
+    expires_at = EXCLUDED.expires_at
+"""
+
+# 만료 후에도 재검증용으로 남겨 두는 기간 (초)
+STALE_GRACE = 7 * 24 * 3600
+
+CacheKey = Tuple[str, str]
+
+
+def params_key(params: Optional[Mapping[str, Any]]) -> str:
+    """쿼리 파라미터를 정렬된 쿼리 문자열로 (None 값은 제외)"""
+    if not params:
+        return ""
+    return urlencode(sorted((str(k), str(v)) for k, v in params.items() if v is not None))
+
+
+def _to_datetime(ts: float) -> datetime:
+    return datetime.fromtimestamp(ts, tz=timezone.utc)
+
+
+@dataclass
+class CacheEntry:
+    endpoint: str
+    params_key: str
+    status: int
+    payload: Any
+    fetched_at: float           # epoch 초
+    expires_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def key(self) -> CacheKey:
+        return self.endpoint, self.params_key
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300
+
+    @classmethod
+    def from_row(cls, row) -> "CacheEntry":
+        return cls(
+            endpoint=row['endpoint'],
+            params_key=row['params_key'],
+            status=row['status'],
+            payload=row['payload'],
+            fetched_at=row['fetched_at'].timestamp(),
+            expires_at=row['expires_at'].timestamp(),
+            etag=row['etag'],
+            last_modified=row['last_modified'],
+        )
+
+
+class ApiCache:
+    # L1 최대 항목 수
+    L1_SIZE = 2048
+
+    def __init__(self):
+        self.db_manager = None
+        self._l1: "OrderedDict[CacheKey, CacheEntry]" = OrderedDict()
+
+    def attach(self, db_manager):
+        """L2로 쓸 DB 연결 (붙이기 전에는 L1만 사용)"""
+        self.db_manager = db_manager
+
+    async def ensure_schema(self):
+        async with self.db_manager.get_connection() as conn:
+            await conn.execute(API_CACHE_SCHEMA_SQL)
+
+    # ===== L1 =====
+
+    def _l1_get(self, key: CacheKey) -> Optional[CacheEntry]:
+        entry = self._l1.get(key)
+        if entry is not None:
+            self._l1.move_to_end(key)
+        return entry
+
+    def _l1_put(self, entry: CacheEntry):
+        self._l1[entry.key] = entry
+        self._l1.move_to_end(entry.key)
+        while len(self._l1) > self.L1_SIZE:
+            self._l1.popitem(last=False)
+
+    # ===== 조회 =====
+
+    async def get(self, endpoint: str, params: Optional[Mapping[str, Any]] = None) -> Optional[CacheEntry]:
+        """캐시 항목 조회 (만료된 항목도 반환하니 entry.fresh로 확인)"""
+        key = (endpoint, params_key(params))
+        entries = await self._get_keys(endpoint, [key[1]])
+        return entries.get(key[1])
+
+    async def get_many(self, endpoint: str,
+                       params_list: Iterable[Optional[Mapping[str, Any]]]) -> Dict[str, CacheEntry]:
+        """여러 요청을 한 번에 조회 (L1에 없는 것만 L2에서 쿼리 한 번으로) -> {params_key: entry}"""
+        return await self._get_keys(endpoint, [params_key(p) for p in params_list])
+
+    async def _get_keys(self, endpoint: str, keys: Sequence[str]) -> Dict[str, CacheEntry]:
+        found: Dict[str, CacheEntry] = {}
+        stale: Dict[str, CacheEntry] = {}      # L1에 있지만 만료된 항목 (L2에 더 새 것이 없으면 사용)
+        missing: List[str] = []
+        for key in dict.fromkeys(keys):
+            entry = self._l1_get((endpoint, key))
+            if entry is not None and entry.fresh:
+                found[key] = entry
+            else:
+                missing.append(key)
+                if entry is not None:
+                    stale[key] = entry
+            record_cache("api_l1", entry is not None and entry.fresh)
+
+        if not missing:
+            return found
+
+        rows = []
+        if self.db_manager is not None:
+            try:
+                async with self.db_manager.get_connection() as conn:
+                    rows = await conn.fetch("""
+                        SELECT endpoint, params_key, status, payload, etag, last_modified,
+                               fetched_at, expires_at
+                        FROM guild_bot.api_cache
+                        WHERE endpoint = $1 AND params_key = ANY($2::text[])
+                    """, endpoint, missing)
+            except Exception as e:
+                logger.warning(f"API 캐시 L2 조회 실패 ({endpoint}): {e}")
+
+        for row in rows:
+            entry = CacheEntry.from_row(row)
+            previous = stale.get(entry.params_key)
+            if previous is not None and previous.fetched_at > entry.fetched_at:
+                continue
+            self._l1_put(entry)
+            found[entry.params_key] = entry
+        for key in missing:
+            if key not in found and key in stale:
+                found[key] = stale[key]
+            if self.db_manager is not None:
+                entry = found.get(key)
+                record_cache("api_l2", entry is not None and entry.fresh)
+        return found
+
+    # ===== 저장 =====
+
+    def make_entry(self, endpoint: str, params: Optional[Mapping[str, Any]], status: int, payload: Any,
+                   ttl: float, etag: Optional[str] = None, last_modified: Optional[str] = None) -> CacheEntry:
+        now = time.time()
+        return CacheEntry(endpoint, params_key(params), status, payload, now, now + ttl, etag, last_modified)
+
+    async def put(self, endpoint: str, params: Optional[Mapping[str, Any]], status: int, payload: Any,
+                  ttl: float, etag: Optional[str] = None, last_modified: Optional[str] = None) -> CacheEntry:
+        entry = self.make_entry(endpoint, params, status, payload, ttl, etag, last_modified)
+        await self.put_many([entry])
+        return entry
+
+    async def put_many(self, entries: Sequence[CacheEntry]):
+        """여러 항목을 L1에 넣고 L2에는 INSERT 한 번으로 저장"""
+        if not entries:
+            return
+        for entry in entries:
+            self._l1_put(entry)
+        if self.db_manager is None:
+            return
+
+        columns = (
+            [e.endpoint for e in entries],
+            [e.params_key for e in entries],
+            [e.status for e in entries],
+            [e.payload for e in entries],
+            [e.etag for e in entries],
+            [e.last_modified for e in entries],
+            [_to_datetime(e.fetched_at) for e in entries],
+            [_to_datetime(e.expires_at) for e in entries],
+        )
+        try:
+            async with self.db_manager.get_connection() as conn:
+                await conn.execute(UPSERT_ENTRIES_SQL, *columns)
+        except Exception as e:
+            logger.warning(f"API 캐시 L2 저장 실패 ({len(entries)}개): {e}")
+
+    async def refresh(self, entry: CacheEntry, ttl: float):
+        """내용은 그대로 두고 만료 시각만 연장 (304 Not Modified 응답 등)"""
+        now = time.time()
+        entry.fetched_at = now
+        entry.expires_at = now + ttl
+        self._l1_put(entry)
+        if self.db_manager is None:
+            return
+        try:
+            async with self.db_manager.get_connection() as conn:
+                await conn.execute("""
+                    UPDATE guild_bot.api_cache SET fetched_at = $3, expires_at = $4
+                    WHERE endpoint = $1 AND params_key = $2
+                """, entry.endpoint, entry.params_key, _to_datetime(entry.fetched_at), _to_datetime(entry.expires_at))
+        except Exception as e:
+            logger.warning(f"API 캐시 L2 갱신 실패 ({entry.endpoint}): {e}")
+
+    async def cleanup(self, grace: float = STALE_GRACE) -> int:
+        """만료 후 grace초가 지난 항목 삭제 (L1 포함) -> L2 삭제 건수"""
+        cutoff = time.time() - grace
+        for key in [k for k, e in self._l1.items() if e.expires_at < cutoff]:
+            del self._l1[key]
+        if self.db_manager is None:
+            return 0
+
+        async with self.db_manager.get_connection() as conn:
+            result = await conn.execute(
+                "DELETE FROM guild_bot.api_cache WHERE expires_at < $1", _to_datetime(cutoff))
+        deleted = int(result.split()[-1])
+        if deleted:
+            logger.info(f"API 캐시 정리: {deleted}개 삭제")
+        return deleted
+
+
+# 전역 캐시 (봇은 lifecycle에서, 도구는 직접 attach)
+api_cache = ApiCache()
+
+
+@dataclass
+class FetchResult:
+    status: int
+    payload: Any
+    source: str                 # "cache" / "not_modified" / "network" / "stale"
+    entry: Optional[CacheEntry] = None
+
+
+def _conditional_headers(entry: Optional[CacheEntry]) -> Dict[str, str]:
+    headers = {}
+    if entry is not None and entry.ok:
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+    return headers
+
+
+async def fetch_json(endpoint: str, params: Optional[Mapping[str, Any]] = None, *, ttl: float,
+                     cache_statuses: Sequence[int] = (200,), miss_ttl: Optional[float] = None,
+                     headers: Optional[Mapping[str, str]] = None, cache: ApiCache = api_cache) -> FetchResult:
+    """캐시를 거치는 GET (JSON 응답)
+
+    - 신선한 캐시가 있으면 요청하지 않음
+    - 만료된 캐시에 검증자(ETag/Last-Modified)가 있으면 조건부 요청, 304면 캐시 갱신
+    - cache_statuses에 든 상태 코드만 저장 (404 등을 저장하면 miss_ttl 사용)
+    - 네트워크 오류/5xx면 만료된 정상 응답이라도 대신 반환
+    """
+    host = urlsplit(endpoint).hostname or ""
+    entry = await cache.get(endpoint, params)
+    if entry is not None and entry.fresh:
+        record_http_cache(host, "hit")
+        return FetchResult(entry.status, entry.payload, "cache", entry)
+
+    request_headers = dict(headers or {})
+    conditional = _conditional_headers(entry)
+    request_headers.update(conditional)
+
+    try:
+        async with shared_session() as session:
+            async with session.get(endpoint, params=params, headers=request_headers) as resp:
+                status = resp.status
+                if status == 304 and entry is not None:
+                    await cache.refresh(entry, ttl)
+                    record_http_cache(host, "not_modified")
+                    return FetchResult(entry.status, entry.payload, "not_modified", entry)
+                payload = loads(await resp.read()) if status == 200 else None
+                etag = resp.headers.get("ETag")
+                last_modified = resp.headers.get("Last-Modified")
+    except (aiohttp.ClientError, asyncio.TimeoutError):
+        if entry is not None and entry.ok:
+            logger.warning(f"{host} 요청 실패, 이전 응답 사용: {endpoint}")
+            record_http_cache(host, "stale")
+            return FetchResult(entry.status, entry.payload, "stale", entry)
+        record_http_cache(host, "error")
+        raise
+
+    if status >= 500 and entry is not None and entry.ok:
+        logger.warning(f"{host} HTTP {status}, 이전 응답 사용: {endpoint}")
+        record_http_cache(host, "stale")
+        return FetchResult(entry.status, entry.payload, "stale", entry)
+
+    if status == 200:
+        record_http_cache(host, "modified" if conditional else "full")
+    else:
+        record_http_cache(host, "error")
+
+    new_entry = None
+    if status in cache_statuses:
+        entry_ttl = ttl if status == 200 else (miss_ttl if miss_ttl is not None else ttl)
+        new_entry = await cache.put(endpoint, params, status, payload, entry_ttl,
+                                    etag=etag, last_modified=last_modified)
+    return FetchResult(status, payload, "network", new_entry)
@@ -1,9 +1,15 @@
+import logging
 from discord.ext import commands
 from discord import app_commands, Interaction
 import os
 import aiohttp
 import datetime
 from dotenv import load_dotenv
+from utils.helpers import trace_interaction
+from utils.http_session import shared_session
+from utils.json_codec import loads
+
+logger = logging.getLogger(__name__)
 
 load_dotenv()
 
@@ -19,13 +25,13 @@ class TokenPrice(commands.Cog):
         auth = aiohttp.BasicAuth(client_id, client_secret)
         data = {"grant_type": "client_credentials"}
 
-        async with aiohttp.ClientSession() as session:
+        async with shared_session() as session:
             async with session.post(token_url, data=data, auth=auth) as resp:
                 if resp.status == 200:
-                    token_data = await resp.json()
+                    token_data = await resp.json(loads=loads)
                     return token_data["access_token"]
                 else:
-                    print(f"토큰 요청 실패: {resp.status}")
+                    logger.warning(f"토큰 요청 실패: {resp.status}")
                     return None
 
     # @commands.Cog.listener()
@@ -35,6 +41,7 @@ class TokenPrice(commands.Cog):
 
             
     @app_commands.command(name="토큰", description="현재 와우 토큰 시세를 알려줘요!")
+    @trace_interaction
     async def wow_token(self, interaction: Interaction):
         await interaction.response.defer()
 
@@ -46,13 +53,13 @@ class TokenPrice(commands.Cog):
         url = "https://kr.api.blizzard.com/data/wow/token/index?namespace=dynamic-kr&locale=ko_KR"
         headers = {"Authorization": f"Bearer {token}"}
 
-        async with aiohttp.ClientSession() as session:
+        async with shared_session() as session:
             async with session.get(url, headers=headers) as resp:
                 if resp.status != 200:
                     await interaction.followup.send(f"토큰 정보를 불러오지 못했어요 😢 (상태 코드: {resp.status})")
                     return
 
-                data = await resp.json()
+                data = await resp.json(loads=loads)
                 raw_price = data.get("price")
                 timestamp = data.get("last_updated_timestamp")
                 dt = datetime.datetime.fromtimestamp(timestamp / 1000)
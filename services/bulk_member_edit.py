@@ -0,0 +1,256 @@
+# services/bulk_member_edit.py
+"""
+멤버 닉네임 일괄 변경 엔진
+
+- discord.py의 레이트리밋 버킷 정보(limit/remaining)를 읽어서 버킷이 허용하는 만큼 동시에 처리
+- 진행 상황을 체크포인트 파일에 저장해서 중단된 작업을 이어서 실행
+  ((멤버, 새 닉네임) 단위로 기록하고, CHECKPOINT_MAX_AGE보다 오래된 체크포인트는 새 실행으로 간주)
+- 미리보기(dry-run)와 실제 실행이 같은 코드 경로를 사용하고 같은 형식의 결과 보고서를 반환
+- 도구에서는 open_rest_client()로 게이트웨이 로그인 없이 REST 요청만 보낼 수 있음
+"""
+import asyncio
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+import discord
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_DIR = Path(__file__).parent.parent / 'data' / 'checkpoints'
+# 이 시간 안에 다시 실행해야 중단된 작업을 이어서 하는 것으로 본다 (초)
+CHECKPOINT_MAX_AGE = 6 * 3600
+
+
+@dataclass
+class MemberEdit:
+    """닉네임 변경 계획 한 건"""
+    member_id: int
+    current_name: str
+    new_nick: str
+    reason: str = ""
+    payload: Any = None  # 성공 후 처리(on_success)에 넘길 추가 데이터
+
+
+@dataclass
+class BulkEditReport:
+    """일괄 변경 결과 (미리보기도 같은 형식)"""
+    label: str
+    dry_run: bool
+    planned: int = 0
+    resumed_skip: int = 0
+    succeeded: int = 0
+    forbidden: int = 0
+    failed: int = 0
+    elapsed: float = 0.0
+    errors: List[str] = field(default_factory=list)
+
+    def summary_lines(self) -> List[str]:
+        mode = "미리보기" if self.dry_run else "실행"
+        lines = [
+            f">>> [{self.label}] {mode} 결과",
+            f">>> 계획: {self.planned}명 (체크포인트로 건너뜀: {self.resumed_skip}명)",
+        ]
+        if self.dry_run:
+            lines.append(f">>> 변경 예정: {self.succeeded}명")
+        else:
+            lines.append(f">>> 성공: {self.succeeded}명, 권한 부족: {self.forbidden}명, 기타 오류: {self.failed}명")
+            lines.append(f">>> 소요 시간: {self.elapsed:.1f}초")
+        return lines
+
+    def print_summary(self):
+        for line in self.summary_lines():
+            print(line)
+
+
+class Checkpoint:
+    """처리 완료된 (멤버 ID, 새 닉네임) 기록 (JSON 파일)
+
+    같은 멤버라도 바꿀 닉네임이 다르면 새 작업이므로 다시 처리한다.
+    """
+
+    def __init__(self, label: str, directory: Path = CHECKPOINT_DIR, max_age: float = CHECKPOINT_MAX_AGE):
+        self.path = directory / f"{label}.json"
+        self.max_age = max_age
+        self.done: Set[str] = set()
+
+    @staticmethod
+    def key(edit: "MemberEdit") -> str:
+        return f"{edit.member_id}:{edit.new_nick}"
+
+    def load(self) -> Set[str]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            age = time.time() - data.get('updated_at', 0)
+            if age > self.max_age:
+                # 중단된 작업의 이어하기가 아니라 며칠 뒤의 새 실행
+                logger.info(f"오래된 체크포인트 무시 ({self.path.name}, {age / 3600:.1f}시간 전)")
+                self.done = set()
+            else:
+                self.done = set(data.get('done', []))
+        except FileNotFoundError:
+            self.done = set()
+        except Exception as e:
+            logger.warning(f"체크포인트 로딩 실패 ({self.path}): {e}")
+            self.done = set()
+        return self.done
+
+    def _write(self, done: List[str]):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix('.json.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'done': done, 'updated_at': time.time()}, f)
+        os.replace(temp_path, self.path)
+
+    async def save(self):
+        await asyncio.to_thread(self._write, sorted(self.done))
+
+    async def clear(self):
+        await asyncio.to_thread(self.path.unlink, True)
+
+
+async def open_rest_client(token: str) -> discord.Client:
+    """게이트웨이 연결 없이 REST API만 쓰는 클라이언트 (login만 하고 start/connect는 하지 않음)"""
+    client = discord.Client(intents=discord.Intents.none())
+    await client.login(token)
+    return client
+
+
+def read_member_bucket(http, guild_id: int) -> Optional[Dict[str, float]]:
+    """discord.py HTTP 클라이언트에 기록된 멤버 수정(PATCH /guilds/{guild_id}/members/{user_id}) 버킷 정보
+
+    discord.py는 응답 헤더(X-RateLimit-Limit/Remaining/Reset-After)를 버킷 객체에 기록한다.
+    버킷 키는 HTTPClient.request와 같은 방식으로 만든다 (경로 키 -> 버킷 해시 + 주요 파라미터).
+    내부 속성이라 버전에 따라 없을 수 있으므로 읽기 실패는 모두 None으로 처리한다.
+    """
+    try:
+        buckets = getattr(http, '_buckets', None)
+        if not buckets:
+            return None
+        route = discord.http.Route('PATCH', '/guilds/{guild_id}/members/{user_id}', guild_id=guild_id, user_id=0)
+        bucket_hash = getattr(http, '_bucket_hashes', {}).get(route.key)
+        bucket = buckets.get(f"{bucket_hash or route.key}:{route.major_parameters}")
+        if bucket is None or not getattr(bucket, 'limit', None):
+            return None
+        return {
+            'limit': bucket.limit,
+            'remaining': getattr(bucket, 'remaining', 0),
+            'reset_after': getattr(bucket, 'reset_after', 0.0),
+        }
+    except Exception:
+        return None
+
+
+class BulkMemberEditor:
+    """닉네임 일괄 변경 엔진"""
+
+    # 버킷 정보를 읽지 못했을 때의 동시 처리 수
+    DEFAULT_CONCURRENCY = 5
+    MAX_CONCURRENCY = 10
+    # 체크포인트 저장 간격 (처리 건수)
+    CHECKPOINT_EVERY = 10
+
+    def __init__(self, client: discord.Client, guild_id: int, label: str,
+                 max_concurrency: int = MAX_CONCURRENCY, use_checkpoint: bool = True):
+        self.client = client
+        self.guild_id = guild_id
+        self.label = label
+        self.max_concurrency = max_concurrency
+        self.checkpoint = Checkpoint(label) if use_checkpoint else None
+
+    async def _apply(self, edit: MemberEdit):
+        await self.client.http.edit_member(self.guild_id, edit.member_id, nick=edit.new_nick)
+
+    def _concurrency(self) -> int:
+        bucket = read_member_bucket(self.client.http, self.guild_id)
+        if not bucket:
+            return min(self.DEFAULT_CONCURRENCY, self.max_concurrency)
+        return max(1, min(int(bucket['limit']), self.max_concurrency))
+
+    async def run(self, edits: List[MemberEdit], dry_run: bool = True,
+                  on_success: Optional[Callable[[MemberEdit], Awaitable[None]]] = None,
+                  verbose: bool = True) -> BulkEditReport:
+        """계획 실행 (dry_run=True면 실제 변경 없이 같은 경로로 보고서만 생성)"""
+        report = BulkEditReport(label=self.label, dry_run=dry_run, planned=len(edits))
+        started = time.perf_counter()
+
+        done = self.checkpoint.load() if self.checkpoint else set()
+        pending = [edit for edit in edits if Checkpoint.key(edit) not in done]
+        report.resumed_skip = len(edits) - len(pending)
+        if report.resumed_skip:
+            logger.info(f"[{self.label}] 체크포인트에서 이어서 실행: {report.resumed_skip}명 건너뜀")
+
+        total = len(pending)
+        completed = 0
+
+        async def process(edit: MemberEdit):
+            nonlocal completed
+            if dry_run:
+                report.succeeded += 1
+                status = "예정"
+            else:
+                try:
+                    await self._apply(edit)
+                    report.succeeded += 1
+                    status = "성공"
+                    if self.checkpoint:
+                        self.checkpoint.done.add(Checkpoint.key(edit))
+                    if on_success:
+                        await on_success(edit)
+                except discord.Forbidden:
+                    report.forbidden += 1
+                    status = "권한 부족"
+                    # 이어서 실행할 때 다시 시도해도 실패하므로 완료로 기록 (체크포인트 만료 후에는 다시 시도)
+                    if self.checkpoint:
+                        self.checkpoint.done.add(Checkpoint.key(edit))
+                except Exception as e:
+                    report.failed += 1
+                    status = "오류"
+                    report.errors.append(f"{edit.current_name}: {e}")
+
+            completed += 1
+            if verbose:
+                reason = f" ({edit.reason})" if edit.reason else ""
+                logger.info(f"[{completed}/{total}] {status}: {edit.current_name} → {edit.new_nick}{reason}")
+            if not dry_run and self.checkpoint and completed % self.CHECKPOINT_EVERY == 0:
+                await self.checkpoint.save()
+
+        if dry_run:
+            for edit in pending:
+                await process(edit)
+        elif pending:
+            try:
+                # 첫 요청으로 버킷 정보를 받아온 뒤 버킷 크기만큼 동시에 처리
+                # (버킷이 비면 discord.py가 리셋 시각까지 대기시킨다)
+                await process(pending[0])
+                concurrency = self._concurrency()
+                logger.info(f"[{self.label}] 동시 처리 수: {concurrency}")
+
+                queue: asyncio.Queue = asyncio.Queue()
+                for edit in pending[1:]:
+                    queue.put_nowait(edit)
+
+                async def worker():
+                    while True:
+                        try:
+                            edit = queue.get_nowait()
+                        except asyncio.QueueEmpty:
+                            return
+                        await process(edit)
+
+                await asyncio.gather(*(worker() for _ in range(concurrency)))
+            finally:
+                # 중단되더라도 여기까지의 진행 상황은 남긴다
+                if self.checkpoint:
+                    await self.checkpoint.save()
+
+            if self.checkpoint and not report.failed:
+                await self.checkpoint.clear()
+
+        report.elapsed = time.perf_counter() - started
+        return report
@@ -0,0 +1,153 @@
+# services/character_index.py
+"""
+guild_bot.characters 메모리 인덱스
+
+자동완성처럼 키 입력마다 호출되는 곳에서 DB/HTTP 호출 없이
+캐릭터명 접두사/초성 검색을 처리하기 위한 인덱스
+"""
+import logging
+import time
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from utils.hangul import get_chosung, is_chosung_query, normalize_search_text, split_trailing_chosung
+from utils.metrics import record_cache
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CharacterEntry:
+    """인덱스에 저장되는 캐릭터 정보"""
+    character_id: int
+    character_name: str
+    realm_slug: str
+    is_guild_member: bool
+
+
+class CharacterIndex:
+    """캐릭터명 -> 서버 목록 인덱스 (정렬 리스트 + 이진 탐색)"""
+
+    # 초성 입력 중 마지막 글자 필터링 시 최대 확인 개수
+    MAX_SCAN = 500
+
+    def __init__(self):
+        self._by_name: Dict[str, List[CharacterEntry]] = {}
+        self._sorted_keys: List[Tuple[str, str]] = []      # (정규화된 이름, 원래 이름)
+        self._sorted_chosung: List[Tuple[str, str]] = []   # (초성, 원래 이름)
+        self.loaded_at: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self._by_name)
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.loaded_at is not None
+
+    def build(self, entries: Iterable[CharacterEntry]):
+        """전체 재구축 (새 구조를 만든 뒤 한 번에 교체)"""
+        by_name: Dict[str, List[CharacterEntry]] = {}
+        for entry in entries:
+            by_name.setdefault(entry.character_name, []).append(entry)
+
+        # 길드원 캐릭터를 먼저 보여주기 위한 정렬
+        for realm_entries in by_name.values():
+            realm_entries.sort(key=lambda e: (not e.is_guild_member, e.realm_slug))
+
+        sorted_keys = sorted((normalize_search_text(name), name) for name in by_name)
+        sorted_chosung = sorted((get_chosung(key), name) for key, name in sorted_keys)
+
+        self._by_name = by_name
+        self._sorted_keys = sorted_keys
+        self._sorted_chosung = sorted_chosung
+        self.loaded_at = time.time()
+
+    async def refresh(self, db_manager) -> int:
+        """DB에서 전체 캐릭터를 읽어 인덱스 재구축"""
+        async with db_manager.get_connection() as conn:
+            rows = await conn.fetch("""
+                SELECT id, character_name, realm_slug, is_guild_member
+                FROM guild_bot.characters
+            """)
+
+        self.build(
+            CharacterEntry(row['id'], row['character_name'], row['realm_slug'], bool(row['is_guild_member']))
+            for row in rows
+        )
+        logger.info(f"캐릭터 인덱스 갱신 완료: {len(self._by_name)}개 캐릭터명, {len(rows)}개 캐릭터")
+        return len(rows)
+
+    def add(self, entry: CharacterEntry):
+        """캐릭터 하나 추가/갱신 (DB 저장 직후 호출)"""
+        realm_entries = self._by_name.get(entry.character_name)
+        if realm_entries is None:
+            self._by_name[entry.character_name] = [entry]
+            key = normalize_search_text(entry.character_name)
+            insort(self._sorted_keys, (key, entry.character_name))
+            insort(self._sorted_chosung, (get_chosung(key), entry.character_name))
+            return
+
+        for i, existing in enumerate(realm_entries):
+            if existing.realm_slug == entry.realm_slug:
+                realm_entries[i] = entry
+                break
+        else:
+            realm_entries.append(entry)
+        realm_entries.sort(key=lambda e: (not e.is_guild_member, e.realm_slug))
+
+    def get(self, character_name: str) -> List[CharacterEntry]:
+        """정확한 캐릭터명으로 서버 목록 조회"""
+        entries = self._by_name.get(character_name)
+        record_cache("character_index", entries is not None)
+        return list(entries or ())
+
+    @staticmethod
+    def _prefix_scan(sorted_list: List[Tuple[str, str]], prefix: str, limit: int) -> List[str]:
+        names = []
+        start = bisect_left(sorted_list, (prefix, ""))
+        for key, name in sorted_list[start:start + limit]:
+            if not key.startswith(prefix):
+                break
+            names.append(name)
+        return names
+
+    def search_names(self, query: str, limit: int = 25) -> List[str]:
+        """캐릭터명 접두사/초성 검색"""
+        normalized = normalize_search_text(query)
+        if not normalized:
+            return [name for _, name in self._sorted_keys[:limit]]
+
+        if is_chosung_query(normalized):
+            return self._prefix_scan(self._sorted_chosung, normalized, limit)
+
+        names = self._prefix_scan(self._sorted_keys, normalized, limit)
+        if names:
+            return names
+
+        # 예: "비수ㄱ" -> "비수"로 시작하고 다음 글자 초성이 ㄱ인 캐릭터
+        prefix, trailing = split_trailing_chosung(normalized)
+        if not trailing:
+            return []
+        names = []
+        for name in self._prefix_scan(self._sorted_keys, prefix, self.MAX_SCAN):
+            key = normalize_search_text(name)
+            if len(key) > len(prefix) and get_chosung(key[len(prefix)]) == trailing:
+                names.append(name)
+                if len(names) >= limit:
+                    break
+        return names
+
+    def search(self, query: str, limit: int = 25) -> List[CharacterEntry]:
+        """캐릭터 검색 (같은 이름이 여러 서버에 있으면 서버별로 반환)"""
+        results: List[CharacterEntry] = []
+        for name in self.search_names(query, limit):
+            for entry in self._by_name.get(name, ()):
+                results.append(entry)
+                if len(results) >= limit:
+                    return results
+        return results
+
+
+# 전역 인스턴스
+character_index = CharacterIndex()
@@ -0,0 +1,115 @@
+# services/character_ownership.py
+"""
+캐릭터 소유권 (guild_bot.character_ownership) 설정
+
+한 유저당 인증(is_verified) 캐릭터는 하나만 둔다.
+디스코드 유저 upsert -> 캐릭터 id 확인 -> 기존 인증 해제 -> 새 연결 upsert를
+데이터 변경 CTE 하나로 처리해서 왕복 1번, 문장 하나(원자적)로 끝낸다.
+
+- 대상 캐릭터가 이미 인증 상태면 해제 대상에서 빼서 같은 행을 두 번 바꾸지 않는다
+- 캐릭터가 없으면 아무것도 쓰지 않고 None
+"""
+import logging
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# $1 discord_id, $2 discord_username, $3 character_id (없으면 $4 이름 + $5 서버로 조회)
+LINK_CHARACTER_SQL = """
+    -- name: character_ownership.link
+    WITH target AS (
+        SELECT id AS character_id FROM guild_bot.characters WHERE id = $3::bigint
+        UNION ALL
+        SELECT id FROM guild_bot.characters
+        WHERE $3::bigint IS NULL AND character_name = $4::text AND realm_slug = $5::text
+    ),
+    discord_user AS (
+        INSERT INTO guild_bot.discord_users (discord_id, discord_username)
+        SELECT $1::text, $2::text
+        WHERE EXISTS (SELECT 1 FROM target)
+        ON CONFLICT (discord_id) DO UPDATE SET
+            discord_username = EXCLUDED.discord_username,
+            updated_at = NOW()
+        RETURNING id
+    ),
+    demoted AS (
+        UPDATE guild_bot.character_ownership co
+        SET is_verified = FALSE, updated_at = NOW()
+        FROM discord_user du, target t
+        WHERE co.discord_user_id = du.id AND co.is_verified = TRUE AND co.character_id <> t.character_id
+        RETURNING co.character_id
+    ),
+    linked AS (
+        INSERT INTO guild_bot.character_ownership (discord_user_id, character_id, is_verified)
+        SELECT du.id, t.character_id FROM discord_user du, target t
+        ON CONFLICT (discord_user_id, character_id) DO UPDATE SET
+            is_verified = TRUE,
+            updated_at = NOW()
+        RETURNING discord_user_id, character_id
+    )
+    SELECT l.discord_user_id, l.character_id,
+           COALESCE((SELECT array_agg(character_id) FROM demoted), '{}') AS demoted_character_ids
+    FROM linked l
+"""
+
+# 디스코드 유저 id(guild_bot.discord_users.id)를 이미 알고 있을 때 ($1 discord_user_id, $2 character_id)
+VERIFY_CHARACTER_SQL = """
+    -- name: character_ownership.verify
+    WITH demoted AS (
+        UPDATE guild_bot.character_ownership
+        SET is_verified = FALSE, updated_at = NOW()
+        WHERE discord_user_id = $1 AND is_verified = TRUE AND character_id <> $2
+        RETURNING character_id
+    ),
+    linked AS (
+        INSERT INTO guild_bot.character_ownership (discord_user_id, character_id, is_verified)
+        VALUES ($1, $2, TRUE)
+        ON CONFLICT (discord_user_id, character_id) DO UPDATE SET
+            is_verified = TRUE,
+            updated_at = NOW()
+        RETURNING discord_user_id, character_id
+    )
+    SELECT l.discord_user_id, l.character_id,
+           COALESCE((SELECT array_agg(character_id) FROM demoted), '{}') AS demoted_character_ids
+    FROM linked l
+"""
+
+
+@dataclass(frozen=True)
+class OwnershipLink:
+    """연결 결과"""
+    discord_user_id: int                    # guild_bot.discord_users.id
+    character_id: int
+    demoted_character_ids: Tuple[int, ...]  # 인증이 해제된 이전 캐릭터
+
+    @classmethod
+    def from_row(cls, row) -> "OwnershipLink":
+        return cls(row['discord_user_id'], row['character_id'], tuple(row['demoted_character_ids']))
+
+
+class CharacterOwnershipService:
+    def __init__(self, db_manager):
+        self.db_manager = db_manager
+
+    async def link(self, discord_id: str, discord_username: str, *, character_id: Optional[int] = None,
+                   character_name: Optional[str] = None, realm_slug: Optional[str] = None,
+                   conn=None) -> Optional[OwnershipLink]:
+        """
+        디스코드 유저에게 캐릭터 연결 (유저 정보 갱신 + 인증 캐릭터 교체)
+
+        character_id 또는 (character_name, realm_slug) 중 하나로 캐릭터 지정.
+        캐릭터가 DB에 없으면 None.
+        """
+        args = (discord_id, discord_username, character_id, character_name, realm_slug)
+        if conn is not None:
+            row = await conn.fetchrow(LINK_CHARACTER_SQL, *args)
+        else:
+            async with self.db_manager.get_connection() as conn:
+                row = await conn.fetchrow(LINK_CHARACTER_SQL, *args)
+        return OwnershipLink.from_row(row) if row else None
+
+    async def verify(self, discord_user_id: int, character_id: int, conn) -> OwnershipLink:
+        """discord_users.id를 이미 알 때 인증 캐릭터 교체 (호출한 쪽 트랜잭션 안에서)"""
+        row = await conn.fetchrow(VERIFY_CHARACTER_SQL, discord_user_id, character_id)
+        return OwnershipLink.from_row(row)
@@ -0,0 +1,190 @@
+# services/character_profiles.py
+"""
+raider.io 캐릭터 프로필 원본 저장소 (guild_bot.character_profiles)
+
+characters 테이블에는 자주 쓰는 열 10여 개만 남기고 나머지 응답은 버려 왔다.
+여기에는 (캐릭터, fields 조합)별로 응답 전체를 jsonb로 저장해서
+장비/쐐기 점수/레이드 진행도가 필요한 기능이 다시 API를 부르지 않고 읽을 수 있게 한다.
+
+- fields: raider.io 요청의 fields 파라미터를 정렬해서 쉼표로 이은 값 ('' = 기본 프로필)
+  길드 로스터(guilds/profile?fields=members)의 멤버 항목은 ROSTER_FIELDS로 저장
+- payload는 jsonb이고, 큰 값은 Postgres TOAST 압축 (가능하면 lz4)
+- 읽는 쪽은 max_age로 필요한 신선도를 고르고, CharacterProfile의 속성으로 값을 꺼낸다
+  (프로필 재수집기는 최근에 저장된 응답이 있으면 raider.io를 다시 부르지 않는다)
+"""
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+CHARACTER_PROFILES_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS guild_bot.character_profiles (
+    character_id BIGINT NOT NULL REFERENCES guild_bot.characters(id) ON DELETE CASCADE,
+    fields TEXT NOT NULL DEFAULT '',
+    payload JSONB NOT NULL,
+    fetched_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (character_id, fields)
+);
+"""
+
+# lz4 TOAST 압축 (Postgres 14+, lz4 빌드에서만 가능 -> 실패하면 기본 pglz 유지)
+# ALTER TABLE은 ACCESS EXCLUSIVE 잠금이라 이미 lz4면 실행하지 않는다 ('l' = lz4, 14 미만은 열이 없어서 실패)
+CHARACTER_PROFILES_COMPRESSION_CHECK_SQL = """
+SELECT attcompression FROM pg_attribute
+WHERE attrelid = 'guild_bot.character_profiles'::regclass AND attname = 'payload'
+"""
+CHARACTER_PROFILES_COMPRESSION_SQL = """
+ALTER TABLE guild_bot.character_profiles ALTER COLUMN payload SET COMPRESSION lz4
+"""
+
+UPSERT_PROFILES_SQL = """
+INSERT INTO guild_bot.character_profiles (character_id, fields, payload, fetched_at)
+SELECT character_id, fields, payload, NOW()
+FROM unnest($1::bigint[], $2::text[], $3::jsonb[]) AS t(character_id, fields, payload)
+ON CONFLICT (character_id, fields)
+DO UPDATE SET payload = EXCLUDED.payload, fetched_at = EXCLUDED.fetched_at
+"""
+
+BASIC_FIELDS = ""
+# 길드 로스터 멤버 항목 ({"rank": ..., "character": {...}})
+ROSTER_FIELDS = "guild_roster"
+
+
+def fields_key(fields: Optional[Iterable[str]] = None) -> str:
+    """fields 조합 정규화 (순서/중복 무관)"""
+    if fields is None or isinstance(fields, str):
+        fields = (fields or "").split(",")
+    return ",".join(sorted({f.strip() for f in fields if f.strip()}))
+
+
+@dataclass
+class CharacterProfile:
+    """저장된 프로필 응답 + 자주 쓰는 값 접근자 (없는 값은 None)"""
+    character_id: int
+    fields: str
+    payload: Dict[str, Any]
+    fetched_at: datetime
+
+    @property
+    def age(self) -> float:
+        """저장된 지 몇 초 지났는지"""
+        return time.time() - self.fetched_at.timestamp()
+
+    @property
+    def character(self) -> Dict[str, Any]:
+        # 로스터 항목은 캐릭터 정보가 한 단계 안쪽에 있음
+        if self.fields == ROSTER_FIELDS:
+            return self.payload.get("character") or {}
+        return self.payload
+
+    @property
+    def name(self) -> Optional[str]:
+        return self.character.get("name")
+
+    @property
+    def realm(self) -> Optional[str]:
+        return self.character.get("realm")
+
+    @property
+    def race(self) -> Optional[str]:
+        return self.character.get("race")
+
+    @property
+    def class_name(self) -> Optional[str]:
+        return self.character.get("class")
+
+    @property
+    def active_spec(self) -> Optional[str]:
+        return self.character.get("active_spec_name")
+
+    @property
+    def active_spec_role(self) -> Optional[str]:
+        return self.character.get("active_spec_role")
+
+    @property
+    def faction(self) -> Optional[str]:
+        return self.character.get("faction")
+
+    @property
+    def achievement_points(self) -> Optional[int]:
+        return self.character.get("achievement_points")
+
+    @property
+    def thumbnail_url(self) -> Optional[str]:
+        return self.character.get("thumbnail_url")
+
+    @property
+    def guild_rank(self) -> Optional[int]:
+        return self.payload.get("rank") if self.fields == ROSTER_FIELDS else None
+
+    @property
+    def item_level(self) -> Optional[float]:
+        """fields=gear"""
+        gear = self.payload.get("gear") or {}
+        return gear.get("item_level_equipped")
+
+    @property
+    def mythic_plus_score(self) -> Optional[float]:
+        """fields=mythic_plus_scores_by_season:current"""
+        seasons = self.payload.get("mythic_plus_scores_by_season") or []
+        if not seasons:
+            return None
+        return (seasons[0].get("scores") or {}).get("all")
+
+    def raid_progression(self, raid_slug: str) -> Optional[Dict[str, Any]]:
+        """fields=raid_progression"""
+        return (self.payload.get("raid_progression") or {}).get(raid_slug)
+
+
+class CharacterProfileStore:
+    def __init__(self, db_manager):
+        self.db_manager = db_manager
+
+    async def ensure_schema(self):
+        async with self.db_manager.get_connection() as conn:
+            await conn.execute(CHARACTER_PROFILES_SCHEMA_SQL)
+            try:
+                if await conn.fetchval(CHARACTER_PROFILES_COMPRESSION_CHECK_SQL) != 'l':
+                    await conn.execute(CHARACTER_PROFILES_COMPRESSION_SQL)
+            except Exception as e:
+                logger.debug(f"character_profiles lz4 압축 설정 생략: {e}")
+
+    async def save(self, character_id: int, payload: Dict[str, Any], fields: Optional[Iterable[str]] = None,
+                   conn=None):
+        await self.save_many([(character_id, fields_key(fields), payload)], conn=conn)
+
+    async def save_many(self, rows: Sequence[Tuple[int, str, Dict[str, Any]]], conn=None):
+        """(character_id, fields_key, payload) 여러 개를 INSERT 한 번으로 저장"""
+        if not rows:
+            return
+        args = ([r[0] for r in rows], [r[1] for r in rows], [r[2] for r in rows])
+        if conn is not None:
+            # 호출한 쪽 트랜잭션 안이면 세이브포인트라서, 여기서 실패해도 캐릭터 저장은 유지된다
+            async with conn.transaction():
+                await conn.execute(UPSERT_PROFILES_SQL, *args)
+            return
+        async with self.db_manager.get_connection() as conn:
+            await conn.execute(UPSERT_PROFILES_SQL, *args)
+
+    async def get_many(self, character_ids: Iterable[int], fields: Optional[Iterable[str]] = None,
+                       max_age: Optional[float] = None) -> Dict[int, CharacterProfile]:
+        """저장된 프로필 조회 (max_age초보다 오래된 것은 제외) -> {character_id: profile}"""
+        key = fields_key(fields)
+        async with self.db_manager.get_connection() as conn:
+            rows = await conn.fetch("""
+                SELECT character_id, fields, payload, fetched_at
+                FROM guild_bot.character_profiles
+                WHERE character_id = ANY($1::bigint[]) AND fields = $2
+                  AND ($3::float8 IS NULL OR fetched_at >= NOW() - make_interval(secs => $3::float8))
+            """, list(character_ids), key, max_age)
+        return {
+            row['character_id']: CharacterProfile(row['character_id'], row['fields'], row['payload'], row['fetched_at'])
+            for row in rows
+        }
+
+    async def get(self, character_id: int, fields: Optional[Iterable[str]] = None,
+                  max_age: Optional[float] = None) -> Optional[CharacterProfile]:
+        return (await self.get_many([character_id], fields, max_age)).get(character_id)
@@ -0,0 +1,238 @@
+# services/character_repository.py
+"""
+guild_bot.characters 저장소 (raider.io 프로필 -> characters 행)
+
+봇(캐릭터 서비스, 자동 닉네임)과 도구(닉네임 매처, 길드 로스터 수집기)가
+모두 여기의 upsert 하나를 쓴다.
+
+- 1..N개를 unnest 배열로 INSERT 한 번에 저장하고, 입력 순서대로 id를 돌려준다
+- 내용이 같은 행은 쓰지 않는다 (updated_at/dead tuple 증가 방지)
+  단 last_crawled_at이 TOUCH_INTERVAL보다 오래됐으면 그것만 갱신
+- is_guild_member는 guild_member를 넘긴 경우(로스터 수집기)에만 바꾼다
+  (None이면 새 캐릭터는 FALSE, 기존 캐릭터는 그대로)
+- 원본 응답은 character_profiles에도 함께 저장 (profile_fields=None이면 생략)
+"""
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+from services.character_index import character_index, CharacterEntry
+from services.character_profiles import BASIC_FIELDS, CharacterProfileStore, fields_key
+from utils.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+CHARACTER_WRITES = registry.counter(
+    "bot_character_upserts_total",
+    "characters upsert 결과 (inserted, updated: 내용 변경, touched: last_crawled_at만, skipped: 쓰지 않음)",
+    ("result",))
+
+# 내용이 같아도 last_crawled_at을 갱신하는 간격 (초)
+TOUCH_INTERVAL = 6 * 3600
+
+# raider.io 응답에서 그대로 옮기는 열 (열 이름, 응답 키, 타입)
+CONTENT_COLUMNS = (
+    ("race", "race", "text"),
+    ("class", "class", "text"),
+    ("active_spec", "active_spec_name", "text"),
+    ("active_spec_role", "active_spec_role", "text"),
+    ("gender", "gender", "text"),
+    ("faction", "faction", "text"),
+    ("achievement_points", "achievement_points", "int"),
+    ("profile_url", "profile_url", "text"),
+    ("profile_banner", "profile_banner", "text"),
+    ("thumbnail_url", "thumbnail_url", "text"),
+)
+
+
+def _build_upsert_sql() -> str:
+    columns = [name for name, _, _ in CONTENT_COLUMNS]
+    arrays = ", ".join(f"${i}::{pg_type}[]" for i, (_, _, pg_type) in enumerate(CONTENT_COLUMNS, 3))
+    guild = f"${len(CONTENT_COLUMNS) + 3}::boolean"
+    region = f"${len(CONTENT_COLUMNS) + 4}::text"
+    touch = f"${len(CONTENT_COLUMNS) + 5}::float8"
+
+    def row(alias: str, guild_value: str) -> str:
+        return f"({guild_value}, " + ", ".join(f"{alias}.{col}" for col in columns) + ")"
+
+    stored = row("c", "c.is_guild_member")
+    return f"""
+        -- name: characters.upsert
+        WITH input AS (
+            SELECT *
+            FROM unnest($1::text[], $2::text[], {arrays})
+                WITH ORDINALITY AS t(character_name, realm_slug, {", ".join(columns)}, ord)
+        ),
+        written AS (
+            INSERT INTO guild_bot.characters AS c (
+                character_name, realm_slug, is_guild_member, {", ".join(columns)},
+                region, last_crawled_at
+            )
+            SELECT character_name, realm_slug, COALESCE({guild}, FALSE), {", ".join(columns)},
+                   {region}, NOW()
+            FROM input
+            ON CONFLICT (character_name, realm_slug) DO UPDATE SET
+                is_guild_member = COALESCE({guild}, c.is_guild_member),
+                {", ".join(f"{col} = EXCLUDED.{col}" for col in columns)},
+                last_crawled_at = NOW(),
+                updated_at = CASE
+                    WHEN {stored} IS DISTINCT FROM {row("EXCLUDED", f"COALESCE({guild}, c.is_guild_member)")}
+                    THEN NOW() ELSE c.updated_at END
+            WHERE {stored} IS DISTINCT FROM {row("EXCLUDED", f"COALESCE({guild}, c.is_guild_member)")}
+               OR c.last_crawled_at IS NULL
+               OR c.last_crawled_at < NOW() - make_interval(secs => {touch})
+            RETURNING c.id, c.character_name, c.realm_slug, c.is_guild_member
+        )
+        -- 같은 문장 안의 characters(c)는 쓰기 전 상태
+        SELECT i.character_name, i.realm_slug,
+               COALESCE(w.id, c.id) AS id,
+               COALESCE(w.is_guild_member, c.is_guild_member) AS is_guild_member,
+               c.id IS NULL AS inserted,
+               w.id IS NOT NULL AS written,
+               c.id IS NULL OR {stored} IS DISTINCT FROM {row("i", f"COALESCE({guild}, c.is_guild_member)")} AS changed
+        FROM input i
+        LEFT JOIN written w ON w.character_name = i.character_name AND w.realm_slug = i.realm_slug
+        LEFT JOIN guild_bot.characters c ON c.character_name = i.character_name AND c.realm_slug = i.realm_slug
+        ORDER BY i.ord
+    """
+
+
+UPSERT_CHARACTERS_SQL = _build_upsert_sql()
+
+
+@dataclass(frozen=True)
+class SavedCharacter:
+    """upsert 결과 한 건 (입력 순서와 같음)"""
+    character_id: int
+    character_name: str
+    realm_slug: str
+    is_guild_member: bool
+    inserted: bool      # 새로 추가됨
+    changed: bool       # 내용이 바뀜 (추가 포함)
+    written: bool       # 실제로 행을 썼음 (changed 또는 last_crawled_at 갱신)
+
+
+def character_values(payload: Dict[str, Any]) -> Optional[tuple]:
+    """raider.io 캐릭터 응답 -> (이름, 서버, 내용 열...) / 이름이나 서버가 없으면 None"""
+    name = payload.get("name")
+    realm = payload.get("realm")
+    if not name or not realm:
+        return None
+    values = [name, realm]
+    for _, key, pg_type in CONTENT_COLUMNS:
+        value = payload.get(key)
+        values.append((value or 0) if pg_type == "int" else (value or ""))
+    return tuple(values)
+
+
+class CharacterRepository:
+    def __init__(self, db_manager):
+        self.db_manager = db_manager
+        self.profile_store = CharacterProfileStore(db_manager)
+
+    async def save(self, payload: Dict[str, Any], *, guild_member: Optional[bool] = None,
+                   profile_fields: Optional[str] = BASIC_FIELDS, raw: Optional[Dict[str, Any]] = None,
+                   touch_interval: float = TOUCH_INTERVAL, conn=None) -> Optional[SavedCharacter]:
+        """캐릭터 하나 저장 (이름/서버가 없으면 None)"""
+        saved = await self.save_many([payload], guild_member=guild_member, profile_fields=profile_fields,
+                                     raw=None if raw is None else [raw], touch_interval=touch_interval,
+                                     conn=conn)
+        return saved[0]
+
+    async def save_many(self, payloads: Sequence[Dict[str, Any]], *, guild_member: Optional[bool] = None,
+                        profile_fields: Optional[str] = BASIC_FIELDS,
+                        raw: Optional[Sequence[Dict[str, Any]]] = None,
+                        touch_interval: float = TOUCH_INTERVAL,
+                        conn=None) -> List[Optional[SavedCharacter]]:
+        """
+        캐릭터 여러 개를 한 번에 저장
+
+        Args:
+            payloads: raider.io 캐릭터 응답 (로스터 항목은 평평하게 펼친 것)
+            guild_member: True/False면 길드원 여부도 저장, None이면 기존 값 유지
+            profile_fields: character_profiles에 저장할 fields 키 (None이면 저장 안 함)
+            raw: character_profiles에 저장할 원본 (기본값은 payloads)
+            touch_interval: 내용이 같을 때 last_crawled_at을 갱신할 최소 간격 (초, 0이면 항상 갱신)
+            conn: 호출한 쪽 연결 (트랜잭션 안에서 쓸 때)
+
+        Returns:
+            payloads와 같은 순서의 결과 (이름/서버가 없는 항목은 None)
+        """
+        raw = payloads if raw is None else raw
+        # 같은 캐릭터가 두 번 있으면 ON CONFLICT가 실패하므로 마지막 것만 사용
+        unique: Dict[tuple, int] = {}
+        for index, payload in enumerate(payloads):
+            values = character_values(payload)
+            if values is None:
+                logger.info(f"필수 데이터 누락: name={payload.get('name')}, realm={payload.get('realm')}")
+                continue
+            unique[values[:2]] = index
+        if not unique:
+            return [None] * len(payloads)
+
+        indexes = list(unique.values())
+        columns = list(zip(*(character_values(payloads[i]) for i in indexes)))
+        args = [list(column) for column in columns] + [guild_member, "kr", float(touch_interval)]
+
+        if conn is not None:
+            saved = await self._upsert(conn, args, indexes, raw, profile_fields)
+        else:
+            async with self.db_manager.get_connection() as conn:
+                async with conn.transaction():
+                    saved = await self._upsert(conn, args, indexes, raw, profile_fields)
+
+        by_key = {(s.character_name, s.realm_slug): s for s in saved}
+        results = []
+        for payload in payloads:
+            values = character_values(payload)
+            results.append(by_key.get(values[:2]) if values else None)
+        return results
+
+    async def _upsert(self, conn, args, indexes, raw, profile_fields) -> List[SavedCharacter]:
+        rows = await conn.fetch(UPSERT_CHARACTERS_SQL, *args)
+        saved = [
+            SavedCharacter(row['id'], row['character_name'], row['realm_slug'], bool(row['is_guild_member']),
+                           row['inserted'], row['changed'], row['written'])
+            for row in rows
+        ]
+
+        for s in saved:
+            if s.inserted:
+                CHARACTER_WRITES.inc(result="inserted")
+            elif s.changed:
+                CHARACTER_WRITES.inc(result="updated")
+            else:
+                CHARACTER_WRITES.inc(result="touched" if s.written else "skipped")
+        logger.debug(f"characters 저장: {len(saved)}개 중 변경 {sum(s.changed for s in saved)}개, "
+                     f"기록 {sum(s.written for s in saved)}개")
+
+        # 응답 전체는 프로필 저장소에 (장비/점수 등이 필요할 때 다시 요청하지 않도록)
+        if profile_fields is not None:
+            key = fields_key(profile_fields)
+            try:
+                await self.profile_store.save_many(
+                    [(s.character_id, key, raw[i]) for s, i in zip(saved, indexes)], conn=conn)
+            except Exception as e:
+                logger.warning(f"캐릭터 프로필 원본 저장 실패 ({len(saved)}개): {e}")
+
+        # 자동완성 인덱스에 바로 반영 (봇 프로세스에서만 로드되어 있음)
+        if character_index.is_loaded:
+            for s in saved:
+                if s.changed:
+                    character_index.add(CharacterEntry(s.character_id, s.character_name, s.realm_slug,
+                                                       s.is_guild_member))
+        return saved
+
+    async def mark_non_members(self, member_ids: Sequence[int], conn=None) -> int:
+        """member_ids에 없는 길드원 캐릭터를 비길드원으로 표시 (바뀐 행 수 반환)"""
+        query = """
+            UPDATE guild_bot.characters
+            SET is_guild_member = FALSE, updated_at = NOW()
+            WHERE is_guild_member = TRUE AND id <> ALL($1::bigint[])
+        """
+        if conn is not None:
+            result = await conn.execute(query, list(member_ids))
+        else:
+            async with self.db_manager.get_connection() as conn:
+                result = await conn.execute(query, list(member_ids))
+        return int(result.split()[-1])
@@ -1,11 +1,33 @@
 # services/character_service.py
-from utils.wow_translation import translate_spec_en_to_kr, translate_class_en_to_kr
+from utils.wow_translation import translate_spec_en_to_kr, translate_class_en_to_kr, resolve_realm_input, get_realm_suggestions
 from utils.wow_role_mapping import get_character_role, get_character_armor_type
+from services.character_ownership import CharacterOwnershipService
+from services.character_repository import CharacterRepository
+
+
+def resolve_realm_for_input(realm_input: str) -> dict:
+    """서버명 입력을 인덱스로 확인 (API 호출 전에 오타 걸러내기)"""
+    if not realm_input or not realm_input.strip():
+        return {"error": "서버명을 입력해주세요."}
+
+    record = resolve_realm_input(realm_input)
+    if record:
+        return {"realm_name_en": record.name_en, "realm_name_kr": record.name_kr}
+    
+    # 영어 입력은 인덱스에 없는 서버일 수 있으므로 그대로 사용
+    if realm_input.strip().isascii():
+        return {"realm_name_en": realm_input.strip(), "realm_name_kr": realm_input.strip()}
+    
+    suggestions = get_realm_suggestions(realm_input)
+    suggestion_text = f"\n혹시 이 서버인가요? {', '.join(suggestions)}" if suggestions else ""
+    return {"error": f"알 수 없는 서버명입니다: `{realm_input}`{suggestion_text}"}
 
 
 class CharacterService:
     def __init__(self, db_manager):
         self.db_manager = db_manager
+        self.character_repository = CharacterRepository(db_manager)
+        self.ownership_service = CharacterOwnershipService(db_manager)
 
     async def validate_and_get_character(self, clean_name: str):
         """캐릭터 유효성 검증 및 정보 반환"""
@@ -37,33 +59,10 @@ class CharacterService:
                 "character_class": None
             }
         
-        # API에서 가져온 캐릭터 저장
+        # API에서 가져온 캐릭터 저장 (원본 응답은 프로필 저장소에도)
         char_info = char_result["character_info"]
-        character_id = await conn.fetchval("""
-            INSERT INTO guild_bot.characters (
-                character_name, realm_slug, race, class, active_spec, 
-                active_spec_role, gender, faction, achievement_points,
-                profile_url, thumbnail_url, region, last_crawled_at
-            )
-            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, NOW())
-            ON CONFLICT (character_name, realm_slug) DO UPDATE SET
-                race = EXCLUDED.race,
-                class = EXCLUDED.class,
-                active_spec = EXCLUDED.active_spec,
-                active_spec_role = EXCLUDED.active_spec_role,
-                gender = EXCLUDED.gender,
-                faction = EXCLUDED.faction,
-                achievement_points = EXCLUDED.achievement_points,
-                profile_url = EXCLUDED.profile_url,
-                thumbnail_url = EXCLUDED.thumbnail_url,
-                last_crawled_at = NOW(),
-                updated_at = NOW()
-            RETURNING id
-        """, char_info.get("name"), char_info.get("realm"), char_info.get("race"),
-            char_info.get("class"), char_info.get("active_spec_name"),
-            char_info.get("active_spec_role"), char_info.get("gender"),
-            char_info.get("faction"), char_info.get("achievement_points", 0),
-            char_info.get("profile_url", ""), char_info.get("thumbnail_url", ""), "kr")
+        saved = await self.character_repository.save(char_info, conn=conn)
+        character_id = saved.character_id
         
         return {
             "character_id": character_id,
@@ -83,30 +82,19 @@ class CharacterService:
         """, character_id)
 
     async def set_character_ownership(self, discord_user_id: int, character_id: int, conn):
-        """캐릭터 소유권 설정"""
-        # 기존 verified 캐릭터들을 FALSE로 변경
-        await conn.execute("""
-            UPDATE guild_bot.character_ownership 
-            SET is_verified = FALSE, updated_at = NOW()
-            WHERE discord_user_id = $1 AND is_verified = TRUE
-        """, discord_user_id)
-        
-        # 새 캐릭터를 verified=TRUE로 설정
-        await conn.execute("""
-            INSERT INTO guild_bot.character_ownership (discord_user_id, character_id, is_verified)
-            VALUES ($1, $2, TRUE)
-            ON CONFLICT (discord_user_id, character_id) DO UPDATE SET
-                is_verified = TRUE,
-                updated_at = NOW()
-        """, discord_user_id, character_id)
+        """캐릭터 소유권 설정 (기존 인증 캐릭터 해제 + 새 캐릭터 인증을 한 번에)"""
+        return await self.ownership_service.verify(discord_user_id, character_id, conn)
 
     async def validate_character_from_input(self, character_name: str, realm_input: str):
         """사용자 입력으로부터 캐릭터 검증 (캐릭터변경 모달용)"""
-        from utils.wow_translation import normalize_realm_input, translate_realm_en_to_kr
         from utils.character_validator import validate_character, get_character_info
         
-        realm_name_en = normalize_realm_input(realm_input)
-        realm_name_kr = translate_realm_en_to_kr(realm_name_en)
+        realm_result = resolve_realm_for_input(realm_input)
+        if realm_result.get("error"):
+            return realm_result
+        
+        realm_name_en = realm_result["realm_name_en"]
+        realm_name_kr = realm_result["realm_name_kr"]
         
         # API 검증
         character_valid = await validate_character(realm_name_en, character_name)
@@ -0,0 +1,303 @@
+# services/cleanup_job_service.py
+"""
+/기웃정리 작업 실행기 (Postgres 기반, 재시작 후 재개 가능)
+
+작업(cleanup_jobs)과 멤버별 항목(cleanup_job_items)을 DB에 저장하고
+항목 상태를 pending -> dm_sent -> kicked (또는 role_removed / failed)로 갱신한다.
+봇이 중간에 재시작되어도 끝나지 않은 항목만 다시 처리한다.
+"""
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import discord
+
+logger = logging.getLogger(__name__)
+
+CLEANUP_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS guild_bot.cleanup_jobs (
+    id BIGSERIAL PRIMARY KEY,
+    guild_id BIGINT NOT NULL,
+    mode_name TEXT NOT NULL,
+    farewell_message TEXT NOT NULL,
+    target_role_id BIGINT,
+    requested_by BIGINT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'running',
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    finished_at TIMESTAMPTZ
+);
+
+CREATE TABLE IF NOT EXISTS guild_bot.cleanup_job_items (
+    job_id BIGINT NOT NULL REFERENCES guild_bot.cleanup_jobs(id) ON DELETE CASCADE,
+    member_id BIGINT NOT NULL,
+    display_name TEXT NOT NULL,
+    action TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'pending',
+    dm_ok BOOLEAN,
+    error TEXT,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (job_id, member_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_cleanup_jobs_status ON guild_bot.cleanup_jobs (status);
+"""
+
+# 항목 동작
+ACTION_KICK = "kick"
+ACTION_REMOVE_ROLE = "remove_role"
+
+# 항목 상태
+STATE_PENDING = "pending"
+STATE_DM_SENT = "dm_sent"
+STATE_KICKED = "kicked"
+STATE_ROLE_REMOVED = "role_removed"
+STATE_FAILED = "failed"
+
+UNFINISHED_STATES = (STATE_PENDING, STATE_DM_SENT)
+
+ProgressCallback = Callable[[str], Awaitable[None]]
+
+
+class CleanupJobRunner:
+    """기웃정리 작업 실행기"""
+
+    # 동시에 처리할 멤버 수 (DM/추방 버킷은 discord.py가 관리)
+    CONCURRENCY = 5
+    # 진행 상황 메시지 갱신 최소 간격 (초)
+    PROGRESS_INTERVAL = 2.0
+
+    def __init__(self, bot: discord.Client, db_manager):
+        self.bot = bot
+        self.db_manager = db_manager
+        self._running: Dict[int, asyncio.Task] = {}
+        self._listeners: Dict[int, List[ProgressCallback]] = {}
+
+    async def ensure_schema(self):
+        async with self.db_manager.get_connection() as conn:
+            await conn.execute(CLEANUP_SCHEMA_SQL)
+
+    async def create_job(self, guild: discord.Guild, mode_name: str, requested_by: int,
+                         farewell_message: str, kick_members: List[discord.Member],
+                         role_members: Optional[List[discord.Member]] = None,
+                         target_role_id: Optional[int] = None) -> int:
+        """작업과 항목을 한 트랜잭션으로 저장"""
+        role_members = role_members or []
+        async with self.db_manager.get_connection() as conn:
+            async with conn.transaction():
+                job_id = await conn.fetchval("""
+                    INSERT INTO guild_bot.cleanup_jobs
+                    (guild_id, mode_name, farewell_message, target_role_id, requested_by)
+                    VALUES ($1, $2, $3, $4, $5)
+                    RETURNING id
+                """, guild.id, mode_name, farewell_message, target_role_id, requested_by)
+
+                items = [(job_id, m.id, m.display_name, ACTION_KICK) for m in kick_members]
+                items += [(job_id, m.id, m.display_name, ACTION_REMOVE_ROLE) for m in role_members]
+                await conn.executemany("""
+                    INSERT INTO guild_bot.cleanup_job_items (job_id, member_id, display_name, action)
+                    VALUES ($1, $2, $3, $4)
+                    ON CONFLICT (job_id, member_id) DO NOTHING
+                """, items)
+
+        logger.info(f"기웃정리 작업 생성: #{job_id} {mode_name} (추방 {len(kick_members)}명, 역할 제거 {len(role_members)}명)")
+        return job_id
+
+    async def get_running_job_id(self, guild_id: int) -> Optional[int]:
+        async with self.db_manager.get_connection() as conn:
+            return await conn.fetchval("""
+                SELECT id FROM guild_bot.cleanup_jobs
+                WHERE guild_id = $1 AND status = 'running'
+                ORDER BY id LIMIT 1
+            """, guild_id)
+
+    def attach(self, job_id: int, progress: ProgressCallback):
+        """진행 상황을 받을 메시지 추가 (재시작 후 관리자가 다시 명령어를 실행한 경우 등)"""
+        self._listeners.setdefault(job_id, []).append(progress)
+
+    def start(self, job_id: int, progress: Optional[ProgressCallback] = None) -> asyncio.Task:
+        """작업 실행 (이미 실행 중이면 기존 태스크 반환)"""
+        if progress:
+            self.attach(job_id, progress)
+        task = self._running.get(job_id)
+        if task and not task.done():
+            return task
+        task = asyncio.create_task(self.run_job(job_id))
+        self._running[job_id] = task
+        return task
+
+    async def resume_unfinished(self):
+        """재시작 전에 끝나지 않은 작업 재개"""
+        async with self.db_manager.get_connection() as conn:
+            rows = await conn.fetch("SELECT id FROM guild_bot.cleanup_jobs WHERE status = 'running'")
+        for row in rows:
+            if row['id'] not in self._running:
+                logger.info(f"기웃정리 작업 재개: #{row['id']}")
+                self.start(row['id'])
+
+    async def _notify(self, job_id: int, content: str):
+        for progress in list(self._listeners.get(job_id, [])):
+            try:
+                await progress(content)
+            except Exception as e:
+                # 상호작용 토큰 만료(15분) 등 - 작업은 계속 진행
+                logger.warning(f"기웃정리 진행 상황 전송 실패: {e}")
+                self._listeners[job_id].remove(progress)
+
+    async def _set_state(self, job_id: int, member_id: int, state: str,
+                         dm_ok: Optional[bool] = None, error: Optional[str] = None):
+        async with self.db_manager.get_connection() as conn:
+            await conn.execute("""
+                UPDATE guild_bot.cleanup_job_items
+                SET state = $3, dm_ok = COALESCE($4, dm_ok), error = $5, updated_at = NOW()
+                WHERE job_id = $1 AND member_id = $2
+            """, job_id, member_id, state, dm_ok, error)
+
+    async def _process_item(self, job, guild: discord.Guild, item):
+        job_id = job['id']
+        member_id = item['member_id']
+        state = item['state']
+
+        member = guild.get_member(member_id)
+        if member is None:
+            try:
+                member = await guild.fetch_member(member_id)
+            except discord.NotFound:
+                # 이미 서버를 나간 멤버는 목표가 달성된 것으로 처리
+                final_state = STATE_KICKED if item['action'] == ACTION_KICK else STATE_ROLE_REMOVED
+                await self._set_state(job_id, member_id, final_state, error="이미 서버에 없음")
+                return
+
+        if item['action'] == ACTION_REMOVE_ROLE:
+            try:
+                await member.remove_roles(discord.Object(job['target_role_id']), reason=f"길드 정리 작업 - {job['mode_name']}")
+                await self._set_state(job_id, member_id, STATE_ROLE_REMOVED)
+            except Exception as e:
+                await self._set_state(job_id, member_id, STATE_FAILED, error=str(e))
+            return
+
+        # 1. DM 발송 (재개 시 이미 보낸 DM은 다시 보내지 않음)
+        if state == STATE_PENDING:
+            dm_ok = True
+            try:
+                await member.send(job['farewell_message'])
+            except Exception as e:
+                dm_ok = False
+                logger.warning(f"DM 실패: {member.display_name} - {e}")
+            await self._set_state(job_id, member_id, STATE_DM_SENT, dm_ok=dm_ok)
+
+        # 2. 추방
+        try:
+            await member.kick(reason=f"길드 정리 작업 - {job['mode_name']}")
+            await self._set_state(job_id, member_id, STATE_KICKED)
+            logger.info(f"추방 성공: {member.display_name}")
+        except discord.Forbidden:
+            await self._set_state(job_id, member_id, STATE_FAILED, error="권한 부족")
+            logger.warning(f"추방 실패 (권한부족): {member.display_name}")
+        except Exception as e:
+            await self._set_state(job_id, member_id, STATE_FAILED, error=str(e))
+            logger.warning(f"추방 실패: {member.display_name} - {e}")
+
+    async def get_counts(self, job_id: int) -> Dict[str, int]:
+        """상태별 항목 수 (DM 성공/실패 포함)"""
+        async with self.db_manager.get_connection() as conn:
+            rows = await conn.fetch("""
+                SELECT action, state, dm_ok, COUNT(*) AS cnt
+                FROM guild_bot.cleanup_job_items
+                WHERE job_id = $1
+                GROUP BY action, state, dm_ok
+            """, job_id)
+
+        counts = {"total": 0, "done": 0, "kicked": 0, "kick_failed": 0,
+                  "role_removed": 0, "role_failed": 0, "dm_ok": 0, "dm_failed": 0}
+        for row in rows:
+            cnt = row['cnt']
+            counts["total"] += cnt
+            if row['state'] not in UNFINISHED_STATES:
+                counts["done"] += cnt
+            if row['action'] == ACTION_KICK:
+                if row['state'] == STATE_KICKED:
+                    counts["kicked"] += cnt
+                elif row['state'] == STATE_FAILED:
+                    counts["kick_failed"] += cnt
+            else:
+                if row['state'] == STATE_ROLE_REMOVED:
+                    counts["role_removed"] += cnt
+                elif row['state'] == STATE_FAILED:
+                    counts["role_failed"] += cnt
+            if row['dm_ok'] is True:
+                counts["dm_ok"] += cnt
+            elif row['dm_ok'] is False:
+                counts["dm_failed"] += cnt
+        return counts
+
+    async def run_job(self, job_id: int):
+        """끝나지 않은 항목을 동시에 처리하고 진행 상황을 전송"""
+        async with self.db_manager.get_connection() as conn:
+            job = await conn.fetchrow("SELECT * FROM guild_bot.cleanup_jobs WHERE id = $1", job_id)
+            if job is None:
+                logger.warning(f"기웃정리 작업 #{job_id}: 작업 기록이 없어 실행하지 않음")
+                return
+            items = await conn.fetch("""
+                SELECT member_id, display_name, action, state
+                FROM guild_bot.cleanup_job_items
+                WHERE job_id = $1 AND state = ANY($2::text[])
+                ORDER BY action, member_id
+            """, job_id, list(UNFINISHED_STATES))
+
+        guild = self.bot.get_guild(job['guild_id'])
+        if guild is None:
+            logger.info(f"기웃정리 작업 #{job_id}: 길드를 찾을 수 없어 대기")
+            return
+
+        logger.info(f"기웃정리 작업 #{job_id} 실행: 남은 항목 {len(items)}개")
+        semaphore = asyncio.Semaphore(self.CONCURRENCY)
+        last_report = 0.0
+
+        async def handle(item):
+            nonlocal last_report
+            async with semaphore:
+                try:
+                    await self._process_item(job, guild, item)
+                except Exception as e:
+                    await self._set_state(job_id, item['member_id'], STATE_FAILED, error=str(e))
+                    logger.error(f"처리 중 오류: {item['display_name']} - {e}")
+
+            now = time.monotonic()
+            if now - last_report >= self.PROGRESS_INTERVAL:
+                last_report = now
+                counts = await self.get_counts(job_id)
+                await self._notify(job_id, f"{job['mode_name']} 처리 중... ({counts['done']}/{counts['total']})")
+
+        try:
+            await asyncio.gather(*(handle(item) for item in items))
+
+            async with self.db_manager.get_connection() as conn:
+                await conn.execute("""
+                    UPDATE guild_bot.cleanup_jobs SET status = 'completed', finished_at = NOW()
+                    WHERE id = $1
+                """, job_id)
+
+            counts = await self.get_counts(job_id)
+            logger.info(f"기웃정리 작업 #{job_id} 완료 - 추방:{counts['kicked']}, 실패:{counts['kick_failed']}")
+            await self._notify(job_id, self.format_result(job['mode_name'], counts))
+        finally:
+            self._running.pop(job_id, None)
+            self._listeners.pop(job_id, None)
+
+    @staticmethod
+    def format_result(mode_name: str, counts: Dict[str, int]) -> str:
+        """최종 결과 메시지"""
+        result_msg = f"**{mode_name} 완료!** 🎉\n\n"
+        result_msg += "📊 **처리 결과**\n"
+        result_msg += f"- 대상 인원: {counts['total']}명\n"
+        result_msg += f"- 추방 성공: {counts['kicked']}명\n"
+        result_msg += f"- 추방 실패: {counts['kick_failed']}명\n"
+        if counts['role_removed'] or counts['role_failed']:
+            result_msg += "\n⚙️ **역할 제거 결과**\n"
+            result_msg += f"- 성공: {counts['role_removed']}명\n"
+            result_msg += f"- 실패: {counts['role_failed']}명\n"
+        result_msg += "\n💌 **DM 발송 결과**\n"
+        result_msg += f"- DM 성공: {counts['dm_ok']}명\n"
+        result_msg += f"- DM 실패: {counts['dm_failed']}명"
+        return result_msg
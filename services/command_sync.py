@@ -0,0 +1,106 @@
+# services/command_sync.py
+"""
+슬래시 명령어 트리 동기화 (해시 비교)
+
+등록된 명령어 트리를 디스코드에 보내는 payload 그대로 JSON으로 만들어 해시를 내고,
+마지막으로 동기화한 해시(guild_bot.command_sync_state)와 다를 때만 tree.sync()를 호출한다.
+재시작/재연결마다 전체 트리를 다시 올리지 않아서 디스코드의 동기화 레이트 리밋에 걸리지 않는다.
+
+범위(scope)는 '<애플리케이션 ID>:global' 또는 '<애플리케이션 ID>:<길드 ID>'
+(개발용/운영용 봇이 같은 DB를 써도 서로 덮어쓰지 않도록 애플리케이션 ID 포함)
+"""
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from typing import Optional
+
+import discord
+from discord import app_commands
+
+logger = logging.getLogger(__name__)
+
+COMMAND_SYNC_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS guild_bot.command_sync_state (
+    scope TEXT PRIMARY KEY,
+    tree_hash TEXT NOT NULL,
+    command_count INTEGER NOT NULL,
+    synced_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+"""
+
+
+@dataclass
+class SyncResult:
+    scope: str
+    synced: bool
+    command_count: int
+    tree_hash: str
+
+
+def tree_hash(tree: app_commands.CommandTree, guild: Optional[discord.abc.Snowflake] = None) -> str:
+    """명령어 트리 해시 (이름순 정렬 + 키 정렬 JSON이라 등록 순서와 무관)"""
+    payload = sorted((command.to_dict(tree) for command in tree.get_commands(guild=guild)),
+                     key=lambda data: (data.get("type", 1), data["name"]))
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class CommandSyncer:
+    def __init__(self, bot: discord.Client, db_manager):
+        self.bot = bot
+        self.db_manager = db_manager
+
+    async def ensure_schema(self):
+        async with self.db_manager.get_connection() as conn:
+            await conn.execute(COMMAND_SYNC_SCHEMA_SQL)
+
+    def _scope(self, guild: Optional[discord.abc.Snowflake]) -> str:
+        return f"{self.bot.application_id}:{guild.id if guild else 'global'}"
+
+    async def _stored_hash(self, scope: str) -> Optional[str]:
+        async with self.db_manager.get_connection() as conn:
+            return await conn.fetchval(
+                "SELECT tree_hash FROM guild_bot.command_sync_state WHERE scope = $1", scope)
+
+    async def _store_hash(self, scope: str, digest: str, count: int):
+        async with self.db_manager.get_connection() as conn:
+            await conn.execute("""
+                INSERT INTO guild_bot.command_sync_state (scope, tree_hash, command_count, synced_at)
+                VALUES ($1, $2, $3, NOW())
+                ON CONFLICT (scope)
+                DO UPDATE SET tree_hash = EXCLUDED.tree_hash,
+                              command_count = EXCLUDED.command_count,
+                              synced_at = NOW()
+            """, scope, digest, count)
+
+    async def sync(self, guild: Optional[discord.abc.Snowflake] = None, force: bool = False) -> SyncResult:
+        """트리 해시가 바뀌었을 때만 동기화 (force=True면 항상)
+
+        DB를 쓸 수 없으면 해시 비교 없이 동기화한다 (명령어가 안 올라가는 것보다 낫다).
+        """
+        tree = self.bot.tree
+        scope = self._scope(guild)
+        digest = tree_hash(tree, guild)
+
+        stored = None
+        if not force:
+            try:
+                stored = await self._stored_hash(scope)
+            except Exception as e:
+                logger.warning(f"명령어 해시 조회 실패, 동기화 진행 ({scope}): {e}")
+
+        if stored == digest:
+            count = len(tree.get_commands(guild=guild))
+            logger.info(f"명령어 트리 변경 없음, 동기화 생략 ({scope}, {count}개)")
+            return SyncResult(scope, False, count, digest)
+
+        synced = await tree.sync(guild=guild)
+        logger.info(f"{len(synced)}개의 슬래시 커맨드를 동기화했습니다 ({scope}{', 강제' if force else ''})")
+        logger.debug(f"동기화된 명령어: {[cmd.name for cmd in synced]}")
+
+        try:
+            await self._store_hash(scope, digest, len(synced))
+        except Exception as e:
+            logger.warning(f"명령어 해시 저장 실패 ({scope}): {e}")
+        return SyncResult(scope, True, len(synced), digest)
@@ -1,9 +1,10 @@
+import asyncio
 from discord.ext import commands
 from discord import Interaction, app_commands
 from discord.ui import View, Select
 import discord
-import aiohttp
-from bs4 import BeautifulSoup
+from utils.helpers import trace_interaction
+from utils.http_session import shared_session
 
 # 역할별 전문화 옵션 및 URL 쿼리 매핑
 SPEC_OPTIONS = {
@@ -12,6 +13,37 @@ SPEC_OPTIONS = {
     "힐러": ["회복", "보존", "운무", "신성", "수양", "복원"]
 }
 ROLE_MAPPING = {"탱커": "tanker", "딜러": "dealer", "힐러": "healer"}
+WOWTAT_URL = "https://wowtat.com"
+
+
+def _extract_stat(td) -> str:
+    text = td.get_text(strip=True)
+    for key in ["치명", "가속", "특화", "유연"]:
+        text = text.replace(key, "")
+    return text.strip()
+
+
+def parse_spec_stats(html: str, spec: str) -> list:
+    """wowtat 표에서 전문화 행의 2차 스탯 추출 (HTML 파싱은 무거워서 스레드에서 호출)"""
+    # bs4는 import만 20ms 이상이라 처음 쓸 때 불러온다 (봇 시작 시간에서 제외)
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html, "html.parser")
+    matched = []
+    for row in soup.select("table tbody tr"):
+        cols = row.find_all("td")
+        if len(cols) < 5:
+            continue
+        raw_name = cols[0].get_text(separator=" ", strip=True)
+        name = raw_name.replace(" 레이드", "").replace(" TOP 50", "").strip()
+        if name != spec:
+            continue
+        matched.append({
+            "치명": _extract_stat(cols[1]),
+            "가속": _extract_stat(cols[2]),
+            "특화": _extract_stat(cols[3]),
+            "유연": _extract_stat(cols[4])
+        })
+    return matched
 
 class SpecSelect(discord.ui.Select):
     def __init__(self, role: str):
@@ -20,52 +52,28 @@ class SpecSelect(discord.ui.Select):
         super().__init__(placeholder="전문화를 선택하세요", options=options, min_values=1, max_values=1)
         self.role = role
 
+    @trace_interaction
     async def callback(self, interaction: Interaction):
         spec = self.values[0]
         role = self.role  # "탱커", "딜러", "힐러"
         await interaction.response.defer(ephemeral=True)
 
         endpoints = {
-            "레이드": f"https://wowtat.com/raid/?group={ROLE_MAPPING[role]}",
-            "쐐기": f"https://wowtat.com/?group={ROLE_MAPPING[role]}"
+            "레이드": f"{WOWTAT_URL}/raid/?group={ROLE_MAPPING[role]}",
+            "쐐기": f"{WOWTAT_URL}/?group={ROLE_MAPPING[role]}"
         }
         # 엔드포인트별 크롤링 결과를 각각 리스트에 담음
         stats = {"레이드": [], "쐐기": []}
         headers = {"User-Agent": "Mozilla/5.0"}
 
-        async with aiohttp.ClientSession() as session:
+        async with shared_session() as session:
             for label, url in endpoints.items():
                 async with session.get(url, headers=headers) as resp:
                     if resp.status != 200:
                         await interaction.followup.send(f"❌ {label} 페이지 접속 실패 😢")
                         return
                     html = await resp.text()
-                    soup = BeautifulSoup(html, "html.parser")
-                    rows = soup.select("table tbody tr")
-
-                    def extract_stat(td):
-                        text = td.get_text(strip=True)
-                        for key in ["치명", "가속", "특화", "유연"]:
-                            text = text.replace(key, "")
-                        return text.strip()
-
-                    matched = []
-                    for row in rows:
-                        cols = row.find_all("td")
-                        if len(cols) < 5:
-                            continue
-                        raw_name = cols[0].get_text(separator=" ", strip=True)
-                        name = raw_name.replace(" 레이드", "").replace(" TOP 50", "").strip()
-                        if name != spec:
-                            continue
-                        record = {
-                            "치명": extract_stat(cols[1]),
-                            "가속": extract_stat(cols[2]),
-                            "특화": extract_stat(cols[3]),
-                            "유연": extract_stat(cols[4])
-                        }
-                        matched.append(record)
-                    stats[label] = matched
+                stats[label] = await asyncio.to_thread(parse_spec_stats, html, spec)
 
         # 딜러 냉기와 힐러 신성인 경우는 하위 전문화가 2개씩 있다고 가정
         ambiguous = False
@@ -122,6 +130,7 @@ class RoleSelect(discord.ui.Select):
                    for role in SPEC_OPTIONS.keys()]
         super().__init__(placeholder="역할군을 선택하세요", options=options, min_values=1, max_values=1)
 
+    @trace_interaction
     async def callback(self, interaction: Interaction):
         role = self.values[0]
         view = View()
@@ -138,6 +147,7 @@ class SecondaryStats(commands.Cog):
         self.bot = bot
 
     @app_commands.command(name="이차스탯", description="상위50위 평균 2차스탯을 확인해요!")
+    @trace_interaction
     async def stat_selector(self, interaction: Interaction):
         await interaction.response.send_message("🧚‍♀️ 역할군을 선택해주세요~", view=StatView())
 
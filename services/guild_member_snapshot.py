@@ -0,0 +1,183 @@
+# services/guild_member_snapshot.py
+"""
+길드 멤버 스냅샷 (guild_bot.guild_members)
+
+실행 중인 봇이 게이트웨이 이벤트로 멤버 정보를 DB에 계속 반영하고,
+오프라인 도구(tools/)는 게이트웨이 로그인/멤버 청킹 없이 이 테이블만 읽는다.
+이벤트마다 바로 쓰지 않고 변경된 멤버를 모아 두었다가 flush()에서 한 번에 반영한다.
+"""
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+
+import discord
+
+GUILD_MEMBERS_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS guild_bot.guild_members (
+    guild_id BIGINT NOT NULL,
+    member_id BIGINT NOT NULL,
+    username TEXT NOT NULL,
+    nick TEXT,
+    display_name TEXT NOT NULL,
+    role_ids BIGINT[] NOT NULL DEFAULT '{}',
+    joined_at TIMESTAMPTZ,
+    is_bot BOOLEAN NOT NULL DEFAULT FALSE,
+    synced_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (guild_id, member_id)
+);
+"""
+
+UPSERT_MEMBER_SQL = """
+INSERT INTO guild_bot.guild_members
+    (guild_id, member_id, username, nick, display_name, role_ids, joined_at, is_bot, synced_at)
+VALUES ($1, $2, $3, $4, $5, $6, $7, $8, NOW())
+ON CONFLICT (guild_id, member_id)
+DO UPDATE SET
+    username = EXCLUDED.username,
+    nick = EXCLUDED.nick,
+    display_name = EXCLUDED.display_name,
+    role_ids = EXCLUDED.role_ids,
+    joined_at = EXCLUDED.joined_at,
+    is_bot = EXCLUDED.is_bot,
+    synced_at = NOW()
+"""
+
+
+def member_row(member: discord.Member) -> tuple:
+    """UPSERT_MEMBER_SQL 파라미터 (@everyone 역할 제외)"""
+    return (
+        member.guild.id, member.id, member.name, member.nick, member.display_name,
+        [role.id for role in member.roles if not role.is_default()],
+        member.joined_at, member.bot,
+    )
+
+
+@dataclass
+class SnapshotMember:
+    """DB 스냅샷에서 읽은 멤버 (도구에서 discord.Member 대신 사용)"""
+    id: int
+    name: str
+    nick: Optional[str]
+    display_name: str
+    role_ids: List[int] = field(default_factory=list)
+    joined_at: Optional[datetime] = None
+    bot: bool = False
+
+
+class GuildMemberMirror:
+    """게이트웨이 이벤트 -> guild_members 테이블 반영"""
+
+    def __init__(self, db_manager):
+        self.db_manager = db_manager
+        self._dirty: Dict[Tuple[int, int], discord.Member] = {}
+        self._removed: Set[Tuple[int, int]] = set()
+
+    async def ensure_schema(self):
+        async with self.db_manager.get_connection() as conn:
+            await conn.execute(GUILD_MEMBERS_SCHEMA_SQL)
+
+    async def sync_guild(self, guild: discord.Guild) -> int:
+        """길드 전체 동기화 (캐시에 없는 멤버 행은 삭제)"""
+        rows = [member_row(member) for member in guild.members]
+        member_ids = [member.id for member in guild.members]
+        # 스냅샷에 이미 들어간 변경만 지금(첫 await 전에) 꺼낸다.
+        # 동기화 도중 들어오는 변경은 새 항목으로 남아서 다음 flush에서 반영된다.
+        dirty = {key: m for key, m in self._dirty.items() if key[0] == guild.id}
+        removed = {key for key in self._removed if key[0] == guild.id}
+        for key in dirty:
+            del self._dirty[key]
+        self._removed -= removed
+        try:
+            async with self.db_manager.get_connection() as conn:
+                async with conn.transaction():
+                    await conn.executemany(UPSERT_MEMBER_SQL, rows)
+                    await conn.execute(
+                        "DELETE FROM guild_bot.guild_members WHERE guild_id = $1 AND NOT (member_id = ANY($2::bigint[]))",
+                        guild.id, member_ids
+                    )
+        except Exception:
+            self._restore(dirty, removed)
+            raise
+        return len(rows)
+
+    def mark_updated(self, member: discord.Member):
+        key = (member.guild.id, member.id)
+        self._removed.discard(key)
+        self._dirty[key] = member
+
+    def mark_removed(self, guild_id: int, member_id: int):
+        key = (guild_id, member_id)
+        self._dirty.pop(key, None)
+        self._removed.add(key)
+
+    @property
+    def pending(self) -> int:
+        return len(self._dirty) + len(self._removed)
+
+    async def flush(self) -> int:
+        """모아 둔 변경 사항 반영 (실패하면 다음 flush에서 다시 시도)"""
+        if not self._dirty and not self._removed:
+            return 0
+
+        dirty, removed = self._dirty, self._removed
+        self._dirty, self._removed = {}, set()
+        try:
+            async with self.db_manager.get_connection() as conn:
+                async with conn.transaction():
+                    if dirty:
+                        await conn.executemany(UPSERT_MEMBER_SQL, [member_row(m) for m in dirty.values()])
+                    if removed:
+                        await conn.executemany(
+                            "DELETE FROM guild_bot.guild_members WHERE guild_id = $1 AND member_id = $2",
+                            list(removed)
+                        )
+        except Exception:
+            self._restore(dirty, removed)
+            raise
+        return len(dirty) + len(removed)
+
+    def _restore(self, dirty: Dict[Tuple[int, int], discord.Member], removed: Set[Tuple[int, int]]):
+        """반영 실패한 변경 되돌리기 (그 사이에 들어온 더 새로운 변경을 덮어쓰지 않도록 없는 키만)"""
+        for key, member in dirty.items():
+            if key not in self._removed:
+                self._dirty.setdefault(key, member)
+        for key in removed:
+            if key not in self._dirty:
+                self._removed.add(key)
+
+    async def remove_role(self, guild_id: int, role_id: int):
+        """역할 삭제 반영 (디스코드는 멤버별 업데이트 이벤트를 보내지 않는다)"""
+        async with self.db_manager.get_connection() as conn:
+            await conn.execute(
+                "UPDATE guild_bot.guild_members SET role_ids = array_remove(role_ids, $2), synced_at = NOW() "
+                "WHERE guild_id = $1 AND $2 = ANY(role_ids)",
+                guild_id, role_id
+            )
+
+
+async def load_guild_members(db_manager, guild_id: int, include_bots: bool = False) -> List[SnapshotMember]:
+    """스냅샷에서 길드 멤버 목록 읽기 (도구용)"""
+    async with db_manager.get_connection() as conn:
+        rows = await conn.fetch("""
+            SELECT member_id, username, nick, display_name, role_ids, joined_at, is_bot
+            FROM guild_bot.guild_members
+            WHERE guild_id = $1 AND ($2 OR NOT is_bot)
+            ORDER BY member_id
+        """, guild_id, include_bots)
+
+    return [
+        SnapshotMember(
+            id=row['member_id'], name=row['username'], nick=row['nick'],
+            display_name=row['display_name'], role_ids=list(row['role_ids']),
+            joined_at=row['joined_at'], bot=row['is_bot'],
+        )
+        for row in rows
+    ]
+
+
+async def get_snapshot_synced_at(db_manager, guild_id: int) -> Optional[datetime]:
+    """스냅샷 최종 반영 시각 (스냅샷이 비어 있으면 None)"""
+    async with db_manager.get_connection() as conn:
+        return await conn.fetchval(
+            "SELECT MAX(synced_at) FROM guild_bot.guild_members WHERE guild_id = $1", guild_id
+        )
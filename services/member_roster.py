@@ -0,0 +1,83 @@
+# services/member_roster.py
+"""
+member.txt (캐릭터명-서버슬러그) 메모리 맵
+
+파일은 한 번만 읽고, 수정 시간(mtime)이 바뀌었을 때만 다시 읽는다.
+mtime 확인도 일정 간격으로만 하고, 파일 I/O는 모두 스레드에서 처리한다.
+"""
+import asyncio
+import logging
+import os
+import time
+from typing import Dict, List, Optional
+
+from utils.metrics import record_cache
+
+logger = logging.getLogger(__name__)
+
+
+class MemberRoster:
+    """캐릭터명 -> 서버 슬러그 목록"""
+
+    # mtime 확인 최소 간격 (초)
+    CHECK_INTERVAL = 30
+
+    def __init__(self, file_path: str = "member.txt"):
+        self.file_path = file_path
+        self._by_name: Dict[str, List[str]] = {}
+        self._mtime: Optional[float] = None
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    def _read_file(file_path: str) -> Dict[str, List[str]]:
+        by_name: Dict[str, List[str]] = {}
+        with open(file_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if "-" not in line:
+                    continue
+                name, slug = line.strip().split("-", 1)
+                realms = by_name.setdefault(name, [])
+                if slug not in realms:
+                    realms.append(slug)
+        return by_name
+
+    @staticmethod
+    def _get_mtime(file_path: str) -> Optional[float]:
+        try:
+            return os.stat(file_path).st_mtime
+        except FileNotFoundError:
+            return None
+
+    async def ensure_fresh(self):
+        """파일이 바뀌었으면 다시 읽기 (CHECK_INTERVAL 안에서는 바로 반환)"""
+        if time.monotonic() - self._checked_at < self.CHECK_INTERVAL:
+            return
+
+        async with self._lock:
+            if time.monotonic() - self._checked_at < self.CHECK_INTERVAL:
+                return
+
+            mtime = await asyncio.to_thread(self._get_mtime, self.file_path)
+            if mtime is None:
+                self._by_name = {}
+            elif mtime != self._mtime:
+                self._by_name = await asyncio.to_thread(self._read_file, self.file_path)
+                logger.info(f"{self.file_path} 로딩 완료: {len(self._by_name)}개 캐릭터")
+
+            self._mtime = mtime
+            self._checked_at = time.monotonic()
+
+    @property
+    def exists(self) -> bool:
+        return self._mtime is not None
+
+    def get(self, character_name: str) -> List[str]:
+        """캐릭터명으로 서버 슬러그 목록 조회"""
+        realms = self._by_name.get(character_name)
+        record_cache("member_roster", realms is not None)
+        return list(realms or ())
+
+
+# 전역 인스턴스
+member_roster = MemberRoster()
@@ -0,0 +1,250 @@
+# services/profile_recrawler.py
+"""
+오래된 캐릭터 프로필 재수집 (last_crawled_at 기준)
+
+characters의 특성/역할은 저장할 때 값 그대로 남아서, 일정 참가 임베드에 쓰는
+active_spec이 실제와 달라질 수 있다. 주기적으로 오래된 캐릭터를 골라 raider.io에서 다시 받는다.
+
+- 대상: 길드원, 인증된 소유 캐릭터, 다가오는 일정 참가 캐릭터
+- 다가오는 일정(event_instances)에 참가한 캐릭터는 더 짧은 기준(SIGNUP_STALE_AFTER)으로, 일정이 가까운 순서로 먼저
+- raider.io 호출은 호출 예산(초당 RATE_PER_SECOND) 안에서 동시에, 저장은 CharacterRepository.save_many 한 번
+- 404(삭제/이름 변경)는 last_crawled_at만 갱신, 오류/오래된 캐시 응답은 다음 실행에서 다시 시도
+- character_profiles에 REUSE_MAX_AGE 안에 저장된 응답이 있으면 API 대신 그것으로 갱신
+  (내용이 같아서 last_crawled_at을 건드리지 않은 대화형 조회 결과 등)
+
+지표: bot_profile_recrawl_total{result}, bot_profile_recrawl_age_seconds, bot_character_staleness{age},
+      bot_profile_recrawl_last_run_seconds
+"""
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from services.api_cache import fetch_json
+from services.character_profiles import BASIC_FIELDS
+from services.character_repository import CharacterRepository
+from utils.character_validator import PROFILE_ENDPOINT, PROFILE_MISS_TTL, PROFILE_TTL
+from utils.metrics import registry
+from utils.rate_budget import RateBudget
+
+logger = logging.getLogger(__name__)
+
+RECRAWL_RESULTS = registry.counter(
+    "bot_profile_recrawl_total",
+    "프로필 재수집 결과 (updated: 내용 변경, unchanged, missing: 404, error)",
+    ("result",))
+RECRAWL_AGE = registry.histogram(
+    "bot_profile_recrawl_age_seconds", "재수집 시점의 마지막 수집 후 경과 시간",
+    buckets=(3600, 6 * 3600, 24 * 3600, 3 * 86400, 7 * 86400, 30 * 86400))
+CHARACTER_STALENESS = registry.gauge(
+    "bot_character_staleness", "재수집 대상 캐릭터 수 (마지막 수집 후 경과 시간 구간별)", ("age",))
+RECRAWL_LAST_RUN = registry.gauge(
+    "bot_profile_recrawl_last_run_seconds", "마지막 재수집 한 번에 걸린 시간")
+
+# 실행 간격 / 한 번에 고르는 최대 캐릭터 수 (초)
+RECRAWL_INTERVAL = 600
+BATCH_SIZE = 100
+# 재수집 기준: 일반 / 다가오는 일정 참가 캐릭터 (초)
+STALE_AFTER = 24 * 3600
+SIGNUP_STALE_AFTER = 2 * 3600
+# 이 시간 안에 저장된 프로필 원본은 다시 받지 않고 사용 (초)
+REUSE_MAX_AGE = 3600
+# 다가오는 일정으로 볼 기간 (일)
+UPCOMING_DAYS = 7
+SIGNUP_STATUSES = ('confirmed', 'tentative')
+
+# 대화형 조회(닉네임 인증, 캐릭터 변경)가 쓸 여유를 남기도록 작게 (RAIDERIO_RECRAWL_RATE로 변경)
+RATE_PER_SECOND = float(os.getenv("RAIDERIO_RECRAWL_RATE", "1.0"))
+BURST = 5
+CONCURRENCY = 4
+
+STALENESS_BUCKETS = (
+    ("lt_1h", 3600),
+    ("1h_6h", 6 * 3600),
+    ("6h_24h", 24 * 3600),
+    ("1d_7d", 7 * 86400),
+)
+
+# $1 UPCOMING_DAYS, $2 SIGNUP_STATUSES
+SIGNED_UP_CTE = """
+    signed_up AS (
+        SELECT ep.character_id, MIN(ei.instance_datetime) AS next_event
+        FROM guild_bot.event_participations ep
+        JOIN guild_bot.event_instances ei ON ei.id = ep.event_instance_id
+        WHERE ei.status NOT IN ('completed', 'cancelled')
+          AND ei.instance_date BETWEEN CURRENT_DATE - 1 AND CURRENT_DATE + $1::int
+          AND ep.participation_status = ANY($2::text[])
+          AND ep.character_id IS NOT NULL
+        GROUP BY ep.character_id
+    )
+"""
+
+TRACKED_CONDITION = """
+    (s.character_id IS NOT NULL OR c.is_guild_member
+     OR EXISTS (SELECT 1 FROM guild_bot.character_ownership co
+                WHERE co.character_id = c.id AND co.is_verified))
+"""
+
+# $3 SIGNUP_STALE_AFTER, $4 STALE_AFTER, $5 BATCH_SIZE
+PICK_STALE_SQL = f"""
+    -- name: profile_recrawler.pick
+    WITH {SIGNED_UP_CTE}
+    SELECT c.id, c.character_name, c.realm_slug, c.last_crawled_at, s.next_event
+    FROM guild_bot.characters c
+    LEFT JOIN signed_up s ON s.character_id = c.id
+    WHERE {TRACKED_CONDITION}
+      AND (c.last_crawled_at IS NULL
+           OR c.last_crawled_at < NOW() - make_interval(
+               secs => CASE WHEN s.character_id IS NOT NULL THEN $3::float8 ELSE $4::float8 END))
+    ORDER BY s.next_event NULLS LAST, c.last_crawled_at NULLS FIRST
+    LIMIT $5
+"""
+
+STALENESS_SQL = f"""
+    -- name: profile_recrawler.staleness
+    WITH {SIGNED_UP_CTE}
+    SELECT EXTRACT(EPOCH FROM NOW() - c.last_crawled_at) AS age
+    FROM guild_bot.characters c
+    LEFT JOIN signed_up s ON s.character_id = c.id
+    WHERE {TRACKED_CONDITION}
+"""
+
+
+def staleness_bucket(age: Optional[float]) -> str:
+    if age is None:
+        return "never"
+    for label, limit in STALENESS_BUCKETS:
+        if age < limit:
+            return label
+    return "gt_7d"
+
+
+@dataclass
+class RecrawlReport:
+    picked: int = 0
+    signed_up: int = 0
+    reused: int = 0     # 저장된 프로필 원본 사용 (API 호출 없음)
+    updated: int = 0
+    unchanged: int = 0
+    missing: int = 0
+    error: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rate(self) -> float:
+        """초당 처리한 캐릭터 수"""
+        return self.picked / self.seconds if self.seconds else 0.0
+
+
+class ProfileRecrawler:
+    def __init__(self, db_manager, budget: Optional[RateBudget] = None):
+        self.db_manager = db_manager
+        self.repository = CharacterRepository(db_manager)
+        self.budget = budget or RateBudget(RATE_PER_SECOND, BURST)
+        self._semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def pick_stale(self, limit: int = BATCH_SIZE) -> List:
+        async with self.db_manager.get_connection() as conn:
+            return await conn.fetch(PICK_STALE_SQL, UPCOMING_DAYS, list(SIGNUP_STATUSES),
+                                    float(SIGNUP_STALE_AFTER), float(STALE_AFTER), limit)
+
+    async def _fetch_one(self, row) -> Tuple[str, Optional[Dict]]:
+        """-> ("ok", 응답) / ("missing", None) / ("error", None)"""
+        params = {"region": "kr", "realm": row['realm_slug'], "name": row['character_name']}
+        async with self._semaphore:
+            await self.budget.acquire()
+            try:
+                result = await fetch_json(PROFILE_ENDPOINT, params, ttl=PROFILE_TTL,
+                                          cache_statuses=(200, 404), miss_ttl=PROFILE_MISS_TTL)
+            except Exception as e:
+                logger.debug(f"프로필 재수집 실패: {row['character_name']}-{row['realm_slug']} ({e})")
+                return "error", None
+
+        # 오류로 받은 이전 응답은 새로 수집한 것이 아님
+        if result.source == "stale":
+            return "error", None
+        if result.status == 404:
+            return "missing", None
+        if result.status != 200 or not result.payload:
+            return "error", None
+        # 조회한 키로 저장 (응답의 대소문자 차이로 다른 행이 생기지 않게)
+        return "ok", {**result.payload, "name": row['character_name'], "realm": row['realm_slug']}
+
+    async def run_once(self) -> RecrawlReport:
+        started = time.perf_counter()
+        report = RecrawlReport()
+        rows = await self.pick_stale()
+        report.picked = len(rows)
+        report.signed_up = sum(1 for row in rows if row['next_event'] is not None)
+
+        if rows:
+            now = time.time()
+            for row in rows:
+                if row['last_crawled_at'] is not None:
+                    RECRAWL_AGE.observe(now - row['last_crawled_at'].timestamp())
+
+            stored = await self.repository.profile_store.get_many(
+                [row['id'] for row in rows], BASIC_FIELDS, max_age=REUSE_MAX_AGE)
+            reused = [{**stored[row['id']].payload, "name": row['character_name'], "realm": row['realm_slug']}
+                      for row in rows if row['id'] in stored]
+            report.reused = len(reused)
+            fetch_rows = [row for row in rows if row['id'] not in stored]
+
+            outcomes = await asyncio.gather(*(self._fetch_one(row) for row in fetch_rows))
+
+            payloads = [payload for kind, payload in outcomes if kind == "ok"]
+            missing_ids = [row['id'] for row, (kind, _) in zip(fetch_rows, outcomes) if kind == "missing"]
+            report.error = sum(1 for kind, _ in outcomes if kind == "error")
+            report.missing = len(missing_ids)
+
+            async with self.db_manager.get_connection() as conn:
+                async with conn.transaction():
+                    # 수집 시각은 내용이 같아도 항상 갱신 (다음 실행에서 다시 고르지 않도록)
+                    saved = await self.repository.save_many(payloads, touch_interval=0, conn=conn)
+                    # 재사용한 원본은 다시 저장하지 않음 (fetched_at이 새로 받은 것처럼 보이지 않게)
+                    saved += await self.repository.save_many(reused, profile_fields=None, touch_interval=0,
+                                                             conn=conn)
+                    if missing_ids:
+                        await conn.execute("""
+                            UPDATE guild_bot.characters SET last_crawled_at = NOW()
+                            WHERE id = ANY($1::bigint[])
+                        """, missing_ids)
+
+            report.updated = sum(1 for s in saved if s is not None and s.changed)
+            report.unchanged = len(payloads) + len(reused) - report.updated
+
+        for result in ("updated", "unchanged", "missing", "error"):
+            if getattr(report, result):
+                RECRAWL_RESULTS.inc(getattr(report, result), result=result)
+        report.seconds = time.perf_counter() - started
+        RECRAWL_LAST_RUN.set(report.seconds)
+        await self.update_staleness()
+
+        if report.picked:
+            logger.info(f"프로필 재수집: {report.picked}명 (일정 참가 {report.signed_up}명, "
+                        f"저장된 원본 사용 {report.reused}명) - "
+                        f"변경 {report.updated}, 동일 {report.unchanged}, 없음 {report.missing}, "
+                        f"오류 {report.error} ({report.seconds:.1f}초, {report.rate:.1f}명/초)")
+        return report
+
+    async def update_staleness(self):
+        """대상 캐릭터의 마지막 수집 후 경과 시간 분포를 지표로"""
+        async with self.db_manager.get_connection() as conn:
+            rows = await conn.fetch(STALENESS_SQL, UPCOMING_DAYS, list(SIGNUP_STATUSES))
+        counts = {label: 0 for label, _ in STALENESS_BUCKETS}
+        counts.update(gt_7d=0, never=0)
+        for row in rows:
+            counts[staleness_bucket(None if row['age'] is None else float(row['age']))] += 1
+        for label, count in counts.items():
+            CHARACTER_STALENESS.set(count, age=label)
+
+    async def run_forever(self, interval: float = RECRAWL_INTERVAL):
+        """lifecycle 백그라운드 태스크 (한 번 실패해도 다음 주기에 계속)"""
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.warning(f"프로필 재수집 실패: {e}")
+            await asyncio.sleep(interval)
@@ -0,0 +1,329 @@
+# services/raid_reminder_service.py
+"""
+레이드 알림 스케줄러
+
+진행 중인 일정 인스턴스(event_instances)의 시작 시각 기준으로 설정된 시간 전에
+확정/미정 참가자에게 DM을 보내거나 공지 채널에 멘션 메시지를 올린다.
+
+- 발송은 전역 발송 예산(초당 발송 수) 안에서 동시에 처리
+- 수신자별 발송 기록(raid_reminder_deliveries)을 보내기 전에 먼저 선점해서
+  봇이 재시작되어도 같은 알림을 두 번 보내지 않는다
+"""
+import asyncio
+import logging
+import os
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import discord
+import pytz
+
+from utils.rate_budget import RateBudget
+
+logger = logging.getLogger(__name__)
+
+KST = pytz.timezone('Asia/Seoul')
+
+REMINDER_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS guild_bot.raid_reminder_deliveries (
+    event_instance_id BIGINT NOT NULL,
+    offset_minutes INTEGER NOT NULL,
+    recipient_key TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'sending',
+    error TEXT,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (event_instance_id, offset_minutes, recipient_key)
+);
+"""
+
+# 발송 방식
+MODE_DM = "dm"
+MODE_CHANNEL = "channel"
+
+# 발송 기록 상태 (sending 상태로 남은 기록은 전송 여부를 알 수 없으므로 다시 보내지 않는다)
+STATE_SENDING = "sending"
+STATE_SENT = "sent"
+STATE_FAILED = "failed"
+
+NOTIFY_STATUSES = ('confirmed', 'tentative')
+STATUS_LABEL = {'confirmed': '확정', 'tentative': '미정'}
+
+# 기본 알림 규칙 (RAID_REMINDER_RULES 환경변수로 변경: "1440:dm,60:dm,10:channel")
+DEFAULT_REMINDER_RULES = "1440:dm,60:dm"
+
+
+@dataclass(frozen=True)
+class ReminderRule:
+    """시작 offset_minutes분 전에 mode 방식으로 알림"""
+    offset_minutes: int
+    mode: str
+
+
+def parse_reminder_rules(text: str) -> List[ReminderRule]:
+    """'1440:dm,10:channel' 형식 파싱 (잘못된 항목은 건너뜀)"""
+    rules = []
+    for part in text.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        try:
+            offset, mode = part.split(":", 1)
+            mode = mode.strip().lower()
+            if mode not in (MODE_DM, MODE_CHANNEL):
+                raise ValueError(mode)
+            rules.append(ReminderRule(int(offset), mode))
+        except ValueError:
+            logger.warning(f"잘못된 알림 규칙 건너뜀: {part}")
+    return sorted(set(rules), key=lambda r: (r.offset_minutes, r.mode))
+
+
+def load_reminder_rules() -> List[ReminderRule]:
+    return parse_reminder_rules(os.getenv("RAID_REMINDER_RULES", DEFAULT_REMINDER_RULES))
+
+
+def format_offset(minutes: int) -> str:
+    if minutes % 1440 == 0:
+        return f"{minutes // 1440}일"
+    if minutes % 60 == 0:
+        return f"{minutes // 60}시간"
+    return f"{minutes}분"
+
+
+def format_remaining(remaining: timedelta) -> str:
+    """남은 시간 표시 (분 단위 반올림, 예: '1시간 30분')"""
+    minutes = max(1, round(remaining.total_seconds() / 60))
+    days, minutes = divmod(minutes, 1440)
+    hours, minutes = divmod(minutes, 60)
+    parts = [f"{value}{unit}" for value, unit in ((days, "일"), (hours, "시간"), (minutes, "분")) if value]
+    return " ".join(parts)
+
+
+def to_kst_naive(value: datetime) -> datetime:
+    """instance_datetime은 한국 시간 기준 (timezone 정보가 있으면 한국 시간으로 변환)"""
+    if value.tzinfo is not None:
+        return value.astimezone(KST).replace(tzinfo=None)
+    return value
+
+
+def due_rules(rules: Sequence[ReminderRule], start: datetime, now: datetime) -> List[ReminderRule]:
+    """지금 보내야 할 규칙 (방식별로 시작에 가장 가까운 규칙 하나만)
+
+    봇이 꺼져 있어서 여러 규칙이 한꺼번에 도래했으면 지난 알림은 건너뛰고 가장 가까운 것만 보낸다.
+    """
+    if now >= start:
+        return []
+    picked: Dict[str, ReminderRule] = {}
+    for rule in rules:
+        if now >= start - timedelta(minutes=rule.offset_minutes):
+            current = picked.get(rule.mode)
+            if current is None or rule.offset_minutes < current.offset_minutes:
+                picked[rule.mode] = rule
+    return list(picked.values())
+
+
+class DiscordReminderSender:
+    """실제 디스코드 발송 (캐시에 없으면 REST로 조회)"""
+
+    def __init__(self, bot: discord.Client):
+        self.bot = bot
+
+    async def send_dm(self, discord_id: int, content: str):
+        user = self.bot.get_user(discord_id) or await self.bot.fetch_user(discord_id)
+        await user.send(content)
+
+    async def send_channel(self, channel_id: int, content: str):
+        channel = self.bot.get_channel(channel_id) or await self.bot.fetch_channel(channel_id)
+        await channel.send(content, allowed_mentions=discord.AllowedMentions(users=True))
+
+
+class ReminderDeliveryStore:
+    """수신자별 발송 기록 (guild_bot.raid_reminder_deliveries)"""
+
+    def __init__(self, db_manager):
+        self.db_manager = db_manager
+
+    async def ensure_schema(self):
+        async with self.db_manager.get_connection() as conn:
+            await conn.execute(REMINDER_SCHEMA_SQL)
+
+    async def claim(self, instance_id: int, offset_minutes: int, recipient_keys: List[str]) -> List[str]:
+        """아직 기록이 없는 수신자만 선점 (선점된 키 목록 반환)"""
+        if not recipient_keys:
+            return []
+        async with self.db_manager.get_connection() as conn:
+            rows = await conn.fetch("""
+                INSERT INTO guild_bot.raid_reminder_deliveries (event_instance_id, offset_minutes, recipient_key)
+                SELECT $1, $2, key FROM unnest($3::text[]) AS key
+                ON CONFLICT DO NOTHING
+                RETURNING recipient_key
+            """, instance_id, offset_minutes, recipient_keys)
+        return [row['recipient_key'] for row in rows]
+
+    async def finish(self, instance_id: int, offset_minutes: int, results: List[Tuple[str, str, Optional[str]]]):
+        """발송 결과 반영 ((recipient_key, state, error) 목록)"""
+        if not results:
+            return
+        async with self.db_manager.get_connection() as conn:
+            await conn.executemany("""
+                UPDATE guild_bot.raid_reminder_deliveries
+                SET state = $4, error = $5, updated_at = NOW()
+                WHERE event_instance_id = $1 AND offset_minutes = $2 AND recipient_key = $3
+            """, [(instance_id, offset_minutes, key, state, error) for key, state, error in results])
+
+    async def release(self, instance_id: int, offset_minutes: int, recipient_keys: List[str]):
+        """일시적 오류로 보내지 못한 선점 해제 (다음 주기에 다시 시도)"""
+        if not recipient_keys:
+            return
+        async with self.db_manager.get_connection() as conn:
+            await conn.execute("""
+                DELETE FROM guild_bot.raid_reminder_deliveries
+                WHERE event_instance_id = $1 AND offset_minutes = $2 AND recipient_key = ANY($3::text[])
+            """, instance_id, offset_minutes, recipient_keys)
+
+
+@dataclass
+class FanoutReport:
+    sent: int = 0
+    failed: int = 0
+    retry: int = 0
+    skipped: int = 0  # 이미 보낸 수신자
+
+
+class RaidReminderService:
+    """알림 대상 조회 + 동시 발송"""
+
+    # 전역 발송 예산 / 동시 발송 수
+    RATE_PER_SECOND = 5.0
+    BURST = 10
+    CONCURRENCY = 10
+
+    def __init__(self, db_manager, sender, store: Optional[ReminderDeliveryStore] = None,
+                 rules: Optional[Sequence[ReminderRule]] = None, budget: Optional[RateBudget] = None):
+        self.db_manager = db_manager
+        self.sender = sender
+        self.store = store or ReminderDeliveryStore(db_manager)
+        self.rules = list(rules) if rules is not None else load_reminder_rules()
+        self.budget = budget or RateBudget(self.RATE_PER_SECOND, self.BURST)
+        self._semaphore = asyncio.Semaphore(self.CONCURRENCY)
+
+    @property
+    def max_offset(self) -> int:
+        return max((rule.offset_minutes for rule in self.rules), default=0)
+
+    async def fetch_upcoming(self, now: datetime) -> List:
+        """가장 긴 알림 시간 안에 시작하는 진행 중 인스턴스"""
+        until = now + timedelta(minutes=self.max_offset)
+        async with self.db_manager.get_connection() as conn:
+            # instance_date로 넓게 거른 뒤 정확한 시각 비교는 파이썬에서
+            return await conn.fetch("""
+                SELECT ei.id, ei.instance_date, ei.instance_datetime, ei.discord_channel_id,
+                       e.event_name, e.difficulty, e.content_name
+                FROM guild_bot.event_instances ei
+                JOIN guild_bot.events e ON ei.event_id = e.id
+                WHERE ei.status NOT IN ('completed', 'cancelled')
+                AND ei.instance_date BETWEEN $1 AND $2
+            """, now.date() - timedelta(days=1), until.date() + timedelta(days=1))
+
+    async def fetch_recipients(self, instance_id: int) -> List:
+        """확정/미정 참가자 (더미 유저 제외, 디스코드 유저당 한 명)"""
+        async with self.db_manager.get_connection() as conn:
+            return await conn.fetch("""
+                SELECT DISTINCT ON (du.discord_id)
+                       du.discord_id, ep.character_name, ep.participation_status
+                FROM guild_bot.event_participations ep
+                JOIN guild_bot.discord_users du ON ep.discord_user_id = du.id
+                WHERE ep.event_instance_id = $1
+                AND ep.participation_status = ANY($2::text[])
+                AND COALESCE(du.is_dummy, FALSE) = FALSE
+                ORDER BY du.discord_id, ep.participation_status
+            """, instance_id, list(NOTIFY_STATUSES))
+
+    @staticmethod
+    def format_header(instance, now: datetime) -> str:
+        """규칙 시간이 아니라 실제 남은 시간으로 (재시작 후 늦게 보내는 알림도 맞게)"""
+        start = to_kst_naive(instance['instance_datetime'])
+        return (f"⏰ **{instance['event_name']}** 시작 {format_remaining(start - now)} 전이에요!\n"
+                f"📅 {start:%Y-%m-%d %H:%M} · {instance['content_name']} {instance['difficulty']}")
+
+    async def _send_one(self, coro_factory) -> Tuple[str, Optional[str]]:
+        """발송 한 건 (결과 상태, 오류)"""
+        async with self._semaphore:
+            await self.budget.acquire()
+            try:
+                await coro_factory()
+                return STATE_SENT, None
+            except (discord.Forbidden, discord.NotFound) as e:
+                # DM 차단/탈퇴 등 다시 보내도 실패하는 오류
+                return STATE_FAILED, str(e)
+            except Exception as e:
+                return "retry", str(e)
+
+    async def fan_out(self, instance, rule: ReminderRule, recipients: Iterable,
+                      now: Optional[datetime] = None) -> FanoutReport:
+        """규칙 하나에 대한 발송 (선점 -> 동시 발송 -> 결과 기록)"""
+        report = FanoutReport()
+        header = self.format_header(instance, now or datetime.now(KST).replace(tzinfo=None))
+        recipients = list(recipients)
+
+        if rule.mode == MODE_DM:
+            by_key = {f"user:{r['discord_id']}": r for r in recipients}
+            claimed = await self.store.claim(instance['id'], rule.offset_minutes, list(by_key))
+            report.skipped = len(by_key) - len(claimed)
+
+            def dm_task(key):
+                r = by_key[key]
+                content = (f"{header}\n🧙 {r['character_name']} "
+                           f"({STATUS_LABEL.get(r['participation_status'], r['participation_status'])})")
+                return lambda: self.sender.send_dm(int(r['discord_id']), content)
+
+            tasks = {key: dm_task(key) for key in claimed}
+        else:
+            channel_id = instance['discord_channel_id']
+            if not channel_id or not recipients:
+                return report
+            key = f"channel:{channel_id}"
+            claimed = await self.store.claim(instance['id'], rule.offset_minutes, [key])
+            report.skipped = 1 - len(claimed)
+            mentions = " ".join(f"<@{r['discord_id']}>" for r in recipients)
+            content = f"{header}\n{mentions}"[:2000]
+            tasks = {k: (lambda: self.sender.send_channel(int(channel_id), content)) for k in claimed}
+
+        keys = list(tasks)
+        outcomes = await asyncio.gather(*(self._send_one(tasks[key]) for key in keys))
+
+        results, retry_keys = [], []
+        for key, (state, error) in zip(keys, outcomes):
+            if state == "retry":
+                retry_keys.append(key)
+                continue
+            results.append((key, state, error))
+            if state == STATE_SENT:
+                report.sent += 1
+            else:
+                report.failed += 1
+        report.retry = len(retry_keys)
+
+        await self.store.finish(instance['id'], rule.offset_minutes, results)
+        await self.store.release(instance['id'], rule.offset_minutes, retry_keys)
+        return report
+
+    async def run_due(self, now: Optional[datetime] = None) -> List[Tuple[int, ReminderRule, FanoutReport]]:
+        """지금 보내야 할 알림을 모두 발송"""
+        if not self.rules:
+            return []
+        now = now or datetime.now(KST).replace(tzinfo=None)
+        done = []
+        for instance in await self.fetch_upcoming(now):
+            rules = due_rules(self.rules, to_kst_naive(instance['instance_datetime']), now)
+            if not rules:
+                continue
+            recipients = await self.fetch_recipients(instance['id'])
+            for rule in rules:
+                report = await self.fan_out(instance, rule, recipients, now)
+                if report.sent or report.failed or report.retry:
+                    logger.info(f"레이드 알림 발송: 인스턴스 {instance['id']} {format_offset(rule.offset_minutes)} 전 "
+                                f"({rule.mode}) - 성공 {report.sent}, 실패 {report.failed}, 재시도 대기 {report.retry}")
+                done.append((instance['id'], rule, report))
+        return done
@@ -0,0 +1,87 @@
+# services/role_index.py
+"""
+역할 -> 멤버 인덱스
+
+guild.members 전체를 매번 훑지 않도록 역할별 멤버 ID 집합과 멤버별 역할 수를 유지한다.
+봇 시작 시 한 번 구축하고 on_member_join/remove/update 이벤트로 갱신한다.
+"""
+from typing import Dict, FrozenSet, Iterable, Set, Tuple
+
+
+class RoleIndex:
+    """길드 하나의 역할 인덱스"""
+
+    def __init__(self, guild_id: int):
+        self.guild_id = guild_id
+        self._members_by_role: Dict[int, Set[int]] = {}
+        self._roles_by_member: Dict[int, FrozenSet[int]] = {}
+        self.is_built = False
+
+    @staticmethod
+    def _role_ids(member) -> FrozenSet[int]:
+        # @everyone 역할 제외
+        return frozenset(role.id for role in member.roles if not role.is_default())
+
+    def build(self, members: Iterable):
+        """전체 재구축"""
+        self._members_by_role = {}
+        self._roles_by_member = {}
+        for member in members:
+            self.update_member(member)
+        self.is_built = True
+
+    def update_member(self, member):
+        """멤버 추가/역할 변경 반영 (바뀐 역할만 갱신)"""
+        new_roles = self._role_ids(member)
+        old_roles = self._roles_by_member.get(member.id, frozenset())
+        if new_roles == old_roles and member.id in self._roles_by_member:
+            return
+
+        for role_id in old_roles - new_roles:
+            members = self._members_by_role.get(role_id)
+            if members is not None:
+                members.discard(member.id)
+        for role_id in new_roles - old_roles:
+            self._members_by_role.setdefault(role_id, set()).add(member.id)
+        self._roles_by_member[member.id] = new_roles
+
+    def remove_member(self, member_id: int):
+        """멤버 퇴장 반영"""
+        for role_id in self._roles_by_member.pop(member_id, frozenset()):
+            members = self._members_by_role.get(role_id)
+            if members is not None:
+                members.discard(member_id)
+
+    def remove_role(self, role_id: int):
+        """역할 삭제 반영"""
+        for member_id in self._members_by_role.pop(role_id, set()):
+            self._roles_by_member[member_id] = self._roles_by_member[member_id] - {role_id}
+
+    def members_with_role(self, role_id: int) -> Set[int]:
+        return self._members_by_role.get(role_id, set())
+
+    def role_count(self, member_id: int) -> int:
+        """@everyone을 제외한 역할 수"""
+        return len(self._roles_by_member.get(member_id, ()))
+
+    def split_by_role_count(self, role_id: int) -> Tuple[Set[int], Set[int]]:
+        """해당 역할만 가진 멤버 / 다른 역할도 가진 멤버 ID 집합"""
+        single = set()
+        multi = set()
+        for member_id in self.members_with_role(role_id):
+            if len(self._roles_by_member[member_id]) == 1:
+                single.add(member_id)
+            else:
+                multi.add(member_id)
+        return single, multi
+
+
+_indexes: Dict[int, RoleIndex] = {}
+
+
+def get_role_index(guild_id: int) -> RoleIndex:
+    """길드별 역할 인덱스 (없으면 빈 인덱스 생성)"""
+    index = _indexes.get(guild_id)
+    if index is None:
+        index = _indexes[guild_id] = RoleIndex(guild_id)
+    return index
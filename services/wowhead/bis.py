@@ -1,19 +1,25 @@
-import json
+import asyncio
 from discord import app_commands, Interaction, ui
 from discord.ext import commands
+from utils.helpers import trace_interaction
+from utils.json_codec import load_file
 
 class Bis(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.wow_classes = self.load_classes()
+        self.wow_classes = {}
+
+    async def cog_load(self):
+        # 파일 읽기/JSON 파싱은 이벤트 루프 밖에서
+        self.wow_classes = await asyncio.to_thread(self.load_classes)
 
     def load_classes(self):
         # JSON 파일을 읽어오는 부분
-        with open('data/class.json', 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return load_file('data/class.json')
 
     @app_commands.command(name="비스", description="와우헤드 BIS 페이지로 보내줘요!")
     @app_commands.describe(class_name="예: 죽음의기사, 전사, 드루이드...")
+    @trace_interaction
     async def bis_links(self, interaction: Interaction, class_name: str):
         await interaction.response.defer()
 
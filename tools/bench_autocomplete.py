@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+tools/bench_autocomplete.py
+
+자동완성 응답 시간 벤치마크
+가상 캐릭터 50,000개로 인덱스를 만들고 키 입력별 응답 시간을 측정한다.
+디스코드 자동완성 응답 제한(3초)보다 훨씬 짧아야 한다.
+
+사용법: python tools/bench_autocomplete.py [캐릭터수]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.character_index import character_index, CharacterEntry
+from utils.autocomplete import character_choice_pairs, realm_choice_pairs
+from utils.hangul import get_chosung
+from utils.wow_translation import REALM_KR_TO_EN
+
+DISCORD_AUTOCOMPLETE_LIMIT_MS = 3000
+BUDGET_MS = 50  # 키 입력 하나당 허용 시간 (p99)
+
+
+def make_name(rng: random.Random) -> str:
+    """한글 2~6글자 가상 캐릭터명"""
+    return "".join(chr(0xAC00 + rng.randrange(11172)) for _ in range(rng.randint(2, 6)))
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    rng = random.Random(42)
+    realms = list(REALM_KR_TO_EN.values())
+
+    entries = [
+        CharacterEntry(i, make_name(rng), rng.choice(realms), rng.random() < 0.1)
+        for i in range(count)
+    ]
+
+    start = time.perf_counter()
+    character_index.build(entries)
+    build_ms = (time.perf_counter() - start) * 1000
+    print(f">>> 인덱스 구축: {count}개 캐릭터, {build_ms:.1f}ms")
+
+    # 실제 입력 패턴: 이름 앞 1~3글자, 초성, 조합 중인 마지막 초성
+    queries = []
+    for entry in rng.sample(entries, 2000):
+        name = entry.character_name
+        queries.append(name[:rng.randint(1, 3)])
+        queries.append(get_chosung(name[:2]))
+        if len(name) >= 3:
+            queries.append(name[:2] + get_chosung(name[2]))
+
+    timings = {"character": [], "realm": []}
+    for query in queries:
+        start = time.perf_counter()
+        character_choice_pairs(query)
+        timings["character"].append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        realm_choice_pairs(query[:2])
+        timings["realm"].append((time.perf_counter() - start) * 1000)
+
+    failed = False
+    for kind, values in timings.items():
+        p50 = percentile(values, 0.50)
+        p99 = percentile(values, 0.99)
+        worst = max(values)
+        print(f">>> {kind} 자동완성 {len(values)}회: p50 {p50:.3f}ms, p99 {p99:.3f}ms, 최대 {worst:.3f}ms "
+              f"(디스코드 제한 {DISCORD_AUTOCOMPLETE_LIMIT_MS}ms)")
+        if p99 > BUDGET_MS:
+            print(f">>> {kind} 자동완성 p99가 예산 {BUDGET_MS}ms 초과")
+            failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
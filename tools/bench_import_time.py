@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+tools/bench_import_time.py
+
+봇 시작 시 import 비용 측정 (예산 초과 시 종료 코드 1)
+새 인터프리터에서 `python -X importtime`으로 main.py의 의존 모듈과 모든 확장 모듈을 import하고,
+stderr의 importtime 출력을 파싱해서 총 시간과 누적 시간 상위 모듈을 보고한다.
+여러 번 실행해서 중앙값으로 판정한다 (첫 실행은 .pyc 생성이 섞일 수 있어 버림).
+
+사용법: python tools/bench_import_time.py [--runs 5] [--budget-ms 600] [--top 25]
+  예산 기본값: IMPORT_TIME_BUDGET_MS 환경변수 또는 600ms
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+from utils.startup import all_extensions
+
+# main.py가 확장 로딩 전에 직접 import하는 모듈 (main.py 자체는 import하면 봇이 실행되므로 대신 나열)
+MAIN_IMPORTS = [
+    "discord",
+    "discord.ext.commands",
+    "dotenv",
+    "db.database_manager",
+    "services.command_sync",
+    "services.member_roster",
+    "utils.http_session",
+    "utils.lifecycle",
+    "utils.logging_config",
+    "utils.metrics",
+    "utils.startup",
+]
+
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+@dataclass
+class ImportRecord:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(stderr: str) -> List[ImportRecord]:
+    records = []
+    for line in stderr.splitlines():
+        match = _LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        # 최상위 import는 공백 1칸, 한 단계 깊어질 때마다 2칸
+        records.append(ImportRecord(module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return records
+
+
+def measure_once(modules: List[str]) -> List[ImportRecord]:
+    code = "import importlib\nfor name in %r:\n    importlib.import_module(name)\n" % (modules,)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT, capture_output=True, text=True,
+        env={**os.environ, "PYTHONPATH": ROOT},
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import 실패:\n{proc.stderr[-2000:]}")
+    return parse_importtime(proc.stderr)
+
+
+def total_ms(records: List[ImportRecord]) -> float:
+    return sum(r.cumulative_us for r in records if r.depth == 0) / 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="봇 시작 import 시간 측정")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=float(os.getenv("IMPORT_TIME_BUDGET_MS", "600")))
+    parser.add_argument("--top", type=int, default=25)
+    args = parser.parse_args()
+
+    modules = MAIN_IMPORTS + all_extensions()
+    measure_once(modules)  # 워밍업 (.pyc 생성)
+
+    runs = [measure_once(modules) for _ in range(args.runs)]
+    totals = [total_ms(records) for records in runs]
+    median_total = statistics.median(totals)
+
+    # 모듈별 누적/자체 시간 중앙값
+    cumulative: Dict[str, List[int]] = {}
+    self_time: Dict[str, List[int]] = {}
+    for records in runs:
+        for r in records:
+            cumulative.setdefault(r.module, []).append(r.cumulative_us)
+            self_time.setdefault(r.module, []).append(r.self_us)
+
+    print(f"import 모듈 {len(modules)}개 (의존 포함 {len(cumulative)}개), {args.runs}회 측정")
+    print(f"총 import 시간: 중앙값 {median_total:.1f}ms (최소 {min(totals):.1f}ms, 최대 {max(totals):.1f}ms)\n")
+
+    print(f"누적 시간 상위 {args.top}개 (자체 시간 / 누적 시간, ms)")
+    top = sorted(cumulative, key=lambda m: statistics.median(cumulative[m]), reverse=True)[:args.top]
+    for module in top:
+        print(f"  {statistics.median(self_time[module]) / 1000:8.1f} {statistics.median(cumulative[module]) / 1000:8.1f}  {module}")
+
+    print("\n프로젝트 모듈 (자체 시간 상위)")
+    ours = [m for m in cumulative if m.split(".")[0] in ("cogs", "services", "utils", "db", "decorators")]
+    for module in sorted(ours, key=lambda m: statistics.median(self_time[m]), reverse=True)[:10]:
+        print(f"  {statistics.median(self_time[module]) / 1000:8.1f} {statistics.median(cumulative[module]) / 1000:8.1f}  {module}")
+
+    if median_total > args.budget_ms:
+        print(f"\n❌ 예산 초과: {median_total:.1f}ms > {args.budget_ms:.0f}ms")
+        sys.exit(1)
+    print(f"\n✅ 예산 이내: {median_total:.1f}ms <= {args.budget_ms:.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
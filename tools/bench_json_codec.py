@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+tools/bench_json_codec.py
+
+JSON 코덱 벤치마크 (체크인된 길드 로스터 응답 data/response_1756707146235.json, 약 150KB)
+표준 json과 utils.json_codec(orjson 사용 가능 시 orjson)의 파싱/직렬화 시간을 비교한다.
+- 파싱: aiohttp response.json()처럼 bytes -> str 디코딩 후 json.loads vs 코덱 loads(bytes)
+- 직렬화: asyncpg jsonb 코덱처럼 객체 -> str
+
+사용법: python tools/bench_json_codec.py [반복횟수]
+"""
+import json
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import json_codec
+
+ROSTER_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           "data", "response_1756707146235.json")
+
+
+def bench(label: str, fn, iterations: int, size: int) -> float:
+    fn()  # 워밍업
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    per_call = (time.perf_counter() - started) / iterations
+    print(f"  {label:<34} {per_call * 1000:8.3f}ms  {size / per_call / 1024 / 1024:8.1f}MB/s")
+    return per_call
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+
+    with open(ROSTER_FILE, "rb") as f:
+        raw = f.read()
+    data = json.loads(raw.decode("utf-8"))
+    encoded = json.dumps(data, ensure_ascii=False)
+    print(f"로스터 응답: {len(raw) / 1024:.1f}KB, 멤버 {len(data.get('members', []))}명, "
+          f"코덱 백엔드: {json_codec.BACKEND}, {iterations}회 반복\n")
+
+    # 같은 결과를 내는지 먼저 확인
+    assert json_codec.loads(raw) == data
+    assert json_codec.loads(json_codec.dumps(data)) == data
+
+    print("파싱 (bytes -> 객체)")
+    base_parse = bench("json.loads(bytes.decode())", lambda: json.loads(raw.decode("utf-8")), iterations, len(raw))
+    codec_parse = bench(f"json_codec.loads ({json_codec.BACKEND})", lambda: json_codec.loads(raw), iterations, len(raw))
+
+    print("\n직렬화 (객체 -> str, jsonb 인코딩)")
+    base_dump = bench("json.dumps(ensure_ascii=False)", lambda: json.dumps(data, ensure_ascii=False),
+                      iterations, len(encoded.encode("utf-8")))
+    codec_dump = bench(f"json_codec.dumps ({json_codec.BACKEND})", lambda: json_codec.dumps(data),
+                       iterations, len(encoded.encode("utf-8")))
+
+    print(f"\n파싱 {base_parse / codec_parse:.1f}배, 직렬화 {base_dump / codec_dump:.1f}배")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+tools/bench_ownership_link.py
+
+닉네임 인증(캐릭터 소유권 연결) 처리량 벤치마크 - 실제 Postgres 필요 (DATABASE_URL)
+- 이전 방식: 유저 upsert / 유저 id 조회 / 캐릭터 id 조회 / 기존 인증 해제 / 연결 upsert (왕복 5번, 각각 자동 커밋)
+- 현재 방식: CharacterOwnershipService.link (데이터 변경 CTE 하나, 왕복 1번)
+
+벤치마크용 캐릭터(realm_slug = BENCH_REALM)와 디스코드 유저(discord_id 'bench-...')를 만들고
+끝나면 지운다. 원격 DB 상황을 흉내 내려면 왕복마다 추가 지연(ms)을 줄 수 있다.
+
+사용법: python tools/bench_ownership_link.py [연결횟수] [동시실행수] [추가왕복지연ms]
+"""
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db.database_manager import DatabaseManager
+from services.character_ownership import CharacterOwnershipService
+
+BENCH_REALM = "bench-ownership"
+BENCH_USERS = 200
+BENCH_CHARACTERS = 400
+
+
+class DelayedConnection:
+    """왕복마다 지연을 더하는 연결 래퍼"""
+
+    def __init__(self, conn, delay: float):
+        self._conn = conn
+        self._delay = delay
+
+    async def _roundtrip(self, method: str, *args):
+        if self._delay:
+            await asyncio.sleep(self._delay)
+        return await getattr(self._conn, method)(*args)
+
+    async def execute(self, *args):
+        return await self._roundtrip("execute", *args)
+
+    async def fetchval(self, *args):
+        return await self._roundtrip("fetchval", *args)
+
+    async def fetchrow(self, *args):
+        return await self._roundtrip("fetchrow", *args)
+
+
+async def legacy_link(conn, discord_id: str, username: str, character_name: str, realm_slug: str) -> bool:
+    """이전 AutoNicknameHandler.link_character_to_discord와 같은 쿼리 순서"""
+    await conn.execute("""
+        INSERT INTO guild_bot.discord_users (discord_id, discord_username)
+        VALUES ($1, $2)
+        ON CONFLICT (discord_id)
+        DO UPDATE SET
+            discord_username = EXCLUDED.discord_username,
+            updated_at = NOW()
+    """, discord_id, username)
+    discord_user_db_id = await conn.fetchval(
+        "SELECT id FROM guild_bot.discord_users WHERE discord_id = $1", discord_id)
+    character_db_id = await conn.fetchval(
+        "SELECT id FROM guild_bot.characters WHERE character_name = $1 AND realm_slug = $2",
+        character_name, realm_slug)
+    if not character_db_id:
+        return False
+    await conn.execute("""
+        UPDATE guild_bot.character_ownership
+        SET is_verified = FALSE, updated_at = NOW()
+        WHERE discord_user_id = $1 AND is_verified = TRUE
+    """, discord_user_db_id)
+    await conn.execute("""
+        INSERT INTO guild_bot.character_ownership (discord_user_id, character_id, is_verified)
+        VALUES ($1, $2, TRUE)
+        ON CONFLICT (discord_user_id, character_id)
+        DO UPDATE SET
+            is_verified = TRUE,
+            updated_at = NOW()
+    """, discord_user_db_id, character_db_id)
+    return True
+
+
+async def single_statement_link(conn, discord_id: str, username: str, character_name: str, realm_slug: str) -> bool:
+    link = await CharacterOwnershipService(None).link(
+        discord_id, username, character_name=character_name, realm_slug=realm_slug, conn=conn)
+    return link is not None
+
+
+async def setup(db_manager: DatabaseManager):
+    async with db_manager.get_connection() as conn:
+        await conn.execute("""
+            INSERT INTO guild_bot.characters (character_name, realm_slug, region)
+            SELECT 'bench-' || i, $1, 'kr' FROM generate_series(1, $2) AS i
+            ON CONFLICT (character_name, realm_slug) DO NOTHING
+        """, BENCH_REALM, BENCH_CHARACTERS)
+
+
+async def cleanup(db_manager: DatabaseManager):
+    async with db_manager.get_connection() as conn:
+        async with conn.transaction():
+            await conn.execute("""
+                DELETE FROM guild_bot.character_ownership
+                WHERE discord_user_id IN (SELECT id FROM guild_bot.discord_users WHERE discord_id LIKE 'bench-%')
+                   OR character_id IN (SELECT id FROM guild_bot.characters WHERE realm_slug = $1)
+            """, BENCH_REALM)
+            await conn.execute("DELETE FROM guild_bot.discord_users WHERE discord_id LIKE 'bench-%'")
+            await conn.execute("DELETE FROM guild_bot.characters WHERE realm_slug = $1", BENCH_REALM)
+
+
+async def run(label: str, link_fn, db_manager: DatabaseManager, iterations: int, concurrency: int,
+              delay: float, seed: int):
+    rng = random.Random(seed)
+    # 같은 유저를 두 작업자가 동시에 연결하지 않도록 유저를 작업자별로 나눈다
+    queues = [[] for _ in range(concurrency)]
+    for _ in range(iterations):
+        user = rng.randrange(BENCH_USERS)
+        queues[user % concurrency].append((f"bench-{user}", f"bench-{rng.randrange(1, BENCH_CHARACTERS + 1)}"))
+    latencies = []
+
+    async def worker(jobs):
+        for discord_id, character_name in jobs:
+            async with db_manager.get_connection() as conn:
+                started = time.perf_counter()
+                ok = await link_fn(DelayedConnection(conn, delay), discord_id, discord_id, character_name, BENCH_REALM)
+                latencies.append(time.perf_counter() - started)
+            assert ok, f"연결 실패: {discord_id} -> {character_name}"
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(jobs) for jobs in queues))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+    print(f"  {label:<24} {iterations / elapsed:8.1f}건/s  p50 {statistics.median(latencies) * 1000:7.2f}ms  "
+          f"p95 {p95 * 1000:7.2f}ms")
+    return iterations / elapsed
+
+
+async def verify_single_verified(db_manager: DatabaseManager):
+    """유저마다 인증 캐릭터가 하나뿐인지 확인"""
+    async with db_manager.get_connection() as conn:
+        duplicated = await conn.fetchval("""
+            SELECT COUNT(*) FROM (
+                SELECT co.discord_user_id
+                FROM guild_bot.character_ownership co
+                JOIN guild_bot.discord_users du ON du.id = co.discord_user_id
+                WHERE du.discord_id LIKE 'bench-%' AND co.is_verified
+                GROUP BY co.discord_user_id HAVING COUNT(*) > 1
+            ) AS t
+        """)
+    assert duplicated == 0, f"인증 캐릭터가 둘 이상인 유저 {duplicated}명"
+
+
+async def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    delay = float(sys.argv[3]) / 1000 if len(sys.argv) > 3 else 0.0
+
+    db_manager = DatabaseManager()
+    if not db_manager.database_url:
+        print("DATABASE_URL이 설정되지 않았습니다 (실제 Postgres가 필요한 벤치마크)")
+        sys.exit(1)
+
+    await db_manager.create_pool()
+    try:
+        await setup(db_manager)
+        print(f"연결 {iterations}회, 동시 {concurrency}개, 왕복당 추가 지연 {delay * 1000:.1f}ms\n")
+
+        before = await run("이전 방식 (왕복 5번)", legacy_link, db_manager, iterations, concurrency, delay, 1)
+        await verify_single_verified(db_manager)
+        after = await run("CTE 한 번 (왕복 1번)", single_statement_link, db_manager, iterations, concurrency, delay, 1)
+        await verify_single_verified(db_manager)
+
+        print(f"\n처리량 {after / before:.1f}배")
+    finally:
+        await cleanup(db_manager)
+        await db_manager.close_pool()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+tools/bench_participant_format.py
+
+참가자 한 명당 표시 비용 마이크로 벤치마크
+임베드 렌더링 때 참가자마다 실행되는 직업/전문화/역할/이모티콘 조회를 측정한다.
+(영어, 한국어, raider.io 소문자 표기를 섞어서 정규화 경로까지 포함)
+
+사용법: python tools/bench_participant_format.py [반복횟수]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.wow_registry import get_wow_registry
+from utils.wow_role_mapping import get_character_role
+
+
+def make_participants(count: int, rng: random.Random) -> list:
+    """표기가 섞인 가상 참가자 목록"""
+    specs = get_wow_registry().specs
+    participants = []
+    for i in range(count):
+        spec = rng.choice(specs)
+        style = i % 3
+        if style == 0:
+            class_name, spec_name = spec.wow_class.name_en, spec.name_en
+        elif style == 1:
+            class_name, spec_name = spec.wow_class.name_kr, spec.name_kr
+        else:
+            class_name, spec_name = spec.wow_class.name_en.lower().replace(" ", "_"), spec.name_en.lower()
+        participants.append({
+            "character_name": f"참가자{i}",
+            "character_class": class_name,
+            "character_spec": spec_name,
+        })
+    return participants
+
+
+def format_line(registry, p) -> str:
+    """_format_participants_compact와 같은 한 줄 포맷"""
+    info = registry.describe(p['character_class'], p['character_spec'])
+    spec_text = f"({info.name_kr or p['character_spec']})" if p['character_spec'] else ""
+    return f"{info.emoji} {p['character_name']}{spec_text} {info.role_kr}"
+
+
+def bench(label: str, func, participants: list, rounds: int):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for p in participants:
+            func(p)
+    elapsed = time.perf_counter() - start
+    per_call_ns = elapsed / (rounds * len(participants)) * 1e9
+    print(f">>> {label}: 참가자당 {per_call_ns:.0f}ns ({rounds * len(participants)}회, {elapsed * 1000:.1f}ms)")
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    participants = make_participants(40, random.Random(42))
+    registry = get_wow_registry()
+
+    bench("레지스트리 조회 (describe)", lambda p: registry.describe(p['character_class'], p['character_spec']),
+          participants, rounds)
+    bench("참가자 한 줄 포맷", lambda p: format_line(registry, p), participants, rounds)
+    bench("세분화 역할 조회 (get_character_role)",
+          lambda p: get_character_role(p['character_class'], p['character_spec']), participants, rounds)
+
+
+if __name__ == "__main__":
+    main()
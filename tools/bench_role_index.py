@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+tools/bench_role_index.py
+
+기웃정리 대상 분석 벤치마크 (가상 멤버 20,000명)
+기존 방식(guild.members 전체 순회 + 리스트 포함 검사)과 역할 인덱스 집합 조회를 비교한다.
+
+사용법: python tools/bench_role_index.py [멤버수]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.role_index import RoleIndex
+
+GUILD_ID = 1
+TARGET_ROLE_ID = 100
+OTHER_ROLE_IDS = list(range(101, 131))
+
+
+class FakeRole:
+    __slots__ = ("id", "name")
+
+    def __init__(self, role_id: int):
+        self.id = role_id
+        self.name = "@everyone" if role_id == GUILD_ID else f"role{role_id}"
+
+    def is_default(self) -> bool:
+        return self.id == GUILD_ID
+
+
+class FakeMember:
+    __slots__ = ("id", "roles", "display_name")
+
+    def __init__(self, member_id: int, roles: list):
+        self.id = member_id
+        self.roles = roles
+        self.display_name = f"member{member_id}"
+
+
+def make_members(count: int, rng: random.Random) -> list:
+    roles = {role_id: FakeRole(role_id) for role_id in [GUILD_ID, TARGET_ROLE_ID] + OTHER_ROLE_IDS}
+    members = []
+    for member_id in range(1, count + 1):
+        member_roles = [roles[GUILD_ID]]
+        if rng.random() < 0.4:
+            member_roles.append(roles[TARGET_ROLE_ID])
+        for role_id in rng.sample(OTHER_ROLE_IDS, rng.randint(0, 3)):
+            member_roles.append(roles[role_id])
+        members.append(FakeMember(member_id, member_roles))
+    return members, roles[TARGET_ROLE_ID]
+
+
+def legacy_analysis(members: list, target_role) -> tuple:
+    """기존 analyze_target_members + kick_cleanup 목록 구성"""
+    all_target_members = [member for member in members if target_role in member.roles]
+    single_role_members = []
+    multi_role_members = []
+    for member in all_target_members:
+        actual_roles = [role for role in member.roles if role.name != "@everyone"]
+        if len(actual_roles) == 1:
+            single_role_members.append(member)
+        else:
+            multi_role_members.append(member)
+    # kick_cleanup의 `member in multi_role_members` 검사
+    flagged = sum(1 for member in single_role_members + multi_role_members if member in multi_role_members)
+    return len(single_role_members), flagged
+
+
+def indexed_analysis(index: RoleIndex, members_by_id: dict) -> tuple:
+    single_ids, multi_ids = index.split_by_role_count(TARGET_ROLE_ID)
+    single_role_members = [members_by_id[i] for i in single_ids]
+    multi_role_members = [members_by_id[i] for i in multi_ids]
+    flagged = sum(1 for member in single_role_members + multi_role_members if member.id in multi_ids)
+    return len(single_role_members), flagged
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    members, target_role = make_members(count, random.Random(42))
+    members_by_id = {member.id: member for member in members}
+
+    index = RoleIndex(GUILD_ID)
+    _, build_ms = timed(index.build, members)
+    print(f">>> 인덱스 구축 (봇 시작 시 1회): {count}명, {build_ms:.1f}ms")
+
+    # 이벤트 갱신 비용
+    start = time.perf_counter()
+    for member in members[:1000]:
+        index.update_member(member)
+    print(f">>> 멤버 갱신 이벤트 1,000건: {(time.perf_counter() - start) * 1000:.2f}ms")
+
+    indexed, indexed_ms = timed(indexed_analysis, index, members_by_id)
+    print(f">>> 인덱스 분석: 단일 {indexed[0]}명, 다중 {indexed[1]}명, {indexed_ms:.1f}ms")
+
+    legacy, legacy_ms = timed(legacy_analysis, members, target_role)
+    print(f">>> 기존 분석: 단일 {legacy[0]}명, 다중 {legacy[1]}명, {legacy_ms:.1f}ms")
+
+    if indexed != legacy:
+        print(">>> 결과 불일치!")
+        sys.exit(1)
+    print(f">>> {legacy_ms / max(indexed_ms, 0.001):.0f}배 빠름")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
 import asyncio
-import aiohttp
+import logging
 import sys
 import os
 from typing import Dict, List
@@ -9,11 +9,28 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # 그 다음에 db 모듈 import
 from db.database_manager import DatabaseManager
+from services.api_cache import api_cache, fetch_json
+from services.character_profiles import ROSTER_FIELDS
+from services.character_repository import CharacterRepository
+from utils.http_session import close_session
+from utils.logging_config import setup_logging
+
+logger = logging.getLogger(__name__)
+
+# 로스터 응답 캐시 시간 (초), 이후에는 조건부 요청
+ROSTER_TTL = 60
 
 class GuildDataCollector:
     def __init__(self):
         self.db_manager = DatabaseManager()
+        self.character_repository = CharacterRepository(self.db_manager)
     
+    async def prepare_api_cache(self):
+        """raider.io 응답은 봇과 같은 API 캐시(guild_bot.api_cache)를 공유"""
+        api_cache.attach(self.db_manager)
+        await api_cache.ensure_schema()
+        await self.character_repository.profile_store.ensure_schema()
+
     async def fetch_guild_members(self) -> List[Dict]:
         """Raider.io API에서 길드 멤버 정보 가져오기"""
         url = "https://raider.io/api/v1/guilds/profile"
@@ -25,27 +42,27 @@ class GuildDataCollector:
         }
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        members = data.get("members", [])
-                        print(f">>> 길드 멤버 {len(members)}명 조회 완료")
-                        
-                        # 첫 번째 멤버의 데이터 구조 출력 (디버깅용)
-                        if members:
-                            print(">>> 첫 번째 멤버 데이터 구조:")
-                            first_member = members[0]
-                            print(f"    루트 레벨 키들: {list(first_member.keys())}")
-                            if 'character' in first_member:
-                                print(f"    character 키들: {list(first_member['character'].keys())}")
-                        
-                        return members
-                    else:
-                        print(f">>> API 호출 실패: {resp.status}")
-                        return []
+            # 로스터(약 150KB)는 자주 바뀌지 않으니 조건부 요청으로 받아 304면 저장된 응답 사용
+            result = await fetch_json(url, params, ttl=ROSTER_TTL)
+            if result.status == 200:
+                data = result.payload
+                members = data.get("members", [])
+                logger.info(f"길드 멤버 {len(members)}명 조회 완료 ({result.source})")
+                
+                # 첫 번째 멤버의 데이터 구조 출력 (디버깅용)
+                if members:
+                    logger.debug("첫 번째 멤버 데이터 구조:")
+                    first_member = members[0]
+                    logger.debug(f"    루트 레벨 키들: {list(first_member.keys())}")
+                    if 'character' in first_member:
+                        logger.debug(f"    character 키들: {list(first_member['character'].keys())}")
+                
+                return members
+            else:
+                logger.warning(f"API 호출 실패: {result.status}")
+                return []
         except Exception as e:
-            print(f">>> API 호출 오류: {e}")
+            logger.error(f"API 호출 오류: {e}")
             return []
     
     def normalize_member_data(self, member_data: Dict) -> Dict:
@@ -62,94 +79,34 @@ class GuildDataCollector:
         
         return normalized
     
-    async def mark_all_non_guild_members(self):
-        """배치 시작 전 모든 캐릭터를 비길드원으로 표시"""
-        try:
-            async with self.db_manager.get_connection() as conn:
-                result = await conn.execute("""
-                    UPDATE guild_bot.characters 
-                    SET is_guild_member = FALSE, updated_at = NOW()
-                    WHERE is_guild_member = TRUE
-                """)
-                print(f">>> 모든 캐릭터를 비길드원으로 초기화 완료")
-        except Exception as e:
-            print(f">>> 초기화 오류: {e}")
-    
-    async def insert_character_data(self, member_data: Dict) -> bool:
-        """캐릭터 데이터를 characters 테이블에 삽입 (raider.io API 응답 그대로 저장)"""
+    async def save_guild_members(self, members: List[Dict]) -> int:
+        """
+        길드 멤버 전체를 한 번에 저장하고, 로스터에 없는 캐릭터는 비길드원으로 표시
+        (내용이 같은 캐릭터는 쓰지 않음 -> 매 실행마다 전체 행이 갱신되지 않는다)
+        """
         if not self.db_manager.pool:
-            print(">>> 데이터베이스 연결 없음")
-            return False
+            logger.error("데이터베이스 연결 없음")
+            return 0
         
         try:
-            # 데이터 정규화
-            normalized_data = self.normalize_member_data(member_data)
-            
-            name = normalized_data.get("name")
-            realm = normalized_data.get("realm")
-            
-            if not name or not realm:
-                print(f">>> 필수 데이터 누락: name={name}, realm={realm}")
-                return False
-            
-            # raider.io API 응답값 그대로 사용
-            race = normalized_data.get("race", "")
-            class_name = normalized_data.get("class", "")
-            active_spec = normalized_data.get("active_spec_name", "")
-            active_spec_role = normalized_data.get("active_spec_role", "")
-            gender = normalized_data.get("gender", "")
-            faction = normalized_data.get("faction", "")
-            
-            # characters 테이블에 삽입/업데이트 (길드원 상태 포함)
+            normalized = [self.normalize_member_data(member) for member in members]
             async with self.db_manager.get_connection() as conn:
-                result = await conn.execute("""
-                    INSERT INTO guild_bot.characters (
-                        character_name, realm_slug, is_guild_member,
-                        race, class, active_spec, active_spec_role,
-                        gender, faction, achievement_points,
-                        profile_url, profile_banner, thumbnail_url, region, last_crawled_at
-                    )
-                    VALUES ($1, $2, $3, $4, $5, $6, $7,
-                            $8, $9, $10, $11, $12, $13, $14, NOW())
-                    ON CONFLICT (character_name, realm_slug)
-                    DO UPDATE SET
-                        is_guild_member = EXCLUDED.is_guild_member,  -- 중요: 길드원 상태 업데이트
-                        race = EXCLUDED.race,
-                        class = EXCLUDED.class,
-                        active_spec = EXCLUDED.active_spec,
-                        active_spec_role = EXCLUDED.active_spec_role,
-                        gender = EXCLUDED.gender,
-                        faction = EXCLUDED.faction,
-                        achievement_points = EXCLUDED.achievement_points,
-                        profile_url = EXCLUDED.profile_url,
-                        profile_banner = EXCLUDED.profile_banner,
-                        thumbnail_url = EXCLUDED.thumbnail_url,
-                        last_crawled_at = NOW(),
-                        updated_at = NOW()
-                """,
-                name,
-                realm,  # realm_slug로 저장
-                True,  # is_guild_member (길드원임을 명시)
-                race,
-                class_name,
-                active_spec,
-                active_spec_role,
-                gender,
-                faction,
-                normalized_data.get("achievement_points", 0),
-                normalized_data.get("profile_url", ""),
-                normalized_data.get("profile_banner", ""),
-                normalized_data.get("thumbnail_url", ""),
-                "kr"  # region
-                )
-                
-                print(f"    ✓ {name}-{realm} 길드원 데이터 업데이트 완료")
-                return True
+                async with conn.transaction():
+                    # 로스터 항목 원본(rank 포함)은 프로필 저장소에
+                    saved = await self.character_repository.save_many(
+                        normalized, guild_member=True, profile_fields=ROSTER_FIELDS, raw=members, conn=conn)
+                    saved = [s for s in saved if s is not None]
+                    left = await self.character_repository.mark_non_members(
+                        [s.character_id for s in saved], conn=conn)
+            
+            changed = sum(s.changed for s in saved)
+            logger.info(f"길드원 {len(saved)}명 저장 (변경 {changed}명, 변경 없음 {len(saved) - changed}명), "
+                        f"비길드원 전환 {left}명")
+            return len(saved)
                 
         except Exception as e:
-            name = normalized_data.get("name", "Unknown") if 'normalized_data' in locals() else member_data.get("name", "Unknown")
-            print(f">>> ✗ {name} 데이터 삽입 오류: {e}")
-            return False
+            logger.error(f"✗ 길드 멤버 데이터 저장 오류: {e}")
+            return 0
     
     async def get_guild_character_count(self) -> int:
         """길드 캐릭터 수 조회"""
@@ -163,7 +120,7 @@ class GuildDataCollector:
                 )
                 return result or 0
         except Exception as e:
-            print(f">>> 레코드 수 조회 오류: {e}")
+            logger.error(f"레코드 수 조회 오류: {e}")
             return 0
 
     async def get_status_changes(self) -> Dict[str, int]:
@@ -187,67 +144,61 @@ class GuildDataCollector:
                     "total_members": total_members or 0
                 }
         except Exception as e:
-            print(f">>> 상태 변경 통계 조회 오류: {e}")
+            logger.error(f"상태 변경 통계 조회 오류: {e}")
             return {"new_members": 0, "total_members": 0}
 
     async def collect_guild_data(self):
         """길드 데이터 수집 메인 함수"""
-        print(">>> 길드 데이터 수집 시작")
+        logger.info("길드 데이터 수집 시작")
         
         # 처리 전 상태 확인
         before_count = await self.get_guild_character_count()
-        print(f">>> 처리 전 길드원 수: {before_count}명")
+        logger.info(f"처리 전 길드원 수: {before_count}명")
         
-        # 1단계: 모든 캐릭터를 비길드원으로 초기화
-        print(">>> 1단계: 길드원 상태 초기화")
-        await self.mark_all_non_guild_members()
-        
-        # 2단계: API에서 현재 길드 멤버 데이터 가져오기
-        print(">>> 2단계: API에서 길드 멤버 데이터 수집")
+        # 1단계: API에서 현재 길드 멤버 데이터 가져오기
+        logger.info("1단계: API에서 길드 멤버 데이터 수집")
         members = await self.fetch_guild_members()
         if not members:
-            print(">>> 길드 멤버 데이터 없음")
+            logger.info("길드 멤버 데이터 없음")
             return
         
-        # 3단계: 각 멤버 데이터 처리
-        print(">>> 3단계: 길드 멤버 데이터 업데이트")
-        success_count = 0
-        for i, member in enumerate(members, 1):
-            name = member.get("character", {}).get("name", "Unknown")
-            print(f">>> [{i}/{len(members)}] {name} 처리 중...")
-            
-            # 캐릭터 데이터 삽입/업데이트 (길드원으로 표시)
-            if await self.insert_character_data(member):
-                success_count += 1
+        # 2단계: 길드 멤버 저장 + 로스터에 없는 캐릭터 비길드원 처리
+        logger.info("2단계: 길드 멤버 데이터 업데이트")
+        success_count = await self.save_guild_members(members)
         
         # 처리 후 결과 출력
         after_count = await self.get_guild_character_count()
         changes = await self.get_status_changes()
         
-        print(f"\n>>> 길드 데이터 처리 완료:")
-        print(f"    API에서 조회한 멤버 수: {len(members)}명")
-        print(f"    처리 전 길드원 수: {before_count}명")
-        print(f"    처리 후 길드원 수: {after_count}명")
-        print(f"    성공적으로 업데이트된 캐릭터: {success_count}명")
-        print(f"    오늘 새로 업데이트된 길드원: {changes['new_members']}명")
+        logger.info("길드 데이터 처리 완료:")
+        logger.info(f"    API에서 조회한 멤버 수: {len(members)}명")
+        logger.info(f"    처리 전 길드원 수: {before_count}명")
+        logger.info(f"    처리 후 길드원 수: {after_count}명")
+        logger.info(f"    성공적으로 업데이트된 캐릭터: {success_count}명")
+        logger.info(f"    오늘 새로 업데이트된 길드원: {changes['new_members']}명")
 
     async def insert_from_api(self):
         """API에서 데이터를 가져와 삽입하는 독립 실행 함수"""
         await self.db_manager.create_pool()
         try:
+            await self.prepare_api_cache()
             await self.collect_guild_data()
         finally:
             await self.db_manager.close_pool()
+            await close_session()
 
 
 # 실행 함수
 async def main():
+    setup_logging()
     collector = GuildDataCollector()
     try:
         await collector.db_manager.create_pool()
+        await collector.prepare_api_cache()
         await collector.collect_guild_data()
     finally:
         await collector.db_manager.close_pool()
+        await close_session()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+tools/check_loop_blocking.py
+
+핸들러가 이벤트 루프를 예산 이상 막는지 검사 (막으면 종료 코드 1)
+디스코드/DB 없이 돌릴 수 있는 핸들러를 가짜 인터랙션으로 실행하면서
+LoopWatchdog(스택 캡처 모드)으로 막힌 위치를 수집한다.
+
+- /비스: 클래스 JSON 로딩 + 응답
+- /이차스탯 전문화 선택: 로컬 HTTP 서버에서 큰 HTML 표를 받아 파싱
+- 이모티콘 스냅샷 로딩, member.txt 로딩
+- 캐릭터 자동완성 (가상 캐릭터 20,000개 인덱스)
+
+사용법: python tools/check_loop_blocking.py [--budget-ms 50] [--self-test]
+  --self-test: 일부러 time.sleep으로 루프를 막는 시나리오를 추가해서 감지가 되는지 확인
+
+시나리오에서 예외가 나면 실패로 센다 (건너뛰는 것은 고정 데이터 파일이 없을 때의 SkipScenario뿐)
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import discord
+from aiohttp import web
+
+from utils.http_session import close_session
+from utils.loop_watchdog import LoopWatchdog
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class SkipScenario(Exception):
+    """시나리오에 필요한 고정 데이터 파일이 없음 (실패가 아니라 건너뜀)"""
+
+
+def require_fixture(relative_path: str):
+    if not os.path.exists(os.path.join(ROOT, relative_path)):
+        raise SkipScenario(f"{relative_path} 없음")
+
+
+class FakeResponse:
+    def __init__(self):
+        self._done = False
+
+    def is_done(self) -> bool:
+        return self._done
+
+    async def defer(self, **kwargs):
+        self._done = True
+
+    async def send_message(self, *args, **kwargs):
+        self._done = True
+
+
+class FakeFollowup:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, content=None, **kwargs):
+        self.sent.append(content)
+
+
+class FakeUser:
+    id = 1
+    name = "checker"
+    display_name = "검사봇"
+
+
+class FakeInteraction:
+    type = discord.InteractionType.application_command
+    guild = None
+
+    def __init__(self, interaction_type=None):
+        self.id = random.getrandbits(48)
+        if interaction_type is not None:
+            self.type = interaction_type
+        self.user = FakeUser()
+        self.response = FakeResponse()
+        self.followup = FakeFollowup()
+
+
+# ===== 시나리오 =====
+
+async def scenario_bis():
+    require_fixture("data/class.json")
+    from services.wowhead.bis import Bis
+    cog = Bis(None)
+    await cog.cog_load()
+    await Bis.bis_links.callback(cog, FakeInteraction(), next(iter(cog.wow_classes), "전사"))
+
+
+def _stats_page(rows: int) -> str:
+    specs = ["혈기", "복수", "화염", "냉기", "신성", "회복"]
+    body = "".join(
+        f"<tr><td>{specs[i % len(specs)]} 레이드 TOP 50</td><td>치명 {i % 40}%</td><td>가속 {i % 30}%</td>"
+        f"<td>특화 {i % 20}%</td><td>유연 {i % 10}%</td></tr>"
+        for i in range(rows)
+    )
+    return f"<html><body><table><tbody>{body}</tbody></table></body></html>"
+
+
+async def scenario_secondary_stats():
+    from services.community import secondary_stats
+
+    page = _stats_page(3000)
+
+    async def handle(request):
+        return web.Response(text=page, content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/", handle)
+    app.router.add_get("/raid/", handle)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    original_url = secondary_stats.WOWTAT_URL
+    secondary_stats.WOWTAT_URL = f"http://127.0.0.1:{port}"
+    try:
+        select = secondary_stats.SpecSelect("딜러")
+        select._values = ["화염"]
+        await select.callback(FakeInteraction(discord.InteractionType.component))
+    finally:
+        secondary_stats.WOWTAT_URL = original_url
+        await runner.cleanup()
+
+
+async def scenario_emoji_snapshot():
+    require_fixture("data/server_emojis.json")
+    from cogs.core.emoji_sync import EmojiSync
+    await EmojiSync(None).cog_load()
+
+
+async def scenario_member_roster():
+    require_fixture("member.txt")
+    from services.member_roster import MemberRoster
+    await MemberRoster().ensure_fresh()
+
+
+async def scenario_character_autocomplete():
+    from services.character_index import CharacterEntry, character_index
+    from utils.autocomplete import character_autocomplete
+
+    def build_index():
+        syllables = "가나다라마바사아자차카타파하비수긔별빛"
+        character_index.build(
+            CharacterEntry(i, "".join(random.choice(syllables) for _ in range(random.randint(2, 6))),
+                           random.choice(["azshara", "hyjal", "durotan"]), i % 3 == 0)
+            for i in range(20000)
+        )
+
+    # 인덱스 구축은 봇에서도 시작 시 한 번뿐이라 검사 대상에서 제외
+    await asyncio.to_thread(build_index)
+    for query in ["", "비", "비수", "ㅂㅅ", "가나다"]:
+        await character_autocomplete(FakeInteraction(), query)
+
+
+async def scenario_blocking_sleep():
+    """--self-test용: 루프를 일부러 막는 핸들러"""
+    time.sleep(0.3)
+
+
+SCENARIOS = [
+    ("/비스", scenario_bis),
+    ("/이차스탯 전문화 선택", scenario_secondary_stats),
+    ("이모티콘 스냅샷 로딩", scenario_emoji_snapshot),
+    ("member.txt 로딩", scenario_member_roster),
+    ("캐릭터 자동완성", scenario_character_autocomplete),
+]
+
+
+async def run(budget: float, self_test: bool) -> int:
+    scenarios = SCENARIOS + ([("self-test time.sleep", scenario_blocking_sleep)] if self_test else [])
+    watchdog = LoopWatchdog(budget=budget, interval=0.01, capture_stacks=True)
+    watchdog.start()
+    await asyncio.sleep(0.05)
+
+    failures = 0
+    try:
+        for name, scenario in scenarios:
+            before = len(watchdog.blocks)
+            started = time.perf_counter()
+            error = None
+            try:
+                await scenario()
+                status = "ok"
+            except SkipScenario as e:
+                status = f"건너뜀 ({e})"
+            except Exception as e:
+                # 리팩터링으로 핸들러가 깨진 경우: 아무것도 검사하지 못했으므로 실패
+                error = f"{type(e).__name__}: {e}"
+            # 마지막 막힘 기록이 루프로 넘어올 시간
+            await asyncio.sleep(budget + 0.05)
+            elapsed = (time.perf_counter() - started) * 1000
+            blocks = list(watchdog.blocks)[before:]
+
+            if error:
+                failures += 1
+                print(f"❌ {name}: 오류 - {error} ({elapsed:.0f}ms)")
+            elif blocks:
+                failures += 1
+                print(f"❌ {name}: {len(blocks)}회 막힘 ({elapsed:.0f}ms)")
+                for block in blocks:
+                    print(f"   {block.stalled * 1000:.0f}ms 이상 - {block.site}")
+            else:
+                print(f"✅ {name}: {status} ({elapsed:.0f}ms)")
+    finally:
+        await watchdog.stop()
+        await close_session()
+
+    print(f"\n예산 {budget * 1000:.0f}ms, 실패 {failures}/{len(scenarios)}")
+    if self_test:
+        # 자체 검사 시나리오는 실패해야 정상
+        return 0 if failures == 1 else 1
+    return 1 if failures else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="이벤트 루프 막힘 검사")
+    parser.add_argument("--budget-ms", type=int, default=int(os.getenv("LOOP_BLOCK_BUDGET_MS", "50")))
+    parser.add_argument("--self-test", action="store_true")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(args.budget_ms / 1000, args.self_test)))
+
+
+if __name__ == "__main__":
+    main()
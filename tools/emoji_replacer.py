@@ -3,13 +3,21 @@
 emoji_replacer.py
 
 디스코드 서버에서 특정 이모티콘을 다른 이모티콘으로 일괄 변경하는 스크립트
+(멤버 목록은 봇이 유지하는 guild_members 스냅샷에서 읽고, 변경에만 REST 전용 클라이언트 사용)
 """
-import discord
 import asyncio
 import os
+import sys
 from typing import Dict, List
 from dotenv import load_dotenv
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db.database_manager import DatabaseManager
+from services.bulk_member_edit import BulkMemberEditor, MemberEdit, open_rest_client
+from services.guild_member_snapshot import SnapshotMember, get_snapshot_synced_at, load_guild_members
+from utils.logging_config import setup_logging
+
 load_dotenv()  # .env 파일 로드
 
 # 설정값
@@ -19,52 +27,34 @@ BOT_TOKEN = os.getenv("DISCORD_TOKEN")
 class EmojiReplacer:
     def __init__(self):
         self.bot = None
-        self.guild = None
-        
-    async def connect_to_discord(self):
-        """디스코드 봇 연결"""
-        intents = discord.Intents.default()
-        intents.members = True
-        
-        self.bot = discord.Client(intents=intents)
-        
-        ready_future = asyncio.Future()
-        
-        @self.bot.event
-        async def on_ready():
-            print(f">>> 봇 로그인 완료: {self.bot.user}")
-            self.guild = self.bot.get_guild(GUILD_ID)
-            if self.guild:
-                print(f">>> 길드 연결 완료: {self.guild.name} (멤버수: {self.guild.member_count})")
-                ready_future.set_result(True)
-            else:
-                print(f">>> 길드를 찾을 수 없음: {GUILD_ID}")
-                ready_future.set_exception(Exception(f"길드를 찾을 수 없음: {GUILD_ID}"))
+        self.members: List[SnapshotMember] = []
+        self.db_manager = DatabaseManager()
         
-        bot_task = asyncio.create_task(self.bot.start(BOT_TOKEN))
+    async def load_members(self):
+        """봇이 유지하는 guild_members 스냅샷에서 멤버 목록 읽기 (게이트웨이 로그인 없음)"""
+        synced_at = await get_snapshot_synced_at(self.db_manager, GUILD_ID)
+        if synced_at is None:
+            raise Exception(f"guild_members 스냅샷이 비어 있음: {GUILD_ID} (봇을 먼저 실행하세요)")
         
-        try:
-            await asyncio.wait_for(ready_future, timeout=30.0)
-            print(">>> 디스코드 연결 완료")
-        except asyncio.TimeoutError:
-            print(">>> 디스코드 연결 타임아웃")
-            bot_task.cancel()
-            raise
-        except Exception as e:
-            print(f">>> 디스코드 연결 오류: {e}")
-            bot_task.cancel()
-            raise
+        self.members = await load_guild_members(self.db_manager, GUILD_ID)
+        print(f">>> 멤버 스냅샷 로딩 완료: {len(self.members)}명 (최종 반영: {synced_at:%Y-%m-%d %H:%M:%S})")
+
+    async def connect(self):
+        """DB 연결 + 멤버 스냅샷 로딩 + REST 전용 클라이언트 로그인"""
+        await self.db_manager.create_pool()
+        await self.load_members()
+        self.bot = await open_rest_client(BOT_TOKEN)
 
-    async def find_members_with_emoji(self, target_emoji: str) -> List[discord.Member]:
+    async def close(self):
+        if self.bot and not self.bot.is_closed():
+            await self.bot.close()
+            print(">>> 디스코드 REST 세션 종료")
+        await self.db_manager.close_pool()
+
+    async def find_members_with_emoji(self, target_emoji: str) -> List[SnapshotMember]:
         """특정 이모티콘이 붙은 멤버들 찾기"""
-        if not self.guild:
-            return []
-        
         matching_members = []
-        for member in self.guild.members:
-            if member.bot:
-                continue
-                
+        for member in self.members:
             if member.display_name.startswith(target_emoji):
                 matching_members.append(member)
         
@@ -79,9 +69,6 @@ class EmojiReplacer:
 
     async def replace_emoji_batch(self, old_emoji: str, new_emoji: str, dry_run: bool = True) -> Dict[str, int]:
         """이모티콘 일괄 변경"""
-        if not self.guild:
-            return {"error": 1}
-        
         # 대상 멤버 찾기
         target_members = await self.find_members_with_emoji(old_emoji)
         
@@ -89,54 +76,36 @@ class EmojiReplacer:
             print(f">>> {old_emoji} 이모티콘이 붙은 멤버가 없어요")
             return {"found": 0}
         
-        # 미리보기 모드
+        edits = [
+            MemberEdit(member.id, member.display_name, member.display_name.replace(old_emoji, new_emoji, 1),  # 첫 번째만 변경
+                       payload=member)
+            for member in target_members
+        ]
+        
+        async def apply_to_snapshot(edit: MemberEdit):
+            # 봇이 스냅샷을 갱신하기 전에 같은 세션에서 다시 조회해도 바뀐 닉네임이 보이도록
+            edit.payload.nick = edit.payload.display_name = edit.new_nick
+        
+        # 미리보기와 실제 변경 모두 같은 엔진 경로 사용
+        label = f"emoji_replacer_{old_emoji.encode().hex()}_{new_emoji.encode().hex()}"
+        editor = BulkMemberEditor(self.bot, GUILD_ID, label)
+        
         if dry_run:
             print(f"\n>>> 미리보기 모드 (실제 변경 안함)")
-            print(f">>> {old_emoji} → {new_emoji} 변경 예정:")
-            for i, member in enumerate(target_members, 1):
-                old_name = member.display_name
-                new_name = old_name.replace(old_emoji, new_emoji, 1)  # 첫 번째만 변경
-                print(f">>>   [{i}] {old_name} → {new_name}")
-            
-            print(f"\n>>> 총 {len(target_members)}명 변경 예정")
+        else:
+            print(f"\n>>> 실제 변경 시작: {old_emoji} → {new_emoji}")
+        
+        report = await editor.run(edits, dry_run=dry_run, on_success=apply_to_snapshot)
+        report.print_summary()
+        
+        if dry_run:
             print(f">>> 실제 변경하려면 dry_run=False로 다시 실행하세요")
-            return {"preview": len(target_members)}
-        
-        # 실제 변경 수행
-        print(f"\n>>> 실제 변경 시작: {old_emoji} → {new_emoji}")
-        
-        success_count = 0
-        error_count = 0
-        permission_error_count = 0
-        
-        for i, member in enumerate(target_members, 1):
-            try:
-                old_name = member.display_name
-                new_name = old_name.replace(old_emoji, new_emoji, 1)  # 첫 번째만 변경
-                
-                await member.edit(nick=new_name)
-                success_count += 1
-                print(f">>> [{i}/{len(target_members)}] 성공: {old_name} → {new_name}")
-                
-                # API 제한을 위한 대기
-                await asyncio.sleep(0.5)
-                
-            except discord.Forbidden:
-                permission_error_count += 1
-                print(f">>> [{i}/{len(target_members)}] 권한 부족: {member.display_name}")
-            except Exception as e:
-                error_count += 1
-                print(f">>> [{i}/{len(target_members)}] 오류: {member.display_name} - {e}")
-        
-        print(f"\n>>> 변경 완료!")
-        print(f">>> 성공: {success_count}명")
-        print(f">>> 권한 부족: {permission_error_count}명") 
-        print(f">>> 기타 오류: {error_count}명")
+            return {"preview": report.succeeded}
         
         return {
-            "success": success_count,
-            "permission_error": permission_error_count,
-            "error": error_count
+            "success": report.succeeded,
+            "permission_error": report.forbidden,
+            "error": report.failed
         }
 
     async def interactive_mode(self):
@@ -146,7 +115,7 @@ class EmojiReplacer:
         print("="*50)
         
         while True:
-            print(f"\n현재 서버: {self.guild.name}")
+            print(f"\n현재 서버: {GUILD_ID} (멤버 {len(self.members)}명)")
             print("1. 이모티콘 변경")
             print("2. 특정 이모티콘 멤버 조회")
             print("3. 종료")
@@ -208,11 +177,8 @@ class EmojiReplacer:
         try:
             print(">>> 이모티콘 일괄 변경 스크립트 시작")
             
-            # 디스코드 연결
-            await self.connect_to_discord()
-            
-            if not self.guild:
-                raise Exception("길드 연결 실패")
+            # 멤버 스냅샷 + REST 클라이언트 준비
+            await self.connect()
             
             # 대화형 모드 시작
             await self.interactive_mode()
@@ -220,28 +186,31 @@ class EmojiReplacer:
         except Exception as e:
             print(f">>> 실행 오류: {e}")
         finally:
-            if self.bot and not self.bot.is_closed():
-                await self.bot.close()
-                print(">>> 디스코드 연결 종료")
+            await self.close()
 
 # 간단한 사용 예시 함수들
 async def quick_replace(old_emoji: str, new_emoji: str, dry_run: bool = True):
     """빠른 변경 함수"""
     replacer = EmojiReplacer()
     try:
-        await replacer.connect_to_discord()
+        await replacer.connect()
         result = await replacer.replace_emoji_batch(old_emoji, new_emoji, dry_run)
         return result
     finally:
-        if replacer.bot and not replacer.bot.is_closed():
-            await replacer.bot.close()
+        await replacer.close()
 
 async def main():
     """메인 함수"""
+    setup_logging()
+    
     if not BOT_TOKEN:
         print(">>> DISCORD_TOKEN 환경변수가 없습니다")
         return
     
+    if not os.getenv("DATABASE_URL"):
+        print(">>> DATABASE_URL 환경변수가 없습니다")
+        return
+    
     replacer = EmojiReplacer()
     await replacer.run()
 
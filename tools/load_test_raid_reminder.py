@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+tools/load_test_raid_reminder.py
+
+레이드 알림 발송 부하 테스트 (디스코드 HTTP 계층과 발송 기록 저장소를 가짜로 대체)
+- 500명에게 DM 발송: 전역 발송 예산 준수, 동시 발송 수, 소요 시간 확인
+- 같은 발송 기록으로 다시 실행(재시작 상황)했을 때 중복 발송 0건인지 확인
+- discord.py HTTPClient를 거치는 발송 (aiohttp 세션만 가짜 API로 대체):
+  버킷 헤더(X-RateLimit-*)를 따라 한도를 넘기지 않는지, 429를 받으면 재시도해서 결국 보내는지 확인
+
+사용법: python tools/load_test_raid_reminder.py [수신자수] [초당발송수]
+"""
+import asyncio
+import os
+import random
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime
+from urllib.parse import urlparse
+
+import discord
+import orjson
+from multidict import CIMultiDict
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.raid_reminder_service import (
+    MODE_DM, STATE_SENDING, RaidReminderService, RateBudget, ReminderRule
+)
+
+INSTANCE = {
+    'id': 1, 'instance_datetime': datetime(2025, 1, 2, 21, 0), 'discord_channel_id': None,
+    'event_name': '정규 공대', 'content_name': '해방 언더마인', 'difficulty': '영웅',
+}
+# 규칙 시각(20:00) 직후에 발송하는 상황
+NOW = datetime(2025, 1, 2, 20, 0, 5)
+
+
+def make_recipients(count: int):
+    return [
+        {'discord_id': str(100000 + i), 'character_name': f'캐릭터{i}',
+         'participation_status': 'confirmed' if i % 3 else 'tentative'}
+        for i in range(count)
+    ]
+
+
+class FakeResponse:
+    status = 403
+    reason = "Forbidden"
+
+
+class FakeDiscordHTTP:
+    """디스코드 발송 흉내 (지연 30~120ms, 2%는 DM 차단, 1%는 일시적 오류)"""
+
+    def __init__(self, rng: random.Random):
+        self.rng = rng
+        self.sent = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.send_times = []
+
+    async def send_dm(self, discord_id: int, content: str):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        self.send_times.append(time.monotonic())
+        try:
+            await asyncio.sleep(self.rng.uniform(0.03, 0.12))
+            roll = self.rng.random()
+            if roll < 0.02:
+                raise discord.Forbidden(FakeResponse(), "Cannot send messages to this user")
+            if roll < 0.03:
+                raise ConnectionResetError("일시적 네트워크 오류")
+            self.sent.append(discord_id)
+        finally:
+            self.in_flight -= 1
+
+    async def send_channel(self, channel_id: int, content: str):
+        self.sent.append(channel_id)
+
+
+class MemoryDeliveryStore:
+    """raid_reminder_deliveries 테이블 대신 메모리 사용 (재시작 간에 공유)"""
+
+    def __init__(self):
+        self.rows = {}
+
+    async def claim(self, instance_id, offset_minutes, recipient_keys):
+        claimed = []
+        for key in recipient_keys:
+            row_key = (instance_id, offset_minutes, key)
+            if row_key not in self.rows:
+                self.rows[row_key] = (STATE_SENDING, None)
+                claimed.append(key)
+        return claimed
+
+    async def finish(self, instance_id, offset_minutes, results):
+        for key, state, error in results:
+            self.rows[(instance_id, offset_minutes, key)] = (state, error)
+
+    async def release(self, instance_id, offset_minutes, recipient_keys):
+        for key in recipient_keys:
+            self.rows.pop((instance_id, offset_minutes, key), None)
+
+
+class FakeAPIResponse:
+    """aiohttp.ClientResponse 대신 (discord.py가 읽는 속성만)"""
+
+    def __init__(self, status: int, body, headers: dict):
+        self.status = status
+        self.reason = {200: "OK", 403: "Forbidden", 429: "Too Many Requests"}.get(status, "")
+        self.headers = CIMultiDict(headers)
+        self.headers['Content-Type'] = 'application/json'
+        self._body = orjson.dumps(body).decode()
+
+    async def text(self, encoding='utf-8'):
+        return self._body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeDiscordAPI:
+    """HTTPClient의 aiohttp 세션 자리에 들어가는 가짜 디스코드 API
+
+    - 버킷마다 고정 창(window) 한도를 두고 X-RateLimit-* 헤더로 알려준다
+      (DM 채널 생성은 전체가 한 버킷, 메시지 전송은 채널별 버킷)
+    - 한도를 넘긴 요청은 429 (클라이언트가 헤더를 무시했다는 뜻이므로 over_limit으로 따로 센다)
+    - 메시지 전송의 3%는 한도와 무관한 429(하위 한도), 2%는 DM 차단(403)
+    """
+
+    closed = False
+
+    def __init__(self, rng: random.Random, dm_limit: int = 20, window: float = 1.0):
+        self.rng = rng
+        self.limits = {"dm_channel": dm_limit, "message": 5}
+        self.window = window
+        self.windows = {}               # 버킷 -> (창 시작, 사용 수)
+        self.over_limit = 0
+        self.injected_429 = 0
+        self.blocked = set()
+        self.delivered = defaultdict(int)
+        self.requests = 0
+
+    def _take(self, bucket_hash: str, major: str):
+        """(허용 여부, 응답 헤더)"""
+        now = time.monotonic()
+        started, used = self.windows.get((bucket_hash, major), (now, 0))
+        if now - started >= self.window:
+            started, used = now, 0
+        limit = self.limits[bucket_hash]
+        allowed = used < limit
+        if allowed:
+            used += 1
+        self.windows[(bucket_hash, major)] = (started, used)
+        reset_after = max(0.0, self.window - (now - started))
+        return allowed, {
+            'X-RateLimit-Bucket': bucket_hash,
+            'X-RateLimit-Limit': str(limit),
+            'X-RateLimit-Remaining': str(limit - used),
+            'X-RateLimit-Reset-After': f"{reset_after:.3f}",
+            'X-RateLimit-Reset': f"{time.time() + reset_after:.3f}",
+        }
+
+    @staticmethod
+    def _rate_limited(headers: dict, retry_after: float) -> FakeAPIResponse:
+        # 디스코드가 보낸 429에는 Via 헤더가 있다 (없으면 discord.py가 Cloudflare 차단으로 본다)
+        return FakeAPIResponse(429, {'message': 'You are being rate limited.', 'retry_after': retry_after,
+                                     'global': False}, {**headers, 'Via': '1.1 google'})
+
+    def request(self, method: str, url: str, **kwargs) -> FakeAPIResponse:
+        self.requests += 1
+        path = urlparse(url).path.split('/api/v10', 1)[-1]
+        if method == 'POST' and path == '/users/@me/channels':
+            recipient_id = int(orjson.loads(kwargs['data'])['recipient_id'])
+            allowed, headers = self._take("dm_channel", "")
+            if not allowed:
+                self.over_limit += 1
+                return self._rate_limited(headers, float(headers['X-RateLimit-Reset-After']))
+            if self.rng.random() < 0.02:
+                self.blocked.add(recipient_id)
+            return FakeAPIResponse(200, {'id': str(recipient_id + 10 ** 9), 'type': 1}, headers)
+
+        if method == 'POST' and path.startswith('/channels/') and path.endswith('/messages'):
+            channel_id = int(path.split('/')[2])
+            allowed, headers = self._take("message", str(channel_id))
+            if not allowed:
+                self.over_limit += 1
+                return self._rate_limited(headers, float(headers['X-RateLimit-Reset-After']))
+            if self.rng.random() < 0.03:
+                self.injected_429 += 1
+                return self._rate_limited(headers, 0.2)
+            if channel_id - 10 ** 9 in self.blocked:
+                return FakeAPIResponse(403, {'message': 'Cannot send messages to this user', 'code': 50007}, headers)
+            self.delivered[channel_id - 10 ** 9] += 1
+            return FakeAPIResponse(200, {'id': str(self.requests), 'channel_id': str(channel_id)}, headers)
+
+        return FakeAPIResponse(404, {'message': 'Unknown route', 'code': 0}, {})
+
+
+class HTTPClientSender:
+    """discord.py HTTPClient로 발송 (User.send와 같은 순서: DM 채널 생성 -> 메시지 전송)"""
+
+    def __init__(self, http: discord.http.HTTPClient):
+        self.http = http
+
+    async def send_dm(self, discord_id: int, content: str):
+        channel = await self.http.start_private_message(discord_id)
+        with discord.http.handle_message_parameters(content=content) as params:
+            await self.http.send_message(int(channel['id']), params=params)
+
+    async def send_channel(self, channel_id: int, content: str):
+        with discord.http.handle_message_parameters(content=content) as params:
+            await self.http.send_message(channel_id, params=params)
+
+
+async def run_http_layer(count: int, rate: float) -> bool:
+    """discord.py HTTP 계층을 거치는 발송 (429/버킷 처리)"""
+    api = FakeDiscordAPI(random.Random(11))
+    http = discord.http.HTTPClient(asyncio.get_running_loop())
+    http._HTTPClient__session = api
+    http._global_over = asyncio.Event()
+    http._global_over.set()
+    http.token = "load-test"
+
+    rule = ReminderRule(60, MODE_DM)
+    recipients = make_recipients(count)
+    service = RaidReminderService(None, HTTPClientSender(http), store=MemoryDeliveryStore(), rules=[rule],
+                                  budget=RateBudget(rate, RaidReminderService.BURST))
+    started = time.monotonic()
+    report = await service.fan_out(INSTANCE, rule, recipients, NOW)
+    elapsed = time.monotonic() - started
+
+    duplicates = sum(1 for n in api.delivered.values() if n > 1)
+    learned = http._bucket_hashes.get('POST /users/@me/channels')
+    print(f">>> HTTP 계층 발송 ({count}명, DM 채널 버킷 {api.limits['dm_channel']}/{api.window:.0f}초): "
+          f"성공 {report.sent}, 실패 {report.failed}, 재시도 대기 {report.retry}, 소요 {elapsed:.1f}초")
+    print(f">>> 429: 하위 한도 {api.injected_429}건 (재시도됨), 버킷 한도 초과 {api.over_limit}건, "
+          f"학습한 버킷 해시 {learned}, 중복 {duplicates}건")
+
+    return (
+        api.injected_429 > 0
+        and api.over_limit == 0
+        and learned == "dm_channel"
+        and duplicates == 0
+        and report.retry == 0
+        and report.failed == len(api.blocked)
+        and report.sent == len(api.delivered) == count - len(api.blocked)
+    )
+
+
+async def run(count: int, rate: float):
+    rng = random.Random(7)
+    store = MemoryDeliveryStore()
+    rule = ReminderRule(60, MODE_DM)
+    instance = INSTANCE
+    recipients = make_recipients(count)
+
+    http = FakeDiscordHTTP(rng)
+    service = RaidReminderService(None, http, store=store, rules=[rule],
+                                  budget=RateBudget(rate, RaidReminderService.BURST))
+    started = time.monotonic()
+    first = await service.fan_out(instance, rule, recipients, NOW)
+    elapsed = time.monotonic() - started
+
+    # 1초 단위 최대 발송 수 (버스트 구간 제외)
+    window_max = 0
+    for i, t in enumerate(http.send_times):
+        window = sum(1 for u in http.send_times[i:] if u - t < 1.0)
+        window_max = max(window_max, window)
+
+    print(f">>> 1차 발송: 성공 {first.sent}, 실패 {first.failed}, 재시도 대기 {first.retry}, 소요 {elapsed:.1f}초")
+    print(f">>> 최대 동시 발송: {http.max_in_flight} (제한 {RaidReminderService.CONCURRENCY}), "
+          f"1초 최대 발송: {window_max} (예산 {rate:.0f}/초 + 버스트 {RaidReminderService.BURST})")
+
+    # 재시작 상황: 새 서비스 인스턴스 + 같은 발송 기록
+    restarted = RaidReminderService(None, http, store=store, rules=[rule],
+                                    budget=RateBudget(rate, RaidReminderService.BURST))
+    second = await restarted.fan_out(instance, rule, recipients, NOW)
+    print(f">>> 재시작 후 발송: 성공 {second.sent}, 실패 {second.failed}, 건너뜀 {second.skipped} "
+          f"(일시적 오류 {first.retry}건만 재발송 대상)")
+
+    duplicates = len(http.sent) - len(set(http.sent))
+    print(f">>> 중복 발송: {duplicates}건")
+
+    header = service.format_header(instance, NOW)
+    # 재시작으로 늦게 보내는 알림은 규칙 시간(1시간)이 아니라 실제 남은 시간
+    late_header = service.format_header(instance, datetime(2025, 1, 2, 20, 30))
+    print(f">>> 알림 머리말: {header.splitlines()[0]} / 늦은 발송: {late_header.splitlines()[0]}")
+
+    # DM 채널 생성 버킷이 병목이라 수신자를 줄여서
+    http_ok = await run_http_layer(max(1, count // 5), rate)
+
+    ok = (
+        http_ok
+        and "시작 1시간 전" in header
+        and "시작 30분 전" in late_header
+        and duplicates == 0
+        and http.max_in_flight <= RaidReminderService.CONCURRENCY
+        and window_max <= rate + RaidReminderService.BURST
+        and second.sent + second.failed + second.retry == first.retry
+    )
+    if not ok:
+        print(">>> 부하 테스트 실패")
+        sys.exit(1)
+    print(">>> 부하 테스트 통과")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    rate = float(sys.argv[2]) if len(sys.argv) > 2 else 50.0
+    asyncio.run(run(count, rate))
+
+
+if __name__ == "__main__":
+    main()
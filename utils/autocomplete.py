@@ -0,0 +1,60 @@
+"""
+utils/autocomplete.py
+
+슬래시 명령어 자동완성 (캐릭터명/서버명)
+메모리 인덱스에서만 응답하고 키 입력마다 DB나 API를 호출하지 않는다.
+"""
+from typing import List, Optional, Tuple
+
+from discord import app_commands, Interaction
+
+from services.character_index import character_index
+from utils.wow_translation import REALM_INDEX, translate_realm_en_to_kr
+
+# 디스코드 자동완성 선택지 최대 개수
+MAX_CHOICES = 25
+
+
+def character_choice_pairs(current: str, limit: int = MAX_CHOICES) -> List[Tuple[str, str]]:
+    """캐릭터 자동완성 (표시명, 값) 목록"""
+    pairs = []
+    for entry in character_index.search(current, limit):
+        realm_kr = translate_realm_en_to_kr(entry.realm_slug)
+        guild_mark = " ⭐" if entry.is_guild_member else ""
+        pairs.append((f"{entry.character_name} - {realm_kr}{guild_mark}", entry.character_name))
+    return pairs
+
+
+def realm_choice_pairs(current: str, character_name: Optional[str] = None,
+                       limit: int = MAX_CHOICES) -> List[Tuple[str, str]]:
+    """서버 자동완성 (표시명, 값) 목록 - 캐릭터가 정해져 있으면 그 캐릭터의 서버 우선"""
+    pairs = []
+    seen = set()
+    matched = REALM_INDEX.search(current, limit)
+
+    if character_name:
+        for entry in character_index.get(character_name):
+            record = REALM_INDEX.lookup(entry.realm_slug)
+            if record and (not current or record in matched):
+                pairs.append((f"{record.display_name} · {character_name}", record.name_kr))
+                seen.add(record)
+
+    for record in matched:
+        if record not in seen:
+            pairs.append((record.display_name, record.name_kr))
+    return pairs[:limit]
+
+
+async def character_autocomplete(interaction: Interaction, current: str) -> List[app_commands.Choice[str]]:
+    """캐릭터명 자동완성"""
+    return [app_commands.Choice(name=name[:100], value=value) for name, value in character_choice_pairs(current)]
+
+
+async def realm_autocomplete(interaction: Interaction, current: str) -> List[app_commands.Choice[str]]:
+    """서버명 자동완성 (같은 명령어에 입력된 캐릭터명 참고)"""
+    namespace = interaction.namespace
+    character_name = getattr(namespace, "캐릭터명", None) or getattr(namespace, "character_name", None)
+    return [
+        app_commands.Choice(name=name[:100], value=value)
+        for name, value in realm_choice_pairs(current, character_name)
+    ]
@@ -1,94 +1,108 @@
 # utils\character_validator.py
 
+import logging
+from typing import Iterable, Optional, Tuple
+
 import aiohttp
-import urllib.parse
+
+from services.api_cache import api_cache, fetch_json
+
+logger = logging.getLogger(__name__)
+
+PROFILE_ENDPOINT = "https://raider.io/api/v1/characters/profile"
+# 프로필 캐시 유지 시간 (초) - 있는 캐릭터 / 없는 캐릭터(404)
+PROFILE_TTL = 3600
+PROFILE_MISS_TTL = 600
+
+
+def _profile_params(realm: str, character_name: str) -> dict:
+    return {"region": "kr", "realm": realm, "name": character_name}
+
+
+async def prefetch_character_profiles(realms: Iterable[str], character_name: str):
+    """여러 서버의 프로필 캐시를 한 번에 불러오기 (서버를 하나씩 검사하기 전에 호출)"""
+    await api_cache.get_many(PROFILE_ENDPOINT, [_profile_params(realm, character_name) for realm in realms])
+
+
+async def fetch_character_profile(realm: str, character_name: str) -> Tuple[int, Optional[dict]]:
+    """
+    Raider.IO 캐릭터 프로필 조회 (API 캐시 경유, 만료 시 조건부 요청)
+
+    Returns:
+        (HTTP 상태 코드, 응답 JSON 또는 None)
+    """
+    result = await fetch_json(PROFILE_ENDPOINT, _profile_params(realm, character_name),
+                              ttl=PROFILE_TTL, cache_statuses=(200, 404), miss_ttl=PROFILE_MISS_TTL)
+    logger.debug("캐릭터 프로필: %s-%s (%s, %s)", character_name, realm, result.status, result.source)
+    return result.status, result.payload
+
 
 async def validate_character(realm: str, character_name: str) -> bool:
     """
     Raider.IO API를 사용해 캐릭터의 유효성을 검사합니다.
-    
+
     Args:
         realm (str): 서버명 (예: "Azshara", "Hyjal")
         character_name (str): 캐릭터명 (예: "물고긔")
-    
+
     Returns:
         bool: 캐릭터가 존재하면 True, 없거나 오류시 False
     """
     try:
-        # URL 인코딩
-        encoded_name = urllib.parse.quote(character_name)
-        encoded_realm = urllib.parse.quote(realm)
-        
-        url = f"https://raider.io/api/v1/characters/profile?region=kr&realm={encoded_realm}&name={encoded_name}"
-        
-        print(f">>> 캐릭터 유효성 검사 시작: {character_name}-{realm}")
-        print(f">>> API 요청 URL: {url}")
-        
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as response:
-                print(f">>> API 응답 상태 코드: {response.status}")
-                
-                if response.status == 200:
-                    data = await response.json()
-                    
-                    # 필수 필드 확인
-                    if 'name' in data and 'realm' in data:
-                        print(f">>> 캐릭터 유효성 검사 성공: {data['name']}-{data['realm']}")
-                        return True
-                    else:
-                        print(">>> 응답 데이터에 필수 필드가 없음")
-                        return False
-                        
-                elif response.status == 404:
-                    print(f">>> 캐릭터를 찾을 수 없음: {character_name}-{realm}")
-                    return False
-                else:
-                    print(f">>> API 요청 실패: HTTP {response.status}")
-                    return False
-                    
+        logger.debug("캐릭터 유효성 검사 시작: %s-%s", character_name, realm)
+
+        status, data = await fetch_character_profile(realm, character_name)
+
+        if status == 200:
+            # 필수 필드 확인
+            if 'name' in data and 'realm' in data:
+                logger.debug("캐릭터 유효성 검사 성공: %s-%s", data['name'], data['realm'])
+                return True
+            else:
+                logger.warning("응답 데이터에 필수 필드가 없음: %s-%s", character_name, realm)
+                return False
+
+        elif status == 404:
+            logger.debug("캐릭터를 찾을 수 없음: %s-%s", character_name, realm)
+            return False
+        else:
+            logger.warning(f"API 요청 실패: HTTP {status}")
+            return False
+
     except aiohttp.ClientError as e:
-        print(f">>> 네트워크 오류 발생: {e}")
+        logger.error(f"네트워크 오류 발생: {e}")
         return False
     except Exception as e:
-        print(f">>> 예상치 못한 오류 발생: {e}")
+        logger.error(f"예상치 못한 오류 발생: {e}")
         return False
 
 async def get_character_info(realm: str, character_name: str) -> dict:
     """
     Raider.IO API를 사용해 캐릭터 정보를 가져옵니다.
-    
+    (validate_character 직후 호출하면 캐시된 응답을 그대로 사용)
+
     Args:
-        realm (str): 서버명 (예: "Azshara", "Hyjal")  
+        realm (str): 서버명 (예: "Azshara", "Hyjal")
         character_name (str): 캐릭터명 (예: "물고긔")
-    
+
     Returns:
         dict: 캐릭터 정보 딕셔너리, 실패시 빈 딕셔너리
     """
     try:
-        # URL 인코딩
-        encoded_name = urllib.parse.quote(character_name)
-        encoded_realm = urllib.parse.quote(realm)
-        
-        url = f"https://raider.io/api/v1/characters/profile?region=kr&realm={encoded_realm}&name={encoded_name}"
-        
-        print(f">>> 캐릭터 정보 조회 시작: {character_name}-{realm}")
-        print(f">>> API 요청 URL: {url}")
-        
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as response:
-                print(f">>> API 응답 상태 코드: {response.status}")
-                
-                if response.status == 200:
-                    data = await response.json()
-                    print(f">>> 캐릭터 정보 조회 성공: {data.get('name', 'Unknown')}-{data.get('realm', 'Unknown')}")
-                    return data
-                else:
-                    print(f">>> 캐릭터 정보 조회 실패: HTTP {response.status}")
-                    return {}
-                    
+        logger.debug("캐릭터 정보 조회 시작: %s-%s", character_name, realm)
+
+        status, data = await fetch_character_profile(realm, character_name)
+
+        if status == 200:
+            logger.debug("캐릭터 정보 조회 성공: %s-%s", data.get('name', 'Unknown'), data.get('realm', 'Unknown'))
+            return data
+        else:
+            logger.warning(f"캐릭터 정보 조회 실패: HTTP {status}")
+            return {}
+
     except aiohttp.ClientError as e:
-        print(f">>> 네트워크 오류 발생: {e}")
+        logger.error(f"네트워크 오류 발생: {e}")
         return {}
     except Exception as e:
-        print(f">>> 예상치 못한 오류 발생: {e}")
-        return {}
\ No newline at end of file
+        logger.error(f"예상치 못한 오류 발생: {e}")
+        return {}
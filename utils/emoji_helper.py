@@ -3,10 +3,88 @@ utils/emoji_helper.py
 
 서버 이모티콘 데이터를 로딩하고 관리하는 헬퍼 함수들
 """
-import json
+import logging
 import os
+import tempfile
+import threading
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterable, Optional
+
+from utils.json_codec import dump_file, load_file
+from utils.wow_registry import WoWRegistry, class_emojis_from_data, get_wow_registry, set_wow_registry
+
+logger = logging.getLogger(__name__)
+
+EMOJI_DATA_FILE = Path(__file__).parent.parent / 'data' / 'server_emojis.json'
+# 같은 프로세스 안의 스냅샷 저장은 한 번에 하나씩
+_snapshot_lock = threading.Lock()
+
+# WoW 직업 목록 (이모티콘 이름 기준)
+WOW_CLASS_NAMES = [
+    'warrior', 'paladin', 'hunter', 'rogue', 'priest', 'shaman',
+    'mage', 'warlock', 'monk', 'druid', 'demonhunter', 'deathknight', 'evoker'
+]
+
+# 역할 관련 키워드
+ROLE_KEYWORDS = ['tank', 'heal', 'dps', 'damage']
+
+# 기타 유용한 이모티콘 키워드
+OTHER_KEYWORDS = ['check', 'cross', 'question', 'gear', 'sword', 'shield']
+
+
+def _emoji_entry(emoji) -> Dict:
+    return {
+        'id': str(emoji.id),
+        'format': str(emoji),
+        'name': emoji.name,
+        'animated': emoji.animated
+    }
+
+
+def build_emoji_data(emojis: Iterable) -> Dict:
+    """디스코드 이모티콘 목록을 server_emojis.json 형식으로 분류"""
+    wow_emojis = {}
+    wow_classes = {}
+    wow_roles = {}
+    other_emojis = {}
+    guild = None
+
+    for emoji in emojis:
+        emoji_name = emoji.name.lower()
+
+        if emoji_name.startswith('wow_'):
+            entry = _emoji_entry(emoji)
+            wow_emojis[emoji.name] = entry
+            guild = guild or emoji.guild
+
+            # wow_ 접두사 제거한 이름
+            clean_name = emoji_name[4:]
+
+            for class_name in WOW_CLASS_NAMES:
+                if class_name in clean_name:
+                    wow_classes[class_name] = entry
+                    break
+
+            for role_keyword in ROLE_KEYWORDS:
+                if role_keyword in clean_name:
+                    wow_roles[role_keyword] = entry
+                    break
+
+        elif any(keyword in emoji_name for keyword in OTHER_KEYWORDS):
+            other_emojis[emoji.name] = _emoji_entry(emoji)
+
+    return {
+        'guild_id': str(guild.id) if guild else None,
+        'guild_name': guild.name if guild else None,
+        'collected_at': datetime.now(timezone.utc).isoformat(),
+        'wow_emojis': wow_emojis,
+        'wow_classes': wow_classes,
+        'wow_roles': wow_roles,
+        'other_emojis': other_emojis,
+        'total_count': len(wow_emojis) + len(other_emojis)
+    }
+
 
 class EmojiManager:
     def __init__(self):
@@ -16,74 +94,82 @@ class EmojiManager:
         self._loaded = False
         
     def load_emojis(self) -> bool:
-        """이모티콘 데이터 로딩"""
+        """이모티콘 데이터 로딩 (봇이 서버 이모티콘을 받기 전 콜드 스타트용 스냅샷)"""
         if self._loaded:
             return True
             
         try:
-            # data/server_emojis.json 파일 경로
-            data_file = Path(__file__).parent.parent / 'data' / 'server_emojis.json'
-            
-            if not data_file.exists():
-                print(f">>> 이모티콘 파일이 존재하지 않음: {data_file}")
-                print(">>> tools/fetch_server_emojis.py를 먼저 실행해주세요")
+            if not EMOJI_DATA_FILE.exists():
+                logger.info(f"이모티콘 파일이 존재하지 않음: {EMOJI_DATA_FILE}")
+                logger.info("봇이 시작되면 서버 이모티콘으로 자동 생성됩니다")
                 return False
             
-            with open(data_file, 'r', encoding='utf-8') as f:
-                self._emojis_data = json.load(f)
-            
-            # 직업별 이모티콘 매핑 생성
-            self._class_emojis = {}
-            if 'wow_classes' in self._emojis_data:
-                for class_name, emoji_data in self._emojis_data['wow_classes'].items():
-                    self._class_emojis[class_name.lower()] = emoji_data['format']
-            
-            # 역할별 이모티콘 매핑 생성 (기본값 포함)
-            self._role_emojis = {
-                'tank': '🛡️',
-                'healer': '💚', 
-                'dps': '⚔️',
-                'damage': '⚔️'
-            }
-            
-            # 서버 이모티콘으로 덮어쓰기 (있는 경우)
-            if 'wow_roles' in self._emojis_data:
-                for role_name, emoji_data in self._emojis_data['wow_roles'].items():
-                    self._role_emojis[role_name.lower()] = emoji_data['format']
-            
-            self._loaded = True
-            print(f">>> 이모티콘 데이터 로딩 완료: {len(self._class_emojis)}개 직업, {len(self._role_emojis)}개 역할")
+            self.apply_emoji_data(load_file(EMOJI_DATA_FILE), rebuild_registry=False)
             return True
             
         except Exception as e:
-            print(f">>> 이모티콘 로딩 오류: {e}")
+            logger.error(f"이모티콘 로딩 오류: {e}")
             return False
     
-    def get_class_emoji(self, class_name: str) -> str:
-        """직업 이모티콘 가져오기"""
-        if not self._loaded:
-            self.load_emojis()
+    def apply_emoji_data(self, data: Dict, rebuild_registry: bool = True):
+        """이모티콘 데이터 적용 (직업 이모티콘은 레지스트리를 새로 만들어 교체)"""
+        self._emojis_data = data
         
-        if not self._class_emojis:
-            return "❓"  # 기본값
+        # 직업별 이모티콘 매핑 생성
+        self._class_emojis = {}
+        for class_name, emoji_data in data.get('wow_classes', {}).items():
+            self._class_emojis[class_name.lower()] = emoji_data['format']
         
-        # 다양한 형태의 직업명 처리
-        class_key = class_name.lower().strip()
+        # 역할별 이모티콘 매핑 생성 (기본값 포함)
+        self._role_emojis = {
+            'tank': '🛡️',
+            'healer': '💚', 
+            'dps': '⚔️',
+            'damage': '⚔️'
+        }
         
-        # 직접 매칭
-        if class_key in self._class_emojis:
-            return self._class_emojis[class_key]
+        # 서버 이모티콘으로 덮어쓰기 (있는 경우)
+        for role_name, emoji_data in data.get('wow_roles', {}).items():
+            self._role_emojis[role_name.lower()] = emoji_data['format']
         
-        # Death Knight -> deathknight 변환
-        class_key = class_key.replace(' ', '').replace('_', '').replace('-', '')
+        if rebuild_registry:
+            set_wow_registry(WoWRegistry(class_emojis_from_data(data)))
         
-        # 부분 매칭
-        for key, emoji in self._class_emojis.items():
-            if key.replace('_', '').replace('-', '') == class_key:
-                return emoji
+        self._loaded = True
+        logger.info(f"이모티콘 데이터 적용 완료: {len(self._class_emojis)}개 직업, {len(self._role_emojis)}개 역할")
+    
+    def update_from_discord(self, emojis: Iterable) -> Optional[Dict]:
+        """디스코드 이모티콘 목록으로 갱신 (WoW 이모티콘이 없으면 기존 데이터 유지)"""
+        data = build_emoji_data(emojis)
+        if not data['wow_emojis']:
+            logger.info("서버에서 WoW 이모티콘을 찾지 못해 기존 이모티콘 데이터 유지")
+            return None
         
-        print(f">>> 알 수 없는 직업: {class_name}")
-        return "❓"  # 알 수 없는 직업
+        self.apply_emoji_data(data)
+        return data
+    
+    def save_snapshot(self, data: Dict):
+        """콜드 스타트용 스냅샷 저장 (블로킹 I/O라 스레드에서 호출)
+
+        여러 스레드/프로세스가 동시에 저장해도 서로의 임시 파일을 덮어쓰지 않도록
+        저장마다 다른 임시 파일에 쓰고 교체한다.
+        """
+        EMOJI_DATA_FILE.parent.mkdir(exist_ok=True)
+        with _snapshot_lock:
+            fd, temp_path = tempfile.mkstemp(dir=EMOJI_DATA_FILE.parent, prefix=EMOJI_DATA_FILE.name,
+                                             suffix='.tmp')
+            os.close(fd)
+            try:
+                dump_file(temp_path, data)
+                os.replace(temp_path, EMOJI_DATA_FILE)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+    
+    def get_class_emoji(self, class_name: str) -> str:
+        """직업 이모티콘 가져오기"""
+        # 직업 이모티콘은 레지스트리에서 정규화된 키로 바로 조회
+        return get_wow_registry().class_emoji(class_name)
     
     def get_role_emoji(self, role_name: str) -> str:
         """역할 이모티콘 가져오기"""
@@ -110,7 +196,7 @@ class EmojiManager:
         if normalized_role in self._role_emojis:
             return self._role_emojis[normalized_role]
         
-        print(f">>> 알 수 없는 역할: {role_name}")
+        logger.warning(f"알 수 없는 역할: {role_name}")
         return "❓"  # 알 수 없는 역할
     
     def get_status_emoji(self, status: str) -> str:
@@ -169,6 +255,14 @@ def load_emojis() -> bool:
     """이모티콘 로딩 (편의 함수)"""
     return _emoji_manager.load_emojis()
 
+def update_emojis_from_discord(emojis: Iterable) -> Optional[Dict]:
+    """디스코드 이모티콘으로 갱신 (편의 함수)"""
+    return _emoji_manager.update_from_discord(emojis)
+
+def save_emoji_snapshot(data: Dict):
+    """이모티콘 스냅샷 저장 (편의 함수)"""
+    _emoji_manager.save_snapshot(data)
+
 def is_emojis_loaded() -> bool:
     """로딩 상태 확인 (편의 함수)"""
     return _emoji_manager.is_loaded()
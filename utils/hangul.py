@@ -0,0 +1,64 @@
+"""
+utils/hangul.py
+
+한글 검색용 헬퍼 함수들 (초성 추출, 초성 검색어 판별)
+"""
+
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+JUNGSEONG_COUNT = 21
+JONGSEONG_COUNT = 28
+
+# 초성 19자 (호환용 자모)
+CHOSUNG_LIST = [
+    "ㄱ", "ㄲ", "ㄴ", "ㄷ", "ㄸ", "ㄹ", "ㅁ", "ㅂ", "ㅃ", "ㅅ",
+    "ㅆ", "ㅇ", "ㅈ", "ㅉ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"
+]
+CHOSUNG_SET = frozenset(CHOSUNG_LIST)
+
+
+def is_hangul_syllable(char: str) -> bool:
+    """완성형 한글 음절인지 확인"""
+    return HANGUL_BASE <= ord(char) <= HANGUL_LAST
+
+
+def get_chosung(text: str) -> str:
+    """문자열의 초성만 추출 (한글이 아닌 문자는 그대로 유지)"""
+    result = []
+    for char in text:
+        if is_hangul_syllable(char):
+            index = (ord(char) - HANGUL_BASE) // (JUNGSEONG_COUNT * JONGSEONG_COUNT)
+            result.append(CHOSUNG_LIST[index])
+        else:
+            result.append(char)
+    return "".join(result)
+
+
+def is_chosung_query(text: str) -> bool:
+    """초성으로만 이루어진 검색어인지 확인 (예: ㅇㅈㅅㄹ)"""
+    return bool(text) and all(char in CHOSUNG_SET for char in text)
+
+
+def split_trailing_chosung(text: str):
+    """입력 중인 마지막 초성 분리 (예: 아즈ㅅ -> ("아즈", "ㅅ"))
+
+    IME 조합 중에는 마지막 글자가 초성만 입력된 상태일 수 있어서
+    앞부분은 음절 접두사로, 마지막 초성은 다음 글자의 초성으로 매칭한다.
+    """
+    if len(text) >= 2 and text[-1] in CHOSUNG_SET and is_hangul_syllable(text[-2]):
+        return text[:-1], text[-1]
+    return text, ""
+
+
+def normalize_search_text(text: str) -> str:
+    """검색용 정규화 (공백/하이픈/작은따옴표 제거 + 소문자)"""
+    if not text:
+        return ""
+    return (
+        text.strip()
+        .lower()
+        .replace(" ", "")
+        .replace("-", "")
+        .replace("'", "")
+        .replace("’", "")
+    )
@@ -1,28 +1,69 @@
 # utils/helpers.py
-import traceback
+import asyncio
+import logging
 from functools import wraps
 
+import discord
 
-class Logger:
-    @staticmethod
-    def info(message):
-        print(f">>> {message}")
-    
-    @staticmethod
-    def error(message, exception=None):
-        print(f">>> {message}")
-        if exception:
-            print(f">>> 스택 추적: {traceback.format_exc()}")
+from utils.metrics import observe_interaction
+from utils.tracing import current_span, end_trace, log_slow_trace, mark_error, span, start_trace
+
+logger = logging.getLogger(__name__)
+
+
+def _interaction_kind(interaction) -> str:
+    if interaction.type == discord.InteractionType.application_command:
+        return "command"
+    if interaction.type == discord.InteractionType.modal_submit:
+        return "modal"
+    return "component"
+
+
+def trace_interaction(func):
+    """인터랙션 추적 데코레이터
+
+    인터랙션 처리 전체를 루트 스팬으로 기록하고 (DB 쿼리/HTTP/Discord API 호출이 자식 스팬),
+    INTERACTION_SLOW_MS를 넘으면 스팬 트리를 로그로 남긴다.
+    이미 추적 중인 인터랙션 안에서 호출되면 자식 스팬 하나로만 기록한다.
+    """
+    name = func.__qualname__
+
+    @wraps(func)
+    async def wrapper(self, interaction, *args, **kwargs):
+        if current_span() is not None:
+            with span(name):
+                return await func(self, interaction, *args, **kwargs)
+
+        kind = _interaction_kind(interaction)
+        trace, token = start_trace(kind, name)
+        error = None
+        try:
+            return await func(self, interaction, *args, **kwargs)
+        except BaseException as e:
+            error = type(e).__name__
+            raise
+        finally:
+            slow = end_trace(trace, token, error)
+            # 슬래시 명령어 처리 시간은 cogs/core/metrics.py에서 기록
+            if kind != "command":
+                observe_interaction(kind, name, trace.root.duration, ok=trace.root.error is None)
+            if slow:
+                # asyncpg 쿼리 로거는 call_soon으로 호출되므로 마지막 쿼리 기록이 붙을 때까지 한 번 양보
+                await asyncio.sleep(0)
+                log_slow_trace(trace)
+    return wrapper
 
 
 def handle_interaction_errors(func):
-    """인터랙션 에러 처리 데코레이터"""
+    """인터랙션 에러 처리 데코레이터 (trace_interaction 포함)"""
+    @trace_interaction
     @wraps(func)
     async def wrapper(self, interaction, *args, **kwargs):
         try:
             return await func(self, interaction, *args, **kwargs)
         except Exception as e:
-            Logger.error(f"{func.__name__} 오류: {e}", e)
+            mark_error(e)
+            logger.exception(f"{func.__name__} 오류: {e}")
             
             # 이미 응답했는지 확인
             if not interaction.response.is_done():
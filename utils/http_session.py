@@ -0,0 +1,68 @@
+# utils/http_session.py
+"""
+공용 aiohttp 세션
+
+요청마다 ClientSession을 새로 만들면 커넥션 풀/DNS 캐시/TLS 세션을 매번 버리게 된다.
+봇에서는 lifecycle(main.py)이 시작 시 open_session(), 종료 시 close_session()을 호출하고,
+도구 스크립트처럼 lifecycle 없이 쓰는 경우에는 첫 사용 시 만들어진다 (끝날 때 close_session() 호출).
+
+사용법:
+    async with shared_session() as session:
+        async with session.get(url) as resp:
+            ...
+(shared_session은 세션을 닫지 않는다)
+"""
+import logging
+from contextlib import asynccontextmanager
+from typing import Optional
+
+import aiohttp
+
+from utils.metrics import http_trace_config
+
+logger = logging.getLogger(__name__)
+
+# 개별 요청 기본 타임아웃 (초)
+DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=10)
+
+_session: Optional[aiohttp.ClientSession] = None
+
+
+def _create_session() -> aiohttp.ClientSession:
+    connector = aiohttp.TCPConnector(limit=50, ttl_dns_cache=300)
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=DEFAULT_TIMEOUT,
+        trace_configs=[http_trace_config()],
+    )
+
+
+def get_session() -> aiohttp.ClientSession:
+    """공용 세션 반환 (없거나 닫혔으면 새로 생성)"""
+    global _session
+    if _session is None or _session.closed:
+        _session = _create_session()
+    return _session
+
+
+@asynccontextmanager
+async def shared_session():
+    """`async with aiohttp.ClientSession() as session:` 자리에 그대로 쓰는 공용 세션 (닫지 않음)"""
+    yield get_session()
+
+
+async def open_session():
+    get_session()
+    logger.info("공용 HTTP 세션 생성")
+
+
+async def close_session():
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+        logger.info("공용 HTTP 세션 종료")
+    _session = None
+
+
+def session_healthy() -> bool:
+    return _session is not None and not _session.closed
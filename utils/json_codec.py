@@ -0,0 +1,78 @@
+# utils/json_codec.py
+"""
+JSON 인코딩/디코딩 공용 계층
+
+orjson(C 구현)이 있으면 쓰고, 없으면 표준 json으로 대체한다.
+HTTP 응답 디코딩, 데이터 파일 읽기, asyncpg json/jsonb 타입 코덱이 모두 여기를 거친다.
+
+- loads(): str/bytes 모두 받음 (orjson은 bytes를 디코딩 없이 바로 파싱)
+- dumps(): 항상 str, 한글은 이스케이프하지 않음, 모르는 타입은 str()로
+- 키 정렬/들여쓰기는 옵션 (파일 저장, 해시 계산용)
+"""
+import json
+import logging
+from pathlib import Path
+from typing import Any, Union
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:  # 순수 파이썬 대체
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+JSONDecodeError = orjson.JSONDecodeError if orjson is not None else json.JSONDecodeError
+
+
+def _default(value: Any) -> str:
+    return str(value)
+
+
+def loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        data = bytes(data).decode("utf-8")
+    return json.loads(data)
+
+
+def dumps_bytes(value: Any, *, sort_keys: bool = False, indent: bool = False) -> bytes:
+    """UTF-8 bytes로 인코딩 (HTTP 본문/파일 쓰기에 그대로 사용)"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(value, default=_default, option=option)
+    return _stdlib_dumps(value, sort_keys, indent).encode("utf-8")
+
+
+def dumps(value: Any, *, sort_keys: bool = False, indent: bool = False) -> str:
+    if orjson is not None:
+        return dumps_bytes(value, sort_keys=sort_keys, indent=indent).decode("utf-8")
+    return _stdlib_dumps(value, sort_keys, indent)
+
+
+def _stdlib_dumps(value: Any, sort_keys: bool, indent: bool) -> str:
+    return json.dumps(value, ensure_ascii=False, default=_default, sort_keys=sort_keys,
+                      indent=2 if indent else None, separators=None if indent else (",", ":"))
+
+
+def load_file(path: Union[str, Path]) -> Any:
+    """JSON 파일 읽기 (바이트로 읽어서 바로 파싱)"""
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def dump_file(path: Union[str, Path], value: Any, *, indent: bool = True):
+    with open(path, "wb") as f:
+        f.write(dumps_bytes(value, indent=indent))
+
+
+async def set_pg_codecs(conn):
+    """asyncpg 연결에 json/jsonb 코덱 등록 (파이썬 객체를 그대로 주고받음)"""
+    for type_name in ("json", "jsonb"):
+        await conn.set_type_codec(type_name, encoder=dumps, decoder=loads, schema="pg_catalog")
@@ -0,0 +1,160 @@
+# utils/lifecycle.py
+"""
+봇 애플리케이션 수명주기 (시작/점검/종료)
+
+구성 요소(DB 풀, HTTP 세션, 캐시, 백그라운드 태스크)를 등록한 순서대로 시작하고
+종료는 Bot.close()에서만 역순으로 한다.
+
+게이트웨이 재연결(on_disconnect -> on_resumed/on_ready)은 흔한 일이라 여기서 자원을 닫으면 안 된다.
+재연결 후에는 revalidate()로 각 구성 요소의 probe만 가볍게 돌리고,
+실패한 것만 recover로 되살린다 (전체 재시작 없음).
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from utils.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+COMPONENT_HEALTHY = registry.gauge(
+    "bot_component_healthy", "구성 요소 상태 (1 정상, 0 이상)", ["component"])
+COMPONENT_RECOVERIES = registry.counter(
+    "bot_component_recoveries_total", "점검 실패 후 복구 시도 횟수", ["component", "result"])
+
+# probe 하나에 허용하는 시간 (초)
+PROBE_TIMEOUT = 5.0
+
+AsyncFn = Callable[[], Awaitable]
+
+
+@dataclass
+class Component:
+    name: str
+    start: Optional[AsyncFn] = None
+    stop: Optional[AsyncFn] = None
+    probe: Optional[Callable[[], Awaitable[bool]]] = None   # True면 정상
+    recover: Optional[AsyncFn] = None                       # probe 실패 시 호출 (없으면 stop+start)
+    required: bool = False                                  # 시작 실패 시 봇 시작 중단
+
+
+class Lifecycle:
+    def __init__(self):
+        self.components: List[Component] = []
+        self._started: List[Component] = []
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._revalidate_lock = asyncio.Lock()
+        self._closed = False
+
+    def add(self, name: str, *, start: Optional[AsyncFn] = None, stop: Optional[AsyncFn] = None,
+            probe: Optional[Callable[[], Awaitable[bool]]] = None, recover: Optional[AsyncFn] = None,
+            required: bool = False) -> Component:
+        component = Component(name, start, stop, probe, recover, required)
+        self.components.append(component)
+        return component
+
+    def add_task(self, name: str, factory: Callable[[], Awaitable]) -> Component:
+        """백그라운드 태스크 등록 (시작 시 생성, 종료 시 취소, 죽어 있으면 점검 때 다시 생성)"""
+        async def start():
+            self._tasks[name] = asyncio.create_task(factory(), name=name)
+
+        async def stop():
+            task = self._tasks.pop(name, None)
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+
+        async def probe() -> bool:
+            task = self._tasks.get(name)
+            return task is not None and not task.done()
+
+        return self.add(name, start=start, stop=stop, probe=probe)
+
+    async def startup(self):
+        """등록 순서대로 시작 (required가 아닌 구성 요소의 실패는 기록만 하고 계속)"""
+        for component in self.components:
+            started = time.perf_counter()
+            try:
+                if component.start:
+                    await component.start()
+            except Exception as e:
+                COMPONENT_HEALTHY.set(0, component=component.name)
+                if component.required:
+                    logger.error(f"필수 구성 요소 시작 실패: {component.name} ({e})")
+                    raise
+                logger.error(f"구성 요소 시작 실패: {component.name} ({e})")
+                continue
+            self._started.append(component)
+            COMPONENT_HEALTHY.set(1, component=component.name)
+            logger.info(f"구성 요소 시작: {component.name} ({(time.perf_counter() - started) * 1000:.0f}ms)")
+
+    async def shutdown(self):
+        """시작된 구성 요소를 역순으로 종료 (한 번만)"""
+        if self._closed:
+            return
+        self._closed = True
+        for component in reversed(self._started):
+            try:
+                if component.stop:
+                    await component.stop()
+                logger.info(f"구성 요소 종료: {component.name}")
+            except Exception as e:
+                logger.warning(f"구성 요소 종료 실패: {component.name} ({e})")
+            COMPONENT_HEALTHY.set(0, component=component.name)
+        self._started.clear()
+
+    async def _check(self, component: Component) -> bool:
+        try:
+            return bool(await asyncio.wait_for(component.probe(), PROBE_TIMEOUT))
+        except Exception as e:
+            logger.warning(f"구성 요소 점검 실패: {component.name} ({type(e).__name__}: {e})")
+            return False
+
+    async def _recover(self, component: Component) -> bool:
+        try:
+            if component.recover:
+                await component.recover()
+            else:
+                if component.stop:
+                    await component.stop()
+                if component.start:
+                    await component.start()
+        except Exception as e:
+            logger.error(f"구성 요소 복구 실패: {component.name} ({e})")
+            COMPONENT_RECOVERIES.inc(component=component.name, result="error")
+            return False
+        if component not in self._started:
+            self._started.append(component)
+        COMPONENT_RECOVERIES.inc(component=component.name, result="ok")
+        return await self._check(component) if component.probe else True
+
+    async def revalidate(self, reason: str = "") -> Dict[str, bool]:
+        """재연결 후 가벼운 점검 (probe 실패한 구성 요소만 복구)
+
+        동시에 여러 번 불려도(on_resumed 연속 등) 한 번씩만 돈다.
+        """
+        if self._closed:
+            return {}
+        async with self._revalidate_lock:
+            results: Dict[str, bool] = {}
+            for component in self.components:
+                if component.probe is None:
+                    continue
+                healthy = await self._check(component)
+                if not healthy:
+                    logger.warning(f"구성 요소 이상, 복구 시도: {component.name}")
+                    healthy = await self._recover(component)
+                COMPONENT_HEALTHY.set(1 if healthy else 0, component=component.name)
+                results[component.name] = healthy
+
+            failed = [name for name, ok in results.items() if not ok]
+            if failed:
+                logger.warning(f"구성 요소 점검 결과{f' ({reason})' if reason else ''}: 실패 {failed}")
+            else:
+                logger.info(f"구성 요소 점검 완료{f' ({reason})' if reason else ''}: {len(results)}개 정상")
+            return results
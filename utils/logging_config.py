@@ -0,0 +1,133 @@
+# utils/logging_config.py
+"""
+로깅 설정
+
+- 모든 모듈은 logging.getLogger(__name__)으로 자기 로거를 사용
+- 로그 레코드는 QueueHandler로 큐에만 넣고, 실제 출력은 QueueListener 스레드에서 처리
+  (이벤트 루프가 stdout 쓰기에 막히지 않음)
+- LOG_FORMAT=json이면 한 줄에 JSON 하나씩 출력
+- DEBUG 로그는 호출 위치별로 LOG_DEBUG_SAMPLE개 중 하나만 남김 (반복 루프 안의 로그 억제)
+
+환경변수: LOG_LEVEL (기본 INFO), LOG_FORMAT (text/json, 기본 text), LOG_DEBUG_SAMPLE (기본 1 = 전부)
+"""
+import atexit
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+from datetime import datetime, timezone
+from typing import Dict, Optional, Tuple
+
+TEXT_FORMAT = "%(asctime)s %(levelname)-7s %(name)s: %(message)s"
+
+# LogRecord 기본 속성 (이외의 속성은 extra로 넘긴 필드로 간주해서 JSON에 포함)
+_RESERVED_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """로그 레코드 -> JSON 한 줄"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class DebugSamplingFilter(logging.Filter):
+    """DEBUG 이하 로그는 호출 위치(파일, 줄)별로 every개 중 첫 번째만 통과"""
+
+    def __init__(self, every: int):
+        super().__init__()
+        self.every = max(1, every)
+        self._counts: Dict[Tuple[str, int], int] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG or self.every == 1:
+            return True
+        key = (record.pathname, record.lineno)
+        with self._lock:
+            count = self._counts.get(key, 0)
+            self._counts[key] = count + 1
+        return count % self.every == 0
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """큐에 넣기 전에 메시지와 예외 정보를 문자열로 확정
+
+    기본 QueueHandler는 스택 추적을 메시지 본문에 합쳐 버리므로,
+    JSON 출력에서 exc 필드로 분리할 수 있도록 exc_text에 따로 담는다.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = _exc_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+_exc_formatter = logging.Formatter()
+
+
+def setup_logging(level: Optional[str] = None, json_output: Optional[bool] = None,
+                  debug_sample: Optional[int] = None) -> logging.handlers.QueueListener:
+    """루트 로거를 큐 기반으로 설정 (여러 번 호출해도 한 번만 적용)"""
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    level = (level or os.getenv("LOG_LEVEL", "INFO")).upper()
+    if json_output is None:
+        json_output = os.getenv("LOG_FORMAT", "text").lower() == "json"
+    if debug_sample is None:
+        debug_sample = int(os.getenv("LOG_DEBUG_SAMPLE", "1"))
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(JsonFormatter() if json_output else logging.Formatter(TEXT_FORMAT))
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = _QueueHandler(log_queue)
+    queue_handler.addFilter(DebugSamplingFilter(debug_sample))
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+
+    # 라이브러리 로그는 INFO 이상만 (DEBUG로 돌려도 게이트웨이 패킷 로그가 쏟아지지 않도록)
+    for noisy in ("discord", "asyncpg", "aiohttp"):
+        logging.getLogger(noisy).setLevel(max(logging.INFO, root.level))
+
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+    return _listener
+
+
+def shutdown_logging():
+    """남은 로그를 모두 출력하고 리스너 종료"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
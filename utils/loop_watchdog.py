@@ -0,0 +1,195 @@
+# utils/loop_watchdog.py
+"""
+이벤트 루프 감시
+
+- 항상: 일정 간격으로 sleep한 뒤 늦게 깨어난 시간(루프 지연)을 지표로 기록하고,
+  지연이 예산(LOOP_BLOCK_BUDGET_MS, 기본 100ms)을 넘으면 경고 로그
+- 디버그 모드 (LOOP_DEBUG=1):
+  * 감시 스레드가 루프가 멈춘 순간 루프 스레드의 스택을 떠서 막고 있는 코드 위치를 기록
+    (루프가 selector에서 대기 중인 표본은 버린다 - 다른 스레드가 GIL을 잡아 늦게 깨어난 경우)
+  * asyncio 디버그 모드 + slow_callback_duration으로 오래 걸린 콜백/태스크 단계를 기록
+"""
+import asyncio
+import logging
+import os
+import re
+import selectors
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass
+from types import FrameType
+from typing import Deque, Optional
+
+from utils.metrics import EVENT_LOOP_LAG, EVENT_LOOP_LAG_LAST, registry
+
+logger = logging.getLogger(__name__)
+
+BLOCK_BUDGET = int(os.getenv("LOOP_BLOCK_BUDGET_MS", "100")) / 1000
+LOOP_DEBUG = os.getenv("LOOP_DEBUG", "0").lower() in ("1", "true", "yes")
+# 루프 지연 측정 간격 (초)
+LAG_INTERVAL = 0.5
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_THIS_FILE = os.path.abspath(__file__)
+
+LOOP_BLOCKS = registry.counter(
+    "bot_event_loop_blocks_total", "예산보다 오래 이벤트 루프를 막은 횟수 (site: 막은 코드 위치)", ("site",))
+SLOW_CALLBACKS = registry.counter(
+    "bot_slow_callbacks_total", "asyncio 디버그 모드에서 감지한 느린 콜백", ("callback",))
+
+_CALLBACK_NAME = re.compile(r"coro=<([\w.<>]+)\(\)|<(?:Timer)?Handle ([\w.<>]+)\(")
+
+
+@dataclass
+class BlockReport:
+    site: str
+    stalled: float
+    stack: str
+
+
+_ASYNCIO_DIR = os.path.dirname(os.path.abspath(asyncio.__file__))
+_SELECTORS_FILE = os.path.abspath(selectors.__file__)
+
+
+def _is_loop_machinery(frame: FrameType) -> bool:
+    """이벤트 루프 자체의 프레임 (콜백 실행 Handle._run, _run_once/run_forever 등)"""
+    path = os.path.abspath(frame.f_code.co_filename)
+    return path == _SELECTORS_FILE or (
+        os.path.dirname(path) == _ASYNCIO_DIR
+        and os.path.basename(path) in ("events.py", "base_events.py", "runners.py"))
+
+
+def _loop_idle(frame: FrameType) -> bool:
+    """루프가 selector에서 이벤트를 기다리는 중 (막힌 것이 아니라 깨어나지 못한 것)
+
+    to_thread 작업이 GIL을 오래 잡고 있으면 하트비트가 늦지만 루프 스레드는 select 안에 있다.
+    """
+    path = os.path.abspath(frame.f_code.co_filename)
+    if path == _SELECTORS_FILE:
+        return True
+    return os.path.dirname(path) == _ASYNCIO_DIR and frame.f_code.co_name in ("_run_once", "select")
+
+
+def _blocking_site(frame: Optional[FrameType]) -> Optional[str]:
+    """루프 콜백 안에서 실행 중인 프로젝트 코드 중 가장 안쪽 프레임 -> '경로:줄 함수'
+
+    루프가 대기 중이거나, 프로젝트 프레임이 루프 기계 바깥(asyncio.run을 부른 main 등)에만 있으면 None.
+    """
+    if frame is None or _loop_idle(frame):
+        return None
+    while frame is not None and not _is_loop_machinery(frame):
+        path = frame.f_code.co_filename
+        if path.startswith(PROJECT_ROOT) and path != _THIS_FILE:
+            relative = os.path.relpath(path, PROJECT_ROOT).replace(os.sep, "/")
+            return f"{relative}:{frame.f_lineno} {frame.f_code.co_name}"
+        frame = frame.f_back
+    return None
+
+
+class _SlowCallbackFilter(logging.Filter):
+    """asyncio의 'Executing ... took N seconds' 경고를 지표로 집계 (로그는 그대로 통과)"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if isinstance(record.msg, str) and record.msg.startswith("Executing") and record.args:
+            match = _CALLBACK_NAME.search(str(record.args[0]))
+            name = (match.group(1) or match.group(2)) if match else "unknown"
+            SLOW_CALLBACKS.inc(callback=name)
+        return True
+
+
+class LoopWatchdog:
+    """이벤트 루프 지연 측정 + (디버그 모드) 막힘 위치 스택 캡처"""
+
+    def __init__(self, budget: float = BLOCK_BUDGET, interval: float = LAG_INTERVAL,
+                 capture_stacks: bool = LOOP_DEBUG):
+        self.budget = budget
+        self.interval = interval
+        self.capture_stacks = capture_stacks
+        # 최근 막힘 기록 (tools/check_loop_blocking.py에서 확인)
+        self.blocks: Deque[BlockReport] = deque(maxlen=50)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._beat = 0.0
+        self._slow_filter: Optional[_SlowCallbackFilter] = None
+
+    def start(self):
+        self._loop = asyncio.get_running_loop()
+        self._beat = time.monotonic()
+        self._task = asyncio.create_task(self._heartbeat())
+
+        if self.capture_stacks:
+            self._loop.set_debug(True)
+            self._loop.slow_callback_duration = self.budget
+            self._slow_filter = _SlowCallbackFilter()
+            logging.getLogger("asyncio").addFilter(self._slow_filter)
+
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._watch, args=(threading.get_ident(),), name="loop-watchdog", daemon=True)
+            self._thread.start()
+            logger.info(f"이벤트 루프 감시 (디버그): 예산 {self.budget * 1000:.0f}ms, 스택 캡처 사용")
+
+    async def stop(self):
+        self._stop.set()
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        if self._thread:
+            await asyncio.to_thread(self._thread.join, 1.0)
+            self._thread = None
+        if self._slow_filter:
+            logging.getLogger("asyncio").removeFilter(self._slow_filter)
+            self._slow_filter = None
+
+    async def _heartbeat(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - expected)
+            self._beat = time.monotonic()
+            EVENT_LOOP_LAG.observe(lag)
+            EVENT_LOOP_LAG_LAST.set(lag)
+            # 스택 캡처 모드에서는 감시 스레드가 위치와 함께 기록
+            if lag > self.budget and not self.capture_stacks:
+                LOOP_BLOCKS.inc(site="unknown")
+                self.blocks.append(BlockReport("unknown", lag, ""))
+                logger.warning(f"이벤트 루프 지연 {lag * 1000:.0f}ms (예산 {self.budget * 1000:.0f}ms)")
+
+    def _watch(self, loop_thread_id: int):
+        """감시 스레드: 하트비트가 예산 이상 늦으면 루프 스레드 스택 캡처"""
+        check_every = max(0.01, self.budget / 4)
+        reported_beat = None
+        while not self._stop.wait(check_every):
+            beat = self._beat
+            stalled = time.monotonic() - beat - self.interval
+            if stalled <= self.budget or reported_beat == beat:
+                continue
+            frame = sys._current_frames().get(loop_thread_id)
+            site = _blocking_site(frame)
+            if site is None:
+                # 대기 중이거나 루프 기계 안 -> 막힘이 아님, 다음 표본에서 다시 확인
+                continue
+            reported_beat = beat
+            stack = "".join(traceback.format_stack(frame, limit=15))
+            # 지표/로그 기록은 루프 스레드에서 (루프가 풀린 뒤 실행됨)
+            try:
+                self._loop.call_soon_threadsafe(self._record_block, BlockReport(site, stalled, stack))
+            except RuntimeError:
+                return
+
+    def _record_block(self, report: BlockReport):
+        LOOP_BLOCKS.inc(site=report.site)
+        self.blocks.append(report)
+        logger.warning(
+            f"이벤트 루프 막힘 {report.stalled * 1000:.0f}ms 이상 (예산 {self.budget * 1000:.0f}ms): "
+            f"{report.site}\n{report.stack}"
+        )
@@ -0,0 +1,341 @@
+# utils/metrics.py
+"""
+봇 내부 지표 (Prometheus 텍스트 형식)
+
+외부 라이브러리 없이 카운터/게이지/히스토그램을 메모리에 모으고,
+cogs/core/metrics.py의 로컬 HTTP 엔드포인트(/metrics)에서 텍스트로 내보낸다.
+모든 갱신은 이벤트 루프 스레드에서만 일어나므로 잠금은 쓰지 않는다.
+
+수집 항목
+- 슬래시 명령어/버튼 처리 시간 (bot_interaction_duration_seconds)
+- asyncpg 쿼리 시간 (문장 이름별), 연결 풀 대기 시간
+- 외부 HTTP 요청 시간과 상태 코드 (호스트별)
+- 캐시 적중/실패 횟수
+- 이벤트 루프 지연
+"""
+import re
+import time
+from bisect import bisect_left
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Callable, Dict, List, Sequence, Tuple
+
+import aiohttp
+
+from utils.tracing import record_span
+
+# 기본 히스토그램 구간 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DB_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+LOOP_LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def get(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def render(self) -> List[str]:
+        lines = self.header()
+        for key, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+class Gauge(_Metric):
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels):
+        self._values[self._key(labels)] = value
+
+    def get(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def render(self) -> List[str]:
+        lines = self.header()
+        for key, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+class Histogram(_Metric):
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 라벨 조합 -> [구간별 개수..., 합계, 전체 개수]
+        self._values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        data = self._values.get(key)
+        if data is None:
+            data = self._values[key] = [0] * len(self.buckets) + [0.0, 0]
+        index = bisect_left(self.buckets, value)
+        if index < len(self.buckets):
+            data[index] += 1
+        data[-2] += value
+        data[-1] += 1
+
+    def count(self, **labels) -> int:
+        data = self._values.get(self._key(labels))
+        return int(data[-1]) if data else 0
+
+    def render(self) -> List[str]:
+        lines = self.header()
+        for key, data in sorted(self._values.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, data):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+            inf = 'le="+Inf"'
+            lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, inf)} {int(data[-1])}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(data[-2])}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {int(data[-1])}")
+        return lines
+
+
+class MetricsRegistry:
+    """지표 모음 (같은 이름은 같은 객체 반환)"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], None]] = []
+
+    def _get_or_create(self, cls, name: str, *args, **kwargs):
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = self._metrics[name] = cls(name, *args, **kwargs)
+        elif not isinstance(metric, cls):
+            raise ValueError(f"지표 이름 중복: {name} ({metric.type_name})")
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def add_collector(self, collector: Callable[[], None]):
+        """내보내기 직전에 호출할 함수 (게이지를 현재 값으로 채우는 용도)"""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        for collector in self._collectors:
+            try:
+                collector()
+            except Exception:
+                pass
+        lines: List[str] = []
+        for name in sorted(self._metrics):
+            lines.extend(self._metrics[name].render())
+        return "\n".join(lines) + "\n"
+
+
+# 전역 레지스트리
+registry = MetricsRegistry()
+
+INTERACTION_DURATION = registry.histogram(
+    "bot_interaction_duration_seconds", "슬래시 명령어/컴포넌트 처리 시간", ("kind", "name", "status"))
+DB_QUERY_DURATION = registry.histogram(
+    "bot_db_query_duration_seconds", "asyncpg 쿼리 실행 시간", ("statement", "status"), buckets=DB_BUCKETS)
+DB_POOL_WAIT = registry.histogram(
+    "bot_db_pool_wait_seconds", "연결 풀에서 연결을 얻기까지 대기 시간", buckets=DB_BUCKETS)
+HTTP_REQUEST_DURATION = registry.histogram(
+    "bot_http_request_duration_seconds", "외부 HTTP 요청 시간", ("host", "method", "status"))
+CACHE_REQUESTS = registry.counter(
+    "bot_cache_requests_total", "캐시 조회 횟수", ("cache", "result"))
+HTTP_CACHE_RESULTS = registry.counter(
+    "bot_http_cache_results_total",
+    "캐시 경유 HTTP 조회 결과 (hit: 요청 없음, not_modified: 304, modified/full: 200, stale: 오류로 이전 응답 사용)",
+    ("host", "result"))
+EVENT_LOOP_LAG = registry.histogram(
+    "bot_event_loop_lag_seconds", "이벤트 루프 지연 (예약한 시각보다 늦게 깨어난 시간)", buckets=LOOP_LAG_BUCKETS)
+EVENT_LOOP_LAG_LAST = registry.gauge(
+    "bot_event_loop_lag_last_seconds", "마지막으로 측정한 이벤트 루프 지연")
+
+
+def observe_interaction(kind: str, name: str, seconds: float, ok: bool = True):
+    INTERACTION_DURATION.observe(seconds, kind=kind, name=name, status="ok" if ok else "error")
+
+
+def record_cache(cache: str, hit: bool):
+    CACHE_REQUESTS.inc(cache=cache, result="hit" if hit else "miss")
+
+
+def record_http_cache(host: str, result: str):
+    HTTP_CACHE_RESULTS.inc(host=host, result=result)
+
+
+# ===== asyncpg =====
+
+_NAME_COMMENT = re.compile(r"/\*\s*name:\s*([\w.\-]+)\s*\*/|--\s*name:\s*([\w.\-]+)")
+_VERB = re.compile(r"^\s*(?:WITH\b.*?\)\s*)?(SELECT|INSERT|UPDATE|DELETE|CREATE|ALTER|DROP|WITH)\b", re.I | re.S)
+_TABLE = re.compile(r"\b(?:FROM|INTO|UPDATE|TABLE(?:\s+IF\s+NOT\s+EXISTS)?)\s+([\w.\"]+)", re.I)
+
+
+@lru_cache(maxsize=1024)
+def statement_name(query: str) -> str:
+    """쿼리 -> 지표용 문장 이름
+
+    쿼리 안에 `-- name: 이름` 또는 `/* name: 이름 */` 주석이 있으면 그 이름을 쓰고,
+    없으면 '동사 대상테이블' (예: 'select guild_bot.characters')로 만든다.
+    """
+    match = _NAME_COMMENT.search(query)
+    if match:
+        return match.group(1) or match.group(2)
+    verb_match = _VERB.match(query)
+    verb = verb_match.group(1).lower() if verb_match else "other"
+    table_match = _TABLE.search(query)
+    table = table_match.group(1).replace('"', "") if table_match else ""
+    return f"{verb} {table}".strip()
+
+
+def _log_query(record):
+    """asyncpg 쿼리 로거 (LoggedQuery: query, elapsed, exception ...)"""
+    name = statement_name(record.query)
+    error = type(record.exception).__name__ if record.exception is not None else None
+    DB_QUERY_DURATION.observe(record.elapsed, statement=name, status="error" if error else "ok")
+    record_span(f"db {name}", record.elapsed, error)
+
+
+async def instrument_connection(conn):
+    """create_pool(init=...)에 넘겨서 연결마다 쿼리 시간 기록"""
+    conn.add_query_logger(_log_query)
+
+
+class TimedAcquire:
+    """pool.acquire() 대기 시간을 기록하는 async with 컨텍스트"""
+
+    __slots__ = ("_acquire",)
+
+    def __init__(self, pool):
+        self._acquire = pool.acquire()
+
+    async def __aenter__(self):
+        started = time.perf_counter()
+        conn = await self._acquire.__aenter__()
+        waited = time.perf_counter() - started
+        DB_POOL_WAIT.observe(waited)
+        if waited >= 0.001:
+            record_span("db pool wait", waited)
+        return conn
+
+    async def __aexit__(self, *exc_info):
+        return await self._acquire.__aexit__(*exc_info)
+
+
+# ===== aiohttp =====
+
+_DISCORD_ROUTES = (
+    (re.compile(r"/interactions/\d+/[^/]+/callback$"), "discord respond"),
+    (re.compile(r"/webhooks/\d+/[^/]+/messages/@original$"), "discord original"),
+    (re.compile(r"/webhooks/\d+/[^/]+/messages/\d+$"), "discord followup message"),
+    (re.compile(r"/webhooks/\d+/[^/]+$"), "discord followup"),
+)
+_SNOWFLAKE = re.compile(r"/\d{15,}")
+
+
+def _span_name(method: str, url) -> str:
+    """추적용 요청 이름 (Discord API는 토큰/ID를 지운 경로)"""
+    host = url.host or ""
+    if not host.endswith("discord.com"):
+        return f"http {method} {host}"
+    path = url.path
+    for pattern, label in _DISCORD_ROUTES:
+        if pattern.search(path):
+            return f"{label} {method}"
+    return f"discord {method} {_SNOWFLAKE.sub('/{id}', path.split('/v10', 1)[-1])}"
+
+
+async def _on_request_start(session, ctx, params):
+    ctx.started = time.perf_counter()
+
+
+async def _on_request_end(session, ctx, params):
+    elapsed = time.perf_counter() - ctx.started
+    status = params.response.status
+    HTTP_REQUEST_DURATION.observe(elapsed, host=params.url.host or "", method=params.method, status=str(status))
+    record_span(_span_name(params.method, params.url), elapsed, str(status) if status >= 400 else None)
+
+
+async def _on_request_exception(session, ctx, params):
+    elapsed = time.perf_counter() - ctx.started
+    error = type(params.exception).__name__
+    HTTP_REQUEST_DURATION.observe(elapsed, host=params.url.host or "", method=params.method, status=error)
+    record_span(_span_name(params.method, params.url), elapsed, error)
+
+
+def http_trace_config() -> aiohttp.TraceConfig:
+    """aiohttp.ClientSession(trace_configs=[http_trace_config()])로 요청 시간 기록
+
+    discord.py의 HTTP 세션에도 commands.Bot(http_trace=...)로 같은 설정을 건다.
+    """
+    trace_config = aiohttp.TraceConfig(trace_config_ctx_factory=SimpleNamespace)
+    trace_config.on_request_start.append(_on_request_start)
+    trace_config.on_request_end.append(_on_request_end)
+    trace_config.on_request_exception.append(_on_request_exception)
+    return trace_config
+
+
+def render_latest() -> str:
+    return registry.render()
@@ -0,0 +1,121 @@
+# utils/profiler.py
+"""
+실행 중인 봇 프로파일링
+
+cProfile을 N초 동안 켜서 그 사이 이벤트 루프 스레드에서 실행된 모든 코드
+(다른 인터랙션/태스크 포함)를 기록한다. 재시작 없이 운영 중에 느린 구간을 찾는 용도.
+선택적으로 tracemalloc으로 같은 구간의 메모리 할당 상위 위치도 수집한다.
+
+결과 정리(pstats 정렬, 스냅샷 통계)는 스레드에서 처리해서 루프를 막지 않는다.
+"""
+import asyncio
+import cProfile
+import io
+import marshal
+import pstats
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import List, Optional
+
+# 동시에 하나만 (cProfile은 스레드당 하나만 켤 수 있음)
+_profile_lock = asyncio.Lock()
+
+
+@dataclass
+class ProfileResult:
+    seconds: float
+    total_calls: int
+    total_time: float
+    hotspots: List[str]          # 요약용 상위 함수 (누적 시간 순)
+    report: str                  # pstats 텍스트 보고서
+    pstats_data: bytes           # .pstats 파일 내용 (python -m pstats / snakeviz로 열기)
+    memory_report: Optional[str] = None
+
+
+def is_profiling() -> bool:
+    return _profile_lock.locked()
+
+
+def _function_label(func) -> str:
+    filename, lineno, name = pstats.func_strip_path(func)
+    if filename == "~":
+        return name
+    return f"{filename}:{lineno}({name})"
+
+
+def _build_report(profiler: cProfile.Profile, seconds: float, top: int) -> ProfileResult:
+    stats = pstats.Stats(profiler)
+    pstats_data = marshal.dumps(stats.stats)
+
+    stream = io.StringIO()
+    stats.stream = stream
+    stats.sort_stats(pstats.SortKey.CUMULATIVE)
+    hotspots = []
+    for func in stats.fcn_list[:top]:
+        _, _, self_time, cumulative, _ = stats.stats[func]
+        hotspots.append(f"{cumulative * 1000:9.1f}ms (자체 {self_time * 1000:7.1f}ms)  {_function_label(func)}")
+
+    stats.print_stats(top)
+    stream.write("\n")
+    stats.sort_stats(pstats.SortKey.TIME).print_stats(top)
+
+    return ProfileResult(
+        seconds=seconds,
+        total_calls=stats.total_calls,
+        total_time=stats.total_tt,
+        hotspots=hotspots,
+        report=stream.getvalue(),
+        pstats_data=pstats_data,
+    )
+
+
+def _build_memory_report(snapshot: tracemalloc.Snapshot, baseline: Optional[tracemalloc.Snapshot],
+                         top: int) -> str:
+    snapshot = snapshot.filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<unknown>"),
+    ))
+    if baseline is not None:
+        stats = snapshot.compare_to(baseline, "lineno")
+    else:
+        stats = snapshot.statistics("lineno")
+
+    lines = [f"메모리 할당 상위 {top}개 (측정 구간에 할당되어 아직 살아 있는 것)", ""]
+    for stat in stats[:top]:
+        lines.append(str(stat))
+    return "\n".join(lines)
+
+
+async def profile_for(seconds: float, top: int = 30, trace_memory: bool = False) -> ProfileResult:
+    """seconds초 동안 이벤트 루프 스레드를 프로파일링 (이미 실행 중이면 RuntimeError)"""
+    if _profile_lock.locked():
+        raise RuntimeError("이미 프로파일링 중입니다")
+
+    async with _profile_lock:
+        started_tracemalloc = False
+        baseline = None
+        if trace_memory:
+            if tracemalloc.is_tracing():
+                baseline = tracemalloc.take_snapshot()
+            else:
+                tracemalloc.start(10)
+                started_tracemalloc = True
+
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        profiler.enable()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            profiler.disable()
+            elapsed = time.perf_counter() - started
+            snapshot = tracemalloc.take_snapshot() if trace_memory else None
+            if started_tracemalloc:
+                tracemalloc.stop()
+
+        result = await asyncio.to_thread(_build_report, profiler, elapsed, top)
+        if snapshot is not None:
+            result.memory_report = await asyncio.to_thread(_build_memory_report, snapshot, baseline, top)
+        return result
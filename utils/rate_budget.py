@@ -0,0 +1,31 @@
+# utils/rate_budget.py
+"""
+호출 예산 (토큰 버킷)
+
+레이드 알림 발송(디스코드), 프로필 재수집(raider.io)처럼 외부 서비스에
+초당 보낼 수 있는 요청 수를 제한하는 곳에서 같이 쓴다.
+"""
+import asyncio
+import time
+
+
+class RateBudget:
+    """전역 호출 예산 (토큰 버킷: 초당 rate개, 최대 burst개까지 몰아서)"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
@@ -0,0 +1,144 @@
+"""
+utils/realm_index.py
+
+서버명 검색 인덱스 (한국어/영어/슬러그 -> 서버 레코드)
+임포트 시 한 번만 구축하고, 접두사/초성 검색은 트라이에서 바로 응답한다.
+"""
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from utils.hangul import (
+    get_chosung,
+    is_chosung_query,
+    normalize_search_text,
+    split_trailing_chosung,
+)
+
+
+@dataclass(frozen=True)
+class RealmRecord:
+    """서버 정보 레코드"""
+    name_kr: str
+    name_en: str
+    slug: str
+
+    @property
+    def display_name(self) -> str:
+        """추천 목록용 표시명 (예: 아즈샤라 (Azshara))"""
+        return f"{self.name_kr} ({self.name_en})"
+
+
+def make_realm_slug(english_name: str) -> str:
+    """영어 서버명을 raider.io 슬러그로 변환 (예: Burning Legion -> burning-legion)"""
+    return (
+        english_name.strip()
+        .lower()
+        .replace("'", "")
+        .replace("’", "")
+        .replace(" ", "-")
+    )
+
+
+class _TrieNode:
+    __slots__ = ("children", "record_ids")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.record_ids: List[int] = []
+
+
+class RealmIndex:
+    """서버명 인덱스 - 정확 매칭은 딕셔너리, 접두사/초성 검색은 트라이"""
+
+    # 서버명 뒤에 흔히 붙여 입력하는 접미사
+    STRIP_SUFFIXES = ("서버",)
+
+    def __init__(self, realm_table: Dict[str, str]):
+        self.records: Tuple[RealmRecord, ...] = tuple(
+            RealmRecord(name_kr=kr, name_en=en, slug=make_realm_slug(en))
+            for kr, en in realm_table.items()
+        )
+        self._exact: Dict[str, RealmRecord] = {}
+        self._name_trie = _TrieNode()
+        self._chosung_trie = _TrieNode()
+
+        for record_id, record in enumerate(self.records):
+            keys = {
+                normalize_search_text(record.name_kr),
+                normalize_search_text(record.name_en),
+                normalize_search_text(record.slug),
+            }
+            for key in keys:
+                self._exact.setdefault(key, record)
+                self._insert(self._name_trie, key, record_id)
+            self._insert(self._chosung_trie, get_chosung(normalize_search_text(record.name_kr)), record_id)
+
+    @staticmethod
+    def _insert(root: _TrieNode, key: str, record_id: int):
+        node = root
+        for char in key:
+            node = node.children.setdefault(char, _TrieNode())
+            if record_id not in node.record_ids:
+                node.record_ids.append(record_id)
+
+    @staticmethod
+    def _walk(root: _TrieNode, key: str) -> Optional[_TrieNode]:
+        node = root
+        for char in key:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
+
+    def _normalize(self, text: str) -> str:
+        normalized = normalize_search_text(text)
+        for suffix in self.STRIP_SUFFIXES:
+            if normalized.endswith(suffix) and len(normalized) > len(suffix):
+                normalized = normalized[:-len(suffix)]
+        return normalized
+
+    def lookup(self, text: str) -> Optional[RealmRecord]:
+        """정확 매칭 (한국어명/영어명/슬러그 모두 허용)"""
+        if not text:
+            return None
+        return self._exact.get(self._normalize(text))
+
+    def search(self, text: str, limit: int = 5) -> List[RealmRecord]:
+        """접두사/초성 검색 (입력 중인 마지막 초성도 처리)"""
+        normalized = self._normalize(text) if text else ""
+        if not normalized:
+            return list(self.records[:limit])
+
+        if is_chosung_query(normalized):
+            node = self._walk(self._chosung_trie, normalized)
+            return [self.records[i] for i in node.record_ids[:limit]] if node else []
+
+        node = self._walk(self._name_trie, normalized)
+        if node:
+            return [self.records[i] for i in node.record_ids[:limit]]
+
+        # 예: "아즈ㅅ" -> "아즈"로 시작하고 다음 글자 초성이 ㅅ인 서버
+        prefix, trailing = split_trailing_chosung(normalized)
+        if not trailing:
+            return []
+        node = self._walk(self._name_trie, prefix)
+        if not node:
+            return []
+        results = []
+        for record_id in node.record_ids:
+            name = normalize_search_text(self.records[record_id].name_kr)
+            if len(name) > len(prefix) and name.startswith(prefix) and get_chosung(name[len(prefix)]) == trailing:
+                results.append(self.records[record_id])
+                if len(results) >= limit:
+                    break
+        return results
+
+    def resolve(self, text: str) -> Optional[RealmRecord]:
+        """정확 매칭 우선, 없으면 접두사 검색 결과가 하나뿐일 때 그 서버 반환"""
+        record = self.lookup(text)
+        if record:
+            return record
+        candidates = self.search(text, limit=2)
+        if len(candidates) == 1:
+            return candidates[0]
+        return None
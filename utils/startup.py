@@ -0,0 +1,118 @@
+# utils/startup.py
+"""
+확장(코그) 로딩 파이프라인
+
+EXTENSION_STAGES의 단계는 순서대로, 단계 안의 확장은 동시에 로드한다.
+대부분의 코그는 cog_load에서 각자 DB 풀을 만들거나 파일을 읽느라 I/O 대기뿐이라
+한 줄씩 기다리면 그 대기 시간이 그대로 더해진다.
+
+확장마다 시작/종료 시점을 기록해서 시작 타임라인을 로그로 남기고
+bot_extension_load_seconds 지표로 내보낸다.
+
+모듈 import 비용은 tools/bench_import_time.py로 측정한다 (이 파일은 거기서도 import하므로 가볍게 유지).
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+EXTENSION_STAGES: List[List[str]] = [
+    # 1단계: 지표 코그를 먼저 올려서 이후 코그의 시작 과정도 측정
+    ["cogs.core.metrics"],
+    # 2단계: 서로 의존하지 않는 코그 (동시 로드)
+    [
+        "cogs.admin.raid_management",
+        "cogs.admin.profiler",
+        "cogs.admin.command_sync",
+        "cogs.core.auto_nickname",
+        "cogs.core.emoji_sync",
+        "cogs.core.member_manager",
+        "cogs.core.member_sync",
+        "cogs.stats.guild_stats",
+        "cogs.raid.general",
+        "cogs.raid.participation",
+        "cogs.raid.reminder",
+        "cogs.raid.schedule",
+        "services.blizzard.token_price",
+        "services.raiderio.affixes",
+        "services.raiderio.raid_progression",
+        "services.wowhead.bis",
+        "services.community.secondary_stats",
+        # "cogs.craft",
+        # "cogs.general",
+        # "cogs.raid_schedule",
+        # "cogs.character_manager",
+        # "cogs.raid_management",
+    ],
+]
+
+
+@dataclass
+class ExtensionTiming:
+    name: str
+    stage: int
+    started: float      # 파이프라인 시작 기준 (초)
+    finished: float
+    error: Optional[BaseException] = None
+
+    @property
+    def duration(self) -> float:
+        return self.finished - self.started
+
+
+def all_extensions(stages: Sequence[Sequence[str]] = EXTENSION_STAGES) -> List[str]:
+    return [name for stage in stages for name in stage]
+
+
+def format_timeline(timings: Sequence[ExtensionTiming], total: float, width: int = 30) -> str:
+    """확장별 로딩 구간을 막대로 표시"""
+    scale = width / total if total > 0 else 0
+    name_width = max((len(t.name) for t in timings), default=0)
+    lines = [f"확장 로딩 타임라인 (총 {total * 1000:.0f}ms)"]
+    for t in sorted(timings, key=lambda t: (t.stage, t.started)):
+        begin = min(int(t.started * scale), width - 1)
+        length = min(max(1, int(t.duration * scale)), width - begin)
+        bar = " " * begin + ("x" if t.error else "#") * length
+        status = f"  실패: {t.error}" if t.error else ""
+        lines.append(f"  {t.stage} {t.name:<{name_width}} |{bar:<{width}}| {t.duration * 1000:6.0f}ms{status}")
+    return "\n".join(lines)
+
+
+async def load_extensions(bot, stages: Sequence[Sequence[str]] = EXTENSION_STAGES) -> List[ExtensionTiming]:
+    """단계별로 확장을 동시 로드하고 타임라인 반환
+
+    한 확장이 실패해도 같은 단계의 나머지는 끝까지 로드하고, 타임라인을 남긴 뒤 첫 오류를 다시 던진다
+    (기존처럼 코그 로드 실패는 시작 실패).
+    """
+    from utils.metrics import registry
+    load_seconds = registry.gauge(
+        "bot_extension_load_seconds", "확장 로딩 시간 (마지막 시작 기준)", ["extension"])
+
+    origin = time.perf_counter()
+    timings: List[ExtensionTiming] = []
+
+    async def load(name: str, stage: int) -> ExtensionTiming:
+        started = time.perf_counter() - origin
+        error = None
+        try:
+            await bot.load_extension(name)
+        except Exception as e:
+            error = e
+            logger.error(f"확장 로드 실패: {name} ({type(e).__name__}: {e})")
+        timing = ExtensionTiming(name, stage, started, time.perf_counter() - origin, error)
+        load_seconds.set(timing.duration, extension=name)
+        return timing
+
+    for index, stage in enumerate(stages, start=1):
+        timings.extend(await asyncio.gather(*(load(name, index) for name in stage)))
+
+    total = time.perf_counter() - origin
+    logger.info(format_timeline(timings, total))
+
+    failed = [t for t in timings if t.error]
+    if failed:
+        raise failed[0].error
+    return timings
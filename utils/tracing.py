@@ -0,0 +1,163 @@
+# utils/tracing.py
+"""
+인터랙션 단위 실행 추적 (스팬 트리)
+
+utils.helpers.trace_interaction 데코레이터가 인터랙션마다 루트 스팬을 열고,
+그 안에서 일어나는 작업이 자식 스팬으로 붙는다.
+- DB 쿼리: asyncpg 쿼리 로거 (utils.metrics)
+- 외부 HTTP / Discord API (defer, followup, 메시지 수정): aiohttp TraceConfig (utils.metrics)
+- 그 밖의 구간: with span("render"): ... 로 직접 표시
+
+현재 스팬은 contextvars로 전달되므로 같은 태스크 안의 호출은 인자 없이 이어진다.
+처리 시간이 INTERACTION_SLOW_MS (기본 1000ms)를 넘으면 전체 스팬 트리를 경고 로그로 남긴다.
+"""
+import logging
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+SLOW_THRESHOLD = int(os.getenv("INTERACTION_SLOW_MS", "1000")) / 1000
+# 인터랙션 하나에 기록할 최대 스팬 수 (반복문 안의 쿼리가 수천 개여도 메모리가 늘지 않도록)
+MAX_SPANS = 200
+
+
+class Span:
+    __slots__ = ("name", "started", "duration", "error", "children", "trace")
+
+    def __init__(self, name: str, started: float, trace: "Trace"):
+        self.name = name
+        self.started = started
+        self.duration: Optional[float] = None
+        self.error: Optional[str] = None
+        self.children: List["Span"] = []
+        self.trace = trace
+
+    def to_dict(self, origin: float) -> Dict[str, Any]:
+        entry: Dict[str, Any] = {
+            "name": self.name,
+            "start_ms": round((self.started - origin) * 1000, 1),
+            "ms": round((self.duration or 0.0) * 1000, 1),
+        }
+        if self.error:
+            entry["error"] = self.error
+        if self.children:
+            entry["children"] = [child.to_dict(origin) for child in sorted(self.children, key=lambda s: s.started)]
+        return entry
+
+
+class Trace:
+    """인터랙션 하나의 스팬 트리"""
+
+    def __init__(self, kind: str, name: str):
+        self.kind = kind
+        self.span_count = 0
+        self.dropped = 0
+        self.root = Span(name, time.perf_counter(), self)
+
+    def _add(self, parent: Span, name: str, started: float) -> Optional[Span]:
+        if self.span_count >= MAX_SPANS:
+            self.dropped += 1
+            return None
+        self.span_count += 1
+        child = Span(name, started, self)
+        parent.children.append(child)
+        return child
+
+    def finish(self, error: Optional[str] = None):
+        self.root.duration = time.perf_counter() - self.root.started
+        self.root.error = error or self.root.error
+
+    def format(self) -> str:
+        """사람이 읽는 트리 (시작 오프셋 + 소요 시간)"""
+        origin = self.root.started
+        lines: List[str] = []
+
+        def walk(node: Span, depth: int):
+            offset = (node.started - origin) * 1000
+            duration = (node.duration or 0.0) * 1000
+            error = f" [{node.error}]" if node.error else ""
+            lines.append(f"{'  ' * depth}+{offset:7.1f}ms {duration:8.1f}ms  {node.name}{error}")
+            for child in sorted(node.children, key=lambda s: s.started):
+                walk(child, depth + 1)
+
+        walk(self.root, 0)
+        if self.dropped:
+            lines.append(f"  ... 스팬 {self.dropped}개 생략")
+        return "\n".join(lines)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = self.root.to_dict(self.root.started)
+        data["kind"] = self.kind
+        if self.dropped:
+            data["dropped"] = self.dropped
+        return data
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("interaction_span", default=None)
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+@contextmanager
+def span(name: str) -> Iterator[Optional[Span]]:
+    """현재 인터랙션 아래에 구간 스팬 추가 (추적 중이 아니면 아무것도 하지 않음)"""
+    parent = _current_span.get()
+    child = parent.trace._add(parent, name, time.perf_counter()) if parent else None
+    if child is None:
+        yield None
+        return
+
+    token = _current_span.set(child)
+    try:
+        yield child
+    except BaseException as e:
+        child.error = type(e).__name__
+        raise
+    finally:
+        child.duration = time.perf_counter() - child.started
+        _current_span.reset(token)
+
+
+def record_span(name: str, duration: float, error: Optional[str] = None):
+    """이미 끝난 작업을 현재 스팬의 자식으로 추가 (쿼리 로거/HTTP 훅에서 사용)"""
+    parent = _current_span.get()
+    if parent is None:
+        return
+    child = parent.trace._add(parent, name, time.perf_counter() - duration)
+    if child is not None:
+        child.duration = duration
+        child.error = error
+
+
+def mark_error(error: BaseException):
+    """처리된 예외를 현재 스팬과 루트 스팬에 표시 (에러 처리 데코레이터가 예외를 삼킬 때)"""
+    current = _current_span.get()
+    if current is not None:
+        current.error = type(error).__name__
+        current.trace.root.error = current.trace.root.error or current.error
+
+
+def start_trace(kind: str, name: str):
+    """루트 스팬 시작 -> (trace, reset용 토큰)"""
+    trace = Trace(kind, name)
+    return trace, _current_span.set(trace.root)
+
+
+def end_trace(trace: Trace, token, error: Optional[str] = None) -> bool:
+    """루트 스팬 종료, 느린 인터랙션이면 True"""
+    _current_span.reset(token)
+    trace.finish(error)
+    return trace.root.duration >= SLOW_THRESHOLD
+
+
+def log_slow_trace(trace: Trace):
+    logger.warning(
+        f"느린 인터랙션 ({trace.kind}) {trace.root.name}: {trace.root.duration * 1000:.0f}ms\n{trace.format()}",
+        extra={"trace": trace.to_dict()}
+    )
@@ -0,0 +1,272 @@
+"""
+utils/wow_registry.py
+
+WoW 직업/전문화 메타데이터 레지스트리
+직업, 전문화, 세분화 역할, 방어구, 한국어 표시명, 이모티콘을 한 곳에서 관리한다.
+임포트 시 한 번 구축하고, 영어/한국어/raider.io 표기 모두 정규화된 키 하나로 O(1) 조회한다.
+"""
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from utils.json_codec import load_file
+
+logger = logging.getLogger(__name__)
+
+# 역할별 한국어 표시명
+ROLE_DISPLAY_KR = {
+    "TANK": "탱커",
+    "HEALER": "힐러",
+    "MELEE_DPS": "근딜",
+    "RANGED_DPS": "원딜"
+}
+
+# 역할별 우선순위 (정렬용)
+ROLE_PRIORITY = {
+    "TANK": 1,
+    "HEALER": 2,
+    "MELEE_DPS": 3,
+    "RANGED_DPS": 4
+}
+
+# 알 수 없는 직업/전문화의 기본값
+DEFAULT_ROLE = "MELEE_DPS"
+UNKNOWN_EMOJI = "❓"
+
+# (영어, 한국어, 방어구, 추가 표기) -> [(전문화 영어, 전문화 한국어, 역할)]
+# 추가 표기는 서버 이모티콘 이름 등 비표준 철자 (예: wow_sharman)
+CLASS_DATA = [
+    (("Warrior", "전사", "판금", ()), [
+        ("Arms", "무기", "MELEE_DPS"),
+        ("Fury", "분노", "MELEE_DPS"),
+        ("Protection", "방어", "TANK"),
+    ]),
+    (("Paladin", "성기사", "판금", ()), [
+        ("Holy", "신성", "HEALER"),
+        ("Protection", "보호", "TANK"),
+        ("Retribution", "징벌", "MELEE_DPS"),
+    ]),
+    (("Hunter", "사냥꾼", "사슬", ()), [
+        ("Beast Mastery", "야수", "RANGED_DPS"),
+        ("Marksmanship", "사격", "RANGED_DPS"),
+        ("Survival", "생존", "MELEE_DPS"),
+    ]),
+    (("Rogue", "도적", "가죽", ()), [
+        ("Assassination", "암살", "MELEE_DPS"),
+        ("Outlaw", "무법", "MELEE_DPS"),
+        ("Subtlety", "잠행", "MELEE_DPS"),
+    ]),
+    (("Priest", "사제", "천", ()), [
+        ("Discipline", "수양", "HEALER"),
+        ("Holy", "신성", "HEALER"),
+        ("Shadow", "암흑", "RANGED_DPS"),
+    ]),
+    (("Shaman", "주술사", "사슬", ("sharman",)), [
+        ("Elemental", "정기", "RANGED_DPS"),
+        ("Enhancement", "고양", "MELEE_DPS"),
+        ("Restoration", "복원", "HEALER"),
+    ]),
+    (("Mage", "마법사", "천", ()), [
+        ("Arcane", "비전", "RANGED_DPS"),
+        ("Fire", "화염", "RANGED_DPS"),
+        ("Frost", "냉기", "RANGED_DPS"),
+    ]),
+    (("Warlock", "흑마법사", "천", ()), [
+        ("Affliction", "고통", "RANGED_DPS"),
+        ("Demonology", "악마", "RANGED_DPS"),
+        ("Destruction", "파괴", "RANGED_DPS"),
+    ]),
+    (("Monk", "수도사", "가죽", ()), [
+        ("Brewmaster", "양조", "TANK"),
+        ("Mistweaver", "운무", "HEALER"),
+        ("Windwalker", "풍운", "MELEE_DPS"),
+    ]),
+    (("Druid", "드루이드", "가죽", ()), [
+        ("Balance", "조화", "RANGED_DPS"),
+        ("Feral", "야성", "MELEE_DPS"),
+        ("Guardian", "수호", "TANK"),
+        ("Restoration", "회복", "HEALER"),
+    ]),
+    (("Demon Hunter", "악마사냥꾼", "가죽", ("dh",)), [
+        ("Havoc", "파멸", "MELEE_DPS"),
+        ("Vengeance", "복수", "TANK"),
+    ]),
+    (("Death Knight", "죽음의기사", "판금", ("dk",)), [
+        ("Blood", "혈기", "TANK"),
+        ("Frost", "냉기", "MELEE_DPS"),
+        ("Unholy", "부정", "MELEE_DPS"),
+    ]),
+    (("Evoker", "기원사", "사슬", ("evoke", "용술사")), [
+        ("Devastation", "황폐", "RANGED_DPS"),
+        ("Preservation", "보존", "HEALER"),
+        # 지원형 DPS지만 원거리로 분류
+        ("Augmentation", "증강", "RANGED_DPS"),
+    ]),
+]
+
+EMOJI_DATA_FILE = Path(__file__).parent.parent / 'data' / 'server_emojis.json'
+
+
+def normalize_key(text: str) -> str:
+    """조회용 키 정규화 (Death Knight, death_knight, DEATHKNIGHT, 죽음의 기사 -> 같은 키)"""
+    if not text:
+        return ""
+    return (
+        text.strip()
+        .lower()
+        .replace(" ", "")
+        .replace("_", "")
+        .replace("-", "")
+        .replace("'", "")
+    )
+
+
+@dataclass(frozen=True)
+class WoWClass:
+    """직업 레코드"""
+    name_en: str
+    name_kr: str
+    armor_type: str
+    emoji: str
+
+
+@dataclass(frozen=True)
+class WoWSpec:
+    """직업+전문화 레코드 (참가자 표시에 필요한 정보 전부)"""
+    wow_class: WoWClass
+    name_en: str
+    name_kr: str
+    detailed_role: str
+
+    @property
+    def role_kr(self) -> str:
+        return ROLE_DISPLAY_KR.get(self.detailed_role, self.detailed_role)
+
+    @property
+    def role_priority(self) -> int:
+        return ROLE_PRIORITY.get(self.detailed_role, 99)
+
+    @property
+    def class_kr(self) -> str:
+        return self.wow_class.name_kr
+
+    @property
+    def emoji(self) -> str:
+        return self.wow_class.emoji
+
+
+def class_emojis_from_data(data: Dict) -> Dict[str, str]:
+    """이모티콘 데이터(server_emojis.json 형식)에서 직업 이모티콘 추출 (정규화 키 -> 이모티콘 포맷)"""
+    emojis = {}
+    # wow_classes에 빠진 직업이 있어서 wow_<직업> 이름의 이모티콘도 함께 사용
+    for name, emoji_data in data.get('wow_emojis', {}).items():
+        if name.lower().startswith('wow_'):
+            emojis[normalize_key(name[4:])] = emoji_data['format']
+    for name, emoji_data in data.get('wow_classes', {}).items():
+        emojis[normalize_key(name)] = emoji_data['format']
+    return emojis
+
+
+def load_class_emojis_from_file(path: Path = EMOJI_DATA_FILE) -> Dict[str, str]:
+    """data/server_emojis.json에서 직업 이모티콘 읽기 (봇 연결 전 콜드 스타트용)"""
+    try:
+        data = load_file(path)
+    except FileNotFoundError:
+        logger.info(f"이모티콘 파일이 존재하지 않음: {path}")
+        return {}
+    except Exception as e:
+        logger.error(f"이모티콘 파일 로딩 오류: {e}")
+        return {}
+
+    return class_emojis_from_data(data)
+
+
+class WoWRegistry:
+    """불변 직업/전문화 레지스트리"""
+
+    def __init__(self, class_emojis: Optional[Dict[str, str]] = None):
+        class_emojis = class_emojis or {}
+        classes = []
+        specs = []
+        class_lookup: Dict[str, WoWClass] = {}
+        spec_lookup: Dict[Tuple[str, str], WoWSpec] = {}
+        default_specs: Dict[WoWClass, WoWSpec] = {}
+
+        for (name_en, name_kr, armor_type, aliases), spec_rows in CLASS_DATA:
+            keys = [normalize_key(name_en), normalize_key(name_kr)] + [normalize_key(a) for a in aliases]
+            emoji = next((class_emojis[k] for k in keys if k in class_emojis), UNKNOWN_EMOJI)
+            wow_class = WoWClass(name_en, name_kr, armor_type, emoji)
+            classes.append(wow_class)
+            # 원래 표기도 그대로 넣어서 대부분의 조회는 정규화 없이 끝나도록 함
+            for key in keys + [name_en, name_kr]:
+                class_lookup[key] = wow_class
+
+            for spec_en, spec_kr, role in spec_rows:
+                spec = WoWSpec(wow_class, spec_en, spec_kr, role)
+                specs.append(spec)
+                for spec_key in (spec_en, spec_kr, normalize_key(spec_en), normalize_key(spec_kr)):
+                    spec_lookup[(name_en, spec_key)] = spec
+
+            # 전문화를 모를 때 쓰는 레코드 (역할은 기본값)
+            default_specs[wow_class] = WoWSpec(wow_class, "", "", DEFAULT_ROLE)
+
+        self.classes: Tuple[WoWClass, ...] = tuple(classes)
+        self.specs: Tuple[WoWSpec, ...] = tuple(specs)
+        self._class_lookup = class_lookup
+        self._spec_lookup = spec_lookup
+        self._default_specs = default_specs
+        self._unknown_class = WoWClass("", "", "알 수 없음", UNKNOWN_EMOJI)
+        self._unknown_spec = WoWSpec(self._unknown_class, "", "", DEFAULT_ROLE)
+
+    def get_class(self, class_name: str) -> Optional[WoWClass]:
+        """직업 조회 (영어/한국어/이모티콘 이름 표기 모두 허용)"""
+        wow_class = self._class_lookup.get(class_name)
+        if wow_class is None and class_name:
+            wow_class = self._class_lookup.get(normalize_key(class_name))
+        return wow_class
+
+    def get_spec(self, class_name: str, spec_name: str) -> Optional[WoWSpec]:
+        """직업+전문화 조회 (같은 영어 전문화명도 직업별로 구분: 전사 방어 / 성기사 보호)"""
+        wow_class = self.get_class(class_name)
+        if not wow_class:
+            return None
+        spec = self._spec_lookup.get((wow_class.name_en, spec_name))
+        if spec is None and spec_name:
+            spec = self._spec_lookup.get((wow_class.name_en, normalize_key(spec_name)))
+        return spec
+
+    def describe(self, class_name: str, spec_name: str = "") -> WoWSpec:
+        """표시용 레코드 - 항상 레코드를 반환 (모르는 전문화/직업은 기본값 레코드)"""
+        spec = self.get_spec(class_name, spec_name)
+        if spec:
+            return spec
+        wow_class = self.get_class(class_name)
+        if wow_class:
+            return self._default_specs[wow_class]
+        return self._unknown_spec
+
+    def class_emoji(self, class_name: str) -> str:
+        """직업 이모티콘"""
+        wow_class = self.get_class(class_name)
+        return wow_class.emoji if wow_class else UNKNOWN_EMOJI
+
+
+# 콜드 스타트: 봇이 서버 이모티콘을 받기 전까지는 마지막 스냅샷 파일 사용
+_registry = WoWRegistry(load_class_emojis_from_file())
+
+
+def get_wow_registry() -> WoWRegistry:
+    """현재 레지스트리 (이모티콘 갱신 시 교체되므로 모듈 변수 대신 이 함수를 사용)"""
+    return _registry
+
+
+def set_wow_registry(registry: WoWRegistry):
+    """레지스트리 교체 (참조 한 번 바꾸기라 렌더링 중에도 안전)"""
+    global _registry
+    _registry = registry
+
+
+def describe_character(class_name: str, spec_name: str = "") -> WoWSpec:
+    """직업+전문화 표시용 레코드 (편의 함수)"""
+    return _registry.describe(class_name, spec_name)
@@ -5,109 +5,18 @@ WoW 직업과 전문화 조합에 따른 역할 매핑
 TANK, HEALER, MELEE_DPS, RANGED_DPS로 세분화
 """
 
-# 직업별 전문화 역할 매핑
-CLASS_SPEC_ROLES = {
-    # 전사 (Warrior)
-    ("Warrior", "Arms"): "MELEE_DPS",
-    ("Warrior", "Fury"): "MELEE_DPS", 
-    ("Warrior", "Protection"): "TANK",
-    
-    # 성기사 (Paladin)
-    ("Paladin", "Holy"): "HEALER",
-    ("Paladin", "Protection"): "TANK",
-    ("Paladin", "Retribution"): "MELEE_DPS",
-    
-    # 사냥꾼 (Hunter)
-    ("Hunter", "Beast Mastery"): "RANGED_DPS",
-    ("Hunter", "Marksmanship"): "RANGED_DPS",
-    ("Hunter", "Survival"): "MELEE_DPS",  # 근접 DPS
-    
-    # 도적 (Rogue)
-    ("Rogue", "Assassination"): "MELEE_DPS",
-    ("Rogue", "Outlaw"): "MELEE_DPS",
-    ("Rogue", "Subtlety"): "MELEE_DPS",
-    
-    # 사제 (Priest)
-    ("Priest", "Discipline"): "HEALER",
-    ("Priest", "Holy"): "HEALER",
-    ("Priest", "Shadow"): "RANGED_DPS",
-    
-    # 주술사 (Shaman)
-    ("Shaman", "Elemental"): "RANGED_DPS",
-    ("Shaman", "Enhancement"): "MELEE_DPS",
-    ("Shaman", "Restoration"): "HEALER",
-    
-    # 마법사 (Mage)
-    ("Mage", "Arcane"): "RANGED_DPS",
-    ("Mage", "Fire"): "RANGED_DPS",
-    ("Mage", "Frost"): "RANGED_DPS",
-    
-    # 흑마법사 (Warlock)
-    ("Warlock", "Affliction"): "RANGED_DPS",
-    ("Warlock", "Demonology"): "RANGED_DPS",
-    ("Warlock", "Destruction"): "RANGED_DPS",
-    
-    # 수도사 (Monk)
-    ("Monk", "Brewmaster"): "TANK",
-    ("Monk", "Mistweaver"): "HEALER",
-    ("Monk", "Windwalker"): "MELEE_DPS",
-    
-    # 드루이드 (Druid)
-    ("Druid", "Balance"): "RANGED_DPS",
-    ("Druid", "Feral"): "MELEE_DPS",
-    ("Druid", "Guardian"): "TANK",
-    ("Druid", "Restoration"): "HEALER",
-    
-    # 악마사냥꾼 (Demon Hunter)
-    ("Demon Hunter", "Havoc"): "MELEE_DPS",
-    ("Demon Hunter", "Vengeance"): "TANK",
-    
-    # 죽음의 기사 (Death Knight)
-    ("Death Knight", "Blood"): "TANK",
-    ("Death Knight", "Frost"): "MELEE_DPS",
-    ("Death Knight", "Unholy"): "MELEE_DPS",
-    
-    # 기원사 (Evoker)
-    ("Evoker", "Devastation"): "RANGED_DPS",
-    ("Evoker", "Preservation"): "HEALER",
-    ("Evoker", "Augmentation"): "RANGED_DPS",  # 지원형 DPS지만 원거리로 분류
-}
+import logging
+from utils.wow_registry import get_wow_registry, ROLE_DISPLAY_KR, ROLE_PRIORITY
 
-# 장비 소재 매핑 (방어구 타입)
-CLASS_ARMOR_TYPE = {
-    "Warrior": "판금",
-    "Paladin": "판금",
-    "Death Knight": "판금",
-    
-    "Hunter": "사슬",
-    "Shaman": "사슬",
-    "Evoker": "사슬",
-    
-    "Rogue": "가죽",
-    "Monk": "가죽",
-    "Druid": "가죽",
-    "Demon Hunter": "가죽",
-    
-    "Priest": "천",
-    "Mage": "천",
-    "Warlock": "천"
-}
+logger = logging.getLogger(__name__)
 
-# 역할별 한국어 표시명
-ROLE_DISPLAY_KR = {
-    "TANK": "탱커",
-    "HEALER": "힐러",
-    "MELEE_DPS": "근딜",
-    "RANGED_DPS": "원딜"
+# 직업별 전문화 역할 매핑 / 장비 소재 매핑 (utils/wow_registry.py에서 생성)
+CLASS_SPEC_ROLES = {
+    (spec.wow_class.name_en, spec.name_en): spec.detailed_role
+    for spec in get_wow_registry().specs
 }
+CLASS_ARMOR_TYPE = {wow_class.name_en: wow_class.armor_type for wow_class in get_wow_registry().classes}
 
-# 역할별 우선순위 (정렬용)
-ROLE_PRIORITY = {
-    "TANK": 1,
-    "HEALER": 2,
-    "MELEE_DPS": 3,
-    "RANGED_DPS": 4
-}
 
 class WoWRoleMapper:
     """WoW 역할 매핑 클래스"""
@@ -115,33 +24,22 @@ class WoWRoleMapper:
     @staticmethod
     def get_detailed_role(class_name: str, spec_name: str) -> str:
         """직업과 전문화로 세분화된 역할 반환"""
-        # 정규화
-        class_key = class_name.strip().title() if class_name else ""
-        spec_key = spec_name.strip().title() if spec_name else ""
-        
-        # 직접 매칭
-        role_key = (class_key, spec_key)
-        if role_key in CLASS_SPEC_ROLES:
-            return CLASS_SPEC_ROLES[role_key]
-        
-        # 부분 매칭 시도 (전문화만으로)
-        for (cls, spec), role in CLASS_SPEC_ROLES.items():
-            if cls.lower() == class_key.lower() and spec.lower() in spec_key.lower():
-                return role
+        spec = get_wow_registry().get_spec(class_name, spec_name)
+        if spec:
+            return spec.detailed_role
         
         # 기본값: 알 수 없으면 DPS로 간주
-        print(f">>> 알 수 없는 직업/전문화 조합: {class_name}/{spec_name}")
+        logger.warning(f"알 수 없는 직업/전문화 조합: {class_name}/{spec_name}")
         return "MELEE_DPS"
     
     @staticmethod
     def get_armor_type(class_name: str) -> str:
         """직업별 장비 소재 반환"""
-        class_key = class_name.strip().title() if class_name else ""
-        
-        if class_key in CLASS_ARMOR_TYPE:
-            return CLASS_ARMOR_TYPE[class_key]
+        wow_class = get_wow_registry().get_class(class_name)
+        if wow_class:
+            return wow_class.armor_type
         
-        print(f">>> 알 수 없는 직업: {class_name}")
+        logger.warning(f"알 수 없는 직업: {class_name}")
         return "알 수 없음"
     
     @staticmethod
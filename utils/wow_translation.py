@@ -3,6 +3,10 @@ utils/wow_translation.py
 
 WoW 관련 용어들의 한국어-영어 번역을 관리하는 모듈
 """
+from typing import Optional
+
+from utils.realm_index import RealmIndex, RealmRecord
+from utils.wow_registry import get_wow_registry
 
 # 서버명 번역 (한국어 -> 영어)
 REALM_KR_TO_EN = {
@@ -33,6 +37,9 @@ REALM_KR_TO_EN = {
 # 서버명 번역 (영어 -> 한국어)
 REALM_EN_TO_KR = {v: k for k, v in REALM_KR_TO_EN.items()}
 
+# 서버명 검색 인덱스 (임포트 시 한 번만 구축)
+REALM_INDEX = RealmIndex(REALM_KR_TO_EN)
+
 # 직업명 번역 (한국어 -> 영어)
 CLASS_KR_TO_EN = {
     "전사": "Warrior",
@@ -141,17 +148,10 @@ class WoWTranslator:
     @staticmethod
     def realm_kr_to_en(korean_name: str) -> str:
         """한국어 서버명을 영어로 변환"""
-        # 공백 제거 및 정규화
-        normalized = korean_name.strip().replace(" ", "")
-        
-        # 직접 매칭
-        if normalized in REALM_KR_TO_EN:
-            return REALM_KR_TO_EN[normalized]
-        
-        # 부분 매칭 시도
-        for kr_name, en_name in REALM_KR_TO_EN.items():
-            if normalized in kr_name or kr_name in normalized:
-                return en_name
+        # 정확 매칭 -> 유일한 접두사 매칭 순으로 인덱스 조회
+        record = REALM_INDEX.resolve(korean_name)
+        if record:
+            return record.name_en
         
         # 매칭 실패 시 원본 반환 (이미 영어일 수 있음)
         return korean_name
@@ -159,22 +159,25 @@ class WoWTranslator:
     @staticmethod
     def realm_en_to_kr(english_name: str) -> str:
         """영어 서버명을 한국어로 변환"""
-        # Pascal Case 정규화
-        normalized = english_name.strip().replace(" ", "").replace("'", "'")
-        
-        if normalized in REALM_EN_TO_KR:
-            return REALM_EN_TO_KR[normalized]
+        # 영어명/슬러그 정확 매칭 (Burning Legion, burning-legion 모두 허용)
+        record = REALM_INDEX.lookup(english_name)
+        if record:
+            return record.name_kr
         
         # 매칭 실패 시 원본 반환
         return english_name
     
+    @staticmethod
+    def resolve_realm(user_input: str) -> Optional[RealmRecord]:
+        """사용자 입력을 서버 레코드로 변환 (실패 시 None)"""
+        return REALM_INDEX.resolve(user_input)
+    
     @staticmethod
     def class_en_to_kr(english_class: str) -> str:
         """영어 직업명을 한국어로 변환"""
-        normalized = english_class.strip().title()
-        
-        if normalized in CLASS_EN_TO_KR:
-            return CLASS_EN_TO_KR[normalized]
+        wow_class = get_wow_registry().get_class(english_class)
+        if wow_class:
+            return wow_class.name_kr
         
         return english_class
     
@@ -188,6 +191,15 @@ class WoWTranslator:
         
         return english_spec
     
+    @staticmethod
+    def class_spec_en_to_kr(english_class: str, english_spec: str) -> str:
+        """직업을 알 때의 전문화 번역 (보호/방어, 복원/회복처럼 직업마다 다른 이름 구분)"""
+        spec = get_wow_registry().get_spec(english_class, english_spec)
+        if spec:
+            return spec.name_kr
+        
+        return WoWTranslator.spec_en_to_kr(english_spec)
+    
     @staticmethod
     def role_en_to_kr(english_role: str) -> str:
         """영어 역할명을 한국어로 변환"""
@@ -200,23 +212,8 @@ class WoWTranslator:
     
     @staticmethod
     def get_realm_suggestions(partial_name: str) -> list:
-        """부분 서버명으로 추천 목록 반환"""
-        suggestions = []
-        partial = partial_name.lower().strip()
-        
-        # 한국어 검색
-        for kr_name, en_name in REALM_KR_TO_EN.items():
-            if partial in kr_name.lower():
-                suggestions.append(f"{kr_name} ({en_name})")
-        
-        # 영어 검색
-        for en_name, kr_name in REALM_EN_TO_KR.items():
-            if partial in en_name.lower():
-                suggestion = f"{kr_name} ({en_name})"
-                if suggestion not in suggestions:
-                    suggestions.append(suggestion)
-        
-        return suggestions[:5]  # 최대 5개까지
+        """부분 서버명으로 추천 목록 반환 (접두사/초성 검색)"""
+        return [record.display_name for record in REALM_INDEX.search(partial_name, limit=5)]
     
     @staticmethod
     def normalize_user_input(user_input: str, input_type: str = "realm") -> str:
@@ -245,6 +242,10 @@ def translate_spec_en_to_kr(english_spec: str) -> str:
     """영어 전문화 -> 한국어 (편의 함수)"""
     return WoWTranslator.spec_en_to_kr(english_spec)
 
+def translate_class_spec_en_to_kr(english_class: str, english_spec: str) -> str:
+    """직업별 전문화 영어 -> 한국어 (편의 함수)"""
+    return WoWTranslator.class_spec_en_to_kr(english_class, english_spec)
+
 def translate_class_en_to_kr(english_class: str) -> str:
     """영어 직업 -> 한국어 (편의 함수)"""
     return WoWTranslator.class_en_to_kr(english_class)
@@ -253,6 +254,14 @@ def normalize_realm_input(user_input: str) -> str:
     """사용자 서버명 입력 정규화 (편의 함수)"""
     return WoWTranslator.normalize_user_input(user_input, "realm")
 
+def resolve_realm_input(user_input: str) -> Optional[RealmRecord]:
+    """사용자 서버명 입력을 서버 레코드로 변환 (편의 함수)"""
+    return WoWTranslator.resolve_realm(user_input)
+
+def get_realm_suggestions(partial_name: str) -> list:
+    """부분 서버명 추천 목록 (편의 함수)"""
+    return WoWTranslator.get_realm_suggestions(partial_name)
+
 # 테스트 함수
 def test_translation():
     """번역 기능 테스트"""
@@ -266,6 +275,12 @@ def test_translation():
         en_to_kr = translate_realm_en_to_kr(realm)
         print(f">>>   {realm} -> 영어: {kr_to_en}, 한국어: {en_to_kr}")
     
+    # 서버 검색 테스트 (접두사/초성)
+    test_queries = ["아즈", "ㅇㅈ", "아즈ㅅ", "burn", "guldan"]
+    print("\n>>> 서버 검색 테스트:")
+    for query in test_queries:
+        print(f">>>   {query} -> {get_realm_suggestions(query)}")
+    
     # 전문화 테스트
     test_specs = ["Blood", "Holy", "Arcane", "Beast Mastery"]
     print("\n>>> 전문화 번역 테스트:")